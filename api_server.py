@@ -12,7 +12,7 @@ import json
 import subprocess
 import logging
 from datetime import datetime, timedelta, timezone
-from collections import Counter, defaultdict
+from collections import defaultdict
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import time
@@ -42,7 +42,11 @@ from list_sync.database import (
     save_list_id,
     delete_list,
     DB_FILE,
-    init_database
+    get_connection,
+    init_database,
+    get_deduplicated_items,
+    count_deduplicated_items,
+    get_deduplicated_status_counts
 )
 from list_sync.config import load_env_config
 # Removed in-memory sync tracker - now using database-based tracking
@@ -129,6 +133,10 @@ class ListAdd(BaseModel):
     list_id: str
     user_id: str = "1"
 
+class ListScheduleUpdate(BaseModel):
+    interval_hours: Optional[float] = None  # None = global sync interval
+    priority: int = 0
+
 class ProcessInfo(BaseModel):
     pid: int
     status: str
@@ -202,7 +210,7 @@ def parse_log_for_sync_info(log_path: str = 'data/list_sync.log', max_lines: int
         print(f"Log file not found: {log_path}")
         # Try to get last sync from database as fallback
         try:
-            conn = sqlite3.connect(DB_FILE)
+            conn = get_connection()
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(last_synced) FROM synced_items")
             result = cursor.fetchone()
@@ -266,7 +274,7 @@ def parse_log_for_sync_info(log_path: str = 'data/list_sync.log', max_lines: int
         if not log_info.last_sync_complete:
             print("No sync completion found in logs, checking database...")
             try:
-                conn = sqlite3.connect(DB_FILE)
+                conn = get_connection()
                 cursor = conn.cursor()
                 cursor.execute("SELECT MAX(last_synced) FROM synced_items")
                 result = cursor.fetchone()
@@ -423,131 +431,43 @@ def normalize_list_id(list_type: str, list_id: str) -> str:
     return list_id
 
 
-def get_deduplicated_items():
-    """Get unique items with deduplication logic"""
-    if not os.path.exists(DB_FILE):
-        return []
-    
-    try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        # Get all synced items including year and source list info
-        cursor.execute("SELECT id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id FROM synced_items")
-        items = cursor.fetchall()
-        
-        unique_items = {}
-        
-        # Define status priority (higher number = higher priority)
-        status_priority = {
-            'requested': 100,
-            'already_requested': 90,
-            'already_available': 80,
-            'available': 70,
-            'not_found': 20,
-            'error': 10,
-            'skipped': 5  # Lowest priority
-        }
-        
-        for item in items:
-            item_id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id = item
-            
-            # Create unique key based on title and media type
-            key = f"{title}_{media_type}".lower().strip()
-            
-            if key not in unique_items:
-                unique_items[key] = item
-            else:
-                existing_item = unique_items[key]
-                existing_status = existing_item[6]  # Status is now at index 6
-                existing_last_synced = existing_item[7]  # Last synced is now at index 7
-                
-                # Prefer item with higher status priority
-                current_priority = status_priority.get(status, 0)
-                existing_priority = status_priority.get(existing_status, 0)
-                
-                should_replace = False
-                
-                if current_priority > existing_priority:
-                    should_replace = True
-                elif current_priority == existing_priority:
-                    # Same priority, prefer item with overseerr_id
-                    if overseerr_id and not existing_item[5]:  # overseerr_id is now at index 5
-                        should_replace = True
-                    elif (overseerr_id and existing_item[5]) or (not overseerr_id and not existing_item[5]):
-                        # Both have or both don't have overseerr_id, prefer more recent
-                        if last_synced > existing_last_synced:
-                            should_replace = True
-                
-                if should_replace:
-                    unique_items[key] = item
-        
-        conn.close()
-        
-        result = list(unique_items.values())
-        print(f"DEBUG - Deduplication: {len(items)} raw items -> {len(result)} unique items")
-        
-        # Debug: Show status breakdown of unique items
-        status_counts = {}
-        for item in result:
-            status = item[6]  # Status is now at index 6
-            status_counts[status] = status_counts.get(status, 0) + 1
-        print(f"DEBUG - Unique item statuses: {status_counts}")
-        
-        return result
-        
-    except Exception as e:
-        print(f"Error getting deduplicated items: {e}")
-        return []
-
 def analyze_data_quality():
     """Analyze data quality with deduplication stats"""
     if not os.path.exists(DB_FILE):
         return None
     
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection()
         cursor = conn.cursor()
         
-        # Get all synced items including year
-        cursor.execute("SELECT title, media_type, year, imdb_id, overseerr_id, status, last_synced FROM synced_items")
-        items = cursor.fetchall()
+        cursor.execute("SELECT status, COUNT(*) FROM synced_items GROUP BY status")
+        status_counts = dict(cursor.fetchall())
+        total_raw_items = sum(status_counts.values())
         
-        # Analyze duplicates
-        title_counts = Counter()
-        status_counts = Counter()
-        unique_items = {}
+        # Count titles for duplicate analysis
+        cursor.execute("SELECT title, COUNT(*) FROM synced_items GROUP BY title ORDER BY COUNT(*) DESC LIMIT 5")
+        most_duplicated = cursor.fetchall()
         
-        for item in items:
-            title, media_type, year, imdb_id, overseerr_id, status, last_synced = item
-            
-            # Count titles for duplicate analysis
-            title_counts[title] += 1
-            status_counts[status] += 1
-            
-            # Create unique key (prefer items with overseerr_id and more recent sync)
-            key = f"{title}_{media_type}".lower()
-            if key not in unique_items or \
-               (overseerr_id and not unique_items[key][4]) or \
-               last_synced > unique_items[key][6]:
-                unique_items[key] = item
+        # Unique items are kept in the deduplicated_items table as sync results are saved
+        unique_status_counts = get_deduplicated_status_counts()
+        total_unique_items = sum(unique_status_counts.values())
         
         # Categorize statuses
         success_statuses = ['already_available', 'already_requested', 'available', 'requested']
         failure_statuses = ['not_found', 'error']
         
-        unique_success = sum(1 for item in unique_items.values() if item[5] in success_statuses)
-        unique_failure = sum(1 for item in unique_items.values() if item[5] in failure_statuses)
+        unique_success = sum(unique_status_counts.get(status, 0) for status in success_statuses)
+        unique_failure = sum(unique_status_counts.get(status, 0) for status in failure_statuses)
         
         analysis = {
-            'total_raw_items': len(items),
-            'total_unique_items': len(unique_items),
-            'duplicates_found': len(items) - len(unique_items),
-            'status_breakdown': dict(status_counts),
+            'total_raw_items': total_raw_items,
+            'total_unique_items': total_unique_items,
+            'duplicates_found': total_raw_items - total_unique_items,
+            'status_breakdown': status_counts,
             'unique_success_count': unique_success,
             'unique_failure_count': unique_failure,
-            'success_rate': (unique_success / len(unique_items) * 100) if unique_items else 0,
-            'most_duplicated': title_counts.most_common(5)
+            'success_rate': (unique_success / total_unique_items * 100) if total_unique_items else 0,
+            'most_duplicated': most_duplicated
         }
         
         conn.close()
@@ -1737,7 +1657,7 @@ async def get_system_status():
             database_status["last_modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
             
             # Test connection
-            conn = sqlite3.connect(DB_FILE)
+            conn = get_connection()
             conn.execute("SELECT 1")
             conn.close()
             database_status["connected"] = True
@@ -1793,7 +1713,7 @@ async def get_log_info():
 async def test_database():
     """Test database connectivity"""
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection()
         conn.execute("SELECT 1")
         conn.close()
         return {"connected": True}
@@ -2753,7 +2673,7 @@ async def sync_interval_from_env():
 async def get_sync_stats():
     """Get deduplicated sync statistics"""
     try:
-        unique_items = get_deduplicated_items()
+        status_counts = get_deduplicated_status_counts()
         
         # Categorize statuses based on user requirements
         newly_requested_statuses = ['requested']  # Actually requested during this sync
@@ -2762,11 +2682,11 @@ async def get_sync_stats():
         skipped_statuses = ['skipped']
         error_statuses = ['not_found', 'error']
         
-        newly_requested_count = sum(1 for item in unique_items if item[6] in newly_requested_statuses)
-        already_requested_count = sum(1 for item in unique_items if item[6] in already_requested_statuses)
-        available_count = sum(1 for item in unique_items if item[6] in available_statuses)
-        skipped_count = sum(1 for item in unique_items if item[6] in skipped_statuses)
-        error_count = sum(1 for item in unique_items if item[6] in error_statuses)
+        newly_requested_count = sum(status_counts.get(status, 0) for status in newly_requested_statuses)
+        already_requested_count = sum(status_counts.get(status, 0) for status in already_requested_statuses)
+        available_count = sum(status_counts.get(status, 0) for status in available_statuses)
+        skipped_count = sum(status_counts.get(status, 0) for status in skipped_statuses)
+        error_count = sum(status_counts.get(status, 0) for status in error_statuses)
         
         # Get duplicates from the most recent sync session in logs
         duplicates_in_current_sync = get_duplicates_from_current_sync()
@@ -2781,7 +2701,7 @@ async def get_sync_stats():
             log_based_errors = error_count
         
         # Calculate simplified metrics
-        total_processed = len(unique_items)
+        total_processed = sum(status_counts.values())
         successful_items = newly_requested_count + already_requested_count + available_count + skipped_count  # All non-error items
         total_requested = newly_requested_count  # Only items actually requested during this sync
         total_errors = log_based_errors  # Use same count as /failures page for consistency
@@ -2839,27 +2759,25 @@ async def get_data_quality():
 async def get_status_breakdown():
     """Get success/failure categorization"""
     try:
-        unique_items = get_deduplicated_items()
+        status_counts = get_deduplicated_status_counts()
         
         success_statuses = ['already_available', 'already_requested', 'available', 'requested']
         failure_statuses = ['not_found', 'error']
         
-        successful_items = [item for item in unique_items if item[6] in success_statuses]
-        failed_items = [item for item in unique_items if item[6] in failure_statuses]
-        other_items = [item for item in unique_items if item[6] not in success_statuses + failure_statuses]
+        other_statuses = [status for status in status_counts if status not in success_statuses + failure_statuses]
         
         return {
             "successful": {
-                "count": len(successful_items),
+                "count": sum(status_counts.get(status, 0) for status in success_statuses),
                 "statuses": success_statuses
             },
             "failed": {
-                "count": len(failed_items),
+                "count": sum(status_counts.get(status, 0) for status in failure_statuses),
                 "statuses": failure_statuses
             },
             "other": {
-                "count": len(other_items),
-                "statuses": list(set(item[6] for item in other_items))
+                "count": sum(status_counts[status] for status in other_statuses),
+                "statuses": other_statuses
             }
         }
     except Exception as e:
@@ -3113,7 +3031,9 @@ async def get_lists():
                 "display_name": display_name,
                 "item_count": list_item.get('item_count', 0),  # Include item count from database
                 "last_synced": last_synced,  # Include converted last_synced timestamp
-                "user_id": list_item.get('user_id', '1')  # Include user_id for per-list user assignment
+                "user_id": list_item.get('user_id', '1'),  # Include user_id for per-list user assignment
+                "sync_interval_hours": list_item.get('sync_interval_hours'),  # None = global sync interval
+                "sync_priority": list_item.get('sync_priority', 0)
             })
         
         return {"lists": formatted_lists}
@@ -3126,10 +3046,7 @@ async def get_lists_debug():
     try:
         lists = load_list_ids()
         # Also get raw database data for debugging
-        import sqlite3
-        from list_sync.database import DB_FILE
-        
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT list_type, list_id, list_url, item_count, last_synced FROM lists")
             raw_data = cursor.fetchall()
@@ -3191,8 +3108,7 @@ async def add_list(list_add: ListAdd):
 async def get_list_items_endpoint(list_type: str, list_id: str, limit: int = Query(20, ge=1, le=100)):
     """Get items from a specific list with enriched metadata"""
     try:
-        from list_sync.database import get_list_items, DB_FILE
-        import sqlite3
+        from list_sync.database import get_list_items
         
         items = get_list_items(list_type, list_id)
         
@@ -3202,7 +3118,7 @@ async def get_list_items_endpoint(list_type: str, list_id: str, limit: int = Que
         
         if item_ids:
             try:
-                with sqlite3.connect(DB_FILE) as conn:
+                with get_connection() as conn:
                     cursor = conn.cursor()
                     placeholders = ','.join('?' * len(item_ids))
                     cursor.execute(f"SELECT id, poster_url FROM synced_items WHERE id IN ({placeholders})", item_ids)
@@ -3230,6 +3146,29 @@ async def get_list_items_endpoint(list_type: str, list_id: str, limit: int = Que
         logging.error(f"Error fetching list items: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.put("/api/lists/{list_type}/{list_id:path}/schedule")
+async def update_list_schedule(list_type: str, list_id: str, schedule: ListScheduleUpdate):
+    """Set a list's own sync interval (null for the global interval) and its priority in automated mode"""
+    if schedule.interval_hours is not None and schedule.interval_hours <= 0:
+        raise HTTPException(status_code=400, detail="interval_hours must be greater than 0")
+    try:
+        from list_sync.database import set_list_schedule
+        
+        if not set_list_schedule(list_type, list_id, schedule.interval_hours, schedule.priority):
+            raise HTTPException(status_code=404, detail=f"List not found: {list_type}/{list_id}")
+        
+        return {
+            "success": True,
+            "list_type": list_type,
+            "list_id": list_id,
+            "sync_interval_hours": schedule.interval_hours,
+            "sync_priority": schedule.priority
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.delete("/api/lists/{list_type}/{list_id:path}")
 async def delete_list_endpoint(list_type: str, list_id: str):
     """Delete list - uses :path to capture full URLs with forward slashes"""
@@ -3269,17 +3208,11 @@ async def delete_list_endpoint(list_type: str, list_id: str):
 async def get_items(page: int = Query(1, ge=1), limit: int = Query(50, ge=1, le=100)):
     """Get all synced items (deduplicated)"""
     try:
-        unique_items = get_deduplicated_items()
-        
         # Calculate pagination
-        total = len(unique_items)
+        total = count_deduplicated_items()
         total_pages = (total + limit - 1) // limit
-        start = (page - 1) * limit
-        end = start + limit
         
-        # Sort by last_synced descending
-        sorted_items = sorted(unique_items, key=lambda x: x[6], reverse=True)
-        page_items = sorted_items[start:end]
+        page_items = get_deduplicated_items(order_by='status', limit=limit, offset=(page - 1) * limit)
         
         items = []
         for item in page_items:
@@ -3338,12 +3271,11 @@ async def get_enriched_items(
     """Get synced items enriched with Trakt metadata (poster, rating, etc.)"""
     try:
         from list_sync.providers.trakt import get_trakt_metadata
-        from list_sync.database import DB_FILE
         import time
         
         # Debug: Check item_lists table
         try:
-            with sqlite3.connect(DB_FILE) as conn:
+            with get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) FROM item_lists")
                 item_lists_count = cursor.fetchone()[0]
@@ -3351,48 +3283,35 @@ async def get_enriched_items(
         except Exception as e:
             logging.warning(f"Could not check item_lists table: {e}")
         
-        # Get base items (deduplicated)
-        unique_items = get_deduplicated_items()
-        
-        # Filter by list source if specified (before pagination)
-        # Filter directly using source_list_type and source_list_id columns from synced_items
+        # Filter by list source if specified, using the source_list_type and source_list_id columns from synced_items
+        filter_list_type, filter_list_ids = None, None
         if list_source and list_source.strip():
             try:
                 filter_list_type, filter_list_id = list_source.split(':', 1)
                 
                 # Normalize the list_id to match what's stored in database
                 normalized_list_id = normalize_list_id(filter_list_type, filter_list_id)
+                filter_list_ids = [normalized_list_id, filter_list_id]
                 
                 logging.info(f"📋 Filtering by list {filter_list_type}:{filter_list_id} (normalized: {normalized_list_id})")
-                
-                # Filter items where source_list_type and source_list_id match
-                # Item tuple: (id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
-                before_count = len(unique_items)
-                unique_items = [
-                    item for item in unique_items 
-                    if (item[8] == filter_list_type and 
-                        (item[9] == normalized_list_id or item[9] == filter_list_id))
-                ]
-                
-                logging.info(f"📋 Filtered {before_count} items → {len(unique_items)} items match list {filter_list_type}:{filter_list_id}")
             except ValueError:
                 # Invalid list_source format, ignore filter
                 logging.warning(f"Invalid list_source format: {list_source}, ignoring filter")
         
         # Calculate pagination on filtered items
-        total = len(unique_items)
+        total = count_deduplicated_items(filter_list_type, filter_list_ids)
         total_pages = (total + limit - 1) // limit if total > 0 else 0
-        start = (page - 1) * limit
-        end = start + limit
-        
-        # Sort by last_synced descending (most recently synced first)
-        # Handle None values by putting them at the end
-        sorted_items = sorted(
-            unique_items, 
-            key=lambda x: x[7] if x[7] is not None else '', 
-            reverse=True
+        if filter_list_type:
+            logging.info(f"📋 {total} items match list {filter_list_type}:{filter_list_ids[-1]}")
+        
+        # Get base items (deduplicated), most recently synced first and never-synced last
+        page_items = get_deduplicated_items(
+            order_by='last_synced',
+            list_type=filter_list_type,
+            list_ids=filter_list_ids,
+            limit=limit,
+            offset=(page - 1) * limit
         )
-        page_items = sorted_items[start:end]
         
         # Get overseerr URL for constructing links
         config_tuple = load_env_config()
@@ -3405,7 +3324,7 @@ async def get_enriched_items(
         item_lists_map = {}  # Map item_id to list of lists it belongs to
 
         try:
-            with sqlite3.connect(DB_FILE) as conn:
+            with get_connection() as conn:
                 cursor = conn.cursor()
                 placeholders = ','.join('?' * len(item_ids))
                 
@@ -3695,7 +3614,7 @@ async def get_current_time():
 
 @app.post("/api/sync/trigger")
 async def trigger_manual_sync(sync_request: dict = None):
-    """Trigger a manual sync by sending SIGUSR1 signal to ListSync process"""
+    """Trigger a manual sync by queueing a sync job for the ListSync core process"""
     try:
         from list_sync.utils.sync_status import clear_pause_until
         # Parse request body if provided
@@ -3732,122 +3651,48 @@ async def trigger_manual_sync(sync_request: dict = None):
         
         print(f"DEBUG - Sync request parsed: type={sync_type}, target={target_list}, raw_request={sync_request}")
         
-        # Find ListSync processes
-        processes = find_listsync_processes()
-        
-        if not processes:
-            raise HTTPException(
-                status_code=404, 
-                detail="No ListSync process found. Please ensure ListSync is running in automated mode."
-            )
-        
-        # For single list sync, create a request file
-        if sync_type == "single" and target_list:
-            import os
-            import json
-            import uuid
-            
-            print(f"DEBUG - Creating single list sync request file for: {target_list}")
-            
-            # Create the request data
-            request_data = {
-                "list_type": target_list["list_type"],
-                "list_id": target_list["list_id"],
-                "timestamp": datetime.now().isoformat(),
-                "requested_by": "web_ui"
-            }
-            
-            # Ensure data directory exists
-            os.makedirs("data/sync_requests", exist_ok=True)
-            
-            # Use a unique filename with timestamp and UUID to prevent overwrites
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            request_file = f"data/sync_requests/single_sync_{timestamp_str}_{unique_id}.json"
-            
-            with open(request_file, 'w') as f:
-                json.dump(request_data, f, indent=2)
-            
-            print(f"DEBUG - Single list sync request file created: {request_file}")
-            
-            # Also maintain the legacy single file for backwards compatibility
-            legacy_file = "data/single_list_sync_request.json"
-            with open(legacy_file, 'w') as f:
-                json.dump(request_data, f, indent=2)
-            
-            # Also set environment variables as fallback (though these may not persist across processes)
-            os.environ["SINGLE_LIST_SYNC"] = "true"
-            os.environ["SINGLE_LIST_TYPE"] = target_list["list_type"]
-            os.environ["SINGLE_LIST_ID"] = target_list["list_id"]
-            
-            print(f"DEBUG - Environment variables set as fallback: SINGLE_LIST_SYNC=true, SINGLE_LIST_TYPE={target_list['list_type']}, SINGLE_LIST_ID={target_list['list_id']}")
-        else:
-            # Clear any existing single list request file for full sync
-            import os
-            request_file = "data/single_list_sync_request.json"
-            if os.path.exists(request_file):
-                os.remove(request_file)
-                print(f"DEBUG - Removed existing single list sync request file")
-            
-            # Clear single list environment variables for full sync
-            os.environ.pop("SINGLE_LIST_SYNC", None)
-            os.environ.pop("SINGLE_LIST_TYPE", None)
-            os.environ.pop("SINGLE_LIST_ID", None)
-            print(f"DEBUG - Cleared single list environment variables for full sync")
-        
         # Clear any pause (e.g., set after cancellation) so manual trigger runs immediately
         try:
             clear_pause_until()
         except Exception as e:
             print(f"WARNING - Could not clear pause before manual sync: {e}")
         
-        # Send SIGUSR1 signal to trigger sync (works for both single and full)
-        signals_sent = []
-        errors = []
-        
-        for process in processes:
-            try:
-                # Send SIGUSR1 signal to trigger immediate sync
-                os.kill(process.pid, signal.SIGUSR1)
-                signals_sent.append({
-                    "pid": process.pid,
-                    "cmdline": process.cmdline,
-                    "status": "signal_sent"
-                })
-                print(f"Sent SIGUSR1 signal to ListSync process PID {process.pid}")
-                
-            except ProcessLookupError:
-                errors.append({
-                    "pid": process.pid,
-                    "error": "Process not found (may have exited)"
-                })
-            except PermissionError:
-                errors.append({
-                    "pid": process.pid,
-                    "error": "Permission denied (insufficient privileges)"
-                })
-            except Exception as e:
-                errors.append({
-                    "pid": process.pid,
-                    "error": str(e)
-                })
+        # Queue the sync; repeated triggers for the same list (or full sync) coalesce into one job
+        from list_sync.database import enqueue_sync_job
+        from list_sync.utils.sync_wakeup import notify_core
         
-        if not signals_sent and errors:
-            # All signals failed
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to send signals to any ListSync process: {errors}"
+        if sync_type == "single" and target_list:
+            job = enqueue_sync_job(
+                "single",
+                target_list["list_type"],
+                target_list["list_id"],
+                requested_by="web_ui"
             )
+        else:
+            job = enqueue_sync_job("full", requested_by="web_ui")
+        
+        # Wake the core process so the job starts right away
+        woken = notify_core()
+        processes = find_listsync_processes()
+        print(f"DEBUG - Sync job {job['id']} {'coalesced' if job['coalesced'] else 'queued'}, core woken: {woken}")
+        
+        if job['coalesced']:
+            message = f"A {sync_type} sync for this target is already {job['state']}; trigger merged into job {job['id']}"
+        else:
+            message = f"Manual {sync_type} sync queued as job {job['id']}"
         
         return {
             "success": True,
             "sync_type": sync_type,
             "target_list": target_list if sync_type == "single" else None,
-            "message": f"Manual {sync_type} sync triggered successfully for {len(signals_sent)} process(es)",
-            "signals_sent": signals_sent,
-            "errors": errors if errors else None,
-            "note": "Sync should start immediately if ListSync is running in automated mode",
-            "method": "file_based" if sync_type == "single" else "signal_only",
+            "message": message,
+            "job_id": job['id'],
+            "job_state": job['state'],
+            "coalesced": job['coalesced'],
+            "core_notified": woken,
+            "note": ("Sync will start immediately" if processes
+                     else "No ListSync process found; the job will run when ListSync starts in automated mode"),
+            "method": "job_queue",
             "timestamp": datetime.now().isoformat()
         }
         
@@ -4131,11 +3976,18 @@ async def get_sync_status():
                     "can_signal": False
                 })
         
+        # Job state comes from the same queue the trigger endpoint writes to
+        from list_sync.database import get_sync_jobs
+        jobs = get_sync_jobs(limit=20)
+        
         return {
             "processes_found": len(processes),
             "processes": process_info,
-            "can_trigger_sync": len(processes) > 0,
-            "sync_method": "signal" if len(processes) > 0 else "none",
+            "can_trigger_sync": True,  # Jobs are durable and run once the core process is up
+            "sync_method": "job_queue",
+            "jobs": jobs,
+            "running_job": next((job for job in jobs if job['state'] == 'running'), None),
+            "queued_jobs": sum(1 for job in jobs if job['state'] == 'queued'),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -4410,6 +4262,88 @@ async def get_failures(
         print(f"Error parsing failures: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/failures/backoff")
+async def get_failure_backoff(limit: int = Query(100, ge=1, le=1000)):
+    """Get items that are currently skipped because they keep failing (not_found/error/request_failed)"""
+    try:
+        from list_sync.database import get_item_backoffs
+        items = get_item_backoffs(limit)
+        return {
+            "items": items,
+            "total": len(items),
+            "skipping": sum(1 for item in items if item["skips_remaining"] > 0)
+        }
+    except Exception as e:
+        logging.error(f"Error getting failure backoff: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/failures/retry")
+async def retry_failed_items(
+    imdb_id: Optional[str] = Query(None, description="Retry the item with this IMDb ID"),
+    tmdb_id: Optional[str] = Query(None, description="Retry the item with this TMDB ID"),
+    title: Optional[str] = Query(None, description="Retry the item with this title (when it has no IDs)"),
+    year: Optional[int] = Query(None, description="Year of the title to retry"),
+    media_type: Optional[str] = Query(None, description="Media type (movie/tv) of the item to retry"),
+    status: Optional[str] = Query(None, description="When no item is given, only retry items with this status")
+):
+    """
+    Force items out of failure backoff so the next sync searches them again.
+    
+    With an IMDb ID, TMDB ID or title the backoff entry for that item is removed; without
+    one, every item in backoff (optionally filtered by status) becomes eligible again.
+    """
+    try:
+        from list_sync.database import clear_item_backoff, reset_item_backoff
+        
+        if imdb_id or tmdb_id or title:
+            cleared = clear_item_backoff(imdb_id=imdb_id, tmdb_id=tmdb_id, title=title, year=year, media_type=media_type)
+            if not cleared:
+                raise HTTPException(status_code=404, detail="Item is not in failure backoff")
+            return {"success": True, "reset_count": 1, "message": "Item will be retried on the next sync"}
+        
+        reset_count = reset_item_backoff(status)
+        return {
+            "success": True,
+            "reset_count": reset_count,
+            "message": f"{reset_count} item(s) will be retried on the next sync"
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Error resetting failure backoff: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/revalidation")
+async def get_revalidation_schedule():
+    """Get how many items reuse their last Overseerr status instead of being re-checked, per status"""
+    try:
+        from list_sync.database import get_revalidation_summary
+        statuses = get_revalidation_summary()
+        return {
+            "statuses": statuses,
+            "total_scheduled": sum(row["scheduled"] for row in statuses)
+        }
+    except Exception as e:
+        logging.error(f"Error getting revalidation schedule: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/revalidation/reset")
+async def reset_revalidation(
+    status: Optional[str] = Query(None, description="Only re-check items with this status (e.g. already_available)")
+):
+    """Make scheduled items due, so the next sync checks their Overseerr status again"""
+    try:
+        from list_sync.database import reset_revalidation_schedule
+        reset_count = reset_revalidation_schedule(status)
+        return {
+            "success": True,
+            "reset_count": reset_count,
+            "message": f"{reset_count} item(s) will be re-checked on the next sync"
+        }
+    except Exception as e:
+        logging.error(f"Error resetting revalidation schedule: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/processed")
 async def get_processed_items(
     page: int = Query(1, ge=1), 
@@ -4440,7 +4374,7 @@ async def get_processed_items(
         
         if item_ids:
             try:
-                with sqlite3.connect(DB_FILE) as conn:
+                with get_connection() as conn:
                     cursor = conn.cursor()
                     placeholders = ','.join('?' * len(item_ids))
                     
@@ -4706,7 +4640,7 @@ async def get_requested_items(
                 }
             }
         
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection()
         cursor = conn.cursor()
         
         # Build WHERE clause for filters - ONLY include 'requested' status, not 'already_requested'
@@ -6973,7 +6907,7 @@ def enrich_historic_data_with_database(historic_items):
         return historic_items
     
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection()
         cursor = conn.cursor()
         
         # Get all database items with their IDs, year, and source list info
@@ -8347,10 +8281,9 @@ async def cleanup_image_cache(hours: int = Query(24, description="Remove images
 async def list_cached_images(limit: int = Query(50, ge=1, le=1000)):
     """List cached images for debugging."""
     try:
-        from list_sync.database import DB_FILE
         import sqlite3
 
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('''
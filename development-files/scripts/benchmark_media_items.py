@@ -0,0 +1,80 @@
+"""
+Memory benchmark: fetched media items as plain dicts vs. MediaItem.
+
+Builds the same set of items both ways, tagged with their source list and a _source_lists
+entry the way fetch_list_items and the de-duplication pass do, and reports the memory held.
+
+Usage (from the repository root):
+    python development-files/scripts/benchmark_media_items.py [item_count]
+"""
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from list_sync.media_item import ListRef, MediaItem
+
+LISTS = [("trakt", f"user/list-{i}", "1") for i in range(20)]
+
+
+def provider_items(count):
+    """Items as providers return them."""
+    for i in range(count):
+        yield {
+            "title": f"Movie Title {i}",
+            "year": 1950 + i % 75,
+            "media_type": "movie" if i % 3 else "tv",
+            "imdb_id": f"tt{1000000 + i:07d}",
+            "tmdb_id": str(10000 + i),
+        }
+
+
+def build_dicts(count):
+    items = []
+    for i, item in enumerate(provider_items(count)):
+        list_type, list_id, user_id = LISTS[i % len(LISTS)]
+        item["_source_list_type"] = list_type
+        item["_source_list_id"] = list_id
+        item["_source_list_user_id"] = user_id
+        item["_source_lists"] = [{"type": list_type, "id": list_id, "user_id": user_id}]
+        items.append(item)
+    return items
+
+
+def build_media_items(count):
+    items = []
+    for i, data in enumerate(provider_items(count)):
+        item = MediaItem.from_dict(data)
+        item.set_source_list(*LISTS[i % len(LISTS)])
+        item["_source_lists"] = [ListRef(*LISTS[i % len(LISTS)])]
+        items.append(item)
+    return items
+
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    items = build(count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"=== {count:,} MEDIA ITEMS ===\n")
+    results = {}
+    for name, build in (("dict", build_dicts), ("MediaItem", build_media_items)):
+        current, peak = measure(build, count)
+        results[name] = current
+        print(f"{name:>10}: {current / 1024 / 1024:7.1f} MB held, {peak / 1024 / 1024:7.1f} MB peak, "
+              f"{current / count:6.0f} bytes/item")
+    print(f"\nMediaItem uses {results['MediaItem'] / results['dict'] * 100:.0f}% of the dict representation")
+
+
+if __name__ == "__main__":
+    main()
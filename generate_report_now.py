@@ -20,12 +20,11 @@ logger = logging.getLogger(__name__)
 
 def get_sync_results_from_db():
     """Get sync results from database"""
-    from list_sync.database import DB_FILE
-    import sqlite3
+    from list_sync.database import get_connection
     
     sync_results = SyncResults()
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Get total items
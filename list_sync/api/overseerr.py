@@ -4,15 +4,39 @@ Overseerr API client for the ListSync application.
 
 import json
 import logging
+import threading
 import requests
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from urllib.parse import quote
 
+from ..utils import http_client
 from ..utils.helpers import calculate_title_similarity, custom_input, color_gradient
 
+class _InFlightRequest:
+    """A media-detail request that other threads asking for the same media wait on."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[Exception] = None
+
+
 class OverseerrClient:
     """Client for interacting with the Overseerr API."""
     
+    # Page size used when listing media and requests for the availability index
+    AVAILABILITY_PAGE_SIZE = 250
+    
+    # Media status codes as interpreted by get_media_status. For 4K, status4k is 1 (unknown)
+    # on every media entry that has no 4K request, so only 2-3 count as requested there.
+    AVAILABLE_STATUSES = (4, 5)
+    REQUESTED_STATUSES = (1, 2, 3)
+    REQUESTED_STATUSES_4K = (2, 3)
+    # Per-season media status codes: pending/processing count as requested, partially
+    # available/available as available. Request status codes: pending approval, approved.
+    SEASON_REQUESTED_STATUSES = (2, 3)
+    ACTIVE_REQUEST_STATUSES = (1, 2)
+    
     def __init__(self, overseerr_url: str, api_key: str, requester_user_id: str = "1"):
         """
         Initialize the Overseerr API client.
@@ -27,6 +51,12 @@ class OverseerrClient:
         self.requester_user_id = requester_user_id
         self.headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
         self.request_headers = {"X-Api-Key": api_key, "X-Api-User": requester_user_id, "Content-Type": "application/json"}
+        # (tmdb_id, media_type) -> (status, status4k), filled by prefetch_availability_index()
+        self._availability_index: Optional[Dict[Tuple[int, str], Tuple[Optional[int], Optional[int]]]] = None
+        # (media_type, tmdb_id) -> media detail response, kept for one sync (see enable_media_cache)
+        self._media_cache: Optional[Dict[Tuple[str, str], requests.Response]] = None
+        self._media_in_flight: Dict[Tuple[str, str], _InFlightRequest] = {}
+        self._media_lock = threading.Lock()
 
     def _headers_for_user(self, requester_user_id: Optional[str] = None) -> Dict[str, str]:
         """
@@ -48,7 +78,7 @@ class OverseerrClient:
         """
         test_url = f"{self.overseerr_url}/api/v1/status"
         try:
-            response = requests.get(test_url, headers=self.headers)
+            response = http_client.get(test_url, headers=self.headers)
             response.raise_for_status()
             logging.info("Overseerr API connection successful!")
             return True
@@ -66,7 +96,7 @@ class OverseerrClient:
         users_url = f"{self.overseerr_url}/api/v1/user"
         try:
             requester_user_id = "1"
-            response = requests.get(users_url, headers=self.headers)
+            response = http_client.get(users_url, headers=self.headers)
             response.raise_for_status()
             jsonResult = response.json()
             
@@ -85,6 +115,67 @@ class OverseerrClient:
             logging.error(f"Failed to set requester user. Error: {str(e)}")
             return "1"  # Default fallback
     
+    def enable_media_cache(self):
+        """
+        Start caching media detail responses (call at the start of a sync).
+        
+        get_media_by_tmdb_id and get_media_status read the same /api/v1/{type}/{id}
+        response, so with the cache each item costs one request instead of two.
+        """
+        with self._media_lock:
+            self._media_cache = {}
+    
+    def clear_media_cache(self):
+        """Drop cached media details and stop caching (call at the end of a sync)."""
+        with self._media_lock:
+            self._media_cache = None
+    
+    def reset_sync_caches(self):
+        """Drop all per-sync state: the availability index and the media detail cache."""
+        self.clear_availability_index()
+        self.clear_media_cache()
+    
+    def _get_media_details(self, media_type: str, tmdb_id: Any, timeout: int = 10) -> requests.Response:
+        """
+        GET /api/v1/{media_type}/{tmdb_id}, shared between concurrent callers and cached per sync.
+        
+        Concurrent requests for the same media wait for the first one instead of issuing their
+        own (single-flight). Successful and 404 responses are cached while the media cache is
+        enabled; other responses and errors are handed to every waiting caller but not kept.
+        
+        Returns:
+            requests.Response: The (possibly cached) response
+        """
+        key = (media_type, str(tmdb_id))
+        with self._media_lock:
+            if self._media_cache is not None and key in self._media_cache:
+                return self._media_cache[key]
+            flight = self._media_in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._media_in_flight[key] = _InFlightRequest()
+        
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        
+        try:
+            media_url = f"{self.overseerr_url}/api/v1/{media_type}/{tmdb_id}"
+            flight.response = http_client.get(media_url, headers=self.headers, timeout=timeout)
+            with self._media_lock:
+                if self._media_cache is not None and flight.response.status_code in (200, 404):
+                    self._media_cache[key] = flight.response
+            return flight.response
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._media_lock:
+                self._media_in_flight.pop(key, None)
+            flight.done.set()
+    
     def get_media_by_tmdb_id(self, tmdb_id: int, media_type: str) -> Optional[Dict[str, Any]]:
         """
         Get media details directly by TMDB ID (no search needed).
@@ -102,7 +193,7 @@ class OverseerrClient:
             logging.info(f"🎯 Overseerr API: Direct lookup by TMDB ID: {tmdb_id} [{media_type}]")
             logging.debug(f"Request URL: {media_url}")
             
-            response = requests.get(media_url, headers=self.headers, timeout=10)
+            response = self._get_media_details(media_type, tmdb_id)
             
             if response.status_code == 404:
                 logging.info(f"❌ Overseerr API: TMDB ID {tmdb_id} not found in Overseerr")
@@ -173,13 +264,7 @@ class OverseerrClient:
                 
                 logging.info(f"  📄 Overseerr API: Searching page {page} for '{search_title}' (Year: {release_year})")
                 logging.debug(f"  Request URL: {url}")
-                response = requests.get(url, headers=self.headers, timeout=10)
-                
-                if response.status_code == 429:
-                    logging.warning("Rate limited, waiting 5 seconds...")
-                    import time
-                    time.sleep(5)
-                    continue
+                response = http_client.get(url, headers=self.headers, timeout=10)
                 
                 if response.status_code == 403:
                     logging.error(f"❌ Overseerr API: 403 Forbidden - API key does not have permission to access /api/v1/search")
@@ -246,10 +331,6 @@ class OverseerrClient:
                 
             except requests.exceptions.RequestException as e:
                 logging.error(f'Error searching for "{search_title}": {str(e)}')
-                if "429" in str(e):
-                    import time
-                    time.sleep(5)
-                    continue
                 raise
 
         if best_match:
@@ -272,13 +353,187 @@ class OverseerrClient:
         logging.warning(f'❌ Overseerr API: No matching results found for "{media_title}" ({release_year}) of type "{media_type}"')
         return None
     
-    def get_media_status(self, media_id: int, media_type: str) -> Tuple[bool, bool, int]:
+    def _page_through(self, endpoint: str) -> list:
+        """
+        Collect all results of a paged Overseerr listing endpoint.
+        
+        Args:
+            endpoint (str): Endpoint path with query string, e.g. "/api/v1/media?filter=all"
+            
+        Returns:
+            list: Results of all pages
+        """
+        results = []
+        skip = 0
+        while True:
+            url = f"{self.overseerr_url}{endpoint}&take={self.AVAILABILITY_PAGE_SIZE}&skip={skip}"
+            response = http_client.get(url, headers=self.headers, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            page_results = data.get("results", [])
+            results.extend(page_results)
+            
+            page_info = data.get("pageInfo", {})
+            skip += self.AVAILABILITY_PAGE_SIZE
+            if not page_results or page_info.get("page", 1) >= page_info.get("pages", 1):
+                break
+        return results
+    
+    def prefetch_availability_index(self) -> bool:
+        """
+        Build an in-memory availability index from Overseerr's media and request listings.
+        
+        Maps (tmdb_id, media_type) to the non-4K and 4K media status, so get_media_status can
+        answer most items without a per-item request. Media that only appears in a request
+        (not yet in the media listing) is recorded as requested.
+        
+        Returns:
+            bool: True if the index was built, False if Overseerr could not be listed
+        """
+        index = {}
+        try:
+            for media in self._page_through("/api/v1/media?filter=all&sort=added"):
+                tmdb_id = media.get("tmdbId")
+                media_type = media.get("mediaType")
+                if tmdb_id and media_type:
+                    index[(int(tmdb_id), media_type)] = (media.get("status"), media.get("status4k"))
+            media_count = len(index)
+            
+            for req in self._page_through("/api/v1/request?filter=all&sort=added"):
+                media = req.get("media") or {}
+                tmdb_id = media.get("tmdbId")
+                media_type = media.get("mediaType") or req.get("type")
+                if not tmdb_id or not media_type:
+                    continue
+                # Only pending-approval (1) and approved (2) requests count as requested
+                if req.get("status") not in (1, 2):
+                    continue
+                key = (int(tmdb_id), media_type)
+                status, status4k = index.get(key, (media.get("status"), media.get("status4k")))
+                # An open request whose media has no status yet still counts as pending (2)
+                if req.get("is4k"):
+                    status4k = 2 if status4k in (None, 0, 1) else status4k
+                else:
+                    status = 2 if status in (None, 0) else status
+                index[key] = (status, status4k)
+        except Exception as e:
+            logging.warning(f"⚠️ Could not build Overseerr availability index, falling back to per-item lookups: {e}")
+            self._availability_index = None
+            return False
+        
+        self._availability_index = index
+        logging.info(f"📇 Overseerr availability index: {media_count} media entries, {len(index)} total after requests")
+        return True
+    
+    def clear_availability_index(self):
+        """Drop the availability index so status checks go back to per-item lookups."""
+        self._availability_index = None
+    
+    def get_availability_index(self) -> Optional[Dict[Tuple[int, str], Tuple[Optional[int], Optional[int]]]]:
+        """The index built by prefetch_availability_index(), or None if it is not loaded."""
+        return self._availability_index
+    
+    def set_availability_index(self, index: Optional[Dict[Tuple[int, str], Tuple[Optional[int], Optional[int]]]]):
+        """Use an availability index built by another client (a shard process gets its parent's)."""
+        self._availability_index = index
+    
+    def _indexed_media_status(self, media_id: int, media_type: str, is_4k: bool) -> Optional[Tuple[bool, bool, int]]:
+        """
+        Answer get_media_status from the availability index, if it can.
+        
+        Returns:
+            Optional[Tuple[bool, bool, int]]: Status tuple, or None if a per-item lookup is needed
+            (index not loaded, media not indexed, or a TV show that will need its season count)
+        """
+        if self._availability_index is None:
+            return None
+        entry = self._availability_index.get((media_id, media_type))
+        if entry is None:
+            return None
+        
+        status = entry[1] if is_4k else entry[0]
+        # Season count only matters when a TV show is about to be requested
+        if status in self.AVAILABLE_STATUSES:
+            return True, False, 1
+        if status in (self.REQUESTED_STATUSES_4K if is_4k else self.REQUESTED_STATUSES):
+            return False, True, 1
+        if media_type == "movie":
+            return False, False, 1
+        return None
+    
+    def indexed_status(self, media_id: int, media_type: str, is_4k: bool = False) -> Optional[int]:
+        """Media status from the availability index, or None if the index is not loaded or lacks the media."""
+        if self._availability_index is None:
+            return None
+        entry = self._availability_index.get((int(media_id), media_type))
+        if entry is None:
+            return None
+        return entry[1] if is_4k else entry[0]
+    
+    def get_tv_season_state(self, tv_id: int, is_4k: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Work out which seasons of a TV show are available, requested or still missing.
+        
+        Reads the show's detail response (shared with get_media_status through the media
+        cache): the season list, mediaInfo's per-season statuses and the seasons of its open
+        requests. Specials (season 0) are left out, as in request_tv_series.
+        
+        Args:
+            tv_id (int): TV series TMDB ID
+            is_4k (bool, optional): Whether to read the 4K statuses. Defaults to False.
+            
+        Returns:
+            Optional[Dict[str, Any]]: {'media_status', 'seasons', 'available', 'requested', 'missing'}
+            with sorted season number lists, or None if the details could not be read
+        """
+        try:
+            response = self._get_media_details("tv", tv_id)
+            response.raise_for_status()
+            media_data = response.json()
+        except Exception as e:
+            logging.warning(f"Could not read season details for TV series ID {tv_id}: {e}")
+            return None
+        
+        seasons = {season.get("seasonNumber") for season in media_data.get("seasons") or []}
+        seasons = {season for season in seasons if isinstance(season, int) and season > 0}
+        if not seasons:
+            seasons = set(range(1, self.extract_number_of_seasons(media_data) + 1))
+        
+        media_info = media_data.get("mediaInfo") or {}
+        status_key = "status4k" if is_4k else "status"
+        available, requested = set(), set()
+        for season in media_info.get("seasons") or []:
+            status = season.get(status_key)
+            if status in self.AVAILABLE_STATUSES:
+                available.add(season.get("seasonNumber"))
+            elif status in self.SEASON_REQUESTED_STATUSES:
+                requested.add(season.get("seasonNumber"))
+        for request in media_info.get("requests") or []:
+            if bool(request.get("is4k")) != bool(is_4k) or request.get("status") not in self.ACTIVE_REQUEST_STATUSES:
+                continue
+            requested.update(season.get("seasonNumber") for season in request.get("seasons") or [])
+        
+        available &= seasons
+        requested = (requested & seasons) - available
+        return {
+            "media_status": media_info.get(status_key),
+            "seasons": sorted(seasons),
+            "available": sorted(available),
+            "requested": sorted(requested),
+            "missing": sorted(seasons - available - requested),
+        }
+    
+    def get_media_status(self, media_id: int, media_type: str, is_4k: bool = False) -> Tuple[bool, bool, int]:
         """
         Get the status of media in Overseerr.
         
+        Uses the availability index when it has been prefetched, otherwise (or on a miss)
+        requests the media details.
+        
         Args:
             media_id (int): Media ID (must be integer, not string)
             media_type (str): Media type (movie or tv)
+            is_4k (bool, optional): Whether to check the 4K status. Defaults to False.
             
         Returns:
             Tuple[bool, bool, int]: Availability, requested status, and number of seasons
@@ -290,10 +545,13 @@ class OverseerrClient:
             logging.error(f"Invalid media_id type in get_media_status: {type(media_id)} = {media_id}")
             raise ValueError(f"media_id must be an integer, got {type(media_id)}: {media_id}")
         
-        media_url = f"{self.overseerr_url}/api/v1/{media_type}/{media_id}"
+        indexed = self._indexed_media_status(media_id, media_type, is_4k)
+        if indexed is not None:
+            logging.debug(f"Overseerr {media_type} ID {media_id}: status from availability index")
+            return indexed
         
         try:
-            response = requests.get(media_url, headers=self.headers)
+            response = self._get_media_details(media_type, media_id)
             response.raise_for_status()
             media_data = response.json()
             # Log only essential info instead of full response to reduce log size
@@ -301,7 +559,7 @@ class OverseerrClient:
             logging.debug(f"Overseerr {media_type} ID {media_id}: status={status}")
 
             media_info = media_data.get("mediaInfo", {})
-            status = media_info.get("status") if media_info else None
+            status = media_info.get("status4k" if is_4k else "status") if media_info else None
             number_of_seasons = self.extract_number_of_seasons(media_data)
 
             # Handle None status (no mediaInfo - movie not in Overseerr yet)
@@ -326,8 +584,8 @@ class OverseerrClient:
                 logging.debug(f"Status 0 for {media_type} ID {media_id}: Not requested yet (available to request)")
                 return False, False, number_of_seasons
             
-            is_available_to_watch = status in [4, 5]
-            is_requested = status in [1, 2, 3]
+            is_available_to_watch = status in self.AVAILABLE_STATUSES
+            is_requested = status in (self.REQUESTED_STATUSES_4K if is_4k else self.REQUESTED_STATUSES)
 
             return is_available_to_watch, is_requested, number_of_seasons
         except Exception as e:
@@ -348,7 +606,7 @@ class OverseerrClient:
             # Query requests endpoint
             # filter=pending will get requests with status=1 (REQUESTED/pending approval)
             requests_url = f"{self.overseerr_url}/api/v1/request?take={limit}&filter=pending&sort=added"
-            response = requests.get(requests_url, headers=self.headers)
+            response = http_client.get(requests_url, headers=self.headers)
             response.raise_for_status()
             data = response.json()
             
@@ -417,7 +675,7 @@ class OverseerrClient:
         }
         
         try:
-            response = requests.post(request_url, headers=self._headers_for_user(requester_user_id), json=payload)
+            response = http_client.post(request_url, headers=self._headers_for_user(requester_user_id), json=payload)
             response.raise_for_status()
             # Log only success/error instead of full response to reduce log size
             logging.debug(f"Request successful for {media_type} ID {media_id}")
@@ -454,6 +712,20 @@ class OverseerrClient:
         Returns:
             str: Status of the request ("success" or "error")
         """
+        return self.request_tv_seasons(tv_id, list(range(1, number_of_seasons + 1)), is_4k, requester_user_id)
+    
+    def request_tv_seasons(self, tv_id: int, seasons: List[int], is_4k: bool = False, requester_user_id: Optional[str] = None) -> str:
+        """
+        Request the given seasons of a TV series in Overseerr.
+        
+        Args:
+            tv_id (int): TV series ID (must be integer, not string)
+            seasons (List[int]): Season numbers to request
+            is_4k (bool, optional): Whether to request 4K. Defaults to False.
+            
+        Returns:
+            str: Status of the request ("success", "already_requested" or "error")
+        """
         # Ensure tv_id is an integer (may be string from API responses)
         try:
             tv_id = int(tv_id)
@@ -463,7 +735,7 @@ class OverseerrClient:
         
         request_url = f"{self.overseerr_url}/api/v1/request"
         
-        seasons_list = [i for i in range(1, number_of_seasons + 1)]
+        seasons_list = list(seasons)
         logging.debug(f"Seasons list for TV series ID {tv_id}: {seasons_list}")
         
         payload = {
@@ -473,10 +745,10 @@ class OverseerrClient:
             "seasons": seasons_list
         }
         
-        logging.debug(f"Requesting TV series ID {tv_id}: {number_of_seasons} seasons")
+        logging.debug(f"Requesting TV series ID {tv_id}: {len(seasons_list)} seasons")
 
         try:
-            response = requests.post(request_url, headers=self._headers_for_user(requester_user_id), json=payload)
+            response = http_client.post(request_url, headers=self._headers_for_user(requester_user_id), json=payload)
             response.raise_for_status()
             logging.debug(f"TV series request successful for ID {tv_id}")
             return "success"
@@ -531,7 +803,7 @@ class OverseerrClient:
         logging.info(f"📺 Requesting Season {season_number} for TV series TMDB ID {tv_id}")
 
         try:
-            response = requests.post(request_url, headers=self._headers_for_user(requester_user_id), json=payload)
+            response = http_client.post(request_url, headers=self._headers_for_user(requester_user_id), json=payload)
             response.raise_for_status()
             logging.info(f"✅ Successfully requested Season {season_number} for TV series ID {tv_id}")
             return "success"
@@ -144,7 +144,7 @@ class BlocklistManager:
             return False
         
         try:
-            import requests
+            from .utils import http_client
             
             # Get TMDB API key from environment
             tmdb_key = os.getenv('TMDB_KEY', '')
@@ -156,7 +156,7 @@ class BlocklistManager:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}"
             params = {'api_key': tmdb_key}
             
-            response = requests.get(url, params=params, timeout=5)
+            response = http_client.get(url, params=params, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
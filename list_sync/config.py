@@ -10,11 +10,11 @@ import sqlite3
 import time
 from typing import Optional, Tuple
 
-import requests
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
 from halo import Halo
 
+from .utils import http_client
 from .utils.helpers import custom_input, color_gradient
 from .utils.logger import DATA_DIR
 
@@ -108,7 +108,7 @@ def test_overseerr_api(overseerr_url, api_key):
     spinner = Halo(text=color_gradient("🔍  Testing API connection...", "#ffaa00", "#ff5500"), spinner="dots")
     spinner.start()
     try:
-        response = requests.get(test_url, headers=headers)
+        response = http_client.get(test_url, headers=headers)
         response.raise_for_status()
         spinner.succeed(color_gradient("🎉  API connection successful!", "#00ff00", "#00aa00"))
         import logging
@@ -125,7 +125,7 @@ def set_requester_user(overseerr_url, api_key):
     users_url = f"{overseerr_url}/api/v1/user"
     try:
         requester_user_id = "1"
-        response = requests.get(users_url, headers=headers)
+        response = http_client.get(users_url, headers=headers)
         response.raise_for_status()
         jsonResult = response.json()
         if jsonResult['pageInfo']['results'] > 1:
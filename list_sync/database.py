@@ -4,9 +4,17 @@ Database operations for ListSync.
 
 import sqlite3
 import os
+import random
+import re
 import logging
 import hashlib
-from typing import Dict, List, Optional, Any
+import itertools
+import threading
+import time
+import queue
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 from .utils.logger import DATA_DIR
@@ -15,137 +23,557 @@ from .utils.logger import DATA_DIR
 DB_FILE = os.path.join(DATA_DIR, "list_sync.db")
 
 
-def update_existing_list_urls():
+# ============================================================================
+# Connection Management - pooled per-thread connections in WAL mode
+# ============================================================================
+#
+# The core sync, its worker threads and the API server all use the same database file.
+# Connections are opened once per thread and database file, put in WAL mode (readers and
+# the writer no longer block each other) and kept open, so SQLite's page cache, memory map
+# and the prepared statement cache survive between calls.
+
+_pool = threading.local()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default)) or default))
+    except ValueError:
+        logging.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def open_connection(db_file: Optional[str] = None) -> sqlite3.Connection:
+    """
+    Open a new, unpooled connection with the connection PRAGMAs applied. The caller closes it.
+
+    Tuning knobs: LISTSYNC_DB_BUSY_TIMEOUT (seconds, default 30), LISTSYNC_DB_CACHE_MB
+    (page cache, default 16), LISTSYNC_DB_MMAP_MB (memory map, default 128) and
+    LISTSYNC_DB_STATEMENT_CACHE (prepared statements kept per connection, default 256).
+    """
+    conn = sqlite3.connect(
+        db_file or DB_FILE,
+        timeout=_env_number('LISTSYNC_DB_BUSY_TIMEOUT', 30),
+        cached_statements=int(_env_number('LISTSYNC_DB_STATEMENT_CACHE', 256)),
+    )
+    journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+    if journal_mode.lower() != 'wal':
+        logging.debug(f"SQLite WAL mode unavailable for {db_file or DB_FILE}, using {journal_mode}")
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(f"PRAGMA cache_size=-{int(_env_number('LISTSYNC_DB_CACHE_MB', 16) * 1024)}")
+    conn.execute(f"PRAGMA mmap_size={int(_env_number('LISTSYNC_DB_MMAP_MB', 128) * 1024 * 1024)}")
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+
+class _PoolEntry:
+    """A thread's pooled connection to one database file and its number of open checkouts."""
+    
+    __slots__ = ('conn', 'checkouts')
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.checkouts = 0
+
+
+_savepoint_ids = itertools.count(1)
+
+
+class PooledConnection:
+    """
+    A checkout of the calling thread's pooled connection.
+
+    Behaves like the sqlite3.Connection call sites used to open themselves: `with` commits or
+    rolls back, close() discards uncommitted changes, and row_factory applies to cursors made
+    through this checkout only, so nested checkouts in the same thread don't affect each other.
+    close() leaves the underlying connection open for the next checkout.
+    
+    Only the outermost checkout ends a transaction. A checkout made while another checkout of
+    the thread has a transaction open works in a SAVEPOINT instead: its commit and rollback
+    apply to its own changes, which the outer transaction then commits or rolls back.
+    """
+
+    def __init__(self, entry: _PoolEntry):
+        self._entry = entry
+        self._conn = entry.conn
+        self._released = False
+        self._savepoint = None
+        self.row_factory = None
+        entry.checkouts += 1
+        if entry.checkouts > 1 and self._conn.in_transaction:
+            self._savepoint = f"checkout_{next(_savepoint_ids)}"
+            self._conn.execute(f'SAVEPOINT {self._savepoint}')
+
+    def _savepoint_sql(self, *statements: str):
+        try:
+            for statement in statements:
+                self._conn.execute(f'{statement} {self._savepoint}')
+        except sqlite3.OperationalError as e:
+            # The outer checkout already ended its transaction, and the savepoint with it
+            logging.debug(f"Nested database checkout lost its savepoint: {e}")
+
+    def _release(self):
+        if not self._released:
+            self._released = True
+            self._entry.checkouts -= 1
+
+    def cursor(self) -> sqlite3.Cursor:
+        cursor = self._conn.cursor()
+        cursor.row_factory = self.row_factory
+        return cursor
+
+    def execute(self, sql: str, parameters=()) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str) -> sqlite3.Cursor:
+        return self._conn.executescript(sql_script)
+
+    def commit(self):
+        if self._savepoint:
+            self._savepoint_sql('RELEASE', 'SAVEPOINT')
+        else:
+            self._conn.commit()
+
+    def rollback(self):
+        if self._savepoint:
+            self._savepoint_sql('ROLLBACK TO')
+        else:
+            self._conn.rollback()
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._conn.in_transaction
+
+    @property
+    def total_changes(self) -> int:
+        return self._conn.total_changes
+
+    def close(self):
+        if self._released:
+            return
+        if self._savepoint:
+            self._savepoint_sql('ROLLBACK TO', 'RELEASE')
+        elif self._conn.in_transaction:
+            self._conn.rollback()
+        self._release()
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._released:
+            return False
+        try:
+            if self._savepoint:
+                self._savepoint_sql(*(('ROLLBACK TO', 'RELEASE') if exc_type else ('RELEASE',)))
+                return False
+            return self._conn.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._release()
+
+    def __del__(self):
+        # A checkout that is dropped without close() no longer counts as open
+        self._release()
+
+
+def get_connection(db_file: Optional[str] = None) -> PooledConnection:
+    """
+    Check out this thread's connection to the database (opened on first use).
+
+    Args:
+        db_file (str, optional): Database file. Defaults to DB_FILE.
+
+    Returns:
+        PooledConnection: Use as `with get_connection() as conn:`, like sqlite3.connect()
+    """
+    path = db_file or DB_FILE
+    connections = getattr(_pool, 'connections', None)
+    if connections is None or _pool.pid != os.getpid():
+        # First use in this thread, or a forked child that must not share the parent's handles
+        connections = _pool.connections = {}
+        _pool.pid = os.getpid()
+    entry = connections.get(path)
+    if entry is None:
+        entry = connections[path] = _PoolEntry(open_connection(path))
+    return PooledConnection(entry)
+
+
+def update_existing_list_urls(cursor: sqlite3.Cursor):
     """Update URLs for existing lists that may have incorrect URLs stored."""
     from .utils.helpers import construct_list_url
     
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        
-        # Get all lists to check their URLs
-        cursor.execute("SELECT list_type, list_id, list_url FROM lists")
-        all_lists = cursor.fetchall()
-        
-        updated_count = 0
-        for list_type, list_id, current_url in all_lists:
-            try:
-                # Generate the correct URL
-                correct_url = construct_list_url(list_type, list_id)
+    # Get all lists to check their URLs
+    cursor.execute("SELECT list_type, list_id, list_url FROM lists")
+    all_lists = cursor.fetchall()
+    
+    updated_count = 0
+    for list_type, list_id, current_url in all_lists:
+        try:
+            # Generate the correct URL
+            correct_url = construct_list_url(list_type, list_id)
+            
+            # Update if the URLs don't match
+            if current_url != correct_url:
+                cursor.execute(
+                    "UPDATE lists SET list_url = ? WHERE list_type = ? AND list_id = ?",
+                    (correct_url, list_type, list_id)
+                )
+                updated_count += 1
+                logging.info(f"Updated URL for {list_type} list {list_id}: {current_url} -> {correct_url}")
                 
-                # Update if the URLs don't match
-                if current_url != correct_url:
-                    cursor.execute(
-                        "UPDATE lists SET list_url = ? WHERE list_type = ? AND list_id = ?",
-                        (correct_url, list_type, list_id)
-                    )
-                    updated_count += 1
-                    logging.info(f"Updated URL for {list_type} list {list_id}: {current_url} -> {correct_url}")
-                    
-            except Exception as e:
-                logging.warning(f"Failed to update URL for {list_type} list {list_id}: {e}")
-        
-        if updated_count > 0:
-            conn.commit()
-            logging.info(f"Updated {updated_count} list URLs")
-        else:
-            logging.info("All list URLs are correct")
+        except Exception as e:
+            logging.warning(f"Failed to update URL for {list_type} list {list_id}: {e}")
+    
+    if updated_count > 0:
+        logging.info(f"Updated {updated_count} list URLs")
+    else:
+        logging.info("All list URLs are correct")
 
 
-def remove_simkl_column():
+def remove_simkl_column(cursor: sqlite3.Cursor):
     """Remove the simkl_id column from synced_items table since SIMKL is disabled."""
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        
-        # Check if simkl_id column exists
-        cursor.execute("PRAGMA table_info(synced_items)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'simkl_id' in columns:
-            # SQLite doesn't support DROP COLUMN directly, so we need to recreate the table
-            logging.info("Removing simkl_id column from synced_items table")
-            
-            # Create new table without simkl_id column
-            cursor.execute('''
-                CREATE TABLE synced_items_new (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    media_type TEXT NOT NULL,
-                    year INTEGER,
-                    imdb_id TEXT,
-                    tmdb_id TEXT,
-                    overseerr_id INTEGER,
-                    status TEXT,
-                    last_synced TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Copy data from old table to new table (excluding simkl_id)
-            cursor.execute('''
-                INSERT INTO synced_items_new (id, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced)
-                SELECT id, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced
-                FROM synced_items
-            ''')
-            
-            # Drop old table and rename new table
-            cursor.execute('DROP TABLE synced_items')
-            cursor.execute('ALTER TABLE synced_items_new RENAME TO synced_items')
-            
-            conn.commit()
-            logging.info("Successfully removed simkl_id column from synced_items table")
-        else:
-            logging.info("simkl_id column does not exist in synced_items table")
+    # Check if simkl_id column exists
+    cursor.execute("PRAGMA table_info(synced_items)")
+    table_columns = cursor.fetchall()
+    columns = [column for column in table_columns if column[1] != 'simkl_id']
+    
+    if len(columns) < len(table_columns):
+        # SQLite doesn't support DROP COLUMN directly, so we need to recreate the table
+        logging.info("Removing simkl_id column from synced_items table")
+        
+        # Create new table with every other column, as currently defined
+        definitions = []
+        for _, name, column_type, not_null, default, primary_key in columns:
+            if primary_key:
+                definitions.append(f"{name} INTEGER PRIMARY KEY AUTOINCREMENT")
+                continue
+            definition = f"{name} {column_type}"
+            if not_null:
+                definition += " NOT NULL"
+            if default is not None:
+                definition += f" DEFAULT {default}"
+            definitions.append(definition)
+        cursor.execute(f"CREATE TABLE synced_items_new ({', '.join(definitions)})")
+        
+        # Copy data from old table to new table (excluding simkl_id)
+        names = ', '.join(column[1] for column in columns)
+        cursor.execute(f"INSERT INTO synced_items_new ({names}) SELECT {names} FROM synced_items")
+        
+        # Drop old table and rename new table
+        cursor.execute('DROP TABLE synced_items')
+        cursor.execute('ALTER TABLE synced_items_new RENAME TO synced_items')
+        
+        logging.info("Successfully removed simkl_id column from synced_items table")
+    else:
+        logging.info("simkl_id column does not exist in synced_items table")
 
-def migrate_list_urls():
+def migrate_list_urls(cursor: sqlite3.Cursor):
     """Migrate existing lists to populate missing URLs and add item_count and last_synced columns."""
     from .utils.helpers import construct_list_url
     
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
+    # Add item_count column if it doesn't exist
+    try:
+        cursor.execute('ALTER TABLE lists ADD COLUMN item_count INTEGER DEFAULT 0')
+        logging.info("Added item_count column to lists table")
+    except sqlite3.OperationalError:
+        # Column already exists
+        pass
+    
+    # Add last_synced column if it doesn't exist
+    try:
+        cursor.execute('ALTER TABLE lists ADD COLUMN last_synced TIMESTAMP')
+        logging.info("Added last_synced column to lists table")
+    except sqlite3.OperationalError:
+        # Column already exists
+        pass
+    
+    # Get all lists that don't have URLs
+    cursor.execute("SELECT list_type, list_id FROM lists WHERE list_url IS NULL OR list_url = ''")
+    lists_without_urls = cursor.fetchall()
+    
+    if lists_without_urls:
+        logging.info(f"Migrating {len(lists_without_urls)} lists to add URLs")
         
-        # Add item_count column if it doesn't exist
-        try:
-            cursor.execute('ALTER TABLE lists ADD COLUMN item_count INTEGER DEFAULT 0')
-            logging.info("Added item_count column to lists table")
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
+        for list_type, list_id in lists_without_urls:
+            try:
+                list_url = construct_list_url(list_type, list_id)
+                cursor.execute(
+                    "UPDATE lists SET list_url = ? WHERE list_type = ? AND list_id = ?",
+                    (list_url, list_type, list_id)
+                )
+                logging.info(f"Added URL for {list_type} list {list_id}: {list_url}")
+            except Exception as e:
+                logging.warning(f"Failed to generate URL for {list_type} list {list_id}: {e}")
         
-        # Add last_synced column if it doesn't exist
-        try:
-            cursor.execute('ALTER TABLE lists ADD COLUMN last_synced TIMESTAMP')
-            logging.info("Added last_synced column to lists table")
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
+        logging.info("URL migration completed")
+    
+    # Also update any existing URLs that might be incorrect
+    update_existing_list_urls(cursor)
+
+
+# ============================================================================
+# Schema Migrations - one-time changes, tracked in PRAGMA user_version
+# ============================================================================
+
+def _merge_synced_items(cursor: sqlite3.Cursor, keep_id: int, duplicate_ids: List[int]):
+    """
+    Fold duplicate synced_items rows into keep_id.
+
+    The duplicates' list links, list history and sync history move to keep_id (links to lists keep_id
+    is already on are dropped), and the rows are archived in merged_synced_items before they are deleted.
+    """
+    for duplicate_id in duplicate_ids:
+        cursor.execute('''
+            INSERT OR REPLACE INTO merged_synced_items
+            (id, merged_into, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced)
+            SELECT id, ?, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced
+            FROM synced_items WHERE id = ?
+        ''', (keep_id, duplicate_id))
+        cursor.execute('UPDATE OR IGNORE item_lists SET item_id = ? WHERE item_id = ?', (keep_id, duplicate_id))
+        cursor.execute('DELETE FROM item_lists WHERE item_id = ?', (duplicate_id,))
+        cursor.execute('UPDATE list_changes SET item_id = ? WHERE item_id = ?', (keep_id, duplicate_id))
+        cursor.execute('UPDATE sync_items SET item_id = ? WHERE item_id = ?', (keep_id, duplicate_id))
+        cursor.execute('DELETE FROM synced_items WHERE id = ?', (duplicate_id,))
+
+
+# Values that don't identify an item (save_sync_result skips falsy IDs when matching)
+_IDENTITY_CONDITIONS = {
+    'overseerr_id': "overseerr_id IS NOT NULL AND overseerr_id != 0",
+    'imdb_id': "imdb_id IS NOT NULL AND imdb_id != ''",
+    'tmdb_id': "tmdb_id IS NOT NULL AND tmdb_id NOT IN ('', '0')",
+}
+
+# overseerr_id holds the TMDB ID Overseerr matched; TMDB IDs are only unique within a media type
+_TYPED_IDENTITIES = ('overseerr_id', 'tmdb_id')
+
+
+def _identity_columns(column: str) -> str:
+    """The columns that identify an item by the given ID column."""
+    return f'media_type, {column}' if column in _TYPED_IDENTITIES else column
+
+
+def _migrate_legacy_schema(cursor: sqlite3.Cursor):
+    # Used to run on every startup. The URL rewrite is best effort: it must not hold back
+    # the schema changes or the migrations after this one.
+    remove_simkl_column(cursor)
+    cursor.execute('SAVEPOINT list_urls')
+    try:
+        migrate_list_urls(cursor)
+        cursor.execute('RELEASE list_urls')
+    except Exception as e:
+        cursor.execute('ROLLBACK TO list_urls')
+        cursor.execute('RELEASE list_urls')
+        logging.warning(f"Skipped the list URL backfill, list URLs are filled in as lists are saved: {e}")
+
+
+def _add_synced_items_indexes(cursor: sqlite3.Cursor):
+    # Item identity lookups in save_sync_result, status filters and revalidation scheduling
+    for column in ('overseerr_id', 'imdb_id', 'tmdb_id', 'status', 'last_synced', 'next_check_at'):
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_synced_items_{column} ON synced_items({column})')
+
+
+def _unique_identity_index(column: str) -> str:
+    return f"idx_synced_items_unique_{_identity_columns(column).replace(', ', '_')}"
+
+
+def _merge_duplicate_synced_items(cursor: sqlite3.Cursor) -> int:
+    """
+    Merge synced_items rows that share an identity, so the identities can be made unique.
+
+    Such rows are one item saved twice by concurrent saves. Each group is merged into the row lookups
+    resolve to (the lowest ID) with _merge_synced_items, so list links, list history and sync history
+    are kept and the merged rows are archived in merged_synced_items. The kept row takes over the IDs
+    it lacks from the merged rows of its media type. Every merge is logged as a warning.
+
+    Returns:
+        int: Number of rows merged
+    """
+    merged = 0
+    while True:
+        merged_before = merged
+        for column, condition in _IDENTITY_CONDITIONS.items():
+            cursor.execute(f'''
+                SELECT {column}, GROUP_CONCAT(id) FROM synced_items WHERE {condition}
+                GROUP BY {_identity_columns(column)} HAVING COUNT(*) > 1
+            ''')
+            for value, ids in cursor.fetchall():
+                keep_id, *duplicate_ids = sorted(int(item_id) for item_id in ids.split(','))
+                _merge_synced_items(cursor, keep_id, duplicate_ids)
+                placeholders = ', '.join('?' * len(duplicate_ids))
+                for other, other_condition in _IDENTITY_CONDITIONS.items():
+                    same_type = 'AND media_type = synced_items.media_type' if other in _TYPED_IDENTITIES else ''
+                    cursor.execute(f'''
+                        UPDATE synced_items SET {other} = COALESCE((
+                            SELECT {other} FROM merged_synced_items
+                            WHERE id IN ({placeholders}) AND {other_condition} {same_type}
+                            ORDER BY id LIMIT 1
+                        ), {other})
+                        WHERE id = ? AND NOT ({other_condition})
+                    ''', (*duplicate_ids, keep_id))
+                logging.warning(f"⚠️ Merged synced items {duplicate_ids} into {keep_id}: they share {column} {value}")
+                merged += len(duplicate_ids)
+        # IDs the kept rows took over can be shared with yet another row
+        if merged == merged_before:
+            return merged
+
+
+def _add_synced_items_identity_constraints(cursor: sqlite3.Cursor):
+    merged = _merge_duplicate_synced_items(cursor)
+    if merged:
+        logging.info(f"Merged {merged} duplicate synced items, the merged rows are kept in merged_synced_items")
+
+    for column, condition in _IDENTITY_CONDITIONS.items():
+        cursor.execute(f'''
+            CREATE UNIQUE INDEX IF NOT EXISTS {_unique_identity_index(column)}
+            ON synced_items({_identity_columns(column)}) WHERE {condition}
+        ''')
+
+
+def _type_synced_items_identity_constraints(cursor: sqlite3.Cursor):
+    # Databases that ran the first version of migration 3 have TMDB-based identities unique across media types
+    for column in _TYPED_IDENTITIES:
+        cursor.execute(f'DROP INDEX IF EXISTS idx_synced_items_unique_{column}')
+    _add_synced_items_identity_constraints(cursor)
+
+
+# Dashboard de-duplication: rows with the same title and media type are shown once, as the row
+# with the best status, then the one matched in Overseerr, then the most recently synced
+DEDUP_STATUS_PRIORITY = {
+    'requested': 100,
+    'already_requested': 90,
+    'already_available': 80,
+    'available': 70,
+    'not_found': 20,
+    'error': 10,
+    'skipped': 5,
+}
+
+
+def _dedup_key_sql(row: str = '') -> str:
+    # Case folding is ASCII-only in SQLite; the expression must match idx_synced_items_dedup_key exactly
+    return f"lower(trim({row}title || '_' || {row}media_type, char(32, 9, 10, 11, 12, 13)))"
+
+
+def _dedup_order_sql() -> str:
+    # Best row first; on a full tie the oldest row wins
+    priority = ' '.join(f"WHEN '{status}' THEN {value}" for status, value in DEDUP_STATUS_PRIORITY.items())
+    return (f"CASE status {priority} ELSE 0 END DESC, "
+            f"(overseerr_id IS NOT NULL AND overseerr_id != 0) DESC, last_synced DESC, id")
+
+
+def _dedup_refresh_sql(key: str) -> str:
+    """Statements that re-pick the representative row of one de-duplication key."""
+    return f'''
+        DELETE FROM deduplicated_items WHERE dedup_key = {key};
+        INSERT INTO deduplicated_items (dedup_key, item_id, status, last_synced)
+        SELECT {key}, id, status, last_synced FROM synced_items
+        WHERE {_dedup_key_sql()} = {key}
+        ORDER BY {_dedup_order_sql()}
+        LIMIT 1;
+    '''
+
+
+def _dedup_representatives_sql() -> str:
+    """The rows deduplicated_items holds, computed from synced_items in one pass."""
+    return f'''
+        SELECT dedup_key, id AS item_id, status, last_synced FROM (
+            SELECT {_dedup_key_sql()} AS dedup_key, id, status, last_synced,
+                   ROW_NUMBER() OVER (PARTITION BY {_dedup_key_sql()} ORDER BY {_dedup_order_sql()}) AS rank
+            FROM synced_items
+        ) WHERE rank = 1
+    '''
+
+
+def _add_deduplicated_items(cursor: sqlite3.Cursor):
+    # Kept current by triggers, so every write path (sync results, merges, cleanup) maintains it
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS deduplicated_items (
+            dedup_key TEXT PRIMARY KEY,
+            item_id INTEGER NOT NULL,
+            status TEXT,
+            last_synced TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_deduplicated_items_item_id ON deduplicated_items(item_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_deduplicated_items_status ON deduplicated_items(status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_deduplicated_items_last_synced ON deduplicated_items(last_synced)')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_synced_items_dedup_key ON synced_items({_dedup_key_sql()})')
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS synced_items_dedup_insert AFTER INSERT ON synced_items
+        BEGIN {_dedup_refresh_sql(_dedup_key_sql('NEW.'))} END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS synced_items_dedup_update
+        AFTER UPDATE OF title, media_type, status, overseerr_id, last_synced ON synced_items
+        BEGIN {_dedup_refresh_sql(_dedup_key_sql('OLD.'))} {_dedup_refresh_sql(_dedup_key_sql('NEW.'))} END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS synced_items_dedup_delete AFTER DELETE ON synced_items
+        BEGIN {_dedup_refresh_sql(_dedup_key_sql('OLD.'))} END
+    ''')
+
+    cursor.execute('DELETE FROM deduplicated_items')
+    cursor.execute(f'''
+        INSERT INTO deduplicated_items (dedup_key, item_id, status, last_synced)
+        {_dedup_representatives_sql()}
+    ''')
+
+
+# (version, description, migration) in order; a migration runs once, in the transaction
+# that records its version. Append new migrations, never renumber existing ones.
+_MIGRATIONS = [
+    (1, "list URL backfill and SIMKL column removal", _migrate_legacy_schema),
+    (2, "synced_items lookup indexes", _add_synced_items_indexes),
+    (3, "unique synced_items identities, merging rows that share one", _add_synced_items_identity_constraints),
+    (4, "trigger-maintained deduplicated_items table", _add_deduplicated_items),
+    (5, "synced_items TMDB identities unique per media type", _type_synced_items_identity_constraints),
+]
+
+SCHEMA_VERSION = _MIGRATIONS[-1][0]
+
+
+def run_migrations():
+    """
+    Apply the schema migrations the database has not had yet, then refresh the query planner statistics.
+    
+    Each migration runs in its own write transaction together with the user_version bump, so
+    concurrent startups (core and API server) apply it exactly once. A failed migration is
+    logged and retried on the next startup; later migrations wait for it.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        if cursor.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
         
-        # Get all lists that don't have URLs
-        cursor.execute("SELECT list_type, list_id FROM lists WHERE list_url IS NULL OR list_url = ''")
-        lists_without_urls = cursor.fetchall()
+        applied = 0
+        for version, description, migrate in _MIGRATIONS:
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                if cursor.execute('PRAGMA user_version').fetchone()[0] < version:
+                    logging.info(f"Applying database migration {version}: {description}")
+                    migrate(cursor)
+                    cursor.execute(f'PRAGMA user_version = {version}')
+                    applied += 1
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"Database migration {version} ({description}) failed: {e}")
+                break
         
-        if lists_without_urls:
-            logging.info(f"Migrating {len(lists_without_urls)} lists to add URLs")
-            
-            for list_type, list_id in lists_without_urls:
-                try:
-                    list_url = construct_list_url(list_type, list_id)
-                    cursor.execute(
-                        "UPDATE lists SET list_url = ? WHERE list_type = ? AND list_id = ?",
-                        (list_url, list_type, list_id)
-                    )
-                    logging.info(f"Added URL for {list_type} list {list_id}: {list_url}")
-                except Exception as e:
-                    logging.warning(f"Failed to generate URL for {list_type} list {list_id}: {e}")
-            
+        if applied:
+            cursor.execute('ANALYZE')
             conn.commit()
-            logging.info("URL migration completed")
-        
-        # Also update any existing URLs that might be incorrect
-        update_existing_list_urls()
+            schema_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+            logging.info(f"Applied {applied} database migration(s), schema version is now {schema_version}")
 
 
 def init_database():
     """Initialize the SQLite database with required tables."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS lists (
@@ -182,6 +610,20 @@ def init_database():
             # Column already exists or other error
             pass
         
+        # Content fingerprint of the list as of its last completed sync (unchanged-list skipping)
+        for column in ('content_fingerprint TEXT', 'fingerprint_synced_at TIMESTAMP'):
+            try:
+                cursor.execute(f'ALTER TABLE lists ADD COLUMN {column}')
+            except sqlite3.OperationalError:
+                pass
+        
+        # Per-list sync schedule (NULL interval = global sync interval)
+        for column in ('sync_interval_hours REAL', 'sync_priority INTEGER DEFAULT 0'):
+            try:
+                cursor.execute(f'ALTER TABLE lists ADD COLUMN {column}')
+            except sqlite3.OperationalError:
+                pass
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS synced_items (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -241,6 +683,13 @@ def init_database():
         except sqlite3.OperationalError:
             pass
 
+        # When the item's Overseerr status next needs checking (see the revalidation schedule)
+        try:
+            cursor.execute('ALTER TABLE synced_items ADD COLUMN next_check_at TIMESTAMP')
+            logging.info("Added next_check_at column to synced_items table")
+        except sqlite3.OperationalError:
+            pass
+
         # Add poster columns to lists if they don't exist
         try:
             cursor.execute('ALTER TABLE lists ADD COLUMN poster_url TEXT')
@@ -316,7 +765,24 @@ def init_database():
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_list_changes_date ON list_changes(changed_at)')
         except sqlite3.OperationalError:
             pass
-        
+
+        # Rows merged into another synced item because they shared an identity, as they were when merged
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS merged_synced_items (
+                id INTEGER PRIMARY KEY,
+                merged_into INTEGER NOT NULL,
+                merged_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                title TEXT,
+                media_type TEXT,
+                year INTEGER,
+                imdb_id TEXT,
+                tmdb_id TEXT,
+                overseerr_id INTEGER,
+                status TEXT,
+                last_synced TIMESTAMP
+            )
+        ''')
+
         # Backfill source_list columns from item_lists table for existing items
         # This migration runs AFTER item_lists table is created
         try:
@@ -399,6 +865,12 @@ def init_database():
             )
         ''')
         
+        # Add item_key column so sync_items doubles as the progress cursor of a session
+        try:
+            cursor.execute('ALTER TABLE sync_items ADD COLUMN item_key TEXT')
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
         # Create indexes for sync tables
         try:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_history_in_progress ON sync_history(in_progress)')
@@ -406,6 +878,7 @@ def init_database():
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_history_start_time ON sync_history(start_time DESC)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_items_sync_id ON sync_items(sync_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_items_item_id ON sync_items(item_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_items_sync_key ON sync_items(sync_id, item_key)')
         except sqlite3.OperationalError:
             # Indexes might already exist
             pass
@@ -448,13 +921,79 @@ def init_database():
             # Indexes might already exist
             pass
         
+        # ID resolution cache - IMDb ID or normalized title/year/media type → TMDB ID
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS id_resolution_cache (
+                lookup_key TEXT PRIMARY KEY,  -- 'imdb:<id>' or 'title:<normalized title>|<year>|<media_type>'
+                tmdb_id INTEGER NOT NULL,
+                imdb_id TEXT,
+                media_type TEXT,
+                resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_hit_at TIMESTAMP,
+                hit_count INTEGER DEFAULT 0
+            )
+        ''')
+        
+        # Failure backoff - items that keep failing are skipped for 1, 2, 4, ... syncs
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS item_backoff (
+                backoff_key TEXT PRIMARY KEY,  -- 'imdb:<id>', 'tmdb:<media_type>:<id>' or title key
+                title TEXT,
+                year INTEGER,
+                media_type TEXT,
+                imdb_id TEXT,
+                tmdb_id TEXT,
+                status TEXT NOT NULL,
+                failure_count INTEGER DEFAULT 0,
+                skips_remaining INTEGER DEFAULT 0,
+                last_failure_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Sync job queue - manual and API-triggered syncs waiting for the core process
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sync_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_type TEXT NOT NULL,  -- 'full' or 'single'
+                list_type TEXT,
+                list_id TEXT,
+                dedup_key TEXT NOT NULL,  -- 'full' or 'single:<list_type>:<list_id>'
+                state TEXT NOT NULL DEFAULT 'queued',  -- queued, running, completed, failed
+                attempts INTEGER DEFAULT 0,
+                requested_by TEXT,
+                worker_pid INTEGER,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        ''')
+        # At most one active job per list (or one full sync): repeated triggers coalesce into it
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_sync_jobs_active
+            ON sync_jobs(dedup_key) WHERE state IN ('queued', 'running')
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_jobs_state ON sync_jobs(state, id)')
+
+        # Per-season Overseerr state of TV shows, so unchanged shows need no detail request
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS tv_season_state (
+                tmdb_id INTEGER NOT NULL,
+                is_4k INTEGER NOT NULL DEFAULT 0,
+                media_status INTEGER,  -- show-level status the season state was read with
+                seasons TEXT NOT NULL,  -- comma-separated season numbers, specials excluded
+                available_seasons TEXT NOT NULL,
+                requested_seasons TEXT NOT NULL,
+                checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (tmdb_id, is_4k)
+            )
+        ''')
+
         conn.commit()
     
-    # Migrate existing lists to populate URLs and add item_count column
-    migrate_list_urls()
-    
-    # Remove SIMKL column since SIMKL is disabled
-    remove_simkl_column()
+    # One-time schema changes and indexes
+    run_migrations()
     
     # Initialize configuration tables
     create_settings_tables()
@@ -462,7 +1001,7 @@ def init_database():
     # Migrate BLOB images to filesystem (one-time migration)
     # Only run if there are BLOB images that need migration
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT COUNT(*) FROM cached_images
@@ -483,7 +1022,7 @@ def save_list_id(list_id: str, list_type: str, list_url: Optional[str] = None, i
     """Save list ID, URL, item count, and user_id to database, converting URLs to IDs if needed."""
     from .utils.helpers import construct_list_url
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # For IMDb URLs, store the full URL
@@ -520,7 +1059,7 @@ def save_list_id(list_id: str, list_type: str, list_url: Optional[str] = None, i
 
 def update_list_item_count(list_type: str, list_id: str, item_count: int):
     """Update the item count for an existing list."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE lists SET item_count = ? WHERE list_type = ? AND list_id = ?",
@@ -531,7 +1070,7 @@ def update_list_item_count(list_type: str, list_id: str, item_count: int):
 
 def update_list_last_synced(list_type: str, list_id: str):
     """Update the last_synced timestamp for a list to the current time."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE lists SET last_synced = CURRENT_TIMESTAMP WHERE list_type = ? AND list_id = ?",
@@ -542,7 +1081,7 @@ def update_list_last_synced(list_type: str, list_id: str):
 
 def update_list_sync_info(list_type: str, list_id: str, item_count: int):
     """Update both item count and last_synced timestamp for a list."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE lists SET item_count = ?, last_synced = CURRENT_TIMESTAMP WHERE list_type = ? AND list_id = ?",
@@ -553,9 +1092,12 @@ def update_list_sync_info(list_type: str, list_id: str, item_count: int):
 
 def load_list_ids() -> List[Dict[str, str]]:
     """Load all saved list IDs from database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT list_type, list_id, list_url, item_count, last_synced, user_id FROM lists")
+        cursor.execute(
+            "SELECT list_type, list_id, list_url, item_count, last_synced, user_id, sync_interval_hours, sync_priority "
+            "FROM lists"
+        )
         results = []
         for row in cursor.fetchall():
             list_item = {"type": row[0], "id": row[1]}
@@ -584,15 +1126,43 @@ def load_list_ids() -> List[Dict[str, str]]:
                 list_item["user_id"] = row[5]
             else:
                 list_item["user_id"] = "1"
+            
+            # Add per-list schedule (None = global sync interval)
+            list_item["sync_interval_hours"] = row[6]
+            list_item["sync_priority"] = row[7] or 0
                 
             results.append(list_item)
         return results
 
 
+def set_list_schedule(list_type: str, list_id: str, interval_hours: Optional[float] = None, priority: int = 0) -> bool:
+    """
+    Set how often a list is synced by the automated scheduler and its priority.
+    
+    Args:
+        list_type (str): Type of list
+        list_id (str): ID of the list
+        interval_hours (Optional[float]): Hours between syncs of this list, None for the global interval
+        priority (int): Lists due at the same time are synced highest priority first
+    
+    Returns:
+        bool: True if the list exists
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE lists SET sync_interval_hours = ?, sync_priority = ? WHERE list_type = ? AND list_id = ?",
+            (interval_hours, priority, list_type, list_id)
+        )
+        updated = cursor.rowcount > 0
+        conn.commit()
+        return updated
+
+
 def delete_list(list_type: str, list_id: str) -> bool:
     """Delete a list from the database."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "DELETE FROM lists WHERE list_type = ? AND list_id = ?",
@@ -607,7 +1177,7 @@ def delete_list(list_type: str, list_id: str) -> bool:
 
 def configure_sync_interval(interval_hours: float):
     """Configure the sync interval in hours (can be decimal like 0.5 for 30 minutes)."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM sync_interval")
         cursor.execute("INSERT INTO sync_interval (interval_hours) VALUES (?)", (interval_hours,))
@@ -616,30 +1186,29 @@ def configure_sync_interval(interval_hours: float):
 
 def load_sync_interval() -> float:
     """Load the configured sync interval."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT interval_hours FROM sync_interval")
         result = cursor.fetchone()
         return result[0] if result else 0.0  # Default to 0.0 hours if not set
 
 
-def should_sync_item(overseerr_id: int) -> bool:
-    """Check if an item should be synced based on last sync time."""
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT last_synced FROM synced_items
-            WHERE overseerr_id = ?
-            AND last_synced > datetime('now', '-48 hours')
-        ''', (overseerr_id,))
-        result = cursor.fetchone()
-        return result is None
+_SyncResult = namedtuple('_SyncResult', 'title media_type imdb_id overseerr_id status year tmdb_id list_type list_id keep_schedule')
+
+# Identity columns an item is matched by, in order of reliability
+_SYNC_RESULT_IDENTITIES = ('overseerr_id', 'imdb_id', 'tmdb_id')
 
+# Values per IN (...) lookup, below SQLite's default host parameter limit
+_IN_CHUNK_SIZE = 500
 
-def save_sync_result(title: str, media_type: str, imdb_id: Optional[str], overseerr_id: Optional[int], status: str, year: Optional[int] = None, tmdb_id: Optional[str] = None, list_type: Optional[str] = None, list_id: Optional[str] = None):
+
+def save_sync_result(title: str, media_type: str, imdb_id: Optional[str], overseerr_id: Optional[int], status: str, year: Optional[int] = None, tmdb_id: Optional[str] = None, list_type: Optional[str] = None, list_id: Optional[str] = None, keep_schedule: bool = False):
     """
     Save the result of a sync operation and track which list(s) it came from.
     
+    While a sync is processing its items (see buffered_sync_results) the result is queued
+    and written with the next batch instead, and None is returned.
+    
     Args:
         title: Media title
         media_type: Media type (movie/tv)
@@ -650,142 +1219,344 @@ def save_sync_result(title: str, media_type: str, imdb_id: Optional[str], overse
         tmdb_id: TMDB ID
         list_type: Type of list this item came from (e.g., 'imdb', 'trakt')
         list_id: ID of the list this item came from
+        keep_schedule: Leave the item's next status check as it is (used when the status was
+            not re-checked because the item was not due yet)
     """
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        
-        # Get or create the item record
-        # Try to find existing item by multiple possible keys (overseerr_id is most reliable)
-        item_db_id = None
-        
-        # Try overseerr_id first (most reliable)
-        if overseerr_id:
-            cursor.execute('SELECT id FROM synced_items WHERE overseerr_id = ?', (overseerr_id,))
-            existing = cursor.fetchone()
-            if existing:
-                item_db_id = existing[0]
-        
-        # If not found by overseerr_id, try imdb_id
-        if not item_db_id and imdb_id:
-            cursor.execute('SELECT id FROM synced_items WHERE imdb_id = ?', (imdb_id,))
-            existing = cursor.fetchone()
-            if existing:
-                item_db_id = existing[0]
-        
-        # If still not found, try tmdb_id
-        if not item_db_id and tmdb_id:
-            cursor.execute('SELECT id FROM synced_items WHERE tmdb_id = ?', (tmdb_id,))
-            existing = cursor.fetchone()
-            if existing:
-                item_db_id = existing[0]
-        
-        if status == "skipped":
-            # For skipped items, only insert if it doesn't exist (don't update last_synced)
-            if item_db_id:
-                # Item already exists, just update status if needed
-                cursor.execute('''
-                    UPDATE synced_items 
-                    SET status = ?, title = ?, media_type = ?, year = ?, imdb_id = ?, tmdb_id = ?,
-                        source_list_type = ?, source_list_id = ?
-                    WHERE id = ?
-                ''', (status, title, media_type, year, imdb_id, tmdb_id, list_type, list_id, item_db_id))
-            else:
-                # Insert new item
-                cursor.execute('''
-                    INSERT INTO synced_items 
-                    (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
-                ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id))
-                item_db_id = cursor.lastrowid
-        else:
-            # For non-skipped items, update last_synced timestamp
-            if item_db_id:
-                # Update existing item
-                cursor.execute('''
-                    UPDATE synced_items 
-                    SET title = ?, media_type = ?, year = ?, imdb_id = ?, tmdb_id = ?, 
-                        overseerr_id = ?, status = ?, last_synced = CURRENT_TIMESTAMP,
-                        source_list_type = ?, source_list_id = ?
-                    WHERE id = ?
-                ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id, item_db_id))
-            else:
-                # Insert new item
-                cursor.execute('''
-                    INSERT INTO synced_items 
-                    (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
-                ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id))
-                item_db_id = cursor.lastrowid
-        
-        # Link item to list(s) if list information provided
-        if item_db_id and list_type and list_id:
-            # Check if this is a new addition to the list
-            cursor.execute('''
-                SELECT id FROM item_lists 
-                WHERE item_id = ? AND list_type = ? AND list_id = ?
-            ''', (item_db_id, list_type, list_id))
-            existing_link = cursor.fetchone()
-            
-            if not existing_link:
-                # New addition - record it
-                cursor.execute('''
-                    INSERT INTO item_lists (item_id, list_type, list_id, synced_at)
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (item_db_id, list_type, list_id))
-                
-                # Record the addition in list_changes
-                cursor.execute('''
-                    INSERT INTO list_changes (item_id, list_type, list_id, change_type, changed_at, title, year, tmdb_id)
-                    VALUES (?, ?, ?, 'added', CURRENT_TIMESTAMP, ?, ?, ?)
-                ''', (item_db_id, list_type, list_id, title, year, tmdb_id))
-            else:
-                # Update synced_at timestamp for existing link
-                cursor.execute('''
-                    UPDATE item_lists 
-                    SET synced_at = CURRENT_TIMESTAMP
-                    WHERE item_id = ? AND list_type = ? AND list_id = ?
-                ''', (item_db_id, list_type, list_id))
-        
+    record = _SyncResult(title, media_type, imdb_id, overseerr_id, status, year, tmdb_id, list_type, list_id,
+                         keep_schedule)
+    if _queue_write('result', record):
+        return None
+    
+    with get_connection() as conn:
+        item_db_id = _write_sync_results(conn.cursor(), [record])[0]
         conn.commit()
-        
         return item_db_id
 
 
-def get_item_lists(item_id: int) -> List[Dict[str, str]]:
+def _lookup_in_chunks(cursor: sqlite3.Cursor, query: str, values: List[Any]) -> List[tuple]:
+    """Run a query with an `IN ({})` placeholder for each chunk of values and collect the rows."""
+    rows = []
+    for start in range(0, len(values), _IN_CHUNK_SIZE):
+        chunk = values[start:start + _IN_CHUNK_SIZE]
+        cursor.execute(query.format(','.join('?' * len(chunk))), chunk)
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+def _write_sync_results(cursor: sqlite3.Cursor, records: List[_SyncResult]) -> List[Optional[int]]:
     """
-    Get all lists that an item came from.
+    Write sync results in the caller's transaction, with the same outcome as saving them one by one.
+    
+    Items are matched by overseerr_id, then imdb_id, then tmdb_id (the TMDB-based IDs within the
+    record's media type), and a list link that did not exist yet is recorded in list_changes.
+    Existing items for the whole batch are looked up with IN queries and schedules are written
+    with executemany; list links are staged in a temp table and added, with their list_changes
+    rows, by one INSERT ... SELECT each.
     
-    Args:
-        item_id: The database ID of the item
-        
     Returns:
-        List of dictionaries with 'type' and 'id' keys for each list
-    """
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT list_type, list_id 
-            FROM item_lists 
-            WHERE item_id = ?
-        ''', (item_id,))
-        results = []
-        for row in cursor.fetchall():
-            results.append({'type': row[0], 'id': row[1]})
-        return results
-
-
-def get_list_items(list_type: str, list_id: str) -> List[Dict[str, Any]]:
+        List[Optional[int]]: synced_items ID of each record
     """
-    Get all items that came from a specific list.
+    # Identity key -> lowest matching item ID (what a per-item `WHERE column = ?` returns),
+    # and the media type and stored identity values of every item found
+    known = {column: {} for column in _SYNC_RESULT_IDENTITIES}
+    identities = {}
     
-    Args:
-        list_type: Type of list (e.g., 'imdb', 'trakt')
+    def key(column: str, value: Any, media_type: Optional[str]) -> Any:
+        return (media_type, str(value)) if column in _TYPED_IDENTITIES else str(value)
+    
+    def load(rows: List[tuple], column: str):
+        for row in rows:
+            stored = dict(zip(_SYNC_RESULT_IDENTITIES, row[2:]))
+            identities[row[0]] = (row[1], {name: str(value) for name, value in stored.items() if value})
+            known[column][key(column, stored[column], row[1])] = row[0]
+    
+    select = 'SELECT id, media_type, overseerr_id, imdb_id, tmdb_id FROM synced_items'
+    for column in _SYNC_RESULT_IDENTITIES:
+        values = list({getattr(record, column) for record in records if getattr(record, column)})
+        load(_lookup_in_chunks(cursor, f'{select} WHERE {column} IN ({{}}) ORDER BY id DESC', values), column)
+    
+    def remember(item_id: int, media_type: Optional[str], values: Dict[str, str]):
+        forget(item_id)
+        identities[item_id] = (media_type, values)
+        for column, value in values.items():
+            known[column][key(column, value, media_type)] = item_id
+    
+    def forget(item_id: int):
+        media_type, values = identities.pop(item_id, (None, {}))
+        for column, value in values.items():
+            if known[column].get(key(column, value, media_type)) == item_id:
+                del known[column][key(column, value, media_type)]
+    
+    item_ids = []
+    schedules = []
+    merged_into = {}
+    for record in records:
+        item_db_id = None
+        for column in _SYNC_RESULT_IDENTITIES:
+            value = getattr(record, column)
+            if value and key(column, value, record.media_type) in known[column]:
+                item_db_id = known[column][key(column, value, record.media_type)]
+                break
+        
+        title, media_type, imdb_id, overseerr_id, status, year, tmdb_id, list_type, list_id, keep_schedule = record
+        # Identity columns this record sets (skipped items keep their overseerr_id)
+        columns = ('imdb_id', 'tmdb_id') if status == "skipped" and item_db_id else _SYNC_RESULT_IDENTITIES
+        values = {column: str(getattr(record, column)) for column in columns if getattr(record, column)}
+        if item_db_id:
+            # The item keeps the identities this record doesn't set, now under the record's media type
+            stored_type, stored = identities.get(item_db_id, (None, {}))
+            values = {**{column: value for column, value in stored.items() if column not in columns}, **values}
+            if stored_type != media_type:
+                # Its kept TMDB-based IDs may belong to an item of the new type that no record named,
+                # or that was only looked up by another identity
+                for column in set(_TYPED_IDENTITIES) & set(values) - set(columns):
+                    if key(column, values[column], media_type) not in known[column]:
+                        cursor.execute(f'{select} WHERE media_type = ? AND {column} = ?', (media_type, values[column]))
+                        load(cursor.fetchall(), column)
+            # Identities are unique: rows that already hold one of the values are merged into the item
+            duplicates = {known[column].get(key(column, value, media_type))
+                          for column, value in values.items()} - {None, item_db_id}
+            if duplicates:
+                for duplicate_id in duplicates:
+                    forget(duplicate_id)
+                    merged_into[duplicate_id] = item_db_id
+                _merge_synced_items(cursor, item_db_id, sorted(duplicates))
+                logging.info(f"🔗 Merged synced items {sorted(duplicates)} into {item_db_id} ({title}): they share an identity")
+        
+        if status == "skipped" and item_db_id:
+            # For skipped items, only update the status (don't update last_synced)
+            cursor.execute('''
+                UPDATE synced_items 
+                SET status = ?, title = ?, media_type = ?, year = ?, imdb_id = ?, tmdb_id = ?,
+                    source_list_type = ?, source_list_id = ?
+                WHERE id = ?
+            ''', (status, title, media_type, year, imdb_id, tmdb_id, list_type, list_id, item_db_id))
+        elif item_db_id:
+            cursor.execute('''
+                UPDATE synced_items 
+                SET title = ?, media_type = ?, year = ?, imdb_id = ?, tmdb_id = ?, 
+                    overseerr_id = ?, status = ?, last_synced = CURRENT_TIMESTAMP,
+                    source_list_type = ?, source_list_id = ?
+                WHERE id = ?
+            ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id, item_db_id))
+        else:
+            cursor.execute('''
+                INSERT INTO synced_items 
+                (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, last_synced, source_list_type, source_list_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
+            ''', (title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id))
+            item_db_id = cursor.lastrowid
+        
+        # Later records in the batch find this item by the identity values it now holds on disk
+        remember(item_db_id, media_type, values)
+        
+        if status != "skipped" and not keep_schedule:
+            schedules.append((_next_check_modifier(status), item_db_id))
+        item_ids.append(item_db_id)
+    
+    # Items merged away later in the batch now live on as the item they were merged into
+    def resolve(item_id: int) -> int:
+        while item_id in merged_into:
+            item_id = merged_into[item_id]
+        return item_id
+    
+    if merged_into:
+        item_ids = [resolve(item_id) for item_id in item_ids]
+        schedules = [(modifier, resolve(item_id)) for modifier, item_id in schedules]
+    
+    if schedules:
+        cursor.executemany("UPDATE synced_items SET next_check_at = datetime('now', ?) WHERE id = ?", schedules)
+    
+    # Link items to their lists; links that are new are additions to the list
+    links = [(item_db_id, record.list_type, record.list_id, record.title, record.year, record.tmdb_id, position)
+             for position, (item_db_id, record) in enumerate(zip(item_ids, records))
+             if record.list_type and record.list_id]
+    if links:
+        # The first record of a link in the batch describes its addition
+        cursor.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS staged_links (
+                item_id INTEGER, list_type TEXT, list_id TEXT, title, year, tmdb_id, position INTEGER,
+                PRIMARY KEY (item_id, list_type, list_id)
+            )
+        ''')
+        cursor.execute('DELETE FROM temp.staged_links')
+        cursor.executemany('INSERT OR IGNORE INTO temp.staged_links VALUES (?, ?, ?, ?, ?, ?, ?)', links)
+        cursor.execute('''
+            INSERT INTO list_changes (item_id, list_type, list_id, change_type, changed_at, title, year, tmdb_id)
+            SELECT item_id, list_type, list_id, 'added', CURRENT_TIMESTAMP, title, year, tmdb_id
+            FROM temp.staged_links
+            WHERE NOT EXISTS (
+                SELECT 1 FROM item_lists
+                WHERE item_lists.item_id = staged_links.item_id
+                  AND item_lists.list_type = staged_links.list_type AND item_lists.list_id = staged_links.list_id
+            )
+            ORDER BY position
+        ''')
+        cursor.execute('''
+            INSERT INTO item_lists (item_id, list_type, list_id, synced_at)
+            SELECT item_id, list_type, list_id, CURRENT_TIMESTAMP FROM temp.staged_links WHERE true
+            ON CONFLICT(item_id, list_type, list_id) DO UPDATE SET synced_at = CURRENT_TIMESTAMP
+        ''')
+    
+    return item_ids
+
+
+# ============================================================================
+# Write-Behind - batch the per-item writes of a running sync into few transactions
+# ============================================================================
+
+class _SyncResultWriter:
+    """Background thread that writes queued sync results and progress rows in batched transactions."""
+    
+    def __init__(self):
+        self.batch_size = max(1, int(_env_number('LISTSYNC_WRITE_BATCH_SIZE', 200)))
+        self.flush_seconds = _env_number('LISTSYNC_WRITE_FLUSH_SECONDS', 2)
+        self.users = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="listsync-result-writer")
+        self._thread.start()
+    
+    def put(self, kind: str, record: tuple):
+        self._queue.put((kind, record))
+    
+    def flush(self):
+        """Wait until everything queued so far is written."""
+        written = threading.Event()
+        self._queue.put(written)
+        written.wait()
+    
+    def stop(self):
+        """Write what is queued and end the thread."""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _run(self):
+        running = True
+        while running:
+            batch, waiters = [], []
+            entry = self._queue.get()
+            deadline = time.monotonic() + self.flush_seconds
+            while True:
+                if entry is None:
+                    running = False
+                    break
+                if isinstance(entry, threading.Event):
+                    waiters.append(entry)
+                    break
+                batch.append(entry)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+    
+    def _write(self, batch: List[Tuple[str, tuple]]):
+        try:
+            with get_connection() as conn:
+                cursor = conn.cursor()
+                _write_sync_results(cursor, [record for kind, record in batch if kind == 'result'])
+                cursor.executemany(_SYNC_ITEM_INSERT, [record for kind, record in batch if kind == 'progress'])
+            logging.debug(f"Wrote {len(batch)} queued sync records in one transaction")
+        except Exception as e:
+            logging.error(f"Batched write of {len(batch)} sync records failed, writing them one at a time: {e}")
+            for kind, record in batch:
+                try:
+                    with get_connection() as conn:
+                        if kind == 'result':
+                            _write_sync_results(conn.cursor(), [record])
+                        else:
+                            conn.execute(_SYNC_ITEM_INSERT, record)
+                except Exception as e:
+                    logging.error(f"Failed to write sync record {record}: {e}")
+
+
+_result_writer: Optional[_SyncResultWriter] = None
+_result_writer_lock = threading.Lock()
+
+
+def _queue_write(kind: str, record: tuple) -> bool:
+    """Queue a record with the running writer. Returns False if no sync is buffering its writes."""
+    with _result_writer_lock:
+        if _result_writer is None:
+            return False
+        _result_writer.put(kind, record)
+        return True
+
+
+@contextmanager
+def buffered_sync_results():
+    """
+    Queue save_sync_result and add_item_to_sync writes while the block runs.
+    
+    A writer thread writes the queue in batches of LISTSYNC_WRITE_BATCH_SIZE records (default
+    200), or whatever arrived within LISTSYNC_WRITE_FLUSH_SECONDS (default 2), one transaction
+    per batch. Everything queued is written before the block exits, including on cancellation
+    or errors. Blocks may nest; LISTSYNC_WRITE_BEHIND=false writes every record immediately.
+    """
+    global _result_writer
+    if os.getenv('LISTSYNC_WRITE_BEHIND', 'true').lower() != 'true':
+        yield
+        return
+    
+    with _result_writer_lock:
+        if _result_writer is None:
+            _result_writer = _SyncResultWriter()
+        writer = _result_writer
+        writer.users += 1
+    try:
+        yield
+    finally:
+        with _result_writer_lock:
+            writer.users -= 1
+            last_user = writer.users == 0
+            if last_user:
+                _result_writer = None
+        if last_user:
+            writer.stop()
+        else:
+            writer.flush()
+
+
+def get_item_lists(item_id: int) -> List[Dict[str, str]]:
+    """
+    Get all lists that an item came from.
+    
+    Args:
+        item_id: The database ID of the item
+        
+    Returns:
+        List of dictionaries with 'type' and 'id' keys for each list
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT list_type, list_id 
+            FROM item_lists 
+            WHERE item_id = ?
+        ''', (item_id,))
+        results = []
+        for row in cursor.fetchall():
+            results.append({'type': row[0], 'id': row[1]})
+        return results
+
+
+def get_list_items(list_type: str, list_id: str) -> List[Dict[str, Any]]:
+    """
+    Get all items that came from a specific list.
+    
+    Args:
+        list_type: Type of list (e.g., 'imdb', 'trakt')
         list_id: ID of the list
         
     Returns:
         List of item dictionaries with all item information
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT si.id, si.title, si.media_type, si.year, si.imdb_id, si.tmdb_id, 
@@ -811,57 +1582,56 @@ def get_list_items(list_type: str, list_id: str) -> List[Dict[str, Any]]:
         return results
 
 
-def detect_list_removals(list_type: str, list_id: str, current_item_ids: set):
+def _stage_item_ids(cursor: sqlite3.Cursor, item_ids) -> None:
+    """Load item IDs into the connection's temp.staged_item_ids table for set-based list updates."""
+    cursor.execute('CREATE TEMP TABLE IF NOT EXISTS staged_item_ids (item_id INTEGER PRIMARY KEY)')
+    cursor.execute('DELETE FROM temp.staged_item_ids')
+    cursor.executemany('INSERT OR IGNORE INTO temp.staged_item_ids (item_id) VALUES (?)',
+                       ((item_id,) for item_id in item_ids))
+
+
+def _remove_list_links(cursor: sqlite3.Cursor, list_type: str, list_id: str, condition: str) -> int:
+    """
+    Record the list's links that match condition as removals in list_changes, then delete them.
+    
+    Returns:
+        int: Number of links removed
+    """
+    cursor.execute(f'''
+        INSERT INTO list_changes (item_id, list_type, list_id, change_type, changed_at, title, year, tmdb_id)
+        SELECT item_lists.item_id, item_lists.list_type, item_lists.list_id, 'removed', CURRENT_TIMESTAMP,
+               synced_items.title, synced_items.year, synced_items.tmdb_id
+        FROM item_lists JOIN synced_items ON synced_items.id = item_lists.item_id
+        WHERE item_lists.list_type = ? AND item_lists.list_id = ? AND {condition}
+    ''', (list_type, list_id))
+    cursor.execute(f'''
+        DELETE FROM item_lists
+        WHERE list_type = ? AND list_id = ? AND {condition}
+    ''', (list_type, list_id))
+    return cursor.rowcount
+
+
+def detect_list_removals(list_type: str, list_id: str, current_item_ids: set) -> int:
     """
     Detect items that were removed from a list by comparing current items with previous state.
     
+    Links to items not in current_item_ids are recorded as removals and deleted.
+    
     Args:
         list_type: Type of list
         list_id: ID of the list
         current_item_ids: Set of item IDs currently in the list
+        
+    Returns:
+        int: Number of items removed
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        
-        # Get all items that were previously in this list
-        cursor.execute('''
-            SELECT DISTINCT item_id 
-            FROM item_lists 
-            WHERE list_type = ? AND list_id = ?
-        ''', (list_type, list_id))
-        
-        previous_item_ids = {row[0] for row in cursor.fetchall()}
-        
-        # Find items that were removed (in previous but not in current)
-        removed_item_ids = previous_item_ids - current_item_ids
-        
-        # Record removals in list_changes
-        for item_id in removed_item_ids:
-            # Get item details
-            cursor.execute('''
-                SELECT title, year, tmdb_id 
-                FROM synced_items 
-                WHERE id = ?
-            ''', (item_id,))
-            item = cursor.fetchone()
-            
-            if item:
-                title, year, tmdb_id = item
-                # Record the removal
-                cursor.execute('''
-                    INSERT INTO list_changes (item_id, list_type, list_id, change_type, changed_at, title, year, tmdb_id)
-                    VALUES (?, ?, ?, 'removed', CURRENT_TIMESTAMP, ?, ?, ?)
-                ''', (item_id, list_type, list_id, title, year, tmdb_id))
-        
-        # Remove old item_lists entries for removed items
-        if removed_item_ids:
-            placeholders = ','.join('?' * len(removed_item_ids))
-            cursor.execute(f'''
-                DELETE FROM item_lists 
-                WHERE list_type = ? AND list_id = ? AND item_id IN ({placeholders})
-            ''', (list_type, list_id, *removed_item_ids))
-        
+        _stage_item_ids(cursor, current_item_ids)
+        removed = _remove_list_links(cursor, list_type, list_id, '''NOT EXISTS (
+            SELECT 1 FROM temp.staged_item_ids WHERE staged_item_ids.item_id = item_lists.item_id)''')
         conn.commit()
+        return removed
 
 
 def get_newcomers(days: int = 7) -> List[Dict[str, Any]]:
@@ -874,7 +1644,7 @@ def get_newcomers(days: int = 7) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with item details
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT DISTINCT
@@ -920,7 +1690,7 @@ def get_removals(days: int = 7) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with item details
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT DISTINCT
@@ -953,7 +1723,7 @@ def get_removals(days: int = 7) -> List[Dict[str, Any]]:
 
 def get_repeated_failures(min_attempts: int = 3) -> List[Dict[str, Any]]:
     """Get items that have failed multiple times."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT title, year, tmdb_id, status 
@@ -976,7 +1746,7 @@ def get_repeated_failures(min_attempts: int = 3) -> List[Dict[str, Any]]:
 
 def get_list_staleness() -> List[Dict[str, Any]]:
     """Get lists that haven't been updated recently."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT l.list_type, l.list_id, l.last_synced,
@@ -1003,7 +1773,7 @@ def get_list_staleness() -> List[Dict[str, Any]]:
 
 def get_storage_estimate() -> Dict[str, Any]:
     """Estimate storage needed for pending downloads."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT media_type, COUNT(*) 
@@ -1033,7 +1803,7 @@ def get_storage_estimate() -> Dict[str, Any]:
 
 def get_list_activity_patterns(days: int = 30) -> List[Dict[str, Any]]:
     """Analyze list activity patterns."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT list_type, list_id, COUNT(*) as additions
@@ -1058,7 +1828,7 @@ def get_list_activity_patterns(days: int = 30) -> List[Dict[str, Any]]:
 
 def get_blocking_impact_stats(days: int = 7) -> Dict[str, Any]:
     """Get statistics about blocking filters."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT COUNT(*) FROM synced_items WHERE status = \"blocked\"')
         total_blocked = cursor.fetchone()[0] or 0
@@ -1083,7 +1853,7 @@ def get_blocking_impact_stats(days: int = 7) -> Dict[str, Any]:
 
 def clear_all_lists():
     """Clear all lists from the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM lists")
         conn.commit()
@@ -1091,7 +1861,7 @@ def clear_all_lists():
 
 def get_sync_stats() -> Dict[str, int]:
     """Get sync statistics from the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT status, COUNT(*) 
@@ -1104,154 +1874,880 @@ def get_sync_stats() -> Dict[str, int]:
 
 
 # ============================================================================
-# Sync History Management - Database-Based Sync Tracking
+# Deduplicated Items - one synced item per title and media type, kept by triggers
 # ============================================================================
 
-def start_sync_in_db(
-    session_id: str,
-    sync_type: str,
-    list_type: Optional[str] = None,
-    list_id: Optional[str] = None,
-    pid: Optional[int] = None
-) -> int:
+_DEDUP_ITEM_COLUMNS = ('s.id, s.title, s.media_type, s.year, s.imdb_id, s.overseerr_id, s.status, s.last_synced, '
+                       's.source_list_type, s.source_list_id')
+
+_DEDUP_ORDERINGS = {
+    'last_synced': 'd.last_synced IS NULL, d.last_synced DESC, d.dedup_key',
+    'status': 'd.status DESC, d.last_synced DESC, d.dedup_key',
+}
+
+
+def _deduplicated_source(conn: sqlite3.Connection) -> str:
     """
-    Start a sync operation in the database.
-    
+    The deduplicated_items table, or the same rows derived from synced_items when the table is
+    missing (a database the migrations haven't reached yet, e.g. one the API server opens first).
+    """
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'deduplicated_items'").fetchone():
+        return 'deduplicated_items'
+    logging.debug("deduplicated_items table missing, de-duplicating synced_items directly")
+    return f'({_dedup_representatives_sql()})'
+
+
+def _dedup_list_filter(list_type: Optional[str], list_ids: Optional[List[str]]) -> Tuple[str, list]:
+    if not list_type:
+        return '', []
+    list_ids = list(list_ids or [])
+    placeholders = ','.join('?' * len(list_ids))
+    return f'WHERE s.source_list_type = ? AND s.source_list_id IN ({placeholders})', [list_type] + list_ids
+
+
+def get_deduplicated_items(order_by: str = 'last_synced', list_type: Optional[str] = None,
+                           list_ids: Optional[List[str]] = None, limit: Optional[int] = None,
+                           offset: int = 0) -> List[tuple]:
+    """
+    Get one synced item per title and media type.
+
     Args:
-        session_id: Unique session identifier
-        sync_type: 'full' or 'single'
-        list_type: List type for single list syncs (optional)
-        list_id: List ID for single list syncs (optional)
-        pid: Process ID (optional)
-    
+        order_by (str): 'last_synced' (most recent first) or 'status'
+        list_type (str, optional): Only items whose source list has this type...
+        list_ids (List[str], optional): ...and one of these IDs
+        limit (int, optional): Page size; all items if omitted
+        offset (int): Items to skip
+
     Returns:
-        int: The sync_id (primary key) of the created sync record
+        List[tuple]: (id, title, media_type, year, imdb_id, overseerr_id, status, last_synced,
+        source_list_type, source_list_id) rows
+    """
+    where, params = _dedup_list_filter(list_type, list_ids)
+    with get_connection() as conn:
+        query = f'''
+            SELECT {_DEDUP_ITEM_COLUMNS}
+            FROM {_deduplicated_source(conn)} d JOIN synced_items s ON s.id = d.item_id
+            {where}
+            ORDER BY {_DEDUP_ORDERINGS[order_by]}
+        '''
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params += [limit, offset]
+        return conn.execute(query, params).fetchall()
+
+
+def count_deduplicated_items(list_type: Optional[str] = None, list_ids: Optional[List[str]] = None) -> int:
+    """Count the items get_deduplicated_items returns for the same list filter."""
+    where, params = _dedup_list_filter(list_type, list_ids)
+    with get_connection() as conn:
+        source = _deduplicated_source(conn)
+        if not where:
+            return conn.execute(f'SELECT COUNT(*) FROM {source}').fetchone()[0]
+        return conn.execute(f'''
+            SELECT COUNT(*) FROM {source} d JOIN synced_items s ON s.id = d.item_id {where}
+        ''', params).fetchone()[0]
+
+
+def get_deduplicated_status_counts() -> Dict[str, int]:
+    """Count deduplicated items by status."""
+    with get_connection() as conn:
+        query = f'SELECT status, COUNT(*) FROM {_deduplicated_source(conn)} GROUP BY status'
+        return dict(conn.execute(query).fetchall())
+
+
+# ============================================================================
+# ID Resolution Cache - IMDb/Title → TMDB mappings resolved through Trakt
+# ============================================================================
+
+# Hits and misses of the resolution cache in this process (reset per sync)
+_resolution_cache_stats = {'hits': 0, 'misses': 0}
+_resolution_cache_lock = threading.Lock()
+
+
+def _resolution_cache_ttl_days() -> int:
+    """Days a cached IMDb/title → TMDB mapping stays valid (LISTSYNC_RESOLUTION_CACHE_TTL_DAYS)."""
+    try:
+        return max(0, int(os.getenv('LISTSYNC_RESOLUTION_CACHE_TTL_DAYS', '30') or '30'))
+    except ValueError:
+        return 30
+
+
+def _resolution_cache_key(imdb_id: Optional[str] = None, title: Optional[str] = None,
+                          year: Optional[int] = None, media_type: Optional[str] = None) -> Optional[str]:
     """
-    import os
-    with sqlite3.connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO sync_history (
-                session_id, sync_type, in_progress, start_time,
-                list_type, list_id, pid, status
-            ) VALUES (?, ?, 1, CURRENT_TIMESTAMP, ?, ?, ?, 'running')
-        ''', (session_id, sync_type, list_type, list_id, pid or os.getpid()))
-        sync_id = cursor.lastrowid
-        conn.commit()
-        logging.info(f"Started sync in database: session_id={session_id}, sync_id={sync_id}")
-        return sync_id
+    Build the cache key for a lookup: the IMDb ID if given, otherwise the normalized title/year/media type.
+    
+    Titles are lowercased with punctuation removed and whitespace collapsed, so cosmetic
+    differences between list providers map to the same entry.
+    """
+    if imdb_id:
+        return f"imdb:{imdb_id.strip().lower()}"
+    if title:
+        normalized = re.sub(r'[^\w\s]', ' ', title.lower())
+        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        if normalized:
+            return f"title:{normalized}|{year or ''}|{media_type or ''}"
+    return None
 
 
-def update_sync_lists_in_db(
-    session_id: str,
-    synced_lists: List[Dict[str, str]]
-) -> bool:
+def get_cached_resolution(imdb_id: Optional[str] = None, title: Optional[str] = None,
+                          year: Optional[int] = None, media_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
-    Update sync_history record with list information for full syncs.
+    Look up a previously resolved TMDB ID by IMDb ID or by title/year/media type.
     
     Args:
-        session_id: Session identifier
-        synced_lists: List of dictionaries with 'type' and 'id' keys
-    
+        imdb_id: IMDb ID to look up (takes precedence over the title)
+        title: Title to look up when no IMDb ID is given
+        year: Release year for title lookups
+        media_type: Media type for title lookups
+        
     Returns:
-        bool: True if updated successfully
+        dict: {'tmdb_id', 'imdb_id', 'media_type'} if a fresh entry exists, otherwise None
     """
-    if not synced_lists:
-        return False
+    lookup_key = _resolution_cache_key(imdb_id, title, year, media_type)
+    if not lookup_key:
+        return None
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        
-        # For full syncs, store a summary of all lists synced
-        # Format: "list_type1:list_id1,list_type2:list_id2,..." or summary if too many
-        # Store all list identifiers (comma-separated) - SQLite TEXT can handle long strings
-        list_summaries = [f"{lst['type']}:{lst['id']}" for lst in synced_lists]
-        list_id_value = ','.join(list_summaries)
-        
-        # Use the first list type as the primary type, or "multiple" if different types
-        list_types = set(lst['type'] for lst in synced_lists)
-        if len(list_types) == 1:
-            list_type_value = list_types.pop()
-        else:
-            # Multiple types - store as "multiple" with count
-            list_type_value = f"multiple({len(list_types)} types)"
-        
         cursor.execute('''
-            UPDATE sync_history
-            SET list_type = ?,
-                list_id = ?
-            WHERE session_id = ?
-        ''', (list_type_value, list_id_value, session_id))
-        updated = cursor.rowcount > 0
-        conn.commit()
-        if updated:
-            logging.info(f"Updated sync lists in database: session_id={session_id}, lists={len(synced_lists)}")
-        return updated
+            SELECT tmdb_id, imdb_id, media_type FROM id_resolution_cache
+            WHERE lookup_key = ?
+            AND resolved_at > datetime('now', ?)
+        ''', (lookup_key, f'-{_resolution_cache_ttl_days()} days'))
+        row = cursor.fetchone()
+        
+        if row:
+            cursor.execute('''
+                UPDATE id_resolution_cache
+                SET hit_count = hit_count + 1, last_hit_at = CURRENT_TIMESTAMP
+                WHERE lookup_key = ?
+            ''', (lookup_key,))
+            conn.commit()
+    
+    with _resolution_cache_lock:
+        _resolution_cache_stats['hits' if row else 'misses'] += 1
+    
+    if not row:
+        return None
+    return {'tmdb_id': row[0], 'imdb_id': row[1], 'media_type': row[2]}
 
 
-def end_sync_in_db(
-    session_id: str,
-    status: str = 'completed',
-    total_items: int = 0,
-    items_requested: int = 0,
-    items_skipped: int = 0,
-    items_errors: int = 0,
-    error_message: Optional[str] = None
-) -> bool:
+def save_resolution(tmdb_id: int, imdb_id: Optional[str] = None, title: Optional[str] = None,
+                    year: Optional[int] = None, media_type: Optional[str] = None,
+                    resolved_imdb_id: Optional[str] = None, resolved_media_type: Optional[str] = None):
     """
-    End a sync operation in the database.
+    Store a resolved TMDB ID under the IMDb ID or title/year/media type it was looked up by.
     
     Args:
-        session_id: Session identifier
-        status: Final status ('completed', 'failed', 'no_lists', 'no_items', etc.)
-        total_items: Total items processed
-        items_requested: Items successfully requested
-        items_skipped: Items skipped
-        items_errors: Items with errors
-        error_message: Error message if any
+        tmdb_id: Resolved TMDB ID
+        imdb_id: IMDb ID the lookup was made with
+        title: Title the lookup was made with (used when no IMDb ID is given)
+        year: Release year of the title lookup
+        media_type: Media type of the title lookup
+        resolved_imdb_id: IMDb ID returned by the resolver, if any
+        resolved_media_type: Media type returned by the resolver, if any
+    """
+    lookup_key = _resolution_cache_key(imdb_id, title, year, media_type)
+    if not lookup_key or not tmdb_id:
+        return
     
-    Returns:
-        bool: True if updated successfully
-    """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
-            UPDATE sync_history
-            SET in_progress = 0,
-                end_time = CURRENT_TIMESTAMP,
-                status = ?,
-                total_items = ?,
-                items_requested = ?,
-                items_skipped = ?,
-                items_errors = ?,
-                error_message = ?
-            WHERE session_id = ?
-        ''', (status, total_items, items_requested, items_skipped, items_errors, error_message, session_id))
-        updated = cursor.rowcount > 0
+            INSERT INTO id_resolution_cache (lookup_key, tmdb_id, imdb_id, media_type, resolved_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(lookup_key) DO UPDATE SET
+                tmdb_id = excluded.tmdb_id,
+                imdb_id = excluded.imdb_id,
+                media_type = excluded.media_type,
+                resolved_at = CURRENT_TIMESTAMP
+        ''', (lookup_key, int(tmdb_id), resolved_imdb_id or imdb_id, resolved_media_type or media_type))
         conn.commit()
-        if updated:
-            logging.info(f"Ended sync in database: session_id={session_id}, status={status}")
-        else:
-            logging.warning(f"Sync not found in database: session_id={session_id}")
-        return updated
 
 
-def add_item_to_sync(
-    sync_id: int,
-    item_id: Optional[int],
-    title: str,
-    media_type: str,
-    status: str,
-    list_type: Optional[str] = None,
-    list_id: Optional[str] = None,
-    year: Optional[int] = None,
-    imdb_id: Optional[str] = None,
-    tmdb_id: Optional[str] = None,
-    overseerr_id: Optional[int] = None
-) -> int:
+def get_resolution_cache_stats() -> Dict[str, int]:
+    """
+    Get ID resolution cache statistics.
+    
+    Returns:
+        dict: Hits and misses in this process, plus stored entries and lifetime hits
+    """
+    with _resolution_cache_lock:
+        stats = dict(_resolution_cache_stats)
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM id_resolution_cache')
+        stats['entries'], stats['lifetime_hits'] = cursor.fetchone()
+    return stats
+
+
+def reset_resolution_cache_stats():
+    """Reset the per-process hit/miss counters (called at the start of each sync)."""
+    with _resolution_cache_lock:
+        _resolution_cache_stats['hits'] = 0
+        _resolution_cache_stats['misses'] = 0
+
+
+# ============================================================================
+# Failure Backoff - skip items that keep failing for exponentially more syncs
+# ============================================================================
+
+# Statuses that put an item into backoff
+BACKOFF_STATUSES = ('not_found', 'error', 'request_failed')
+
+
+def _backoff_max_skip() -> int:
+    """Upper bound on the number of syncs an item is skipped (LISTSYNC_BACKOFF_MAX_SKIP)."""
+    try:
+        return max(1, int(os.getenv('LISTSYNC_BACKOFF_MAX_SKIP', '32') or '32'))
+    except ValueError:
+        return 32
+
+
+def _item_backoff_key(imdb_id: Optional[str] = None, tmdb_id: Optional[Any] = None, title: Optional[str] = None,
+                      year: Optional[int] = None, media_type: Optional[str] = None) -> Optional[str]:
+    """Build the backoff key for an item from the IDs its list provided, falling back to the title."""
+    if imdb_id:
+        return f"imdb:{str(imdb_id).strip().lower()}"
+    if tmdb_id:
+        return f"tmdb:{media_type or ''}:{tmdb_id}"
+    return _resolution_cache_key(title=title, year=year, media_type=media_type)
+
+
+def check_item_backoff(imdb_id: Optional[str] = None, tmdb_id: Optional[Any] = None, title: Optional[str] = None,
+                       year: Optional[int] = None, media_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Check whether an item is in failure backoff, consuming one skip if it is.
+    
+    Each call represents one sync seeing the item: while skips remain, the counter is
+    decremented and the item should not be searched again.
+    
+    Returns:
+        dict: {'skip': bool, 'status', 'failure_count', 'skips_remaining'} if the item has a
+        backoff entry, otherwise None
+    """
+    backoff_key = _item_backoff_key(imdb_id, tmdb_id, title, year, media_type)
+    if not backoff_key:
+        return None
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT status, failure_count, skips_remaining FROM item_backoff WHERE backoff_key = ?
+        ''', (backoff_key,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        status, failure_count, skips_remaining = row
+        skip = skips_remaining > 0
+        if skip:
+            skips_remaining -= 1
+            cursor.execute('''
+                UPDATE item_backoff SET skips_remaining = ? WHERE backoff_key = ?
+            ''', (skips_remaining, backoff_key))
+            conn.commit()
+    
+    return {'skip': skip, 'status': status, 'failure_count': failure_count, 'skips_remaining': skips_remaining}
+
+
+def record_item_failure(status: str, imdb_id: Optional[str] = None, tmdb_id: Optional[Any] = None,
+                        title: Optional[str] = None, year: Optional[int] = None,
+                        media_type: Optional[str] = None) -> Optional[int]:
+    """
+    Record a failed sync attempt and schedule the item's next retry.
+    
+    The nth consecutive failure skips the item for 2^(n-1) syncs (1, 2, 4, ...), capped at
+    LISTSYNC_BACKOFF_MAX_SKIP.
+    
+    Returns:
+        int: Number of syncs the item will be skipped, or None if the item has no usable key
+    """
+    backoff_key = _item_backoff_key(imdb_id, tmdb_id, title, year, media_type)
+    if not backoff_key:
+        return None
+    
+    max_skip = _backoff_max_skip()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT failure_count FROM item_backoff WHERE backoff_key = ?', (backoff_key,))
+        row = cursor.fetchone()
+        failure_count = (row[0] if row else 0) + 1
+        # Cap the exponent as well so long-dead entries cannot overflow
+        skips = min(2 ** min(failure_count - 1, 30), max_skip)
+        cursor.execute('''
+            INSERT INTO item_backoff
+            (backoff_key, title, year, media_type, imdb_id, tmdb_id, status, failure_count, skips_remaining, last_failure_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(backoff_key) DO UPDATE SET
+                status = excluded.status,
+                failure_count = excluded.failure_count,
+                skips_remaining = excluded.skips_remaining,
+                last_failure_at = CURRENT_TIMESTAMP
+        ''', (backoff_key, title, year, media_type, imdb_id, str(tmdb_id) if tmdb_id else None,
+              status, failure_count, skips))
+        conn.commit()
+    return skips
+
+
+def clear_item_backoff(imdb_id: Optional[str] = None, tmdb_id: Optional[Any] = None, title: Optional[str] = None,
+                       year: Optional[int] = None, media_type: Optional[str] = None) -> bool:
+    """
+    Remove an item's backoff entry, e.g. after it synced successfully or to force a retry.
+    
+    Returns:
+        bool: True if an entry was removed
+    """
+    backoff_key = _item_backoff_key(imdb_id, tmdb_id, title, year, media_type)
+    if not backoff_key:
+        return False
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM item_backoff WHERE backoff_key = ?', (backoff_key,))
+        conn.commit()
+        return cursor.rowcount > 0
+
+
+def reset_item_backoff(status: Optional[str] = None) -> int:
+    """
+    Make items in backoff eligible again on the next sync, keeping their failure history.
+    
+    Args:
+        status: Only reset entries with this status (default: all)
+        
+    Returns:
+        int: Number of entries reset
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        if status:
+            cursor.execute('UPDATE item_backoff SET skips_remaining = 0 WHERE skips_remaining > 0 AND status = ?', (status,))
+        else:
+            cursor.execute('UPDATE item_backoff SET skips_remaining = 0 WHERE skips_remaining > 0')
+        conn.commit()
+        return cursor.rowcount
+
+
+def get_item_backoffs(limit: int = 100) -> List[Dict[str, Any]]:
+    """Get items currently in failure backoff, most failures first."""
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT backoff_key, title, year, media_type, imdb_id, tmdb_id, status,
+                   failure_count, skips_remaining, last_failure_at
+            FROM item_backoff
+            ORDER BY failure_count DESC, last_failure_at DESC
+            LIMIT ?
+        ''', (limit,))
+        return [dict(row) for row in cursor.fetchall()]
+
+
+# ============================================================================
+# Revalidation Schedule - how long an item's Overseerr status is trusted
+# ============================================================================
+
+# Hours until a status is checked again, overridable per group via environment variables
+REVALIDATION_SCHEDULE = {
+    'already_available': ('LISTSYNC_RECHECK_AVAILABLE_HOURS', 720),
+    'requested': ('LISTSYNC_RECHECK_REQUESTED_HOURS', 24),
+    'already_requested': ('LISTSYNC_RECHECK_REQUESTED_HOURS', 24),
+}
+
+# Spread of next-check times (+/-) so items synced together do not all fall due together
+REVALIDATION_JITTER = 0.1
+
+
+def _revalidation_hours(status: str) -> Optional[float]:
+    """Hours a status stays valid, or None if items with it are checked on every sync."""
+    if status not in REVALIDATION_SCHEDULE:
+        return None
+    env_var, default = REVALIDATION_SCHEDULE[status]
+    try:
+        hours = float(os.getenv(env_var, str(default)) or default)
+    except ValueError:
+        hours = default
+    return hours if hours > 0 else None
+
+
+def _next_check_modifier(status: str) -> Optional[str]:
+    """SQLite datetime modifier for the next check of an item with this status (None = every sync)."""
+    hours = _revalidation_hours(status)
+    if hours is None:
+        return None
+    seconds = hours * 3600 * random.uniform(1 - REVALIDATION_JITTER, 1 + REVALIDATION_JITTER)
+    return f"+{int(seconds)} seconds"
+
+
+def get_scheduled_status(imdb_id: Optional[str] = None, tmdb_id: Optional[Any] = None, title: Optional[str] = None,
+                         year: Optional[int] = None, media_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get an item's last known status if it is not due for a re-check yet.
+    
+    The item is matched on the IDs its list provided (TMDB, then IMDb), or on title, year
+    and media type when it has none.
+    
+    Returns:
+        dict: {'status', 'overseerr_id', 'tmdb_id', 'imdb_id', 'next_check_at'} if the item's
+        status can be reused, otherwise None
+    """
+    if tmdb_id:
+        where, params = 'tmdb_id = ? AND media_type = ?', (str(tmdb_id), media_type)
+    elif imdb_id:
+        where, params = 'imdb_id = ?', (imdb_id,)
+    elif title:
+        where, params = 'LOWER(title) = LOWER(?) AND year IS ? AND media_type = ?', (title, year, media_type)
+    else:
+        return None
+    
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT status, overseerr_id, tmdb_id, imdb_id, next_check_at FROM synced_items
+            WHERE {where}
+            AND overseerr_id IS NOT NULL
+            AND next_check_at > datetime('now')
+            ORDER BY last_synced DESC
+            LIMIT 1
+        ''', params)
+        row = cursor.fetchone()
+    
+    if not row or row['status'] not in REVALIDATION_SCHEDULE:
+        return None
+    return dict(row)
+
+
+def reset_revalidation_schedule(status: Optional[str] = None) -> int:
+    """
+    Make items due for a status check on the next sync.
+    
+    Args:
+        status: Only reset items with this status (default: all)
+        
+    Returns:
+        int: Number of items reset
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        if status:
+            cursor.execute('UPDATE synced_items SET next_check_at = NULL WHERE next_check_at IS NOT NULL AND status = ?', (status,))
+        else:
+            cursor.execute('UPDATE synced_items SET next_check_at = NULL WHERE next_check_at IS NOT NULL')
+        conn.commit()
+        return cursor.rowcount
+
+
+def get_revalidation_summary() -> List[Dict[str, Any]]:
+    """Count scheduled items per status, with how many fall due within the next day."""
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT status,
+                   COUNT(*) AS scheduled,
+                   SUM(CASE WHEN next_check_at <= datetime('now', '+1 day') THEN 1 ELSE 0 END) AS due_within_day,
+                   MIN(next_check_at) AS next_due_at
+            FROM synced_items
+            WHERE next_check_at > datetime('now')
+            GROUP BY status
+            ORDER BY scheduled DESC
+        ''')
+        return [dict(row) for row in cursor.fetchall()]
+
+
+# ============================================================================
+# TV Season State - which seasons of a show are available or requested in Overseerr
+# ============================================================================
+
+def _season_cache_hours() -> float:
+    """Hours a show's cached season state is trusted (LISTSYNC_SEASON_CACHE_HOURS)."""
+    try:
+        return max(0.0, float(os.getenv('LISTSYNC_SEASON_CACHE_HOURS', '24') or '24'))
+    except ValueError:
+        return 24.0
+
+
+def _join_seasons(seasons) -> str:
+    return ','.join(str(season) for season in sorted(seasons))
+
+
+def _split_seasons(value: Optional[str]) -> List[int]:
+    return [int(season) for season in value.split(',')] if value else []
+
+
+def get_tv_season_state(tmdb_id: int, is_4k: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get the cached season state of a TV show, if it is still fresh.
+    
+    Returns:
+        dict: {'media_status', 'seasons', 'available', 'requested', 'missing'} (season number
+        lists), or None if the show has no entry younger than LISTSYNC_SEASON_CACHE_HOURS
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT media_status, seasons, available_seasons, requested_seasons FROM tv_season_state
+            WHERE tmdb_id = ? AND is_4k = ? AND checked_at > datetime('now', ?)
+        ''', (int(tmdb_id), int(bool(is_4k)), f'-{_season_cache_hours()} hours'))
+        row = cursor.fetchone()
+    if not row:
+        return None
+    seasons, available, requested = _split_seasons(row[1]), _split_seasons(row[2]), _split_seasons(row[3])
+    return {
+        'media_status': row[0],
+        'seasons': seasons,
+        'available': available,
+        'requested': requested,
+        'missing': [season for season in seasons if season not in available and season not in requested],
+    }
+
+
+def save_tv_season_state(tmdb_id: int, is_4k: bool, state: Dict[str, Any]):
+    """
+    Cache a TV show's season state (as returned by OverseerrClient.get_tv_season_state).
+    
+    Args:
+        tmdb_id: TMDB ID of the show
+        is_4k: Whether the state is for 4K requests
+        state: Dict with 'media_status', 'seasons', 'available' and 'requested'
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO tv_season_state
+                (tmdb_id, is_4k, media_status, seasons, available_seasons, requested_seasons, checked_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (int(tmdb_id), int(bool(is_4k)), state.get('media_status'), _join_seasons(state['seasons']),
+              _join_seasons(state['available']), _join_seasons(state['requested'])))
+        conn.commit()
+
+
+# ============================================================================
+# List Fingerprints - skip lists whose content has not changed
+# ============================================================================
+
+def compute_list_fingerprint(items: List[Dict[str, Any]]) -> str:
+    """
+    Hash a list's content: its items' IDs, title, year, media type and season, in list order.
+    
+    Args:
+        items: Media items as returned by the list's provider
+        
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for item in items:
+        entry = (
+            item.get('imdb_id'), item.get('tmdb_id'), item.get('title'), item.get('year'),
+            item.get('media_type'), item.get('season_number'),
+        )
+        digest.update(repr(entry).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def get_list_fingerprint(list_type: str, list_id: str) -> Optional[str]:
+    """Get the content fingerprint recorded at the list's last completed sync."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT content_fingerprint FROM lists WHERE list_type = ? AND list_id = ?',
+            (list_type, list_id)
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+
+def save_list_fingerprint(list_type: str, list_id: str, fingerprint: Optional[str]):
+    """Record a list's content fingerprint after all of its items were synced (None forgets it)."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            'UPDATE lists SET content_fingerprint = ?, fingerprint_synced_at = CURRENT_TIMESTAMP '
+            'WHERE list_type = ? AND list_id = ?',
+            (fingerprint, list_type, list_id)
+        )
+        conn.commit()
+
+
+def _item_due_condition() -> Tuple[str, tuple]:
+    """
+    SQL condition (on synced_items aliased si) for items that need processing on the next sync.
+    
+    Items with a scheduled status are due once their next_check_at has passed. Other items
+    (failures, blocked, ...) are due when they were last synced more than
+    LISTSYNC_RECHECK_OTHER_HOURS (default 24) ago, so lists that are skipped or synced as a
+    delta still get their failure backoff and blocklist re-evaluated regularly.
+    """
+    try:
+        other_hours = float(os.getenv('LISTSYNC_RECHECK_OTHER_HOURS', '24') or '24')
+    except ValueError:
+        other_hours = 24.0
+    scheduled = tuple(REVALIDATION_SCHEDULE)
+    placeholders = ','.join('?' * len(scheduled))
+    condition = f'''(
+        (si.status IN ({placeholders})
+            AND (si.next_check_at IS NULL OR si.next_check_at <= datetime('now')))
+        OR (si.status NOT IN ({placeholders})
+            AND (si.last_synced IS NULL OR si.last_synced <= datetime('now', ?)))
+    )'''
+    return condition, (*scheduled, *scheduled, f'-{int(other_hours * 3600)} seconds')
+
+
+def count_list_items_due(list_type: str, list_id: str) -> int:
+    """Count a list's items that need processing on the next sync (see _item_due_condition)."""
+    due_condition, due_params = _item_due_condition()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT COUNT(*) FROM item_lists il
+            JOIN synced_items si ON si.id = il.item_id
+            WHERE il.list_type = ? AND il.list_id = ?
+            AND {due_condition}
+        ''', (list_type, list_id, *due_params))
+        return cursor.fetchone()[0]
+
+
+def get_list_snapshot(list_type: str, list_id: str) -> List[Dict[str, Any]]:
+    """
+    Get the items a list linked to after its previous sync, for delta syncing.
+    
+    Returns:
+        List of dicts with the item's id, imdb_id, tmdb_id, title, year, media_type, status
+        and 'due' (whether it needs processing on this sync, see _item_due_condition)
+    """
+    due_condition, due_params = _item_due_condition()
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT si.id, si.imdb_id, si.tmdb_id, si.title, si.year, si.media_type, si.status,
+                   {due_condition} AS due
+            FROM item_lists il
+            JOIN synced_items si ON si.id = il.item_id
+            WHERE il.list_type = ? AND il.list_id = ?
+        ''', (*due_params, list_type, list_id))
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def touch_list_items(list_type: str, list_id: str, item_ids: Optional[List[int]] = None) -> int:
+    """
+    Refresh item_lists.synced_at for items that are still on a list but were not re-processed.
+    
+    Args:
+        list_type: Type of list
+        list_id: ID of the list
+        item_ids: synced_items IDs to refresh (default: every item linked to the list)
+        
+    Returns:
+        int: Number of links refreshed
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        if item_ids is None:
+            cursor.execute(
+                'UPDATE item_lists SET synced_at = CURRENT_TIMESTAMP WHERE list_type = ? AND list_id = ?',
+                (list_type, list_id)
+            )
+            touched = cursor.rowcount
+        else:
+            touched = 0
+            item_ids = list(item_ids)
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(item_ids), 500):
+                chunk = item_ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    UPDATE item_lists SET synced_at = CURRENT_TIMESTAMP
+                    WHERE list_type = ? AND list_id = ? AND item_id IN ({placeholders})
+                ''', (list_type, list_id, *chunk))
+                touched += cursor.rowcount
+        conn.commit()
+        return touched
+
+
+def unlink_list_items(list_type: str, list_id: str, item_ids: List[int]) -> int:
+    """
+    Remove list links for items that are no longer on a list, recording the removals in list_changes.
+    
+    Returns:
+        int: Number of links removed
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        _stage_item_ids(cursor, item_ids)
+        removed = _remove_list_links(cursor, list_type, list_id,
+                                     'item_lists.item_id IN (SELECT item_id FROM temp.staged_item_ids)')
+        conn.commit()
+    return removed
+
+
+# ============================================================================
+# Sync History Management - Database-Based Sync Tracking
+# ============================================================================
+
+def start_sync_in_db(
+    session_id: str,
+    sync_type: str,
+    list_type: Optional[str] = None,
+    list_id: Optional[str] = None,
+    pid: Optional[int] = None
+) -> int:
+    """
+    Start a sync operation in the database.
+    
+    Args:
+        session_id: Unique session identifier
+        sync_type: 'full' or 'single'
+        list_type: List type for single list syncs (optional)
+        list_id: List ID for single list syncs (optional)
+        pid: Process ID (optional)
+    
+    Returns:
+        int: The sync_id (primary key) of the created sync record
+    """
+    import os
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO sync_history (
+                session_id, sync_type, in_progress, start_time,
+                list_type, list_id, pid, status
+            ) VALUES (?, ?, 1, CURRENT_TIMESTAMP, ?, ?, ?, 'running')
+        ''', (session_id, sync_type, list_type, list_id, pid or os.getpid()))
+        sync_id = cursor.lastrowid
+        conn.commit()
+        logging.info(f"Started sync in database: session_id={session_id}, sync_id={sync_id}")
+        return sync_id
+
+
+def update_sync_lists_in_db(
+    session_id: str,
+    synced_lists: List[Dict[str, str]]
+) -> bool:
+    """
+    Update sync_history record with list information for full syncs.
+    
+    Args:
+        session_id: Session identifier
+        synced_lists: List of dictionaries with 'type' and 'id' keys
+    
+    Returns:
+        bool: True if updated successfully
+    """
+    if not synced_lists:
+        return False
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        
+        # For full syncs, store a summary of all lists synced
+        # Format: "list_type1:list_id1,list_type2:list_id2,..." or summary if too many
+        # Store all list identifiers (comma-separated) - SQLite TEXT can handle long strings
+        list_summaries = [f"{lst['type']}:{lst['id']}" for lst in synced_lists]
+        list_id_value = ','.join(list_summaries)
+        
+        # Use the first list type as the primary type, or "multiple" if different types
+        list_types = set(lst['type'] for lst in synced_lists)
+        if len(list_types) == 1:
+            list_type_value = list_types.pop()
+        else:
+            # Multiple types - store as "multiple" with count
+            list_type_value = f"multiple({len(list_types)} types)"
+        
+        cursor.execute('''
+            UPDATE sync_history
+            SET list_type = ?,
+                list_id = ?
+            WHERE session_id = ?
+        ''', (list_type_value, list_id_value, session_id))
+        updated = cursor.rowcount > 0
+        conn.commit()
+        if updated:
+            logging.info(f"Updated sync lists in database: session_id={session_id}, lists={len(synced_lists)}")
+        return updated
+
+
+def end_sync_in_db(
+    session_id: str,
+    status: str = 'completed',
+    total_items: int = 0,
+    items_requested: int = 0,
+    items_skipped: int = 0,
+    items_errors: int = 0,
+    error_message: Optional[str] = None
+) -> bool:
+    """
+    End a sync operation in the database.
+    
+    Args:
+        session_id: Session identifier
+        status: Final status ('completed', 'failed', 'no_lists', 'no_items', etc.)
+        total_items: Total items processed
+        items_requested: Items successfully requested
+        items_skipped: Items skipped
+        items_errors: Items with errors
+        error_message: Error message if any
+    
+    Returns:
+        bool: True if updated successfully
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE sync_history
+            SET in_progress = 0,
+                end_time = CURRENT_TIMESTAMP,
+                status = ?,
+                total_items = ?,
+                items_requested = ?,
+                items_skipped = ?,
+                items_errors = ?,
+                error_message = ?
+            WHERE session_id = ?
+        ''', (status, total_items, items_requested, items_skipped, items_errors, error_message, session_id))
+        updated = cursor.rowcount > 0
+        conn.commit()
+        if updated:
+            logging.info(f"Ended sync in database: session_id={session_id}, status={status}")
+        else:
+            logging.warning(f"Sync not found in database: session_id={session_id}")
+        return updated
+
+
+_SYNC_ITEM_INSERT = '''
+    INSERT INTO sync_items (
+        sync_id, item_id, title, media_type, year,
+        imdb_id, tmdb_id, overseerr_id, status,
+        list_type, list_id, item_key
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def add_item_to_sync(
+    sync_id: int,
+    item_id: Optional[int],
+    title: str,
+    media_type: str,
+    status: str,
+    list_type: Optional[str] = None,
+    list_id: Optional[str] = None,
+    year: Optional[int] = None,
+    imdb_id: Optional[str] = None,
+    tmdb_id: Optional[str] = None,
+    overseerr_id: Optional[int] = None,
+    item_key: Optional[str] = None
+) -> Optional[int]:
     """
     Add an item to a sync operation.
     
+    Queued like save_sync_result while a sync buffers its writes (see buffered_sync_results).
+    
     Args:
         sync_id: The sync history record ID
         item_id: The synced_items ID (if item exists in database)
@@ -1264,24 +2760,161 @@ def add_item_to_sync(
         imdb_id: IMDB ID
         tmdb_id: TMDB ID
         overseerr_id: Overseerr ID
+        item_key: Identity of the item as its list provided it (see sync_item_key), used to
+            resume an interrupted session
     
     Returns:
-        int: The sync_items record ID
+        Optional[int]: The sync_items record ID, or None if the item was queued
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    record = (sync_id, item_id, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id,
+              item_key)
+    if _queue_write('progress', record):
+        return None
+    
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO sync_items (
-                sync_id, item_id, title, media_type, year,
-                imdb_id, tmdb_id, overseerr_id, status,
-                list_type, list_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (sync_id, item_id, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, list_type, list_id))
+        cursor.execute(_SYNC_ITEM_INSERT, record)
         item_record_id = cursor.lastrowid
         conn.commit()
         return item_record_id
 
 
+def sync_item_key(imdb_id: Optional[str] = None, tmdb_id: Optional[Any] = None, title: Optional[str] = None,
+                  year: Optional[int] = None, media_type: Optional[str] = None) -> Optional[str]:
+    """Build the key an item is recorded under in sync_items (the same identity the backoff uses)."""
+    return _item_backoff_key(imdb_id, tmdb_id, title, year, media_type)
+
+
+def _resume_max_age_hours() -> float:
+    """Oldest interrupted session that is still resumed (LISTSYNC_RESUME_MAX_AGE_HOURS)."""
+    try:
+        return float(os.getenv('LISTSYNC_RESUME_MAX_AGE_HOURS', '24') or '24')
+    except ValueError:
+        return 24.0
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # Exists but belongs to another user
+    return True
+
+
+def resume_interrupted_sync(
+    sync_id: int,
+    sync_type: str,
+    list_type: Optional[str] = None,
+    list_id: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Carry the progress of an interrupted session over to a new one.
+
+    The previous session of the same kind (and, for single list syncs, the same list) is
+    resumed if it was cancelled, failed or left in progress by a process that is gone,
+    started within LISTSYNC_RESUME_MAX_AGE_HOURS and recorded at least one item. Its
+    sync_items rows are copied to the new session, so a resumed sync that is interrupted
+    again still remembers everything done so far.
+
+    Args:
+        sync_id: The sync_id of the session being started
+        sync_type: 'full' or 'single'
+        list_type: List type for single list syncs (optional)
+        list_id: List ID for single list syncs (optional)
+
+    Returns:
+        dict: {'session_id': resumed session ID, 'items': {item_key: sync_items row}},
+            or None if there is nothing to resume
+    """
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        if sync_type == 'single':
+            cursor.execute('''
+                SELECT * FROM sync_history
+                WHERE id < ? AND sync_type = ? AND list_type = ? AND list_id = ?
+                ORDER BY id DESC LIMIT 1
+            ''', (sync_id, sync_type, list_type, list_id))
+        else:
+            cursor.execute('''
+                SELECT * FROM sync_history
+                WHERE id < ? AND sync_type = ?
+                ORDER BY id DESC LIMIT 1
+            ''', (sync_id, sync_type))
+        previous = cursor.fetchone()
+        if not previous:
+            return None
+
+        if previous['in_progress']:
+            # Syncs within one process run one at a time, so a running record of ours is a leftover
+            if previous['pid'] != os.getpid() and _pid_alive(previous['pid']):
+                return None
+        elif previous['status'] in ('completed', 'no_items', 'no_lists'):
+            # The API server closes the records of dead sync processes as completed
+            if not (previous['error_message'] or '').startswith('Auto-cleared stale'):
+                return None
+
+        cursor.execute(
+            "SELECT 1 FROM sync_history WHERE id = ? AND start_time >= datetime('now', ?)",
+            (previous['id'], f"-{_resume_max_age_hours()} hours")
+        )
+        if not cursor.fetchone():
+            return None
+
+        cursor.execute('''
+            INSERT INTO sync_items (
+                sync_id, item_id, title, media_type, year, imdb_id, tmdb_id, overseerr_id,
+                status, list_type, list_id, item_key, processed_at
+            )
+            SELECT ?, item_id, title, media_type, year, imdb_id, tmdb_id, overseerr_id,
+                   status, list_type, list_id, item_key, processed_at
+            FROM sync_items
+            WHERE sync_id = ? AND item_key IS NOT NULL
+        ''', (sync_id, previous['id']))
+        if cursor.rowcount <= 0:
+            return None
+
+        if previous['in_progress']:
+            cursor.execute('''
+                UPDATE sync_history
+                SET in_progress = 0, end_time = CURRENT_TIMESTAMP, status = 'interrupted'
+                WHERE id = ?
+            ''', (previous['id'],))
+        conn.commit()
+
+        cursor.execute('SELECT * FROM sync_items WHERE sync_id = ? AND item_key IS NOT NULL', (sync_id,))
+        items = {row['item_key']: dict(row) for row in cursor.fetchall()}
+
+    logging.info(f"Resuming sync session {previous['session_id']}: {len(items)} item(s) already processed")
+    return {'session_id': previous['session_id'], 'items': items}
+
+
+def prune_sync_items(keep_sync_id: int) -> int:
+    """
+    Delete the item records of finished sessions other than the given one.
+
+    A resume only needs the latest session's items, so this keeps sync_items from
+    growing by one row per item on every sync.
+
+    Returns:
+        int: Number of rows deleted
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            DELETE FROM sync_items
+            WHERE sync_id != ?
+              AND sync_id IN (SELECT id FROM sync_history WHERE in_progress = 0)
+        ''', (keep_sync_id,))
+        deleted = cursor.rowcount
+        conn.commit()
+        return deleted
+
+
 def get_current_sync_status() -> Optional[Dict[str, Any]]:
     """
     Get the current in-progress sync status from database.
@@ -1289,7 +2922,7 @@ def get_current_sync_status() -> Optional[Dict[str, Any]]:
     Returns:
         dict: Current sync status or None if no sync in progress
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1315,7 +2948,7 @@ def get_sync_history(limit: int = 50, include_completed: bool = True) -> List[Di
     Returns:
         list: List of sync history records
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         if include_completed:
@@ -1344,7 +2977,7 @@ def get_sync_items(sync_id: int) -> List[Dict[str, Any]]:
     Returns:
         list: List of sync items
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1357,7 +2990,7 @@ def get_sync_items(sync_id: int) -> List[Dict[str, Any]]:
 
 def cleanup_old_sync_results(days: int = 30):
     """Clean up sync results older than specified days."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             DELETE FROM synced_items 
@@ -1368,6 +3001,186 @@ def cleanup_old_sync_results(days: int = 30):
         return deleted_count
 
 
+# ============================================================================
+# Sync Job Queue - durable queue of triggered syncs for the core process
+# ============================================================================
+
+# Attempts before a job that keeps dying with its worker is given up
+SYNC_JOB_MAX_ATTEMPTS = 3
+
+
+def _sync_job_dedup_key(job_type: str, list_type: Optional[str] = None, list_id: Optional[str] = None) -> str:
+    if job_type == 'single':
+        return f"single:{list_type}:{list_id}"
+    return 'full'
+
+
+def enqueue_sync_job(
+    job_type: str,
+    list_type: Optional[str] = None,
+    list_id: Optional[str] = None,
+    requested_by: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Queue a sync for the core process, coalescing with an active job for the same target.
+    
+    A trigger for a list (or a full sync) that is already queued or running returns that
+    job instead of adding another pass over the same list.
+    
+    Args:
+        job_type: 'full' or 'single'
+        list_type: List type for single list syncs
+        list_id: List ID for single list syncs
+        requested_by: Who triggered the sync (e.g. 'web_ui')
+    
+    Returns:
+        dict: The job row, plus 'coalesced' (True if an active job was reused)
+    """
+    dedup_key = _sync_job_dedup_key(job_type, list_type, list_id)
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR IGNORE INTO sync_jobs (job_type, list_type, list_id, dedup_key, requested_by)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (job_type, list_type, list_id, dedup_key, requested_by))
+        coalesced = cursor.rowcount == 0
+        cursor.execute('''
+            SELECT * FROM sync_jobs
+            WHERE dedup_key = ? AND state IN ('queued', 'running')
+            ORDER BY id DESC LIMIT 1
+        ''', (dedup_key,))
+        job = dict(cursor.fetchone())
+        conn.commit()
+    job['coalesced'] = coalesced
+    if coalesced:
+        logging.info(f"Sync job for {dedup_key} is already {job['state']} (job {job['id']}), trigger coalesced")
+    else:
+        logging.info(f"Queued sync job {job['id']} for {dedup_key}")
+    return job
+
+
+def claim_next_sync_job() -> Optional[Dict[str, Any]]:
+    """
+    Mark the oldest queued job as running for this process and return it.
+    
+    Returns:
+        dict: The claimed job, or None if the queue is empty
+    """
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute("SELECT * FROM sync_jobs WHERE state = 'queued' ORDER BY id LIMIT 1")
+            row = cursor.fetchone()
+            if row is None:
+                cursor.execute('COMMIT')
+                return None
+            cursor.execute('''
+                UPDATE sync_jobs
+                SET state = 'running', attempts = attempts + 1, worker_pid = ?,
+                    started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (os.getpid(), row['id']))
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+    job = dict(row)
+    job['state'] = 'running'
+    job['attempts'] += 1
+    return job
+
+
+def finish_sync_job(job_id: int, state: str = 'completed', error: Optional[str] = None):
+    """Record the outcome of a job ('completed' or 'failed')."""
+    with get_connection() as conn:
+        conn.execute('''
+            UPDATE sync_jobs
+            SET state = ?, last_error = ?, finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (state, error, job_id))
+        conn.commit()
+
+
+def has_queued_sync_jobs() -> bool:
+    """Check whether any job is waiting to run."""
+    with get_connection() as conn:
+        return conn.execute("SELECT 1 FROM sync_jobs WHERE state = 'queued' LIMIT 1").fetchone() is not None
+
+
+def recover_sync_jobs(retention_days: int = 7) -> int:
+    """
+    Requeue jobs whose worker died mid-sync and drop old finished jobs.
+    
+    Called when the core process starts. A job that has already used SYNC_JOB_MAX_ATTEMPTS
+    attempts is marked failed instead of being retried again.
+    
+    Returns:
+        int: Number of jobs requeued
+    """
+    requeued = 0
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, attempts, worker_pid FROM sync_jobs WHERE state = 'running'")
+        for job_id, attempts, worker_pid in cursor.fetchall():
+            if worker_pid != os.getpid() and _pid_alive(worker_pid):
+                continue
+            if attempts >= SYNC_JOB_MAX_ATTEMPTS:
+                cursor.execute('''
+                    UPDATE sync_jobs
+                    SET state = 'failed', last_error = 'Worker exited during the sync',
+                        finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (job_id,))
+                continue
+            try:
+                cursor.execute('''
+                    UPDATE sync_jobs SET state = 'queued', worker_pid = NULL, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (job_id,))
+                requeued += 1
+            except sqlite3.IntegrityError:
+                # A newer trigger for the same target is already queued
+                cursor.execute('''
+                    UPDATE sync_jobs
+                    SET state = 'failed', last_error = 'Superseded by a newer job',
+                        finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (job_id,))
+        cursor.execute(
+            "DELETE FROM sync_jobs WHERE state IN ('completed', 'failed') AND updated_at < datetime('now', ?)",
+            (f"-{int(retention_days)} days",)
+        )
+        conn.commit()
+    if requeued:
+        logging.info(f"Requeued {requeued} interrupted sync job(s)")
+    return requeued
+
+
+def get_sync_jobs(limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Get the active jobs followed by the most recently finished ones.
+    
+    Args:
+        limit: Maximum number of jobs to return
+    
+    Returns:
+        list: Job rows, running first, then queued in run order, then finished newest first
+    """
+    with get_connection() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT * FROM sync_jobs
+            ORDER BY CASE state WHEN 'running' THEN 0 WHEN 'queued' THEN 1 ELSE 2 END,
+                     CASE WHEN state IN ('running', 'queued') THEN id ELSE -id END
+            LIMIT ?
+        ''', (limit,))
+        return [dict(row) for row in cursor.fetchall()]
+
+
 # ============================================================================
 # Configuration Management - Database-Backed Settings
 # ============================================================================
@@ -1377,7 +3190,7 @@ def create_settings_tables():
     Create app_settings and setup_status tables for database-backed configuration.
     Called during database initialization.
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # App settings table - stores all configuration
@@ -1422,7 +3235,7 @@ def save_setting(key: str, value: str, is_encrypted: bool = False, setting_type:
         is_encrypted: Whether the value is encrypted
         setting_type: Type of setting (string, boolean, integer, list)
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT OR REPLACE INTO app_settings 
@@ -1442,7 +3255,7 @@ def get_setting(key: str) -> Optional[tuple]:
     Returns:
         tuple: (value, is_encrypted, setting_type) or None if not found
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT value, is_encrypted, setting_type
@@ -1460,7 +3273,7 @@ def get_all_settings() -> Dict[str, tuple]:
     Returns:
         dict: Dictionary of {key: (value, is_encrypted, setting_type)}
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT key, value, is_encrypted, setting_type
@@ -1472,7 +3285,7 @@ def get_all_settings() -> Dict[str, tuple]:
 
 def delete_setting(key: str):
     """Delete a configuration setting from the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('DELETE FROM app_settings WHERE key = ?', (key,))
         conn.commit()
@@ -1480,7 +3293,7 @@ def delete_setting(key: str):
 
 def is_setup_completed() -> bool:
     """Check if the initial setup wizard has been completed."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT is_completed FROM setup_status WHERE id = 1')
         result = cursor.fetchone()
@@ -1489,7 +3302,7 @@ def is_setup_completed() -> bool:
 
 def mark_setup_complete():
     """Mark the initial setup wizard as completed."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE setup_status
@@ -1502,7 +3315,7 @@ def mark_setup_complete():
 
 def reset_setup_status():
     """Reset setup status (for testing/debugging)."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE setup_status
@@ -1514,7 +3327,7 @@ def reset_setup_status():
 
 def count_settings() -> int:
     """Count the number of settings in the database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT COUNT(*) FROM app_settings')
         result = cursor.fetchone()
@@ -1532,7 +3345,7 @@ def save_overseerr_users(users: List[Dict[str, Any]]):
     Args:
         users: List of user dictionaries with keys: id, display_name, email, avatar
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Clear existing users
@@ -1561,7 +3374,7 @@ def get_overseerr_users() -> List[Dict[str, Any]]:
     Returns:
         List of user dictionaries with keys: id, display_name, email, avatar, last_synced
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, display_name, email, avatar, last_synced
@@ -1592,7 +3405,7 @@ def get_overseerr_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         User dictionary or None if not found
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, display_name, email, avatar, last_synced
@@ -1615,7 +3428,7 @@ def get_overseerr_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
 
 def clear_overseerr_users():
     """Clear all Overseerr users from database."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM overseerr_users")
         conn.commit()
@@ -1633,7 +3446,7 @@ def save_collection_sync_result(franchise_name: str, item_count: Optional[int] =
     """
     from datetime import datetime
     
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         
         # Use existing save_list_id function with list_type='collections'
@@ -1656,7 +3469,7 @@ def get_synced_collections() -> List[str]:
     Returns:
         List[str]: List of franchise names that have been synced
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "SELECT list_id FROM lists WHERE list_type = 'collections' ORDER BY last_synced DESC"
@@ -1786,7 +3599,7 @@ def save_cached_image(image_url: str, image_data: bytes, mime_type: str = None,
         file_size = len(image_data)
         
         # Store in database (preserve existing cached_at if record exists)
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO cached_images
@@ -1821,7 +3634,7 @@ def get_cached_image(image_url: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: Image metadata including local_path, or None if not found
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1857,7 +3670,7 @@ def update_item_poster_url(item_id: int, poster_url: str):
         item_id: Database ID of the synced item
         poster_url: Poster URL (should be our proxy URL, not direct Trakt URL)
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE synced_items
@@ -1876,7 +3689,7 @@ def update_collection_poster_url(list_type: str, list_id: str, poster_url: str):
         list_id: Franchise name
         poster_url: Poster URL (should be our proxy URL, not direct Trakt URL)
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE lists
@@ -1896,7 +3709,7 @@ def get_expired_cached_images(hours: int = 24) -> List[Dict[str, Any]]:
     Returns:
         List of image records that can be cleaned up
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -1918,7 +3731,7 @@ def cleanup_expired_images(hours: int = 24) -> int:
     Returns:
         int: Number of images removed
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -1965,7 +3778,7 @@ def migrate_blob_images_to_files() -> Dict[str, Any]:
     try:
         images_dir = _ensure_images_directory()
         
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -2053,7 +3866,7 @@ def get_cached_image_stats() -> Dict[str, Any]:
     Returns:
         dict: Statistics about image cache
     """
-    with sqlite3.connect(DB_FILE) as conn:
+    with get_connection() as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -4,40 +4,56 @@ Main entry point for the List-Sync application.
 
 import datetime
 import logging
+import multiprocessing
 import os
+import queue
 import re
 import signal
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Any, Optional, Tuple
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 
 from .api.overseerr import OverseerrClient
+from .media_item import ListRef, MediaItem
 from .config import (
     load_config, load_env_config, load_env_lists, save_config,
     CONFIG_FILE
 )
 from .database import (
     init_database, load_list_ids, save_list_id, delete_list,
-    load_sync_interval, configure_sync_interval, should_sync_item,
+    load_sync_interval, configure_sync_interval,
     save_sync_result, update_list_item_count, update_list_sync_info, DB_FILE,
     start_sync_in_db, end_sync_in_db, add_item_to_sync, update_sync_lists_in_db,
-    detect_list_removals, get_newcomers, get_removals
+    detect_list_removals, get_newcomers, get_removals,
+    get_cached_resolution, save_resolution, get_resolution_cache_stats, reset_resolution_cache_stats,
+    BACKOFF_STATUSES, check_item_backoff, record_item_failure, clear_item_backoff,
+    get_scheduled_status, compute_list_fingerprint, get_list_fingerprint, save_list_fingerprint,
+    count_list_items_due, get_list_snapshot, touch_list_items, unlink_list_items,
+    sync_item_key, resume_interrupted_sync, prune_sync_items,
+    claim_next_sync_job, finish_sync_job, has_queued_sync_jobs, recover_sync_jobs,
+    get_tv_season_state, save_tv_season_state, get_connection, open_connection, buffered_sync_results
 )
 from .notifications.discord import send_to_discord_webhook
-from .providers import get_provider, get_available_providers, SyncCancelledException
+from .providers import get_provider, get_available_providers, provider_uses_browser, SyncCancelledException
+from .scheduler import ListScheduler
 from .ui.cli import handle_menu_choice, manage_lists
 from .ui.display import (
     display_ascii_art, display_banner, display_menu, display_lists,
     display_item_status, display_summary, SyncResults
 )
 from .utils.helpers import custom_input, format_time_remaining, init_selenium_driver, color_gradient, construct_list_url
-from .utils.logger import setup_logging, ensure_data_directory_exists
+from .utils.logger import (
+    setup_logging, setup_forwarded_logging, ensure_data_directory_exists, ItemLogBuffer, LogRecordForwarder
+)
 from .utils.log_rotation import get_log_rotator, check_and_rotate_logs
+from .utils.sync_wakeup import start_wakeup_listener
 from .utils.sync_status import (
     get_sync_tracker,
-    is_cancel_requested_persisted,
+    is_cancellation_pending,
+    set_active_sync_session,
     clear_cancel_request,
     set_cancel_request,
     get_pause_until,
@@ -49,6 +65,16 @@ from .utils.sync_status import (
 # Global variable to track current sync session for signal handlers
 _current_sync_session_id: Optional[str] = None
 
+# Progress cursor of the running sync: its sync_id and the items already done in the
+# session it resumes (item_key -> sync_items row), see _start_sync_progress
+_sync_progress: Optional[Dict[str, Any]] = None
+
+# Sentinel marking the end of a sync work queue
+_PIPELINE_END = object()
+
+# Seconds between cancellation checks while waiting on a sync work queue
+_PIPELINE_POLL_INTERVAL = 0.5
+
 
 def _handle_termination_signal(signum, frame):
     """
@@ -64,7 +90,7 @@ def _handle_termination_signal(signum, frame):
         sync_tracker = get_sync_tracker()
         session_id = _current_sync_session_id or sync_tracker.get_state().get('session_id')
         
-        # Persist cancel request so the running loop can see it
+        # Raise the cancel flag; the running loop stops at its next check and clears it
         if session_id:
             try:
                 set_cancel_request(session_id)
@@ -74,9 +100,8 @@ def _handle_termination_signal(signum, frame):
         # Update database to mark sync as cancelled
         if session_id:
             try:
-                import sqlite3
-                from .database import DB_FILE
-                conn = sqlite3.connect(DB_FILE)
+                # Not the pooled connection: the handler may have interrupted a transaction on it
+                conn = open_connection()
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE sync_history 
@@ -90,13 +115,8 @@ def _handle_termination_signal(signum, frame):
             except Exception as e:
                 logging.error(f"Error updating database in signal handler: {e}")
         
-        # Clear the tracker state and persisted flag
+        # Clear the tracker state; the cancel flag stays raised until the loop has stopped
         sync_tracker.end_sync()
-        if session_id:
-            try:
-                clear_cancel_request(session_id)
-            except Exception:
-                pass
         
     except Exception as e:
         logging.error(f"Error in termination signal handler: {e}")
@@ -125,13 +145,8 @@ def check_cancellation_requested(session_id: Optional[str] = None) -> bool:
         bool: True if cancellation requested, False otherwise
     """
     try:
-        sync_tracker = get_sync_tracker()
-        in_mem = sync_tracker.is_cancellation_requested()
-        
-        # Also check persisted flag to support cross-process cancellation
-        sid = session_id or _current_sync_session_id
-        persisted = is_cancel_requested_persisted(sid) if sid else False
-        return in_mem or persisted
+        # In-process and cross-process (shared cancel flag) requests, without file I/O
+        return is_cancellation_pending(session_id or _current_sync_session_id)
     except Exception as e:
         logging.warning(f"Error checking cancellation status: {e}")
         return False
@@ -158,9 +173,7 @@ def handle_cancellation(sync_tracker, session_id: Optional[str] = None):
     # Update database if session_id provided
     if session_id:
         try:
-            import sqlite3
-            from .database import DB_FILE
-            conn = sqlite3.connect(DB_FILE)
+            conn = get_connection()
             cursor = conn.cursor()
             cursor.execute("""
                 UPDATE sync_history 
@@ -257,173 +270,470 @@ def get_credentials() -> tuple:
         sys.exit(1)
 
 
-def fetch_media_from_lists(list_ids: List[Dict[str, str]], is_single_list: bool = False) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+def fetch_list_items(list_info: Dict[str, str]) -> Tuple[List[MediaItem], Dict[str, Any]]:
     """
-    Fetch media items from all configured lists.
+    Fetch and clean the media items of a single configured list.
     
     Args:
-        list_ids (List[Dict[str, str]]): List of dictionaries with list type and ID
-        is_single_list (bool): Whether this is a single list sync (affects log message format)
+        list_info (Dict[str, str]): Dictionary with list type, ID and optional user_id
         
     Returns:
-        tuple: (List of media items from all sources, List of synced list info with URLs)
+        tuple: (List of valid MediaItems tagged with their source list, synced list info with URL)
+        
+    Raises:
+        SyncCancelledException: If cancellation was requested while the provider was running
     """
-    all_media = []
-    synced_lists = []
+    list_type = list_info["type"]
+    list_id = list_info["id"]
+    list_user_id = list_info.get("user_id", "1")
     
-    for list_info in list_ids:
-        # Check for cancellation request
-        if check_cancellation_requested():
-            logging.warning("⚠️ Cancellation detected while fetching lists")
-            # Return what we have so far
-            return all_media, synced_lists
+    try:
+        # Display progress message to user
+        print(color_gradient(f"\n🔍  Fetching items from {list_type.upper()} list: {list_id}... (check backend logs for details - this can take some time)", "#ffaa00", "#ff5500"))
         
-        list_type = list_info["type"]
-        list_id = list_info["id"]
-        list_user_id = list_info.get("user_id", "1")
+        logging.info(f"Fetching {list_type.upper()} list: {list_id}")
+        # Get the appropriate provider function
+        provider_func = get_provider(list_type)
+        media_items = provider_func(list_id)
         
-        try:
-            # Display progress message to user
-            print(color_gradient(f"\n🔍  Fetching items from {list_type.upper()} list: {list_id}... (check backend logs for details - this can take some time)", "#ffaa00", "#ff5500"))
-            
-            logging.info(f"Fetching {list_type.upper()} list: {list_id}")
-            # Get the appropriate provider function
-            provider_func = get_provider(list_type)
-            media_items = provider_func(list_id)
-            
-            # Construct the URL for this list
-            list_url = construct_list_url(list_type, list_id)
-            
-            if media_items:
-                # Filter out items with empty titles and clean up problematic characters
-                valid_items = []
-                for item in media_items:
-                    title = item.get('title', '').strip()
-                    # Clean up backslashes and other problematic characters
-                    title = title.replace('\\', '').strip()
-                    if title:  # Only keep items with non-empty titles
-                        item['title'] = title  # Update the cleaned title
-                        # Attach list information to each item
-                        # This allows tracking which list(s) each item came from (with user)
-                        item['_source_list_type'] = list_type
-                        item['_source_list_id'] = list_id
-                        item['_source_list_user_id'] = list_user_id
-                        valid_items.append(item)
-                    else:
-                        logging.warning(f"Skipping item with empty title from {list_type.upper()} list: {list_id}")
-                
-                # Display success message to user
-                print(color_gradient(f"✅  Found {len(valid_items)} items in {list_type.upper()} list: {list_id}", "#00ff00", "#00aa00"))
-                logging.info(f"Found {len(valid_items)} items in {list_type.upper()} list: {list_id}")
-                all_media.extend(valid_items)
-                
-                # Track this list as successfully synced
-                synced_lists.append({
-                    'type': list_type,
-                    'id': list_id,
-                    'url': list_url,
-                    'item_count': len(media_items),
-                    'user_id': list_user_id
-                })
-            else:
-                # Display warning message to user
-                print(color_gradient(f"⚠️   No items found in {list_type.upper()} list: {list_id}", "#ffaa00", "#ff5500"))
-                logging.warning(f"No items found in {list_type.upper()} list: {list_id}")
-                
-                # Still track the list even if no items found
-                synced_lists.append({
-                    'type': list_type,
-                    'id': list_id,
-                    'url': list_url,
-                    'item_count': 0,
-                    'user_id': list_user_id
-                })
-        except SyncCancelledException:
-            # Cancellation was requested - return what we have so far
-            logging.warning(f"⚠️ Sync cancelled during fetch of {list_type.upper()} list: {list_id}")
-            print(color_gradient(f"⚠️  Sync cancelled - stopping list fetch", "#ffaa00", "#ff5500"))
-            return all_media, synced_lists
-        except Exception as e:
-            # Display error message to user
-            print(color_gradient(f"❌  Error fetching {list_type.upper()} list {list_id}: {str(e)}", "#ff0000", "#aa0000"))
-            logging.error(f"Error fetching {list_type.upper()} list {list_id}: {str(e)}")
+        # Construct the URL for this list
+        list_url = construct_list_url(list_type, list_id)
+        
+        if not media_items:
+            # Display warning message to user
+            print(color_gradient(f"⚠️   No items found in {list_type.upper()} list: {list_id}", "#ffaa00", "#ff5500"))
+            logging.warning(f"No items found in {list_type.upper()} list: {list_id}")
             
-            # Track failed lists too
-            list_url = construct_list_url(list_type, list_id)
-            synced_lists.append({
+            # Still track the list even if no items found
+            return [], {
                 'type': list_type,
                 'id': list_id,
                 'url': list_url,
                 'item_count': 0,
-                'error': str(e)
-            })
+                'user_id': list_user_id,
+                'fingerprint': compute_list_fingerprint([])
+            }
+        
+        # Filter out items with empty titles and clean up problematic characters
+        valid_items = []
+        for item in media_items:
+            title = item.get('title', '').strip()
+            # Clean up backslashes and other problematic characters
+            title = title.replace('\\', '').strip()
+            if title:  # Only keep items with non-empty titles
+                item['title'] = title  # Update the cleaned title
+                # Attach list information to each item
+                # This allows tracking which list(s) each item came from (with user)
+                item.set_source_list(list_type, list_id, list_user_id)
+                valid_items.append(item)
+            else:
+                logging.warning(f"Skipping item with empty title from {list_type.upper()} list: {list_id}")
+        
+        # Display success message to user
+        print(color_gradient(f"✅  Found {len(valid_items)} items in {list_type.upper()} list: {list_id}", "#00ff00", "#00aa00"))
+        logging.info(f"Found {len(valid_items)} items in {list_type.upper()} list: {list_id}")
+        
+        # Track this list as successfully synced
+        return valid_items, {
+            'type': list_type,
+            'id': list_id,
+            'url': list_url,
+            'item_count': len(media_items),
+            'user_id': list_user_id,
+            'fingerprint': compute_list_fingerprint(valid_items)
+        }
+    except SyncCancelledException:
+        # Cancellation was requested - let the caller stop fetching
+        logging.warning(f"⚠️ Sync cancelled during fetch of {list_type.upper()} list: {list_id}")
+        print(color_gradient(f"⚠️  Sync cancelled - stopping list fetch", "#ffaa00", "#ff5500"))
+        raise
+    except Exception as e:
+        # Display error message to user
+        print(color_gradient(f"❌  Error fetching {list_type.upper()} list {list_id}: {str(e)}", "#ff0000", "#aa0000"))
+        logging.error(f"Error fetching {list_type.upper()} list {list_id}: {str(e)}")
+        
+        # Track failed lists too
+        return [], {
+            'type': list_type,
+            'id': list_id,
+            'url': construct_list_url(list_type, list_id),
+            'item_count': 0,
+            'error': str(e)
+        }
+
+
+def _is_list_unchanged(synced_list: Dict[str, Any]) -> bool:
+    """
+    Check whether a fetched list can be skipped: its content fingerprint matches the one saved
+    at its last completed sync and none of its items are due for a re-check.
+    """
+    fingerprint = synced_list.get('fingerprint')
+    if not fingerprint or 'error' in synced_list:
+        return False
+    try:
+        if get_list_fingerprint(synced_list['type'], synced_list['id']) != fingerprint:
+            return False
+        return count_list_items_due(synced_list['type'], synced_list['id']) == 0
+    except Exception as e:
+        logging.warning(f"Unchanged-list check failed for {synced_list['type']} list {synced_list['id']}: {e}")
+        return False
+
+
+def _save_list_fingerprints(synced_lists: List[Dict[str, Any]]):
+    """Record the fingerprints of lists whose items were all processed in this sync."""
+    for synced_list in synced_lists:
+        if not synced_list.get('fingerprint') or synced_list.get('unchanged') or 'error' in synced_list:
+            continue
+        try:
+            save_list_fingerprint(synced_list['type'], synced_list['id'], synced_list['fingerprint'])
+        except Exception as e:
+            logging.warning(f"Failed to save fingerprint for {synced_list['type']} list {synced_list['id']}: {e}")
+
+
+def _snapshot_matcher(snapshot: List[Dict[str, Any]]) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Build a lookup from a fetched item to the snapshot row of the same item (by IMDb ID, TMDB ID, then title)."""
+    by_imdb, by_tmdb, by_title = {}, {}, {}
+    for row in snapshot:
+        if row['imdb_id']:
+            by_imdb.setdefault(row['imdb_id'], row)
+        if row['tmdb_id']:
+            by_tmdb.setdefault((str(row['tmdb_id']), row['media_type']), row)
+        by_title.setdefault((row['title'].lower(), row['year'], row['media_type']), row)
+    
+    def match(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        media_type = item.get('media_type')
+        return (
+            (item.get('imdb_id') and by_imdb.get(item['imdb_id']))
+            or (item.get('tmdb_id') and by_tmdb.get((str(item['tmdb_id']), media_type)))
+            or by_title.get((item['title'].lower(), item.get('year'), media_type))
+        )
     
-    # Remove duplicates (by IMDb ID if available) while preserving list information
-    # Track all lists each item came from
-    seen_imdb_ids = {}
-    seen_tmdb_ids = {}
-    seen_titles = {}
-    unique_media = []
+    return match
+
+
+def _find_list_removals(valid_items: List[Dict[str, Any]], synced_list: Dict[str, Any]):
+    """
+    Record on synced_list['removed_item_ids'] the synced_items still linked to a fully fetched list
+    that are no longer on it. _record_list_removals unlinks them once the sync has completed.
+    """
+    list_type, list_id = synced_list['type'], synced_list['id']
+    try:
+        snapshot = get_list_snapshot(list_type, list_id)
+    except Exception as e:
+        logging.warning(f"Removal detection unavailable for {list_type} list {list_id}: {e}")
+        return
+    match = _snapshot_matcher(snapshot)
+    seen_ids = {row['id'] for row in map(match, valid_items) if row}
+    synced_list['removed_item_ids'] = sorted({row['id'] for row in snapshot} - seen_ids)
+
+
+def _apply_list_delta(valid_items: List[Dict[str, Any]], synced_list: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Reduce a fetched list to the items that need processing, based on its previous snapshot.
     
-    for item in all_media:
-        imdb_id = item.get("imdb_id")
-        tmdb_id = item.get("tmdb_id")
-        title_key = f"{item.get('title', '')}|{item.get('year', '')}|{item.get('media_type', '')}"
-        list_type = item.get('_source_list_type')
-        list_id = item.get('_source_list_id')
+    Items already linked to the list and not due for revalidation are unchanged: only their
+    item_lists.synced_at is refreshed, in bulk. Added items and due items are returned for
+    processing. The counts are recorded on synced_list['delta'] and the synced_items IDs of
+    removed items on synced_list['removed_item_ids'].
+    """
+    list_type, list_id = synced_list['type'], synced_list['id']
+    try:
+        snapshot = get_list_snapshot(list_type, list_id)
+    except Exception as e:
+        logging.warning(f"Delta sync unavailable for {list_type} list {list_id}, processing all items: {e}")
+        return valid_items
+    
+    match = _snapshot_matcher(snapshot)
+    to_process = []
+    seen_ids = set()
+    unchanged_ids = set()
+    added_count = 0
+    for item in valid_items:
+        row = match(item)
+        if not row:
+            added_count += 1
+            to_process.append(item)
+            continue
+        seen_ids.add(row['id'])
+        if row['due']:
+            to_process.append(item)
+        else:
+            unchanged_ids.add(row['id'])
+    
+    removed_ids = sorted({row['id'] for row in snapshot} - seen_ids)
+    if unchanged_ids:
+        try:
+            touch_list_items(list_type, list_id, sorted(unchanged_ids))
+        except Exception as e:
+            logging.warning(f"Failed to refresh unchanged items of {list_type} list {list_id}: {e}")
+    
+    synced_list['delta'] = {
+        'added': added_count,
+        'due': len(to_process) - added_count,
+        'unchanged': len(valid_items) - len(to_process),
+        'removed': len(removed_ids),
+    }
+    synced_list['removed_item_ids'] = removed_ids
+    logging.info(
+        f"🔀 DELTA: {list_type.upper()} list {list_id} - {added_count} added, "
+        f"{len(to_process) - added_count} due for re-check, {len(valid_items) - len(to_process)} unchanged, "
+        f"{len(removed_ids)} removed"
+    )
+    return to_process
+
+
+def _record_list_removals(synced_lists: List[Dict[str, Any]]):
+    """Drop the links of items that left their lists and record them as removed (see _find_list_removals)."""
+    for synced_list in synced_lists:
+        removed_item_ids = synced_list.get('removed_item_ids')
+        if not removed_item_ids:
+            continue
+        try:
+            removed = unlink_list_items(synced_list['type'], synced_list['id'], removed_item_ids)
+            logging.info(f"➖ Recorded {removed} item(s) removed from {synced_list['type']} list {synced_list['id']}")
+        except Exception as e:
+            logging.warning(f"Failed to record removed items of {synced_list['type']} list {synced_list['id']}: {e}")
+
+
+def iter_fetched_lists(list_ids: List[Dict[str, str]], skip_unchanged: bool = False, delta: bool = False) -> Iterator[Tuple[int, List[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    Fetch lists concurrently, yielding each list as soon as it has been fetched.
+    
+    API-backed lists run on a pool of LISTSYNC_FETCH_WORKERS threads (default 8), while lists
+    whose provider drives a Selenium browser share a separate pool of
+    LISTSYNC_BROWSER_FETCH_WORKERS threads (default 1), so slow scrapes never hold up API
+    fetches and only a bounded number of browsers run at once. No new list is started once
+    cancellation is requested, and nothing more is yielded after a provider reports it.
+    
+    With skip_unchanged, a list whose content has not changed since its last completed sync
+    and whose items are all within their revalidation window is yielded without items and
+    with 'unchanged' set on its synced list info. With delta, other lists are reduced to
+    their added and due items (see _apply_list_delta).
+    
+    Args:
+        list_ids (List[Dict[str, str]]): List of dictionaries with list type and ID
+        skip_unchanged (bool): Drop the items of unchanged lists
+        delta (bool): Only yield items that were added to a list or are due for a re-check
+        
+    Yields:
+        tuple: (Position of the list in list_ids, valid media items, synced list info with URL)
+    """
+    api_workers = max(1, int(os.getenv('LISTSYNC_FETCH_WORKERS', '8') or '8'))
+    browser_workers = max(1, int(os.getenv('LISTSYNC_BROWSER_FETCH_WORKERS', '1') or '1'))
+    stopped = threading.Event()
+    
+    def fetch(list_info: Dict[str, str]) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        if stopped.is_set():
+            return None
+        if check_cancellation_requested():
+            if not stopped.is_set():
+                stopped.set()
+                logging.warning("⚠️ Cancellation detected while fetching lists")
+            return None
+        return fetch_list_items(list_info)
+    
+    with ThreadPoolExecutor(max_workers=api_workers, thread_name_prefix="listsync-fetch-api") as api_pool, \
+            ThreadPoolExecutor(max_workers=browser_workers, thread_name_prefix="listsync-fetch-browser") as browser_pool:
+        futures = {}
+        for position, list_info in enumerate(list_ids):
+            pool = browser_pool if provider_uses_browser(list_info["type"]) else api_pool
+            futures[pool.submit(fetch, list_info)] = position
+        
+        try:
+            for future in as_completed(futures):
+                try:
+                    fetched = future.result()
+                except SyncCancelledException:
+                    stopped.set()
+                    continue
+                if fetched is None or stopped.is_set():
+                    continue
+                valid_items, synced_list = fetched
+                if skip_unchanged and _is_list_unchanged(synced_list):
+                    synced_list['unchanged'] = True
+                    logging.info(
+                        f"⏭️  {synced_list['type'].upper()} list {synced_list['id']} is unchanged since its last sync "
+                        f"- skipping its {len(valid_items)} items"
+                    )
+                    try:
+                        touch_list_items(synced_list['type'], synced_list['id'])
+                    except Exception as e:
+                        logging.warning(f"Failed to refresh items of unchanged list {synced_list['id']}: {e}")
+                    valid_items = []
+                elif delta and 'error' not in synced_list:
+                    valid_items = _apply_list_delta(valid_items, synced_list)
+                elif 'error' not in synced_list:
+                    _find_list_removals(valid_items, synced_list)
+                yield futures[future], valid_items, synced_list
+        finally:
+            # Queued fetches return immediately once stopped (also when the caller stops early)
+            stopped.set()
+
+
+class MediaDeduplicator:
+    """
+    Incremental de-duplication of fetched media items across lists.
+    
+    Every item is indexed under each identity it carries: its IMDb ID, its TMDB ID together
+    with its media type (TMDB IDs are only unique within a type) and a normalized
+    title/year key, also per media type. An item matching any indexed key joins that entry,
+    and an item that bridges two entries (e.g. IMDb ID from one list, TMDB ID from another)
+    merges them into the earlier one. Title keys are the weak link: they never join entries
+    whose IMDb or TMDB IDs disagree.
+    
+    The first item seen for an entry is its canonical item and carries a '_source_lists'
+    list; duplicates only add their source list to it. Items can be fed one at a time, so
+    the same logic serves both the fetch-everything path and the streaming pipeline (where
+    both bridged entries may already be dispatched; the earlier one still gains the other's
+    source lists, which the pipeline links once it finishes).
+    """
+    
+    def __init__(self):
+        # Entry i: canonical item, known IDs and source list keys; _parent links merged entries
+        self._entries: List[Dict[str, Any]] = []
+        self._parent: List[int] = []
+        self._index: Dict[str, int] = {}
+        self.total_count = 0
+        self.unique_count = 0
+    
+    @staticmethod
+    def _title_key(item: Dict[str, Any]) -> Optional[str]:
+        title = re.sub(r'[\W_]+', ' ', str(item.get('title') or '').casefold()).strip()
+        if not title:
+            return None
+        return f"title:{item.get('media_type') or ''}:{title}|{item.get('year') or ''}"
+    
+    def _find(self, entry: int) -> int:
+        while self._parent[entry] != entry:
+            self._parent[entry] = self._parent[self._parent[entry]]
+            entry = self._parent[entry]
+        return entry
+    
+    @staticmethod
+    def _compatible(imdb_ids: set, tmdb_ids: set, other: Dict[str, Any]) -> bool:
+        """Whether joining an entry keeps at most one IMDb and one TMDB ID."""
+        return len(imdb_ids | other['imdb_ids']) <= 1 and len(tmdb_ids | other['tmdb_ids']) <= 1
+    
+    def _add_source_list(self, entry: Dict[str, Any], list_ref: ListRef):
+        # ListRefs are interned, so set membership compares type, id and user_id
+        if list_ref not in entry['list_keys']:
+            entry['list_keys'].add(list_ref)
+            entry['item']['_source_lists'].append(list_ref)
+    
+    def add(self, item: Dict[str, Any]) -> bool:
+        """
+        Register a fetched item.
+        
+        Args:
+            item (Dict[str, Any]): Media item tagged with its _source_list_* fields
+            
+        Returns:
+            bool: True if the item is new (and now canonical), False if it was merged into an existing item
+        """
+        self.total_count += 1
         
         # Track which list this item came from
-        list_user_id = item.get('_source_list_user_id', "1")
-        list_info = {'type': list_type, 'id': list_id, 'user_id': list_user_id}
-        
-        # Try to match by IMDb ID first (most reliable)
-        if imdb_id:
-            if imdb_id not in seen_imdb_ids:
-                seen_imdb_ids[imdb_id] = item
-                # Initialize source_lists array
-                item['_source_lists'] = [list_info]
-                unique_media.append(item)
-            else:
-                # Item already exists, add this list to source_lists if not already present
-                existing_item = seen_imdb_ids[imdb_id]
-                if '_source_lists' not in existing_item:
-                    existing_item['_source_lists'] = []
-                # Check if this list is already tracked (by comparing type and id)
-                list_key = f"{list_type}:{list_id}:{list_user_id}"
-                existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
-                if list_key not in existing_keys:
-                    existing_item['_source_lists'].append(list_info)
-        # Try TMDB ID as fallback
-        elif tmdb_id:
-            if tmdb_id not in seen_tmdb_ids:
-                seen_tmdb_ids[tmdb_id] = item
-                item['_source_lists'] = [list_info]
-                unique_media.append(item)
-            else:
-                existing_item = seen_tmdb_ids[tmdb_id]
-                if '_source_lists' not in existing_item:
-                    existing_item['_source_lists'] = []
-                list_key = f"{list_type}:{list_id}:{list_user_id}"
-                existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
-                if list_key not in existing_keys:
-                    existing_item['_source_lists'].append(list_info)
-        # Fallback to title + year + media_type
+        list_info = ListRef(item.get('_source_list_type'), item.get('_source_list_id'),
+                            item.get('_source_list_user_id', "1"))
+        
+        imdb_ids = {str(item['imdb_id'])} if item.get('imdb_id') else set()
+        tmdb_ids = {f"{item.get('media_type') or ''}:{item['tmdb_id']}"} if item.get('tmdb_id') else set()
+        keys = [f"imdb:{imdb_id}" for imdb_id in imdb_ids] + [f"tmdb:{tmdb_id}" for tmdb_id in tmdb_ids]
+        title_key = self._title_key(item)
+        if title_key:
+            keys.append(title_key)
+        
+        # Entries this item matches, strongest key first, skipping any whose IDs conflict
+        matched = []
+        for key in keys:
+            if key not in self._index:
+                continue
+            root = self._find(self._index[key])
+            if root in matched or not self._compatible(imdb_ids, tmdb_ids, self._entries[root]):
+                continue
+            matched.append(root)
+            imdb_ids = imdb_ids | self._entries[root]['imdb_ids']
+            tmdb_ids = tmdb_ids | self._entries[root]['tmdb_ids']
+        
+        if not matched:
+            item['_source_lists'] = []
+            entry = {'item': item, 'imdb_ids': imdb_ids, 'tmdb_ids': tmdb_ids, 'list_keys': set()}
+            self._add_source_list(entry, list_info)
+            self._entries.append(entry)
+            self._parent.append(len(self._entries) - 1)
+            root = len(self._entries) - 1
+            self.unique_count += 1
         else:
-            if title_key not in seen_titles:
-                seen_titles[title_key] = item
-                item['_source_lists'] = [list_info]
-                unique_media.append(item)
-            else:
-                existing_item = seen_titles[title_key]
-                if '_source_lists' not in existing_item:
-                    existing_item['_source_lists'] = []
-                list_key = f"{list_type}:{list_id}:{list_user_id}"
-                existing_keys = [f"{l['type']}:{l['id']}:{l.get('user_id','1')}" for l in existing_item['_source_lists']]
-                if list_key not in existing_keys:
-                    existing_item['_source_lists'].append(list_info)
+            # The earliest entry stays canonical; later ones bridged by this item fold into it
+            matched.sort()
+            root = matched[0]
+            entry = self._entries[root]
+            for other in matched[1:]:
+                merged = self._entries[other]
+                for source_list in merged['item']['_source_lists']:
+                    self._add_source_list(entry, source_list)
+                self._parent[other] = root
+                self.unique_count -= 1
+                logging.info(f"🔗 Dedup: '{merged['item'].get('title')}' is the same title as "
+                             f"'{entry['item'].get('title')}', merging")
+            entry['imdb_ids'], entry['tmdb_ids'] = imdb_ids, tmdb_ids
+            self._add_source_list(entry, list_info)
+        
+        for key in keys:
+            self._index.setdefault(key, root)
+        return not matched
+    
+    def unique_items(self) -> List[Dict[str, Any]]:
+        """Canonical items in the order they were first seen."""
+        return [entry['item'] for position, entry in enumerate(self._entries) if self._parent[position] == position]
+    
+    @property
+    def duplicate_count(self) -> int:
+        """Number of items merged into an earlier item."""
+        return self.total_count - self.unique_count
+
+
+def fetch_media_from_lists(list_ids: List[Dict[str, str]], is_single_list: bool = False, skip_unchanged: bool = False, delta: bool = False) -> Tuple[List[MediaItem], List[Dict[str, str]]]:
+    """
+    Fetch media items from all configured lists.
+    
+    Args:
+        list_ids (List[Dict[str, str]]): List of dictionaries with list type and ID
+        is_single_list (bool): Whether this is a single list sync (affects log message format)
+        skip_unchanged (bool): Leave out the items of unchanged lists (see iter_fetched_lists)
+        delta (bool): Only return items that were added to a list or are due for a re-check
+        
+    Returns:
+        tuple: (List of unique MediaItems from all sources, List of synced list info with URLs)
+    """
+    fetched = {}
+    for position, valid_items, synced_list in iter_fetched_lists(list_ids, skip_unchanged, delta):
+        fetched[position] = (valid_items, synced_list)
     
-    if len(all_media) != len(unique_media):
-        print(color_gradient(f"\n🔄  Removed {len(all_media) - len(unique_media)} duplicate items", "#ffaa00", "#ff5500"))
+    # Reassemble in configured list order so de-duplication picks the same canonical items
+    all_media = []
+    synced_lists = []
+    for position in sorted(fetched):
+        valid_items, synced_list = fetched[position]
+        all_media.extend(valid_items)
+        synced_lists.append(synced_list)
+    
+    # Remove duplicates (by IMDb ID if available) while preserving list information
+    # Track all lists each item came from
+    deduplicator = MediaDeduplicator()
+    for item in all_media:
+        deduplicator.add(item)
+    unique_media = deduplicator.unique_items()
+    
+    if deduplicator.duplicate_count:
+        print(color_gradient(f"\n🔄  Removed {deduplicator.duplicate_count} duplicate items", "#ffaa00", "#ff5500"))
+    
+    unchanged_count = sum(1 for synced_list in synced_lists if synced_list.get('unchanged'))
+    if unchanged_count:
+        print(color_gradient(f"\n⏭️  Skipped {unchanged_count} unchanged list(s)", "#ffaa00", "#ff5500"))
+    delta_unchanged = sum(synced_list.get('delta', {}).get('unchanged', 0) for synced_list in synced_lists)
+    if delta_unchanged:
+        print(color_gradient(f"\n🔀  Delta sync: {delta_unchanged} unchanged list item(s) need no processing", "#ffaa00", "#ff5500"))
     
     # Use different log message for single list syncs to avoid false FULL sync detection
     if is_single_list:
@@ -462,8 +772,10 @@ def get_source_lists_from_item(item: Dict[str, Any], list_type: Optional[str] =
     if not source_lists and list_type and list_id:
         source_lists = [{'type': list_type, 'id': list_id, 'user_id': item.get('_source_list_user_id', "1")}]
     
-    # Ensure all source list entries carry user_id (default to "1")
+    # Ensure all source list entries carry user_id (default to "1"); ListRefs always do
     for sl in source_lists:
+        if isinstance(sl, ListRef):
+            continue
         if 'user_id' not in sl or sl['user_id'] is None:
             sl['user_id'] = "1"
         else:
@@ -484,7 +796,61 @@ def choose_request_user_id(source_lists: List[Dict[str, Any]], default_user_id:
     return str(default_user_id or "1")
 
 
-def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient, dry_run: bool, is_4k: bool = False, list_type: Optional[str] = None, list_id: Optional[str] = None) -> Dict[str, Any]:
+def _resolve_with_cache(
+    lookup,
+    imdb_id: Optional[str] = None,
+    title: Optional[str] = None,
+    year: Optional[int] = None,
+    media_type: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Resolve a TMDB ID from the persistent resolution cache, calling Trakt only on a miss.
+    
+    Args:
+        lookup: Zero-argument callable performing the Trakt lookup
+        imdb_id: IMDb ID the lookup is keyed by
+        title, year, media_type: Title key used when there is no IMDb ID
+        
+    Returns:
+        Optional[Dict[str, Any]]: Cached entry or Trakt result (both carry 'tmdb_id'), or None
+    """
+    try:
+        cached = get_cached_resolution(imdb_id=imdb_id, title=title, year=year, media_type=media_type)
+    except Exception as e:
+        logging.warning(f"Resolution cache lookup failed: {e}")
+        cached = None
+    
+    if cached:
+        logging.info(f"🗂️  Resolution cache hit → TMDB {cached['tmdb_id']} (skipping Trakt)")
+        return cached
+    
+    result = lookup()
+    if result and result.get('tmdb_id'):
+        try:
+            save_resolution(
+                result['tmdb_id'], imdb_id=imdb_id, title=title, year=year, media_type=media_type,
+                resolved_imdb_id=result.get('imdb_id'), resolved_media_type=result.get('media_type')
+            )
+        except Exception as e:
+            logging.warning(f"Failed to cache resolved TMDB ID: {e}")
+    return result
+
+
+def _log_resolution_cache_stats():
+    """Log how much Trakt traffic the resolution cache saved during this sync."""
+    try:
+        stats = get_resolution_cache_stats()
+        lookups = stats['hits'] + stats['misses']
+        if lookups:
+            logging.info(
+                f"🗂️  Resolution cache: {stats['hits']}/{lookups} hits ({stats['hits'] * 100 // lookups}%), "
+                f"{stats['misses']} Trakt lookups, {stats['entries']} cached mappings"
+            )
+    except Exception as e:
+        logging.warning(f"Could not read resolution cache stats: {e}")
+
+
+def process_media_item(item: MediaItem, overseerr_client: OverseerrClient, dry_run: bool, is_4k: bool = False, list_type: Optional[str] = None, list_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Process a single media item for sync to Overseerr using smart ID-based matching.
     
@@ -494,15 +860,217 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
     3. Try Title/Year → Trakt → TMDB ID
     4. Fallback to Overseerr title search (less reliable)
     
+    Items whose last status is still within its revalidation window (already_available
+    for LISTSYNC_RECHECK_AVAILABLE_HOURS, requested/already_requested for
+    LISTSYNC_RECHECK_REQUESTED_HOURS) reuse that status without any network call.
+    
+    Items that keep ending as not_found/error/request_failed are put into backoff and
+    skipped for 1, 2, 4, ... syncs (capped by LISTSYNC_BACKOFF_MAX_SKIP) before being
+    searched again; a successful sync clears the backoff.
+    
+    Every result is recorded in the session's progress cursor (sync_items). When the sync
+    resumes an interrupted session, items that session already finished return their
+    recorded result without any work.
+    
     Args:
-        item (Dict[str, Any]): Media item to process
+        item (MediaItem): Media item to process (a plain dict item works too)
         overseerr_client (OverseerrClient): Overseerr API client
         dry_run (bool): Whether to perform a dry run
         is_4k (bool, optional): Whether to request 4K. Defaults to False.
         
     Returns:
-        Dict[str, Any]: Processing result
+        Dict[str, Any]: Processing result (title, status, year, media_type, plus the resolved
+            overseerr_id/tmdb_id/imdb_id once the item has been matched)
+    """
+    if dry_run:
+        return _match_and_request_media_item(item, overseerr_client, dry_run, is_4k, list_type, list_id)
+    
+    backoff_ids = _item_backoff_ids(item)
+    
+    progress = _sync_progress
+    progress_key = sync_item_key(**backoff_ids) if progress else None
+    if progress_key and progress_key in progress['items']:
+        return _skip_resumed_item(item, progress['items'][progress_key], progress['resumed_session_id'])
+    
+    result = _sync_media_item(item, overseerr_client, is_4k, list_type, list_id, backoff_ids)
+    
+    if progress_key and result.get("status") != "cancelled":
+        _record_sync_progress(progress['sync_id'], progress_key, item, result, list_type, list_id)
+    
+    return result
+
+
+def _item_backoff_ids(item: Dict[str, Any]) -> Dict[str, Any]:
+    """The identity an item's backoff and progress are keyed on: the IDs the list provided, before resolution fills in more."""
+    return {
+        'imdb_id': item.get('imdb_id'),
+        'tmdb_id': item.get('tmdb_id'),
+        'title': item.get('title', 'Unknown Title').replace('\\', '').strip(),
+        'year': item.get('year'),
+        'media_type': item.get('media_type', 'unknown'),
+    }
+
+
+def _sync_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient, is_4k: bool, list_type: Optional[str], list_id: Optional[str], backoff_ids: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the revalidation schedule and failure backoff, then match and request the item (see process_media_item)."""
+    try:
+        scheduled = get_scheduled_status(**backoff_ids)
+    except Exception as e:
+        logging.warning(f"Revalidation schedule check failed: {e}")
+        scheduled = None
+    
+    if scheduled:
+        return _skip_scheduled_item(item, scheduled, list_type, list_id)
+    
+    try:
+        backoff = check_item_backoff(**backoff_ids)
+    except Exception as e:
+        logging.warning(f"Failure backoff check failed: {e}")
+        backoff = None
+    
+    if backoff and backoff['skip']:
+        return _skip_backed_off_item(item, backoff, list_type, list_id)
+    
+    result = _match_and_request_media_item(item, overseerr_client, dry_run=False, is_4k=is_4k, list_type=list_type, list_id=list_id)
+    
+    status = result.get("status")
+    try:
+        if status in BACKOFF_STATUSES:
+            skips = record_item_failure(status, **backoff_ids)
+            if skips:
+                logging.info(f"⏳ BACKOFF: '{backoff_ids['title']}' will be skipped for the next {skips} sync(s)")
+        elif backoff and status not in ("cancelled", "skipped"):
+            clear_item_backoff(**backoff_ids)
+            logging.info(f"✅ BACKOFF: '{backoff_ids['title']}' recovered after {backoff['failure_count']} failed sync(s)")
+    except Exception as e:
+        logging.warning(f"Failed to update failure backoff: {e}")
+    
+    return result
+
+
+def _skip_backed_off_item(item: Dict[str, Any], backoff: Dict[str, Any], list_type: Optional[str] = None, list_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Skip an item that is in failure backoff without any network call.
+    
+    Its list links are still refreshed with the last known failure status, so list
+    membership and the failure views stay accurate while it is skipped.
+    """
+    title = item.get('title', 'Unknown Title').replace('\\', '').strip()
+    media_type = item.get('media_type', 'unknown')
+    year = item.get('year')
+    
+    logging.info(
+        f"⏳ BACKOFF: '{title}' ({year}) [{media_type}] failed {backoff['failure_count']} time(s) "
+        f"({backoff['status']}) - skipping, {backoff['skips_remaining']} more sync(s) until retry"
+    )
+    
+    for source_list in get_source_lists_from_item(item, list_type, list_id):
+        save_sync_result(title, media_type, item.get('imdb_id'), None, backoff['status'], year,
+                         item.get('tmdb_id'), source_list['type'], source_list['id'])
+    
+    return {"title": title, "status": "skipped", "year": year, "media_type": media_type,
+            "tmdb_id": item.get('tmdb_id'), "imdb_id": item.get('imdb_id'), "backoff_status": backoff['status']}
+
+
+def _skip_scheduled_item(item: Dict[str, Any], scheduled: Dict[str, Any], list_type: Optional[str] = None, list_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Reuse an item's last known status because it is not due for a re-check yet.
+    
+    Its list links are refreshed without moving the next check forward.
+    """
+    title = item.get('title', 'Unknown Title').replace('\\', '').strip()
+    media_type = item.get('media_type', 'unknown')
+    year = item.get('year')
+    status = scheduled['status']
+    imdb_id = item.get('imdb_id') or scheduled['imdb_id']
+    tmdb_id = item.get('tmdb_id') or scheduled['tmdb_id']
+    
+    logging.info(f"🗓️  SCHEDULED: '{title}' ({year}) [{media_type}] is {status} - next check at {scheduled['next_check_at']} UTC")
+    
+    for source_list in get_source_lists_from_item(item, list_type, list_id):
+        save_sync_result(title, media_type, imdb_id, scheduled['overseerr_id'], status, year,
+                         tmdb_id, source_list['type'], source_list['id'], keep_schedule=True)
+    
+    return {"title": title, "status": status, "year": year, "media_type": media_type,
+            "overseerr_id": scheduled['overseerr_id'], "tmdb_id": tmdb_id, "imdb_id": imdb_id,
+            "scheduled": True}
+
+
+def _skip_resumed_item(item: Dict[str, Any], done: Dict[str, Any], resumed_session_id: str) -> Dict[str, Any]:
+    """
+    Reuse the result an interrupted session recorded for an item.
+    
+    That session already saved the item and its list links, so nothing is written here.
+    """
+    title = item.get('title', 'Unknown Title').replace('\\', '').strip()
+    media_type = item.get('media_type', 'unknown')
+    year = item.get('year')
+    
+    logging.info(f"♻️  RESUMED: '{title}' ({year}) [{media_type}] was already {done['status']} in session {resumed_session_id}")
+    
+    return {"title": title, "status": done['status'], "year": year, "media_type": media_type,
+            "overseerr_id": done['overseerr_id'], "tmdb_id": item.get('tmdb_id') or done['tmdb_id'],
+            "imdb_id": item.get('imdb_id') or done['imdb_id'], "scheduled": True, "resumed": True}
+
+
+def _record_sync_progress(sync_id: int, item_key: str, item: Dict[str, Any], result: Dict[str, Any], list_type: Optional[str] = None, list_id: Optional[str] = None):
+    """Add a processed item to the session's progress cursor so an interrupted sync can resume after it."""
+    source_lists = get_source_lists_from_item(item, list_type, list_id)
+    source = source_lists[0] if source_lists else {}
+    try:
+        add_item_to_sync(
+            sync_id, None, result["title"], result["media_type"], result["status"],
+            source.get('type'), source.get('id'), result.get("year"),
+            result.get("imdb_id", item.get("imdb_id")), result.get("tmdb_id", item.get("tmdb_id")),
+            result.get("overseerr_id"), item_key=item_key
+        )
+    except Exception as e:
+        logging.warning(f"Failed to record sync progress for '{result['title']}': {e}")
+
+
+def _plan_tv_seasons(overseerr_client: OverseerrClient, tv_id: int, is_4k: bool) -> Optional[Dict[str, Any]]:
+    """
+    Work out which seasons of a TV show still need requesting.
+    
+    The cached season state is reused while it is fresh and the show's status in the
+    availability index has not changed since it was cached; otherwise it is read from
+    Overseerr and cached again. Disabled with LISTSYNC_SEASON_AWARE=false.
+    
+    Returns:
+        Optional[Dict[str, Any]]: Season state with 'missing' and 'requested' season lists, or None
+        to fall back to the show-level status (disabled, fully available, or state unavailable)
     """
+    if os.getenv('LISTSYNC_SEASON_AWARE', 'true').lower() != 'true':
+        return None
+    
+    indexed_status = overseerr_client.indexed_status(tv_id, "tv", is_4k)
+    if indexed_status == 5:
+        # Fully available - every season is there
+        return None
+    
+    try:
+        state = get_tv_season_state(tv_id, is_4k)
+    except Exception as e:
+        logging.warning(f"Could not read cached season state for TV series ID {tv_id}: {e}")
+        state = None
+    if state is not None and indexed_status in (None, state['media_status']):
+        logging.debug(f"Using cached season state for TV series ID {tv_id}")
+    else:
+        state = overseerr_client.get_tv_season_state(tv_id, is_4k)
+        if state is None or not state['seasons']:
+            return None
+        try:
+            save_tv_season_state(tv_id, is_4k, state)
+        except Exception as e:
+            logging.warning(f"Could not cache season state for TV series ID {tv_id}: {e}")
+    
+    logging.debug(f"Seasons of TV series ID {tv_id}: available {state['available']}, "
+                  f"requested {state['requested']}, missing {state['missing']}")
+    return state
+
+
+def _match_and_request_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient, dry_run: bool, is_4k: bool = False, list_type: Optional[str] = None, list_id: Optional[str] = None) -> Dict[str, Any]:
+    """Match a media item in Overseerr and request it if needed (see process_media_item)."""
     # Check for cancellation before processing
     if check_cancellation_requested():
         title = item.get('title', 'Unknown Title').strip()
@@ -537,7 +1105,7 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                     save_sync_result(title, media_type, imdb_id, None, 
                                    "blocked", year, tmdb_id_int, 
                                    source_list['type'], source_list['id'])
-                return {"title": title, "status": "blocked", "year": year, "media_type": media_type}
+                return {"title": title, "status": "blocked", "year": year, "media_type": media_type, "tmdb_id": tmdb_id_int, "imdb_id": imdb_id}
         except (ValueError, TypeError):
             # Invalid TMDB ID, continue processing
             pass
@@ -589,7 +1157,7 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
         # METHOD 2: IMDB ID → Trakt → TMDB ID
         if not search_result and imdb_id:
             logging.info(f"🔍 METHOD 2: IMDB ID → Trakt → TMDB ID (IMDB: {imdb_id})")
-            trakt_result = search_trakt_by_imdb_id(imdb_id)
+            trakt_result = _resolve_with_cache(lambda: search_trakt_by_imdb_id(imdb_id), imdb_id=imdb_id)
             if trakt_result and trakt_result.get('tmdb_id'):
                 resolved_tmdb_id = trakt_result['tmdb_id']
                 # Ensure it's an integer
@@ -613,7 +1181,10 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
         # METHOD 3: Title/Year → Trakt → TMDB ID
         if not search_result:
             logging.info(f"🔍 METHOD 3: Title/Year → Trakt → TMDB ID")
-            trakt_result = search_trakt_by_title(search_title, year, media_type)
+            trakt_result = _resolve_with_cache(
+                lambda: search_trakt_by_title(search_title, year, media_type),
+                title=search_title, year=year, media_type=media_type
+            )
             if trakt_result and trakt_result.get('tmdb_id'):
                 resolved_tmdb_id = trakt_result['tmdb_id']
                 # Ensure it's an integer
@@ -677,27 +1248,16 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
             
             # Check media status in Overseerr
             logging.info(f"🔍 Checking media status in Overseerr...")
-            is_available, is_requested, number_of_seasons = overseerr_client.get_media_status(overseerr_id, search_result["mediaType"])
+            is_available, is_requested, number_of_seasons = overseerr_client.get_media_status(overseerr_id, search_result["mediaType"], is_4k)
             
-            # Check if we should skip re-requesting (but still update status accurately)
-            if not should_sync_item(overseerr_id):
-                logging.info(f"⏭️  Recently synced - updating status but not re-requesting")
-                
-                # Determine ACTUAL current status from Overseerr
-                if is_available:
-                    actual_status = "already_available"
-                elif is_requested:
-                    actual_status = "already_requested"
-                else:
-                    actual_status = "not_requested"
-                
-                logging.info(f"📊 Actual status from Overseerr: {actual_status}")
-                
-                # Save with REAL status (not "skipped"!)
-                for source_list in source_lists:
-                    save_sync_result(title, media_type, imdb_id, overseerr_id, actual_status, year, tmdb_id, source_list['type'], source_list['id'])
-                
-                return {"title": title, "status": actual_status, "year": year, "media_type": media_type}
+            # For whole-show requests, decide per season: only seasons that are neither
+            # available nor requested get requested
+            season_plan = None
+            if search_result["mediaType"] == 'tv' and season_number is None:
+                season_plan = _plan_tv_seasons(overseerr_client, overseerr_id, is_4k)
+                if season_plan is not None:
+                    is_available = not season_plan['missing'] and not season_plan['requested']
+                    is_requested = not season_plan['missing'] and bool(season_plan['requested'])
             
             # Log status interpretation for debugging
             if not is_available and not is_requested:
@@ -708,13 +1268,13 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                 # Save relationship for all source lists
                 for source_list in source_lists:
                     save_sync_result(title, media_type, imdb_id, overseerr_id, "already_available", year, tmdb_id, source_list['type'], source_list['id'])
-                return {"title": title, "status": "already_available", "year": year, "media_type": media_type}
+                return {"title": title, "status": "already_available", "year": year, "media_type": media_type, "overseerr_id": overseerr_id, "tmdb_id": tmdb_id, "imdb_id": imdb_id}
             elif is_requested:
                 logging.info(f"📌 STATUS: Already requested (pending)")
                 # Save relationship for all source lists
                 for source_list in source_lists:
                     save_sync_result(title, media_type, imdb_id, overseerr_id, "already_requested", year, tmdb_id, source_list['type'], source_list['id'])
-                return {"title": title, "status": "already_requested", "year": year, "media_type": media_type}
+                return {"title": title, "status": "already_requested", "year": year, "media_type": media_type, "overseerr_id": overseerr_id, "tmdb_id": tmdb_id, "imdb_id": imdb_id}
             else:
                 logging.info(f"🚀 STATUS: Requesting media...")
                 if search_result["mediaType"] == 'tv':
@@ -722,6 +1282,9 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                     if season_number is not None:
                         logging.info(f"📺 TV SERIES: Requesting Season {season_number} specifically")
                         request_status = overseerr_client.request_specific_season(overseerr_id, season_number, is_4k, requester_user_id=requester_user_id)
+                    elif season_plan is not None:
+                        logging.info(f"📺 TV SERIES: Requesting missing season(s) {season_plan['missing']}")
+                        request_status = overseerr_client.request_tv_seasons(overseerr_id, season_plan['missing'], is_4k, requester_user_id=requester_user_id)
                     else:
                         logging.info(f"📺 TV SERIES: Requesting {number_of_seasons} season(s)")
                         request_status = overseerr_client.request_tv_series(overseerr_id, number_of_seasons, is_4k, requester_user_id=requester_user_id)
@@ -731,22 +1294,28 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                 
                 if request_status == "success":
                     logging.info(f"✅ SUCCESS: Request submitted successfully!")
+                    if season_plan is not None:
+                        try:
+                            save_tv_season_state(overseerr_id, is_4k, dict(
+                                season_plan, requested=season_plan['requested'] + season_plan['missing'], missing=[]))
+                        except Exception as e:
+                            logging.warning(f"Could not cache season state for TV series ID {overseerr_id}: {e}")
                     # Save relationship for all source lists
                     for source_list in source_lists:
                         save_sync_result(title, media_type, imdb_id, overseerr_id, "requested", year, tmdb_id, source_list['type'], source_list['id'])
-                    return {"title": title, "status": "requested", "year": year, "media_type": media_type}
+                    return {"title": title, "status": "requested", "year": year, "media_type": media_type, "overseerr_id": overseerr_id, "tmdb_id": tmdb_id, "imdb_id": imdb_id}
                 elif request_status == "already_requested":
                     logging.info(f"📌 STATUS: Already requested (detected from API response)")
                     # Save relationship for all source lists
                     for source_list in source_lists:
                         save_sync_result(title, media_type, imdb_id, overseerr_id, "already_requested", year, tmdb_id, source_list['type'], source_list['id'])
-                    return {"title": title, "status": "already_requested", "year": year, "media_type": media_type}
+                    return {"title": title, "status": "already_requested", "year": year, "media_type": media_type, "overseerr_id": overseerr_id, "tmdb_id": tmdb_id, "imdb_id": imdb_id}
                 else:
                     logging.error(f"❌ ERROR: Request failed")
                     # Save relationship for all source lists
                     for source_list in source_lists:
                         save_sync_result(title, media_type, imdb_id, overseerr_id, "request_failed", year, tmdb_id, source_list['type'], source_list['id'])
-                    return {"title": title, "status": "request_failed", "year": year, "media_type": media_type}
+                    return {"title": title, "status": "request_failed", "year": year, "media_type": media_type, "overseerr_id": overseerr_id, "tmdb_id": tmdb_id, "imdb_id": imdb_id}
         else:
             logging.error(f"❌ ERROR: Could not find match using any method")
             # Get list information from item using helper function
@@ -757,7 +1326,7 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
                     save_sync_result(title, media_type, imdb_id, None, "not_found", year, tmdb_id, source_list['type'], source_list['id'])
             else:
                 logging.error(f"❌ CRITICAL: Cannot save 'not_found' item without list information!")
-            return {"title": title, "status": "not_found", "year": year, "media_type": media_type}
+            return {"title": title, "status": "not_found", "year": year, "media_type": media_type, "tmdb_id": tmdb_id, "imdb_id": imdb_id}
     except Exception as e:
         logging.error(f"❌ ERROR: Exception during processing: {str(e)}")
         logging.debug(f"Exception details:", exc_info=True)
@@ -779,6 +1348,245 @@ def process_media_item(item: Dict[str, Any], overseerr_client: OverseerrClient,
         return result
 
 
+def _print_item_status(item: Dict[str, Any], status: str, index: int, total: int):
+    """Print the one-line console status for a processed item."""
+    title = item.get('title', 'Unknown')
+    year = item.get('year', '')
+    year_str = f" ({year})" if year else ""
+    
+    if status == "requested":
+        print(f"✅ {title}{year_str}: Successfully Requested ({index}/{total})")
+    elif status == "already_available":
+        print(f"☑️ {title}{year_str}: Already Available ({index}/{total})")
+    elif status == "already_requested":
+        print(f"📌 {title}{year_str}: Already Requested ({index}/{total})")
+    elif status == "skipped":
+        print(f"⏭️ {title}{year_str}: Skipped ({index}/{total})")
+    else:
+        print(f"❓ {title}{year_str}: {status} ({index}/{total})")
+
+
+def _track_item_result(sync_results: SyncResults, result: Dict[str, Any]):
+    """Record not-found/error details, media type and year distribution for a result."""
+    status = result["status"]
+    if status == "not_found":
+        title = result["title"].strip()
+        year = result["year"]
+        if year:
+            title_with_year = f"{title} ({year})"
+        else:
+            title_with_year = title
+        sync_results.not_found_items.append({
+            "title": title_with_year,
+            "year": year
+        })
+    elif status == "error":
+        sync_results.error_items.append({
+            "title": result["title"],
+            "error": result.get("error_message", "Unknown error")
+        })
+    
+    # Track media type counts
+    if result["media_type"] in sync_results.media_type_counts:
+        sync_results.media_type_counts[result["media_type"]] += 1
+    
+    # Track year distribution
+    if result["year"]:
+        year = int(result["year"])
+        if year < 1980:
+            sync_results.year_distribution["pre-1980"] += 1
+        elif year < 2000:
+            sync_results.year_distribution["1980-1999"] += 1
+        elif year < 2020:
+            sync_results.year_distribution["2000-2019"] += 1
+        else:
+            sync_results.year_distribution["2020+"] += 1
+
+
+def _process_item_buffered(
+    log_buffer: ItemLogBuffer,
+    item: Dict[str, Any],
+    index: int,
+    total: int,
+    overseerr_client: OverseerrClient,
+    dry_run: bool,
+    is_4k: bool
+) -> Tuple[Optional[Dict[str, Any]], Optional[Exception], list]:
+    """
+    Worker-thread wrapper around process_media_item that captures the item's log records.
+    
+    Returns:
+        tuple: (result or None, exception or None, captured log records)
+    """
+    result, error = None, None
+    log_buffer.begin()
+    try:
+        logging.info(f"\n{'='*80}")
+        logging.info(f"🎬 PROCESSING ITEM {index}/{total}")
+        logging.info(f"{'='*80}")
+        result = process_media_item(item, overseerr_client, dry_run, is_4k)
+    except Exception as e:
+        error = e
+    finally:
+        records = log_buffer.end()
+    return result, error, records
+
+
+def _sync_media_concurrently(
+    work_queue: "queue.Queue",
+    overseerr_client: OverseerrClient,
+    sync_results: SyncResults,
+    max_workers: int,
+    batch_size: int,
+    is_4k: bool,
+    dry_run: bool,
+    session_id: Optional[str],
+    streaming: bool = False,
+    completed_items: Optional[List[Tuple[Dict[str, Any], Dict[str, Any], int]]] = None
+) -> SyncResults:
+    """
+    Process media items from a work queue on a bounded worker pool.
+    
+    Workers run process_media_item with their log records held back; the calling thread
+    replays each item's records and updates sync_results strictly in item order, so log
+    blocks stay contiguous and counters match a sequential run. At most 2 * max_workers
+    items are in flight, and no new items are started once cancellation is requested.
+    
+    The queue is drained until _PIPELINE_END. With a pre-filled queue sync_results.total_items
+    is known up front; in streaming mode items are still arriving, so total_items grows as
+    they are dispatched.
+    
+    Args:
+        completed_items: Optional list that receives (item, result, source list count at dispatch)
+            for every processed item, used by the streaming pipeline to link late duplicates
+    """
+    max_in_flight = max_workers * 2
+    log_buffer = ItemLogBuffer()
+    
+    pending = {}       # future -> item index
+    completed = {}     # item index -> (result, error, records)
+    items = {}         # item index -> (item, source list count at dispatch)
+    next_submit = 0
+    next_flush = 0
+    processed = 0
+    exhausted = False
+    cancelled = False
+    
+    log_buffer.install()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="listsync-item") as executor:
+            while True:
+                # Keep the pool fed up to the in-flight limit
+                while not cancelled and not exhausted and len(pending) < max_in_flight:
+                    if check_cancellation_requested():
+                        logging.warning(f"⚠️ Cancellation detected before item {next_submit + 1}/{sync_results.total_items}")
+                        cancelled = True
+                        break
+                    try:
+                        # Only block on the queue when there is nothing else to wait for
+                        item = work_queue.get_nowait() if pending else work_queue.get(timeout=_PIPELINE_POLL_INTERVAL)
+                    except queue.Empty:
+                        break
+                    if item is _PIPELINE_END:
+                        exhausted = True
+                        break
+                    if streaming:
+                        sync_results.total_items += 1
+                    items[next_submit] = (item, len(item.get('_source_lists', [])))
+                    future = executor.submit(
+                        _process_item_buffered, log_buffer, item,
+                        next_submit + 1, sync_results.total_items, overseerr_client, dry_run, is_4k
+                    )
+                    pending[future] = next_submit
+                    next_submit += 1
+                
+                if not pending:
+                    if exhausted or cancelled:
+                        break
+                    continue
+                
+                # Poll while the source may still deliver more work, otherwise block
+                can_submit = not (exhausted or cancelled) and len(pending) < max_in_flight
+                done, _ = wait(pending, timeout=_PIPELINE_POLL_INTERVAL if can_submit else None, return_when=FIRST_COMPLETED)
+                for future in done:
+                    completed[pending.pop(future)] = future.result()
+                
+                # Flush finished items in order
+                while next_flush in completed:
+                    result, error, records = completed.pop(next_flush)
+                    item, dispatched_count = items.pop(next_flush)
+                    index = next_flush + 1
+                    total = sync_results.total_items
+                    next_flush += 1
+                    log_buffer.replay(records)
+                    
+                    if error is not None:
+                        logging.error(f"{'='*80}")
+                        logging.error(f"❌ ERROR PROCESSING ITEM {index}/{total}: {str(error)}")
+                        logging.error(f"{'='*80}\n")
+                        sync_results.results["error"] += 1
+                        processed += 1
+                        continue
+                    
+                    status = result["status"]
+                    if status == "cancelled":
+                        # Item noticed the cancellation before doing any work
+                        cancelled = True
+                        continue
+                    
+                    if completed_items is not None:
+                        completed_items.append((item, result, dispatched_count))
+                    
+                    try:
+                        sync_results.results[status] += 1
+                        
+                        logging.info(f"{'='*80}")
+                        logging.info(f"✅ COMPLETED ITEM {index}/{total} - Status: {status.upper()}")
+                        logging.info(f"{'='*80}\n")
+                        
+                        _print_item_status(item, status, index, total)
+                        _track_item_result(sync_results, result)
+                    except Exception as e:
+                        logging.error(f"{'='*80}")
+                        logging.error(f"❌ ERROR PROCESSING ITEM {index}/{total}: {str(e)}")
+                        logging.error(f"{'='*80}\n")
+                        sync_results.results["error"] += 1
+                    processed += 1
+                    
+                    if processed % batch_size == 0:
+                        logging.info(f"📊 PROGRESS: {processed}/{sync_results.total_items} items processed")
+                    
+                    if not cancelled and check_cancellation_requested():
+                        logging.warning(f"⚠️ Cancellation detected after item {index}/{total}")
+                        cancelled = True
+    finally:
+        log_buffer.uninstall()
+    
+    logging.info(f"📊 PROGRESS: {processed}/{sync_results.total_items} items processed")
+    
+    if cancelled:
+        handle_cancellation(get_sync_tracker(), session_id)
+        sync_results.cancelled = True
+    
+    return sync_results
+
+
+def _prepare_overseerr_client(overseerr_client: OverseerrClient, dry_run: bool):
+    """
+    Set up the client's per-sync caches before processing items.
+    
+    Enables the media detail cache and loads Overseerr's availability index
+    (LISTSYNC_AVAILABILITY_INDEX), so a handful of paged listing requests replaces one
+    status request per matched item.
+    """
+    if dry_run:
+        return
+    overseerr_client.enable_media_cache()
+    if os.getenv('LISTSYNC_AVAILABILITY_INDEX', 'true').lower() == 'true':
+        print("📇 Loading Overseerr availability index...")
+        overseerr_client.prefetch_availability_index()
+
+
 def sync_media_to_overseerr(
     media_items: List[Dict[str, Any]],
     overseerr_client: OverseerrClient,
@@ -790,7 +1598,16 @@ def sync_media_to_overseerr(
     session_id: Optional[str] = None
 ) -> SyncResults:
     """
-    Sync media items to Overseerr using ThreadPoolExecutor for concurrent processing.
+    Sync media items to Overseerr.
+    
+    Items are processed sequentially (LISTSYNC_SEQUENTIAL_MODE=true), on a worker pool
+    when LISTSYNC_MAX_WORKERS is greater than 1, or otherwise in batches of
+    LISTSYNC_BATCH_SIZE items. With LISTSYNC_SHARD_PROCESSES greater than 1 the items are
+    first split across that many worker processes (see _sync_media_sharded), each of which
+    processes its shard in one of these modes.
+    
+    Item results are written in batches while the items are processed (see
+    buffered_sync_results) and are all in the database once this returns.
     
     Args:
         media_items (List[Dict[str, Any]]): List of media items to sync
@@ -803,6 +1620,19 @@ def sync_media_to_overseerr(
     Returns:
         SyncResults: Sync results
     """
+    with buffered_sync_results():
+        return _sync_media_items(media_items, overseerr_client, synced_lists, is_4k, dry_run, session_id)
+
+
+def _sync_media_items(
+    media_items: List[Dict[str, Any]],
+    overseerr_client: OverseerrClient,
+    synced_lists: Optional[List[Dict[str, str]]],
+    is_4k: bool,
+    dry_run: bool,
+    session_id: Optional[str]
+) -> SyncResults:
+    """Process media items for sync_media_to_overseerr."""
     sync_results = SyncResults()
     sync_results.total_items = len(media_items)
     sync_results.synced_lists = synced_lists or []
@@ -812,7 +1642,14 @@ def sync_media_to_overseerr(
     
     # Intelligent batching for optimal performance with readable logs
     batch_size = int(os.getenv('LISTSYNC_BATCH_SIZE', '3') or '3')  # Default batch size of 3
+    max_workers = int(os.getenv('LISTSYNC_MAX_WORKERS', '1') or '1')  # Values above 1 enable concurrent mode
     sequential_mode = os.getenv('LISTSYNC_SEQUENTIAL_MODE', 'false').lower() == 'true'
+    shard_processes = min(int(os.getenv('LISTSYNC_SHARD_PROCESSES', '1') or '1'), len(media_items))
+    
+    if shard_processes > 1 and not sequential_mode:
+        return _sync_media_sharded(media_items, overseerr_client, sync_results, shard_processes, is_4k, dry_run, session_id)
+    
+    _prepare_overseerr_client(overseerr_client, dry_run)
     
     if sequential_mode:
         logging.info("🔄 Sequential processing mode enabled (LISTSYNC_SEQUENTIAL_MODE=true)")
@@ -854,6 +1691,25 @@ def sync_media_to_overseerr(
                 logging.error(f"❌ ERROR: Exception during processing: {str(e)}")
                 sync_results.results["error"] += 1
                 current_item += 1
+    elif max_workers > 1:
+        logging.info(f"⚡ Concurrent processing mode enabled ({max_workers} workers, LISTSYNC_MAX_WORKERS={max_workers})")
+        print(f"⚡ Concurrent processing mode enabled - {max_workers} workers")
+        
+        work_queue = queue.Queue()
+        for item in media_items:
+            work_queue.put(item)
+        work_queue.put(_PIPELINE_END)
+        
+        return _sync_media_concurrently(
+            work_queue,
+            overseerr_client,
+            sync_results,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            is_4k=is_4k,
+            dry_run=dry_run,
+            session_id=session_id
+        )
     else:
         logging.info(f"⚡ Intelligent batching mode enabled (batch size: {batch_size})")
         print(f"⚡ Intelligent batching mode enabled - processing {batch_size} items at a time")
@@ -893,21 +1749,7 @@ def sync_media_to_overseerr(
                     logging.info(f"{'='*80}\n")
                     
                     # Display each item individually
-                    title = item.get('title', 'Unknown')
-                    year = item.get('year', '')
-                    year_str = f" ({year})" if year else ""
-                    index = start_idx + i + 1
-                    
-                    if status == "requested":
-                        print(f"✅ {title}{year_str}: Successfully Requested ({index}/{sync_results.total_items})")
-                    elif status == "already_available":
-                        print(f"☑️ {title}{year_str}: Already Available ({index}/{sync_results.total_items})")
-                    elif status == "already_requested":
-                        print(f"📌 {title}{year_str}: Already Requested ({index}/{sync_results.total_items})")
-                    elif status == "skipped":
-                        print(f"⏭️ {title}{year_str}: Skipped ({index}/{sync_results.total_items})")
-                    else:
-                        print(f"❓ {title}{year_str}: {status} ({index}/{sync_results.total_items})")
+                    _print_item_status(item, status, start_idx + i + 1, sync_results.total_items)
                     
                     current_item += 1
                     
@@ -919,38 +1761,7 @@ def sync_media_to_overseerr(
                         return sync_results
                     
                     # Track additional information
-                    if status == "not_found":
-                        title = result["title"].strip()
-                        year = result["year"]
-                        if year:
-                            title_with_year = f"{title} ({year})"
-                        else:
-                            title_with_year = title
-                        sync_results.not_found_items.append({
-                            "title": title_with_year,
-                            "year": year
-                        })
-                    elif status == "error":
-                        sync_results.error_items.append({
-                            "title": result["title"],
-                            "error": result.get("error_message", "Unknown error")
-                        })
-                    
-                    # Track media type counts
-                    if result["media_type"] in sync_results.media_type_counts:
-                        sync_results.media_type_counts[result["media_type"]] += 1
-                    
-                    # Track year distribution
-                    if result["year"]:
-                        year = int(result["year"])
-                        if year < 1980:
-                            sync_results.year_distribution["pre-1980"] += 1
-                        elif year < 2000:
-                            sync_results.year_distribution["1980-1999"] += 1
-                        elif year < 2020:
-                            sync_results.year_distribution["2000-2019"] += 1
-                        else:
-                            sync_results.year_distribution["2020+"] += 1
+                    _track_item_result(sync_results, result)
                     
                 except Exception as e:
                     # Add clear log boundary for errors too
@@ -966,6 +1777,366 @@ def sync_media_to_overseerr(
     return sync_results
 
 
+def _shard_index(item: Dict[str, Any], shard_count: int) -> int:
+    """Stable shard of an item: the same identity lands in the same shard in every sync and process."""
+    key = sync_item_key(**_item_backoff_ids(item)) or item.get('title', '')
+    return zlib.crc32(key.encode('utf-8')) % shard_count
+
+
+def _merge_sync_results(sync_results: SyncResults, shard_results: SyncResults):
+    """Add a shard's counters and item details to the combined results."""
+    for status, count in shard_results.results.items():
+        sync_results.results[status] = sync_results.results.get(status, 0) + count
+    for media_type, count in shard_results.media_type_counts.items():
+        sync_results.media_type_counts[media_type] = sync_results.media_type_counts.get(media_type, 0) + count
+    for bucket, count in shard_results.year_distribution.items():
+        sync_results.year_distribution[bucket] = sync_results.year_distribution.get(bucket, 0) + count
+    sync_results.not_found_items.extend(shard_results.not_found_items)
+    sync_results.error_items.extend(shard_results.error_items)
+    sync_results.cancelled = sync_results.cancelled or shard_results.cancelled
+
+
+# The parent's availability index, handed to each shard process when it starts (see _init_sync_shard)
+_shard_availability_index: Optional[Dict[Tuple[int, str], Tuple[Optional[int], Optional[int]]]] = None
+
+
+def _init_sync_shard(
+    log_queue: Any,
+    availability_index: Optional[Dict[Tuple[int, str], Tuple[Optional[int], Optional[int]]]]
+):
+    """Worker-process initializer: forward log records to the parent and keep the index it built."""
+    global _shard_availability_index
+    setup_forwarded_logging(log_queue)
+    _shard_availability_index = availability_index
+
+
+def _run_sync_shard(
+    shard: int,
+    shard_count: int,
+    media_items: List[Dict[str, Any]],
+    client_settings: Tuple[str, str, str],
+    is_4k: bool,
+    dry_run: bool,
+    session_id: Optional[str],
+    progress: Optional[Dict[str, Any]]
+) -> SyncResults:
+    """
+    Worker-process entry point: sync one shard of the media items with its own Overseerr client.
+    
+    The shard joins the parent's session, so it records progress under the parent's sync_id
+    and stops when that session is cancelled. The cancellation itself is recorded once by
+    the parent after all shards have returned. Its log records go to the parent, and it uses
+    the availability index the parent built instead of listing Overseerr again (the worker
+    process runs _init_sync_shard when it starts).
+    """
+    global _current_sync_session_id, _sync_progress
+    
+    setup_sync_signal_handlers()
+    # A shard processes its items in this process, with the parent's availability index (if it has one)
+    os.environ['LISTSYNC_SHARD_PROCESSES'] = '1'
+    os.environ['LISTSYNC_AVAILABILITY_INDEX'] = 'false'
+    overseerr_client = OverseerrClient(*client_settings)
+    overseerr_client.set_availability_index(_shard_availability_index)
+    _current_sync_session_id = session_id
+    set_active_sync_session(session_id)
+    _sync_progress = progress
+    
+    logging.info(f"🧩 SHARD {shard + 1}/{shard_count} (PID {os.getpid()}): syncing {len(media_items)} items")
+    try:
+        return sync_media_to_overseerr(media_items, overseerr_client, is_4k=is_4k, dry_run=dry_run)
+    finally:
+        _current_sync_session_id = None
+        _sync_progress = None
+        set_active_sync_session(None)
+
+
+def _sync_media_sharded(
+    media_items: List[Dict[str, Any]],
+    overseerr_client: OverseerrClient,
+    sync_results: SyncResults,
+    shard_count: int,
+    is_4k: bool,
+    dry_run: bool,
+    session_id: Optional[str]
+) -> SyncResults:
+    """
+    Sync media items across worker processes, one shard of the de-duplicated set each.
+    
+    Items are partitioned by a stable hash of their identity and each shard runs in its own
+    process (LISTSYNC_SHARD_PROCESSES), so matching and database writes are not serialized
+    on one interpreter. Shards share the session's progress cursor and cancellation flag,
+    and their outbound calls draw from the cross-process rate limiter. The parent loads
+    Overseerr's availability index once for all shards, merges their results and writes
+    their log records.
+    
+    A shard that fails contributes no item results: its items are taken out of total_items
+    and the failure is listed in sync_results.failed_shards. Items it finished before failing
+    are saved and in the progress cursor, so a resumed sync skips them.
+    
+    Returns:
+        SyncResults: The combined results of all shards
+    """
+    shards: List[List[Dict[str, Any]]] = [[] for _ in range(shard_count)]
+    for item in media_items:
+        shards[_shard_index(item, shard_count)].append(item)
+    
+    logging.info(f"🧩 Sharded processing mode enabled ({shard_count} processes, LISTSYNC_SHARD_PROCESSES={shard_count}): "
+                 f"{', '.join(str(len(shard)) for shard in shards)} items per shard")
+    print(f"🧩 Sharded processing mode enabled - {shard_count} worker processes")
+    
+    progress = _sync_progress
+    client_settings = (overseerr_client.overseerr_url, overseerr_client.api_key, overseerr_client.requester_user_id)
+    _prepare_overseerr_client(overseerr_client, dry_run)
+    availability_index = overseerr_client.get_availability_index()
+    
+    # Spawn rather than fork: the parent runs helper threads (wake-up listener, log buffers)
+    mp_context = multiprocessing.get_context('spawn')
+    log_queue = mp_context.Queue()
+    log_forwarder = LogRecordForwarder(log_queue)
+    log_forwarder.start()
+    try:
+        _run_sync_shards(shards, mp_context, log_queue, availability_index, client_settings, progress,
+                         sync_results, is_4k, dry_run, session_id)
+    finally:
+        # The pool has shut down, so every shard's records are queued
+        log_forwarder.stop()
+        log_queue.close()
+    
+    if sync_results.cancelled:
+        handle_cancellation(get_sync_tracker(), session_id)
+    
+    return sync_results
+
+
+def _run_sync_shards(
+    shards: List[List[Dict[str, Any]]],
+    mp_context: Any,
+    log_queue: Any,
+    availability_index: Optional[Dict[Tuple[int, str], Tuple[Optional[int], Optional[int]]]],
+    client_settings: Tuple[str, str, str],
+    progress: Optional[Dict[str, Any]],
+    sync_results: SyncResults,
+    is_4k: bool,
+    dry_run: bool,
+    session_id: Optional[str]
+):
+    """Run the non-empty shards on a process pool and merge their results as they finish."""
+    shard_count = len(shards)
+    with ProcessPoolExecutor(max_workers=shard_count, mp_context=mp_context,
+                             initializer=_init_sync_shard, initargs=(log_queue, availability_index)) as executor:
+        futures = {}
+        for shard, shard_items in enumerate(shards):
+            if not shard_items:
+                continue
+            shard_progress = None
+            if progress:
+                # Only ship the part of the resume map this shard can use
+                keys = {sync_item_key(**_item_backoff_ids(item)) for item in shard_items}
+                shard_progress = dict(progress, items={key: row for key, row in progress['items'].items() if key in keys})
+            future = executor.submit(
+                _run_sync_shard, shard, shard_count, shard_items, client_settings,
+                is_4k, dry_run, session_id, shard_progress
+            )
+            futures[future] = shard
+        
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                _merge_sync_results(sync_results, future.result())
+                logging.info(f"🧩 SHARD {shard + 1}/{shard_count} finished")
+            except Exception as e:
+                # Its results are lost with the process; items it finished are in the progress cursor
+                logging.error(f"❌ SHARD {shard + 1}/{shard_count} failed, {len(shards[shard])} items unprocessed: {e}")
+                sync_results.total_items -= len(shards[shard])
+                sync_results.failed_shards.append({
+                    "shard": shard + 1,
+                    "shard_count": shard_count,
+                    "items": len(shards[shard]),
+                    "error": str(e)
+                })
+
+
+def _put_until_stopped(work_queue: "queue.Queue", item: Any, stop_event: threading.Event) -> bool:
+    """
+    Put an item on a bounded queue, waiting for space unless the pipeline is being torn down.
+    
+    Returns:
+        bool: True if the item was queued, False if the pipeline stopped first
+    """
+    while not stop_event.is_set():
+        try:
+            work_queue.put(item, timeout=_PIPELINE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _link_late_source_lists(completed_items: List[Tuple[Dict[str, Any], Dict[str, Any], int]]) -> int:
+    """
+    Link processed items to lists whose duplicate copy arrived after the item was dispatched.
+    
+    process_media_item may or may not have seen those lists when it saved its result, but
+    save_sync_result only adds a list link once, so saving them again here is safe.
+    
+    Returns:
+        int: Number of late list links saved
+    """
+    linked = 0
+    for item, result, dispatched_count in completed_items:
+        late_lists = get_source_lists_from_item(item)[dispatched_count:]
+        if not late_lists or result.get("status") in ("cancelled", "would_be_synced"):
+            continue
+        # Backed-off items were saved with their last failure status rather than "skipped"
+        status = result.get("backoff_status", result["status"])
+        for source_list in late_lists:
+            try:
+                save_sync_result(
+                    result["title"], result["media_type"], result.get("imdb_id", item.get("imdb_id")),
+                    result.get("overseerr_id"), status, result["year"],
+                    result.get("tmdb_id", item.get("tmdb_id")), source_list['type'], source_list['id'],
+                    keep_schedule=result.get("scheduled", False)
+                )
+                linked += 1
+            except Exception as e:
+                logging.warning(f"Failed to link '{result['title']}' to {source_list['type']} list {source_list['id']}: {e}")
+    return linked
+
+
+def stream_media_to_overseerr(
+    list_ids: List[Dict[str, str]],
+    overseerr_client: OverseerrClient,
+    is_4k: bool = False,
+    dry_run: bool = False,
+    session_id: Optional[str] = None,
+    skip_unchanged: bool = False,
+    delta: bool = False
+) -> Tuple[SyncResults, List[Dict[str, str]]]:
+    """
+    Fetch, de-duplicate and sync media items as a streaming pipeline.
+    
+    A fetch thread pulls the lists concurrently (see iter_fetched_lists) and feeds their items
+    into a bounded queue, a dedup thread forwards only new items into a second bounded queue,
+    and the calling thread processes them on the LISTSYNC_MAX_WORKERS worker pool. Items from
+    fast lists are requested while slow lists are still being fetched, and the bounded queues
+    (LISTSYNC_PIPELINE_QUEUE_SIZE) keep memory flat instead of materializing every list up front.
+    
+    An item that shows up again in a later list after it was dispatched is linked to that
+    list once the pipeline has drained.
+    
+    Args:
+        list_ids (List[Dict[str, str]]): List of dictionaries with list type and ID
+        overseerr_client (OverseerrClient): Overseerr API client
+        is_4k (bool, optional): Whether to request 4K. Defaults to False.
+        dry_run (bool, optional): Whether to perform a dry run. Defaults to False.
+        session_id (Optional[str]): Session ID for cancellation tracking
+        skip_unchanged (bool, optional): Leave out the items of unchanged lists (see iter_fetched_lists)
+        delta (bool, optional): Only sync items that were added to a list or are due for a re-check
+        
+    Returns:
+        tuple: (Sync results, List of synced list info with URLs)
+    """
+    batch_size = int(os.getenv('LISTSYNC_BATCH_SIZE', '3') or '3')
+    max_workers = max(1, int(os.getenv('LISTSYNC_MAX_WORKERS', '1') or '1'))
+    queue_size = max(1, int(os.getenv('LISTSYNC_PIPELINE_QUEUE_SIZE', '500') or '500'))
+    
+    sync_results = SyncResults()
+    synced_lists = []
+    sync_results.synced_lists = synced_lists
+    
+    fetched_queue = queue.Queue(maxsize=queue_size)
+    work_queue = queue.Queue(maxsize=max_workers * 4)
+    stop_event = threading.Event()
+    deduplicator = MediaDeduplicator()
+    
+    def fetch_stage():
+        """Fetch lists concurrently and queue every valid item as each list arrives."""
+        fetched_lists = {}
+        try:
+            for position, valid_items, synced_list in iter_fetched_lists(list_ids, skip_unchanged, delta):
+                fetched_lists[position] = synced_list
+                for item in valid_items:
+                    if not _put_until_stopped(fetched_queue, item, stop_event):
+                        return
+                if stop_event.is_set():
+                    return
+        except Exception as e:
+            logging.error(f"Error in pipeline fetch stage: {e}", exc_info=True)
+        finally:
+            # Report lists in configured order regardless of completion order
+            synced_lists.extend(fetched_lists[position] for position in sorted(fetched_lists))
+            _put_until_stopped(fetched_queue, _PIPELINE_END, stop_event)
+    
+    def dedup_stage():
+        """Forward items that have not been seen yet; merge the rest into their first copy."""
+        try:
+            while not stop_event.is_set():
+                try:
+                    item = fetched_queue.get(timeout=_PIPELINE_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if item is _PIPELINE_END:
+                    return
+                if deduplicator.add(item) and not _put_until_stopped(work_queue, item, stop_event):
+                    return
+        finally:
+            _put_until_stopped(work_queue, _PIPELINE_END, stop_event)
+    
+    logging.info(f"🚰 Streaming pipeline mode enabled ({max_workers} worker(s), queue size {queue_size})")
+    print(f"\n🚰  Streaming pipeline mode enabled - processing items as lists are fetched ({max_workers} worker(s))")
+    # The log parsers key full sync sessions on this marker; the total is not known yet
+    print(color_gradient(f"\n📊  Total unique media items ready for sync: 0 (streaming - counted as lists are fetched)", "#00aaff", "#00ffaa"))
+    
+    stages = [
+        threading.Thread(target=fetch_stage, daemon=True, name="listsync-fetch"),
+        threading.Thread(target=dedup_stage, daemon=True, name="listsync-dedup"),
+    ]
+    for stage in stages:
+        stage.start()
+    
+    # Overseerr is listed while the first lists are still being fetched
+    _prepare_overseerr_client(overseerr_client, dry_run)
+    
+    completed_items = []
+    try:
+        with buffered_sync_results():
+            _sync_media_concurrently(
+                work_queue,
+                overseerr_client,
+                sync_results,
+                max_workers=max_workers,
+                batch_size=batch_size,
+                is_4k=is_4k,
+                dry_run=dry_run,
+                session_id=session_id,
+                streaming=True,
+                completed_items=completed_items
+            )
+    finally:
+        # Stages have already finished on a normal run; on cancellation this unblocks them
+        stop_event.set()
+        for stage in stages:
+            stage.join()
+    
+    if not dry_run and not sync_results.cancelled:
+        late_links = _link_late_source_lists(completed_items)
+        if late_links:
+            logging.info(f"🔗 Linked {late_links} late duplicate(s) to their additional lists")
+    
+    if deduplicator.duplicate_count:
+        print(color_gradient(f"\n🔄  Removed {deduplicator.duplicate_count} duplicate items", "#ffaa00", "#ff5500"))
+    unchanged_count = sum(1 for synced_list in synced_lists if synced_list.get('unchanged'))
+    if unchanged_count:
+        print(color_gradient(f"\n⏭️  Skipped {unchanged_count} unchanged list(s)", "#ffaa00", "#ff5500"))
+    delta_unchanged = sum(synced_list.get('delta', {}).get('unchanged', 0) for synced_list in synced_lists)
+    if delta_unchanged:
+        print(color_gradient(f"\n🔀  Delta sync: {delta_unchanged} unchanged list item(s) needed no processing", "#ffaa00", "#ff5500"))
+    print(color_gradient(f"\n📊  Total unique media items synced: {sync_results.total_items}", "#00aaff", "#00ffaa"))
+    logging.info(f"Fetched {deduplicator.unique_count} unique media items from all lists")
+    
+    return sync_results, synced_lists
+
+
 def schedule_daily_report(overseerr_client: OverseerrClient):
     """
     Schedule daily email reports at 3 AM (independent of sync timing).
@@ -991,11 +2162,10 @@ def schedule_daily_report(overseerr_client: OverseerrClient):
                     
                     # Get data from database
                     from .ui.display import SyncResults
-                    from .database import load_list_ids, DB_FILE
-                    import sqlite3
+                    from .database import load_list_ids
                     
                     sync_results = SyncResults()
-                    with sqlite3.connect(DB_FILE) as conn:
+                    with get_connection() as conn:
                         cursor = conn.cursor()
                         cursor.execute('SELECT COUNT(*) FROM synced_items')
                         sync_results.total_items = cursor.fetchone()[0] or 0
@@ -1026,6 +2196,65 @@ def schedule_daily_report(overseerr_client: OverseerrClient):
     logging.info(f"📧 Daily report scheduler started (will send at {os.getenv('EMAIL_REPORT_HOUR', '3')}:00)")
 
 
+def run_queued_sync_jobs(is_4k: bool = False, automated_mode: bool = True) -> int:
+    """
+    Run the sync jobs waiting in the queue, oldest first, until it is empty.
+
+    Jobs are claimed one at a time, so a trigger that arrives while a job runs is picked
+    up in the same pass, and a job is marked failed rather than retried forever if its sync
+    raises.
+
+    Args:
+        is_4k (bool, optional): Whether to request 4K. Defaults to False.
+        automated_mode (bool, optional): Whether to run in automated mode. Defaults to True.
+
+    Returns:
+        int: Number of jobs run
+    """
+    from list_sync.config import load_env_config
+
+    jobs_run = 0
+    while not check_cancellation_requested():
+        job = claim_next_sync_job()
+        if job is None:
+            break
+        jobs_run += 1
+
+        target = f"{job['list_type']}:{job['list_id']}" if job['job_type'] == 'single' else "all lists"
+        logging.info(f"Running sync job {job['id']} ({job['job_type']}: {target}, attempt {job['attempts']})")
+        try:
+            overseerr_url, overseerr_api_key, user_id, _, _, is_4k_env = load_env_config()
+            if job['job_type'] == 'single':
+                # Pass user_id=None so sync_single_list fetches the per-list user_id from database
+                result = sync_single_list(
+                    job['list_type'],
+                    job['list_id'],
+                    overseerr_url,
+                    overseerr_api_key,
+                    None,
+                    is_4k_env or is_4k,
+                    False  # dry_run=False
+                )
+                if result.get("success", False):
+                    finish_sync_job(job['id'], 'completed')
+                else:
+                    finish_sync_job(job['id'], 'failed', result.get("error") or result.get("message"))
+            else:
+                run_sync(
+                    OverseerrClient(overseerr_url, overseerr_api_key, user_id),
+                    dry_run=False,
+                    is_4k=is_4k_env or is_4k,
+                    automated_mode=automated_mode
+                )
+                finish_sync_job(job['id'], 'completed')
+            logging.info(f"Sync job {job['id']} finished")
+        except Exception as e:
+            logging.error(f"Sync job {job['id']} failed: {str(e)}")
+            finish_sync_job(job['id'], 'failed', str(e))
+
+    return jobs_run
+
+
 def automated_sync(
     overseerr_client: OverseerrClient,
     initial_interval_hours: float,
@@ -1077,13 +2306,17 @@ def automated_sync(
             logging.warning(f"Error loading sync interval from database: {e}")
             return current_interval_hours  # Fallback to current
     
-    def perform_sync(force_full_sync=False, ignore_pause=False):
+    def perform_sync(force_full_sync=False, ignore_pause=False, lists=None, on_lists_run=None):
         """
         Perform a single sync operation
         
         Args:
             force_full_sync (bool): If True, skip single list sync checks and perform full sync
             ignore_pause (bool): If True, ignore any pause_until timer (e.g. for manual triggers)
+            lists (list): Lists to sync instead of all configured lists (scheduled syncs)
+            on_lists_run (callable): Called with `lists` once they have been synced, even if the
+                sync failed. Not called when the sync returns early (a pending cancellation, or
+                queued jobs that ran instead)
         """
         logging.info(f"🔄 perform_sync() called: force_full_sync={force_full_sync}, ignore_pause={ignore_pause}")
         print(f"🔄 perform_sync() called: force_full_sync={force_full_sync}, ignore_pause={ignore_pause}")
@@ -1113,131 +2346,13 @@ def automated_sync(
             return False
         
         try:
-            # Check for single list sync request files (both legacy and queued)
+            # Run queued sync jobs (manual and API triggers) first
             # Skip this check if force_full_sync is True (e.g., on startup)
-            import os
-            import json
-            import glob
-            
-            # Initialize queued_syncs list
-            queued_syncs = []
-            
-            # Only check for single list syncs if not forcing full sync
             if not force_full_sync:
-                # First check for queued sync requests in data/sync_requests/
-                sync_requests_dir = "data/sync_requests"
-                
-                if os.path.exists(sync_requests_dir):
-                    # Get all pending sync request files, sorted by timestamp
-                    request_files = sorted(glob.glob(os.path.join(sync_requests_dir, "single_sync_*.json")))
-                    
-                    for request_file in request_files:
-                        try:
-                            with open(request_file, 'r') as f:
-                                request_data = json.load(f)
-                            
-                            list_type = request_data.get("list_type")
-                            list_id = request_data.get("list_id")
-                            
-                            if list_type and list_id:
-                                queued_syncs.append({
-                                    "list_type": list_type,
-                                    "list_id": list_id,
-                                    "file": request_file,
-                                    "timestamp": request_data.get("timestamp")
-                                })
-                            else:
-                                # Remove invalid request file
-                                os.remove(request_file)
-                                logging.warning(f"Removed invalid sync request file: {request_file}")
-                                
-                        except Exception as e:
-                            logging.error(f"Error reading queued sync request {request_file}: {e}")
-                            # Remove corrupted file
-                            try:
-                                os.remove(request_file)
-                            except:
-                                pass
-                
-                # Also check legacy single file for backwards compatibility
-                single_list_request_file = "data/single_list_sync_request.json"
-                
-                if os.path.exists(single_list_request_file):
-                    try:
-                        with open(single_list_request_file, 'r') as f:
-                            request_data = json.load(f)
-                        
-                        list_type = request_data.get("list_type")
-                        list_id = request_data.get("list_id")
-                        
-                        if list_type and list_id:
-                            # Add to queue if not already there
-                            if not any(s["list_type"] == list_type and s["list_id"] == list_id for s in queued_syncs):
-                                queued_syncs.append({
-                                    "list_type": list_type,
-                                    "list_id": list_id,
-                                    "file": single_list_request_file,
-                                    "timestamp": request_data.get("timestamp")
-                                })
-                    except Exception as e:
-                        logging.error(f"Error reading legacy sync request file: {e}")
-            
-            # Process all queued single list syncs
-            if queued_syncs:
-                logging.info(f"Found {len(queued_syncs)} queued sync request(s)")
-                
-                for sync_req in queued_syncs:
-                    # Check for cancellation between queued syncs
-                    if check_cancellation_requested():
-                        logging.warning("⚠️ Cancellation detected while processing queued syncs")
-                        return False
-                    
-                    list_type = sync_req["list_type"]
-                    list_id = sync_req["list_id"]
-                    request_file = sync_req["file"]
-                    
-                    try:
-                        logging.info(f"Processing queued single list sync: {list_type}:{list_id}")
-                        
-                        # Use the sync_single_list function
-                        try:
-                            # Get environment config for single list sync
-                            from list_sync.config import load_env_config
-                            overseerr_url, overseerr_api_key, _, _, _, is_4k_env = load_env_config()
-                            
-                            # Pass user_id=None so sync_single_list fetches the per-list user_id from database
-                            result = sync_single_list(
-                                list_type,
-                                list_id,
-                                overseerr_url,
-                                overseerr_api_key,
-                                None,  # Let sync_single_list fetch user_id from list's database record
-                                is_4k_env or is_4k,  # Use environment 4K setting or current setting
-                                False  # dry_run=False
-                            )
-                            
-                            if result.get("success", False):
-                                logging.info(f"Queued single list sync completed successfully: {list_type}:{list_id}")
-                            else:
-                                logging.error(f"Queued single list sync failed for {list_type}:{list_id}: {result}")
-                                
-                        except Exception as e:
-                            logging.error(f"Error processing queued single list sync for {list_type}:{list_id}: {str(e)}")
-                        
-                        finally:
-                            # Remove the processed request file
-                            try:
-                                os.remove(request_file)
-                                logging.info(f"Removed processed sync request file: {request_file}")
-                            except Exception as e:
-                                logging.warning(f"Failed to remove sync request file {request_file}: {e}")
-                        
-                    except Exception as e:
-                        logging.error(f"Error processing sync request: {e}")
-                
-                # After processing all queued syncs, return True
-                logging.info(f"Processed {len(queued_syncs)} queued sync request(s)")
-                return True
+                jobs_run = run_queued_sync_jobs(is_4k, automated_mode)
+                if jobs_run:
+                    logging.info(f"Processed {jobs_run} queued sync job(s)")
+                    return True
             
             # Check for single list sync environment variables (fallback method)
             single_list_sync = os.environ.get("SINGLE_LIST_SYNC", "").lower() == "true"
@@ -1289,12 +2404,17 @@ def automated_sync(
             overseerr_url, overseerr_api_key, user_id, _, _, is_4k_env = load_env_config()
             overseerr_client_temp = OverseerrClient(overseerr_url, overseerr_api_key, user_id)
             
-            run_sync(
-                overseerr_client_temp,
-                dry_run=False,
-                is_4k=is_4k_env or is_4k,
-                automated_mode=automated_mode
-            )
+            try:
+                run_sync(
+                    overseerr_client_temp,
+                    dry_run=False,
+                    is_4k=is_4k_env or is_4k,
+                    automated_mode=automated_mode,
+                    lists=lists
+                )
+            finally:
+                if on_lists_run is not None and lists is not None:
+                    on_lists_run(lists)
             
             logging.info("Full sync operation completed successfully")
             return True
@@ -1361,6 +2481,10 @@ def automated_sync(
     def signal_handler(signum, frame):
         logging.info(f"Received signal {signum} in automated_sync loop")
         immediate_sync_requested.set()
+        wake_event.set()
+    
+    # Set by signals and by the API after it queues a sync job
+    wake_event = threading.Event()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -1370,6 +2494,29 @@ def automated_sync(
     logging.info(f"Starting automated sync mode (initial interval: {current_interval_hours} hours)")
     logging.info(f"Process PID: {os.getpid()} - Send SIGUSR1 to trigger immediate sync")
     
+    # Manual and API triggers arrive through the sync_jobs queue; the wake-up socket makes
+    # them start immediately, polling covers platforms without it and lost wake-ups
+    listener = start_wakeup_listener(wake_event)
+    try:
+        job_poll_seconds = max(1.0, float(os.getenv('LISTSYNC_JOB_POLL_SECONDS', '60' if listener else '5')))
+    except ValueError:
+        job_poll_seconds = 60.0 if listener else 5.0
+    try:
+        recover_sync_jobs()
+    except Exception as e:
+        logging.warning(f"Failed to recover interrupted sync jobs: {e}")
+    
+    def pause_remaining():
+        """Seconds left on a pause-until set by a cancellation (0 if not paused)."""
+        try:
+            from datetime import datetime
+            pause_str = get_pause_until()
+            if pause_str:
+                return max((datetime.fromisoformat(pause_str) - datetime.utcnow()).total_seconds(), 0)
+        except Exception as e:
+            logging.warning(f"Pause wait check failed: {e}")
+        return 0
+    
     # Perform initial sync (always force full sync on startup)
     # This ensures that on app reboot, we always sync all configured lists,
     # not just process queued single list syncs
@@ -1377,6 +2524,10 @@ def automated_sync(
     print("🚀 Calling perform_sync(force_full_sync=True) for initial sync")
     perform_sync(force_full_sync=True)
     
+    # Lists are then synced on their own schedules (see ListScheduler)
+    scheduler = ListScheduler(current_interval_hours)
+    logged_wait_until = None
+    
     while True:
         try:
             # Check for updated interval from database before each wait
@@ -1385,34 +2536,52 @@ def automated_sync(
                 logging.info(f"Sync interval updated from {current_interval_hours} to {new_interval} hours")
                 current_interval_hours = new_interval
             
-            wait_seconds = max(current_interval_hours * 3600, 0)
+            # Sleep until the next list is due
+            scheduler.refresh(current_interval_hours)
+            wait_seconds = scheduler.seconds_until_due()
+            if wait_seconds is None:
+                wait_seconds = max(current_interval_hours * 3600, 0)
             
             # Also respect pause-until if set (e.g., from a cancellation)
-            pause_until = None
-            try:
-                from datetime import datetime
-                pause_str = get_pause_until()
-                if pause_str:
-                    pause_until = datetime.fromisoformat(pause_str)
-                    now = datetime.utcnow()
-                    if pause_until > now:
-                        wait_seconds = max(wait_seconds, (pause_until - now).total_seconds())
-                        logging.info(f"⏸️  Waiting until {pause_until.isoformat()} before next sync")
-            except Exception as e:
-                logging.warning(f"Pause wait check failed: {e}")
-            
-            # Wait for the interval or immediate sync signal
-            logging.info(f"Waiting for sync... (Timeout: {wait_seconds}s)")
-            if immediate_sync_requested.wait(timeout=wait_seconds):
-                # Signal received - perform immediate sync
-                logging.info(f"Immediate sync requested via signal (Flag set: {immediate_sync_requested.is_set()})")
-                immediate_sync_requested.clear()  # Reset the flag
+            paused_for = pause_remaining()
+            if paused_for > wait_seconds:
+                wait_seconds = paused_for
+            
+            # Wait for the next due list, a queued job or a signal, whichever comes first
+            if wait_seconds > 0:
+                wait_until = int(time.time() + wait_seconds)
+                if logged_wait_until is None or abs(wait_until - logged_wait_until) > 1:
+                    if paused_for:
+                        logging.info(f"⏸️  Waiting {int(paused_for)}s for the sync pause to end")
+                    logging.info(f"Waiting for sync... (Timeout: {wait_seconds}s)")
+                    logged_wait_until = wait_until
+                wake_event.wait(timeout=min(wait_seconds, job_poll_seconds))
+                wake_event.clear()
+            
+            if immediate_sync_requested.is_set():
+                # Legacy SIGUSR1 trigger: queued jobs if any, else a full sync
+                logging.info("Immediate sync requested via signal")
+                immediate_sync_requested.clear()
                 logging.info("Calling perform_sync(ignore_pause=True)")
                 perform_sync(ignore_pause=True)
+                logged_wait_until = None
+            elif has_queued_sync_jobs():
+                logging.info("Queued sync job(s) found")
+                if perform_sync(ignore_pause=True) is False:
+                    # Jobs stay queued (e.g. a cancellation is pending); don't spin on them
+                    wake_event.wait(timeout=job_poll_seconds)
+                logged_wait_until = None
             else:
-                # Timeout reached - perform scheduled sync
-                logging.info(f"Scheduled sync interval reached ({current_interval_hours} hours)")
-                perform_sync()
+                # Sync the lists that are due, highest priority first
+                scheduler.refresh(current_interval_hours)
+                if scheduler.seconds_until_due() == 0 and not pause_remaining():
+                    due_lists = scheduler.pop_due()
+                    logging.info(f"Scheduled sync: {len(due_lists)} list(s) due")
+                    # The lists only wait for their next interval once they have actually run
+                    if perform_sync(lists=due_lists, on_lists_run=scheduler.mark_dispatched) is False:
+                        # They stay due (e.g. a cancellation is pending); don't spin on them
+                        wake_event.wait(timeout=job_poll_seconds)
+                    logged_wait_until = None
                 
         except Exception as e:
             logging.error(f"Error in automated sync loop: {str(e)}")
@@ -1448,22 +2617,83 @@ def schedule_next_sync(interval_hours: float, is_4k: bool = False, automated_mod
     scheduler_thread.start()
 
 
+def _start_sync_progress(
+    sync_id: int,
+    sync_type: str,
+    dry_run: bool,
+    resume: Optional[bool] = None,
+    list_type: Optional[str] = None,
+    list_id: Optional[str] = None
+):
+    """
+    Set up the progress cursor of a starting sync, picking up an interrupted session if any.
+
+    Args:
+        sync_id (int): sync_history ID of the starting session
+        sync_type (str): 'full' or 'single'
+        dry_run (bool): Dry runs neither record nor resume progress
+        resume (Optional[bool]): Skip items an interrupted session already processed.
+            Defaults to LISTSYNC_RESUME (true).
+        list_type (Optional[str]): List type for single list syncs
+        list_id (Optional[str]): List ID for single list syncs
+    """
+    global _sync_progress
+    _sync_progress = None
+    if dry_run:
+        return
+    if resume is None:
+        resume = os.getenv('LISTSYNC_RESUME', 'true').lower() == 'true'
+
+    resumed = None
+    if resume:
+        try:
+            resumed = resume_interrupted_sync(sync_id, sync_type, list_type, list_id)
+        except Exception as e:
+            logging.warning(f"Failed to load the progress of the interrupted sync: {e}")
+    try:
+        prune_sync_items(sync_id)
+    except Exception as e:
+        logging.warning(f"Failed to prune old sync items: {e}")
+
+    _sync_progress = {
+        'sync_id': sync_id,
+        'items': resumed['items'] if resumed else {},
+        'resumed_session_id': resumed['session_id'] if resumed else None,
+    }
+    if resumed:
+        print(color_gradient(
+            f"\n♻️  Resuming interrupted session {resumed['session_id']} - {len(resumed['items'])} item(s) already processed",
+            "#00aaff", "#00ffaa"
+        ))
+
+
 def run_sync(
     overseerr_client: OverseerrClient,
     dry_run: bool = False,
     is_4k: bool = False,
-    automated_mode: bool = False
+    automated_mode: bool = False,
+    resume: Optional[bool] = None,
+    lists: Optional[List[Dict[str, Any]]] = None
 ):
     """
     Run a sync operation.
     
+    Lists are fetched up front and then synced, or, with LISTSYNC_PIPELINE_MODE=true, fetched,
+    de-duplicated and synced as a streaming pipeline (see stream_media_to_overseerr).
+    
+    If the previous full sync was cancelled, failed or died with its process, the items it
+    already processed are skipped and keep their recorded results (see _start_sync_progress).
+    
     Args:
         overseerr_client (OverseerrClient): Overseerr API client
         dry_run (bool, optional): Whether to perform a dry run. Defaults to False.
         is_4k (bool, optional): Whether to request 4K. Defaults to False.
         automated_mode (bool, optional): Whether to run in automated mode. Defaults to False.
+        resume (Optional[bool]): Resume an interrupted sync. Defaults to LISTSYNC_RESUME (true).
+        lists (Optional[List[Dict[str, Any]]]): Sync only these lists, in this order (e.g. the
+            lists the scheduler found due). Defaults to every configured list.
     """
-    global _current_sync_session_id
+    global _current_sync_session_id, _sync_progress
     
     # Set up signal handlers for immediate termination support
     setup_sync_signal_handlers()
@@ -1477,10 +2707,13 @@ def run_sync(
     
     # Store session ID globally for signal handlers
     _current_sync_session_id = session_id
+    set_active_sync_session(session_id)
     
     try:
         # Track sync start in database
         sync_id = start_sync_in_db(session_id=session_id, sync_type='full')
+        reset_resolution_cache_stats()
+        _start_sync_progress(sync_id, 'full', dry_run, resume)
         
         # Register subprocess PID in tracker for immediate termination
         sync_tracker = get_sync_tracker()
@@ -1492,7 +2725,10 @@ def run_sync(
         print(color_gradient(f"\n{sync_start_marker}", "#00aaff", "#00ffaa"))
         
         # Load lists
-        list_ids = load_list_ids()
+        list_ids = load_list_ids() if lists is None else lists
+        if lists is not None:
+            scheduled_names = ', '.join(f"{list_info['type']}:{list_info['id']}" for list_info in list_ids)
+            logging.info(f"🗓️  Syncing {len(list_ids)} scheduled list(s): {scheduled_names}")
         
         if not list_ids:
             logging.warning("No lists configured")
@@ -1504,23 +2740,31 @@ def run_sync(
             end_sync_in_db(session_id=session_id, status='no_lists')
             return
         
-        # Fetch media from lists
-        media_items, synced_lists = fetch_media_from_lists(list_ids)
+        pipeline_mode = os.getenv('LISTSYNC_PIPELINE_MODE', 'false').lower() == 'true'
+        skip_unchanged = not dry_run and os.getenv('LISTSYNC_SKIP_UNCHANGED_LISTS', 'true').lower() == 'true'
+        delta = not dry_run and os.getenv('LISTSYNC_DELTA_SYNC', 'true').lower() == 'true'
         
-        # Store previous state of items per list (before sync updates item_lists)
-        previous_items_per_list = {}
-        if not dry_run:
-            try:
-                from .database import get_list_items
-                for list_info in synced_lists:
-                    list_type = list_info['type']
-                    list_id = list_info['id']
-                    previous_items = get_list_items(list_type, list_id)
-                    previous_items_per_list[f"{list_type}:{list_id}"] = {item['id'] for item in previous_items}
-            except Exception as e:
-                logging.warning(f"Failed to store previous list state: {e}")
+        if pipeline_mode:
+            # Fetch, de-duplicate and sync in a single streaming pass
+            sync_results, synced_lists = stream_media_to_overseerr(
+                list_ids,
+                overseerr_client,
+                is_4k=is_4k,
+                dry_run=dry_run,
+                session_id=session_id,
+                skip_unchanged=skip_unchanged,
+                delta=delta
+            )
+            has_items = sync_results.total_items > 0 or sync_results.cancelled
+        else:
+            # Fetch media from lists
+            media_items, synced_lists = fetch_media_from_lists(list_ids, skip_unchanged=skip_unchanged, delta=delta)
+            has_items = bool(media_items)
         
-        if not media_items:
+        # Unchanged lists and delta-synced lists still have items; they just need no processing this time
+        has_items = has_items or any(synced_list.get('item_count') for synced_list in synced_lists)
+        
+        if not has_items:
             logging.warning("No media items found in configured lists")
             print("\n⚠️  No media items found in configured lists.")
             # Log sync end marker for early exit
@@ -1544,61 +2788,25 @@ def run_sync(
             except Exception as e:
                 logging.warning(f"Failed to update sync info for {list_info['type']} list {list_info['id']}: {e}")
         
-        # Perform the sync
-        sync_results = sync_media_to_overseerr(
-            media_items,
-            overseerr_client,
-            synced_lists=synced_lists,
-            is_4k=is_4k,
-            dry_run=dry_run,
-            automated_mode=automated_mode,
-            sync_id=sync_id,
-            session_id=session_id
-        )
+        if not pipeline_mode:
+            # Perform the sync
+            sync_results = sync_media_to_overseerr(
+                media_items,
+                overseerr_client,
+                synced_lists=synced_lists,
+                is_4k=is_4k,
+                dry_run=dry_run,
+                automated_mode=automated_mode,
+                sync_id=sync_id,
+                session_id=session_id
+            )
         
-        # Detect removals for each synced list
-        # Compare current items (after sync) with previous state (before sync)
-        if not dry_run:
-            try:
-                from .database import get_list_items
-                for list_info in synced_lists:
-                    list_type = list_info['type']
-                    list_id = list_info['id']
-                    key = f"{list_type}:{list_id}"
-                    # Get current items in this list (after sync, item_lists is updated)
-                    current_items = get_list_items(list_type, list_id)
-                    current_item_ids = {item['id'] for item in current_items}
-                    # Use previous state stored before sync
-                    previous_item_ids = previous_items_per_list.get(key, set())
-                    # Items that were removed = in previous but not in current
-                    removed_item_ids = previous_item_ids - current_item_ids
-                    
-                    # Record removals
-                    if removed_item_ids:
-                        import sqlite3
-                        from .database import DB_FILE
-                        with sqlite3.connect(DB_FILE) as conn:
-                            cursor = conn.cursor()
-                            for item_id in removed_item_ids:
-                                # Get item details
-                                cursor.execute('''
-                                    SELECT title, year, tmdb_id 
-                                    FROM synced_items 
-                                    WHERE id = ?
-                                ''', (item_id,))
-                                item = cursor.fetchone()
-                                
-                                if item:
-                                    title, year, tmdb_id = item
-                                    # Record the removal
-                                    cursor.execute('''
-                                        INSERT INTO list_changes (item_id, list_type, list_id, change_type, changed_at, title, year, tmdb_id)
-                                        VALUES (?, ?, ?, 'removed', CURRENT_TIMESTAMP, ?, ?, ?)
-                                    ''', (item_id, list_type, list_id, title, year, tmdb_id))
-                            
-                            conn.commit()
-            except Exception as e:
-                logging.warning(f"Failed to detect list removals: {e}")
+        # Drop the links of items that left their lists and record the removals
+        if not dry_run and not sync_results.cancelled:
+            _record_list_removals(synced_lists)
+            _save_list_fingerprints(synced_lists)
+        
+        _log_resolution_cache_stats()
         
         # Display summary
         summary_text = str(sync_results)
@@ -1624,10 +2832,10 @@ def run_sync(
         logging.info(sync_end_marker)
         print(color_gradient(f"\n{sync_end_marker}", "#00ff00", "#00aa00"))
         
-        # Mark sync as ended in database
+        # Mark sync as ended in database; a cancelled sync stays resumable
         end_sync_in_db(
             session_id=session_id,
-            status='completed',
+            status='cancelled' if sync_results.cancelled else 'completed',
             total_items=sync_results.total_items,
             items_requested=sync_results.results.get('requested', 0),
             items_skipped=sync_results.results.get('skipped', 0),
@@ -1637,6 +2845,11 @@ def run_sync(
     finally:
         # Clear global session ID to prevent zombie cancellation state
         _current_sync_session_id = None
+        _sync_progress = None
+        clear_cancel_request(session_id)
+        set_active_sync_session(None)
+        # The client outlives this sync in automated mode; don't serve stale statuses later
+        overseerr_client.reset_sync_caches()
 
 
 def sync_single_list(
@@ -1646,11 +2859,14 @@ def sync_single_list(
     overseerr_api_key: str,
     user_id: Optional[str] = None,
     is_4k: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    resume: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Sync a single specific list instead of all configured lists.
     
+    Like run_sync, an interrupted sync of the same list is resumed.
+    
     Args:
         list_type (str): Type of list (e.g., 'imdb', 'trakt')
         list_id (str): ID of the specific list to sync
@@ -1659,11 +2875,12 @@ def sync_single_list(
         user_id (Optional[str]): User ID for requests (if None, will be fetched from database)
         is_4k (bool): Whether to request 4K versions
         dry_run (bool): Whether to run in dry-run mode
+        resume (Optional[bool]): Resume an interrupted sync of this list. Defaults to LISTSYNC_RESUME (true).
         
     Returns:
         Dict[str, Any]: Sync results
     """
-    global _current_sync_session_id
+    global _current_sync_session_id, _sync_progress
     
     try:
         # Set up signal handlers for immediate termination support
@@ -1678,6 +2895,7 @@ def sync_single_list(
         
         # Store session ID globally for signal handlers
         _current_sync_session_id = session_id
+        set_active_sync_session(session_id)
         
         try:
             # Track sync start in database
@@ -1687,6 +2905,8 @@ def sync_single_list(
                 list_type=list_type,
                 list_id=list_id
             )
+            reset_resolution_cache_stats()
+            _start_sync_progress(sync_id, 'single', dry_run, resume, list_type, list_id)
             
             # Register subprocess PID in tracker for immediate termination
             sync_tracker = get_sync_tracker()
@@ -1718,10 +2938,10 @@ def sync_single_list(
                 logging.warning(f"User ID {user_id} not found in local user database. This may cause issues if the user doesn't exist in Overseerr.")
                 # Try to fetch from Overseerr directly
                 try:
-                    import requests
+                    from .utils import http_client
                     users_url = f"{overseerr_url.rstrip('/')}/api/v1/user"
                     headers = {"X-Api-Key": overseerr_api_key}
-                    response = requests.get(users_url, headers=headers, timeout=10)
+                    response = http_client.get(users_url, headers=headers, timeout=10)
                     if response.status_code == 200:
                         users_data = response.json()
                         users = users_data.get('results', [])
@@ -1767,10 +2987,15 @@ def sync_single_list(
                 session_id=session_id
             )
             
+            _log_resolution_cache_stats()
+            
             # Update item count for the synced list
             if synced_lists:
                 list_info = synced_lists[0]
                 update_list_sync_info(list_type, list_id, list_info.get('item_count', 0))
+                if not dry_run and not sync_results.cancelled:
+                    _record_list_removals(synced_lists)
+                    _save_list_fingerprints(synced_lists)
             
             # Convert sync results to return format
             result = {
@@ -1800,10 +3025,10 @@ def sync_single_list(
             logging.info(sync_end_marker)
             print(color_gradient(f"\n{sync_end_marker}", "#00ff00", "#00aa00"))
             
-            # Mark sync as ended in database
+            # Mark sync as ended in database; a cancelled sync stays resumable
             end_sync_in_db(
                 session_id=session_id,
-                status='completed',
+                status='cancelled' if sync_results.cancelled else 'completed',
                 total_items=sync_results.total_items,
                 items_requested=sync_results.results.get('requested', 0),
                 items_skipped=sync_results.results.get('skipped', 0),
@@ -1815,6 +3040,9 @@ def sync_single_list(
         finally:
             # Clear global session ID to prevent zombie cancellation state
             _current_sync_session_id = None
+            _sync_progress = None
+            clear_cancel_request(session_id)
+            set_active_sync_session(None)
             
     except Exception as e:
         error_message = f"Error in single list sync for {list_type}:{list_id}: {str(e)}"
@@ -0,0 +1,229 @@
+"""
+Compact in-memory representation of media items on their way from a provider to Overseerr.
+
+A combined sync can hold hundreds of thousands of fetched items at once during de-duplication.
+As plain dicts every item carries its own key table plus a dict per source list, so items are
+kept as slotted MediaItem objects instead:
+    - fixed fields live in __slots__; anything else a provider adds goes into a small extra dict
+    - numeric TMDB/TVDB IDs, years and IMDb IDs are stored as integers and handed back in the
+      type they were given in
+    - source lists are interned ListRef objects shared by every item of the list
+
+Both types support the dict operations the sync code uses on items (item['title'],
+item.get('imdb_id'), item['_source_lists'] = [...], 'key' in item), so code written against
+dict items keeps working; to_dict() returns a plain dict for serialization.
+"""
+
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_IMDB_ID = re.compile(r'tt(\d{7,})')
+
+_MISSING = object()
+
+
+class ListRef:
+    """A source list of an item. Instances are interned: one object per (type, id, user_id)."""
+
+    __slots__ = ('type', 'id', 'user_id')
+
+    _interned: Dict[Tuple[Any, Any, str], 'ListRef'] = {}
+
+    def __new__(cls, list_type: Optional[str], list_id: Optional[str], user_id: Any = "1"):
+        key = (list_type, list_id, "1" if user_id is None else str(user_id))
+        ref = cls._interned.get(key)
+        if ref is None:
+            ref = super().__new__(cls)
+            object.__setattr__(ref, 'type', key[0])
+            object.__setattr__(ref, 'id', key[1])
+            object.__setattr__(ref, 'user_id', key[2])
+            ref = cls._interned.setdefault(key, ref)
+        return ref
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ListRef is immutable")
+
+    def __reduce__(self):
+        # Re-intern on unpickling (e.g. in sharded sync workers)
+        return ListRef, (self.type, self.id, self.user_id)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': self.type, 'id': self.id, 'user_id': self.user_id}
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+def _compact_int(value: Any) -> Any:
+    """Store digit-only strings as ints; leave anything else as it is."""
+    if isinstance(value, str) and value.isdigit() and (value == '0' or not value.startswith('0')):
+        return int(value)
+    return value
+
+
+class MediaItem:
+    """A fetched media item with a dict-compatible interface (see the module docstring).
+
+    Only the fields that were assigned count as present: keys(), 'key' in item and to_dict()
+    skip the others, and get() returns its default for them (attribute access returns None).
+    IDs and years are returned in the type they were given in; a digit string stored as an int
+    comes back as the same string.
+    """
+
+    __slots__ = ('_title', '_year', '_media_type', '_imdb', '_tmdb', '_tvdb', '_from_str', 'source_list',
+                 'source_lists', 'extra')
+
+    # Dict keys backed by a slot, in to_dict() order; a slot is unset until its field is assigned
+    _FIELDS = {'title': '_title', 'year': '_year', 'media_type': '_media_type', 'imdb_id': '_imdb',
+               'tmdb_id': '_tmdb', 'tvdb_id': '_tvdb'}
+    # Bits of _from_str flagging numeric fields that were given as digit strings
+    _NUMERIC = {'year': 1, 'tmdb_id': 2, 'tvdb_id': 4}
+    _SOURCE_KEYS = {'_source_list_type': 'type', '_source_list_id': 'id', '_source_list_user_id': 'user_id'}
+
+    def __init__(self, title: Any = _MISSING, year: Any = _MISSING, media_type: Any = _MISSING,
+                 imdb_id: Any = _MISSING, tmdb_id: Any = _MISSING, tvdb_id: Any = _MISSING, **extra: Any):
+        self._from_str = 0
+        self.source_list: Optional[ListRef] = None
+        self.source_lists: Optional[List[ListRef]] = None
+        self.extra: Optional[Dict[str, Any]] = None
+        for key, value in zip(self._FIELDS, (title, year, media_type, imdb_id, tmdb_id, tvdb_id)):
+            if value is not _MISSING:
+                self._set_field(key, value)
+        for key, value in extra.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MediaItem':
+        """Build a MediaItem from a provider's dict item."""
+        item = cls()
+        for key, value in data.items():
+            item[key] = value
+        return item
+
+    def _field(self, key: str) -> Any:
+        """A field's value in the form it was assigned, or _MISSING if it never was."""
+        value = getattr(self, self._FIELDS[key], _MISSING)
+        if value is _MISSING or value is None:
+            return value
+        if key == 'imdb_id':
+            return f"tt{value:07d}" if isinstance(value, int) else value
+        if self._from_str & self._NUMERIC.get(key, 0):
+            return str(value)
+        return value
+
+    def _set_field(self, key: str, value: Any):
+        if key == 'media_type' and isinstance(value, str):
+            value = sys.intern(value)
+        elif key == 'imdb_id':
+            match = _IMDB_ID.fullmatch(value) if isinstance(value, str) else None
+            # Only compact IDs that format back to the same string
+            if match and (len(match.group(1)) == 7 or not match.group(1).startswith('0')):
+                value = int(match.group(1))
+        elif key in self._NUMERIC:
+            compact = _compact_int(value)
+            if compact is value:
+                self._from_str &= ~self._NUMERIC[key]
+            else:
+                self._from_str |= self._NUMERIC[key]
+            value = compact
+        setattr(self, self._FIELDS[key], value)
+
+    def _field_property(key: str) -> property:  # noqa: N805 - called in the class body
+        def fget(self) -> Any:
+            return self.get(key)
+
+        def fset(self, value: Any):
+            self._set_field(key, value)
+
+        return property(fget, fset)
+
+    title = _field_property('title')
+    year = _field_property('year')
+    media_type = _field_property('media_type')
+    imdb_id = _field_property('imdb_id')
+    tmdb_id = _field_property('tmdb_id')
+    tvdb_id = _field_property('tvdb_id')
+    del _field_property
+
+    def set_source_list(self, list_type: str, list_id: str, user_id: Any = "1"):
+        """Tag the item with the list it was fetched from."""
+        self.source_list = ListRef(list_type, list_id, user_id)
+
+    # ----- dict interface -----
+
+    def _lookup(self, key: str) -> Any:
+        if key in self._FIELDS:
+            return self._field(key)
+        if key in self._SOURCE_KEYS:
+            return getattr(self.source_list, self._SOURCE_KEYS[key]) if self.source_list else _MISSING
+        if key == '_source_lists':
+            return _MISSING if self.source_lists is None else self.source_lists
+        return self.extra.get(key, _MISSING) if self.extra else _MISSING
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._FIELDS:
+            self._set_field(key, value)
+        elif key in self._SOURCE_KEYS:
+            ref = self.source_list or ListRef(None, None)
+            fields = {'type': ref.type, 'id': ref.id, 'user_id': ref.user_id, self._SOURCE_KEYS[key]: value}
+            self.source_list = ListRef(fields['type'], fields['id'], fields['user_id'])
+        elif key == '_source_lists':
+            self.source_lists = value
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def keys(self) -> Iterator[str]:
+        for key, slot in self._FIELDS.items():
+            if hasattr(self, slot):
+                yield key
+        if self.source_list is not None:
+            yield from self._SOURCE_KEYS
+        if self.source_lists is not None:
+            yield '_source_lists'
+        if self.extra:
+            yield from self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key in self.keys():
+            yield key, self[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the item, with source lists as dicts."""
+        data = dict(self.items())
+        if self.source_lists is not None:
+            data['_source_lists'] = [ref.to_dict() if isinstance(ref, ListRef) else dict(ref)
+                                     for ref in self.source_lists]
+        return data
+
+    def __repr__(self) -> str:
+        return f"MediaItem({self.to_dict()!r})"
@@ -2,8 +2,11 @@
 List provider registration and management.
 """
 
+import functools
 import logging
-from typing import Dict, Callable, List, Any
+from typing import Dict, Callable, List, Any, Union
+
+from ..media_item import MediaItem
 
 
 class SyncCancelledException(Exception):
@@ -19,14 +22,30 @@ def check_cancellation() -> bool:
         bool: True if cancellation was requested, False otherwise
     """
     try:
-        from ..utils.sync_status import get_sync_tracker
-        sync_tracker = get_sync_tracker()
-        return sync_tracker.is_cancellation_requested()
+        from ..utils.sync_status import is_cancellation_pending
+        return is_cancellation_pending()
     except Exception as e:
         logging.warning(f"Error checking cancellation status in provider: {e}")
         return False
 
 
+def cancellable_sleep(seconds: float) -> bool:
+    """
+    Sleep between page loads, returning early if the sync is cancelled.
+    
+    Scrapers use this instead of sb.sleep so a cancel does not wait out page-load delays;
+    the caller's next cancellation check then stops the fetch.
+    
+    Args:
+        seconds (float): Seconds to sleep
+        
+    Returns:
+        bool: True if the sleep was cut short by a cancellation
+    """
+    from ..utils.sync_status import wait_for_cancellation
+    return wait_for_cancellation(seconds)
+
+
 def check_and_raise_if_cancelled():
     """
     Check if cancellation was requested and raise SyncCancelledException if so.
@@ -42,23 +61,60 @@ def check_and_raise_if_cancelled():
 # Registry to store provider functions by type
 PROVIDERS = {}
 
+# Provider types that fetch through a Selenium browser, either always (True) or
+# depending on runtime configuration (a callable evaluated at fetch time)
+BROWSER_PROVIDERS: Dict[str, Union[bool, Callable[[], bool]]] = {}
+
 
-def register_provider(provider_type: str):
+def register_provider(provider_type: str, uses_browser: Union[bool, Callable[[], bool]] = False):
     """
     Decorator to register a provider function.
     
     Args:
         provider_type (str): Type of provider (e.g., 'imdb', 'trakt')
+        uses_browser (Union[bool, Callable[[], bool]]): Whether the provider drives a Selenium
+            browser, or a callable deciding it at fetch time. Browser fetches are heavy and
+            share a much smaller concurrency limit than API fetches.
         
     Returns:
-        Callable: Decorator function
+        Callable: Decorator function. The registered provider returns its items as MediaItems;
+        the decorated function itself is left unchanged.
     """
     def decorator(func):
-        PROVIDERS[provider_type] = func
+        @functools.wraps(func)
+        def fetch_media_items(*args, **kwargs) -> List[MediaItem]:
+            # Providers build dict items; the sync holds them as compact MediaItems
+            items = func(*args, **kwargs)
+            return [MediaItem.from_dict(item) if isinstance(item, dict) else item for item in items or []]
+        
+        PROVIDERS[provider_type] = fetch_media_items
+        if uses_browser:
+            BROWSER_PROVIDERS[provider_type] = uses_browser
         return func
     return decorator
 
 
+def provider_uses_browser(provider_type: str) -> bool:
+    """
+    Check whether fetching a list of the given type will drive a Selenium browser.
+    
+    Args:
+        provider_type (str): Type of provider
+        
+    Returns:
+        bool: True if the provider scrapes with a browser
+    """
+    uses_browser = BROWSER_PROVIDERS.get(provider_type, False)
+    if callable(uses_browser):
+        try:
+            return bool(uses_browser())
+        except Exception as e:
+            # Assume the heavier path if the check itself fails
+            logging.warning(f"Could not determine fetch mode for provider '{provider_type}': {e}")
+            return True
+    return bool(uses_browser)
+
+
 def get_provider(provider_type: str) -> Callable:
     """
     Get the provider function for a given type.
@@ -16,6 +16,7 @@ import logging
 import re
 import requests
 from typing import Dict, Any, List, Optional
+from ..utils import http_client
 from . import register_provider
 from .trakt import search_trakt_by_title
 
@@ -131,7 +132,7 @@ def fetch_anilist_animelist_graphql(username: str, status_filter: Optional[str]
     try:
         logging.info(f"🔍 AniList API: Fetching anime list for user '{username}'")
         
-        response = requests.post(ANILIST_GRAPHQL_URL, json=payload, timeout=30)
+        response = http_client.post(ANILIST_GRAPHQL_URL, json=payload, timeout=30, idempotent=True)
         response.raise_for_status()
         
         data = response.json()
@@ -8,10 +8,10 @@ from typing import List, Dict, Any
 
 from seleniumbase import SB
 
-from . import register_provider, check_and_raise_if_cancelled, SyncCancelledException
+from . import register_provider, cancellable_sleep, check_and_raise_if_cancelled, SyncCancelledException
 
 
-@register_provider("imdb")
+@register_provider("imdb", uses_browser=True)
 def fetch_imdb_list(list_id: str) -> List[Dict[str, Any]]:
     """
     Fetch IMDb list using Selenium with pagination
@@ -61,19 +61,19 @@ def fetch_imdb_list(list_id: str) -> List[Dict[str, Any]]:
             sb.open(url)
             
             # Initial wait for page load
-            sb.sleep(5)  # Longer initial wait to ensure page starts loading
+            cancellable_sleep(5)  # Longer initial wait to ensure page starts loading
             
             # Add some human-like scrolling behavior to avoid bot detection
             try:
                 sb.execute_script("window.scrollTo(0, 300);")
-                sb.sleep(1)
+                cancellable_sleep(1)
                 sb.execute_script("window.scrollTo(0, 600);")
-                sb.sleep(1)
+                cancellable_sleep(1)
             except Exception as e:
                 logging.warning(f"Could not perform scrolling: {str(e)}")
             
             # Wait for any potential captcha/anti-bot verification to load
-            sb.sleep(3)
+            cancellable_sleep(3)
             
             # Check for cancellation before processing
             check_and_raise_if_cancelled()
@@ -126,7 +126,7 @@ def _process_imdb_chart(sb) -> List[Dict[str, Any]]:
             chart_found = True
             logging.info(f"Chart parent found with selector: {selector}")
             # Add extra wait after finding the element to ensure it's fully loaded
-            sb.sleep(2)
+            cancellable_sleep(2)
             break
         except Exception as e:
             logging.warning(f"Could not find chart with data-testid selector {selector}: {str(e)}")
@@ -148,7 +148,7 @@ def _process_imdb_chart(sb) -> List[Dict[str, Any]]:
                 chart_found = True
                 logging.info(f"Chart found with selector: {selector}")
                 # Add extra wait after finding the element
-                sb.sleep(2)
+                cancellable_sleep(2)
                 break
             except Exception as e:
                 logging.warning(f"Could not find chart with class selector {selector}: {str(e)}")
@@ -156,20 +156,20 @@ def _process_imdb_chart(sb) -> List[Dict[str, Any]]:
     if not chart_found:
         # Try a more aggressive approach with longer waits and more scrolling
         logging.warning("Could not find chart with standard selectors, trying more aggressive approach")
-        sb.sleep(8)  # Wait longer for full page load
+        cancellable_sleep(8)  # Wait longer for full page load
         
         # Add more extensive human-like behavior
         sb.execute_script("window.scrollTo(0, 300);")
-        sb.sleep(2)
+        cancellable_sleep(2)
         sb.execute_script("window.scrollTo(0, 600);")
-        sb.sleep(2)
+        cancellable_sleep(2)
         sb.execute_script("window.scrollTo(0, 900);")
-        sb.sleep(2)
+        cancellable_sleep(2)
         sb.execute_script("window.scrollTo(0, 1200);")
-        sb.sleep(2)
+        cancellable_sleep(2)
         # Scroll back up a bit to simulate natural browsing
         sb.execute_script("window.scrollTo(0, 800);")
-        sb.sleep(3)
+        cancellable_sleep(3)
         
         # Try a very generic selector that should match any list with a much longer timeout
         try:
@@ -411,7 +411,7 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
             content_found = True
             logging.info("Found content by data-testid attribute")
             # Add extra wait after finding the element
-            sb.sleep(2)
+            cancellable_sleep(2)
         except Exception as e:
             logging.warning(f"Could not find content by data-testid: {str(e)}")
         
@@ -423,7 +423,7 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 content_found = True
                 logging.info("Found list element directly")
                 # Add extra wait after finding the element
-                sb.sleep(2)
+                cancellable_sleep(2)
             except Exception as e:
                 logging.warning(f"Could not find list element: {str(e)}")
         
@@ -435,7 +435,7 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 content_found = True
                 logging.debug("Found list items")
                 # Add extra wait after finding the element
-                sb.sleep(2)
+                cancellable_sleep(2)
             except Exception as e:
                 logging.warning(f"Could not find list items: {str(e)}")
         
@@ -443,24 +443,24 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
         if not content_found:
             logging.warning("Could not find list content, attempting more aggressive approach...")
             # Scroll more and wait longer
-            sb.sleep(8)
+            cancellable_sleep(8)
             
             # Add more extensive human-like behavior
             sb.execute_script("window.scrollTo(0, 300);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             sb.execute_script("window.scrollTo(0, 600);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             sb.execute_script("window.scrollTo(0, 900);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             sb.execute_script("window.scrollTo(0, 1200);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             # Scroll back up a bit to simulate natural browsing
             sb.execute_script("window.scrollTo(0, 800);")
-            sb.sleep(3)
+            cancellable_sleep(3)
             
             # Reload the page to handle potential temporary glitches
             sb.open(url)
-            sb.sleep(10)  # Wait longer after reload
+            cancellable_sleep(10)  # Wait longer after reload
             
             # Try once more with very generic selectors and longer timeouts
             try:
@@ -484,7 +484,7 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 raise ValueError("Could not find list content on IMDb page after multiple attempts")
         
         # Additional wait to ensure everything is loaded
-        sb.sleep(3)
+        cancellable_sleep(3)
     
     except Exception as e:
         logging.error(f"Failed to load IMDb list page: {str(e)}")
@@ -597,7 +597,7 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 next_url = f"{url}/?page={next_page}"
                 logging.info(f"Attempting to navigate directly to page {next_page}: {next_url}")
                 sb.open(next_url)
-                sb.sleep(5)  # Wait longer for page load
+                cancellable_sleep(5)  # Wait longer for page load
                 current_page += 1
                 continue
             else:
@@ -758,12 +758,12 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                     
                     # Button is enabled, so click it
                     sb.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                    sb.sleep(1)  # Give time for scrolling
+                    cancellable_sleep(1)  # Give time for scrolling
                     next_button.click()
                     
                     # Wait for loading spinner to disappear and content to load
                     sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-                    sb.sleep(3)  # Additional wait for content to fully render
+                    cancellable_sleep(3)  # Additional wait for content to fully render
                     
                     # Verify we have items on the page
                     new_items = sb.find_elements("css selector", "li.ipc-metadata-list-summary-item")
@@ -774,7 +774,7 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                         next_url = f"{url}/?page={next_page}"
                         sb.open(next_url)
                         sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-                        sb.sleep(3)
+                        cancellable_sleep(3)
             except Exception as e:
                 logging.info(f"Could not click next button: {str(e)}")
                 # Fall back to direct URL navigation
@@ -783,10 +783,10 @@ def _process_imdb_list(sb, url) -> List[Dict[str, Any]]:
                 logging.info(f"Attempting to navigate directly to page {next_page}: {next_url}")
                 sb.open(next_url)
                 sb.wait_for_element_present('[data-testid="list-page-mc-list-content"]', timeout=10)
-                sb.sleep(3)
+                cancellable_sleep(3)
             
             current_page += 1
-            sb.sleep(2)
+            cancellable_sleep(2)
         except Exception as e:
             logging.info(f"No more pages available: {str(e)}")
             break
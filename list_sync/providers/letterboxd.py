@@ -8,7 +8,7 @@ from typing import List, Dict, Any
 
 from seleniumbase import SB
 
-from . import register_provider, check_and_raise_if_cancelled, SyncCancelledException
+from . import register_provider, cancellable_sleep, check_and_raise_if_cancelled, SyncCancelledException
 
 
 def _determine_media_type(title: str) -> str:
@@ -53,7 +53,7 @@ def _determine_media_type(title: str) -> str:
     return "movie"
 
 
-@register_provider("letterboxd")
+@register_provider("letterboxd", uses_browser=True)
 def fetch_letterboxd_list(list_id: str) -> List[Dict[str, Any]]:
     """
     Fetch Letterboxd list using Selenium with pagination, supporting both regular lists and watchlists
@@ -122,14 +122,14 @@ def fetch_letterboxd_list(list_id: str) -> List[Dict[str, Any]]:
                 scroll_attempts = 3 if is_watchlist else 10  # Watchlists load faster
                 for i in range(scroll_attempts):
                     sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    sb.sleep(1 if is_watchlist else 2)
+                    cancellable_sleep(1 if is_watchlist else 2)
                     
                     # Also try scrolling to specific elements (for custom lists)
                     if not is_watchlist:
                         items = sb.find_elements("div.listitem.js-listitem")
                         if items:
                             sb.execute_script("arguments[0].scrollIntoView(true);", items[-1])
-                            sb.sleep(1)
+                            cancellable_sleep(1)
                 
                 logging.info("Scrolling complete")
                 
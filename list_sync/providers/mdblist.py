@@ -8,10 +8,10 @@ from typing import List, Dict, Any
 
 from seleniumbase import SB
 
-from . import register_provider
+from . import register_provider, cancellable_sleep
 
 
-@register_provider("mdblist")
+@register_provider("mdblist", uses_browser=True)
 def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
     """
     Fetch MDBList list using Selenium with infinite scrolling support
@@ -47,7 +47,7 @@ def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
             sb.open(url)
             
             # Initial wait for the page to start loading
-            sb.sleep(3)
+            cancellable_sleep(3)
             
             # Scroll to load all content (infinite scrolling)
             last_height = sb.execute_script("return document.body.scrollHeight")
@@ -59,7 +59,7 @@ def fetch_mdblist_list(list_id: str) -> List[Dict[str, Any]]:
                 # Scroll down to bottom
                 sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 # Wait to load page
-                sb.sleep(2)
+                cancellable_sleep(2)
                 
                 # Calculate new scroll height and compare with last scroll height
                 new_height = sb.execute_script("return document.body.scrollHeight")
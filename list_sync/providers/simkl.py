@@ -5,10 +5,10 @@ Uses official SIMKL API for authenticated user watchlists.
 
 import logging
 import os
-import time
 from typing import List, Dict, Any, Optional
 
 import requests
+from ..utils import http_client
 from . import register_provider
 
 # SIMKL API configuration
@@ -49,14 +49,7 @@ def fetch_simkl_watchlist(media_type: str) -> List[Dict[str, Any]]:
     logging.info(f"🎯 SIMKL API: Fetching {media_type} watchlist")
     
     try:
-        response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  SIMKL API rate limit hit. Waiting {retry_after} seconds...")
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+        response = http_client.get(url, headers=get_simkl_headers(), params=params, timeout=30)
         
         response.raise_for_status()
         data = response.json()
@@ -152,14 +145,7 @@ def search_simkl_by_title(title: str, year: Optional[int] = None, media_type: st
     logging.info(f"🔍 SIMKL API: Searching for '{title}' ({year}) [{media_type}]")
     
     try:
-        response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  SIMKL API rate limit hit. Waiting {retry_after} seconds...")
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_simkl_headers(), params=params, timeout=30)
+        response = http_client.get(url, headers=get_simkl_headers(), params=params, timeout=30)
         
         response.raise_for_status()
         data = response.json()
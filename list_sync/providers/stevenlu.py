@@ -3,9 +3,9 @@ Steven Lu popular movies provider for ListSync.
 """
 
 import logging
-import requests
 from typing import List, Dict, Any
 
+from ..utils import http_client
 from . import register_provider
 
 
@@ -39,7 +39,7 @@ def fetch_stevenlu_list(list_id=None) -> List[Dict[str, Any]]:
     logging.info(f"Fetching Steven Lu movies from: {json_url}")
     
     try:
-        response = requests.get(json_url, timeout=10)
+        response = http_client.get(json_url, timeout=10)
         response.raise_for_status()  # Raise exception for HTTP errors
         
         movies_data = response.json()
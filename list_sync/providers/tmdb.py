@@ -9,10 +9,17 @@ from typing import List, Dict, Any, Optional
 
 from seleniumbase import SB
 
-from . import register_provider
+from ..utils import http_client
+from . import register_provider, cancellable_sleep
 
 
-@register_provider("tmdb")
+def _scrapes_without_api_key() -> bool:
+    """TMDB lists are scraped with a browser when no TMDB API key is configured."""
+    from ..config import get_tmdb_api_key
+    return not get_tmdb_api_key()
+
+
+@register_provider("tmdb", uses_browser=_scrapes_without_api_key)
 def fetch_tmdb_list(list_id: str) -> List[Dict[str, Any]]:
     """
     Fetch TMDB list using API if available, otherwise fallback to web scraping
@@ -72,7 +79,7 @@ def _fetch_tmdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
         logging.info(f"Fetching TMDB list {list_id} from API")
         
         # First, get the list details to understand pagination
-        response = requests.get(base_url, params=params, timeout=30)
+        response = http_client.get(base_url, params=params, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -100,7 +107,7 @@ def _fetch_tmdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
                     page_params['page'] = page
                     
                     logging.info(f"Fetching page {page}/{total_pages}")
-                    response = requests.get(base_url, params=page_params, timeout=30)
+                    response = http_client.get(base_url, params=page_params, timeout=30)
                     response.raise_for_status()
                     
                     page_data = response.json()
@@ -111,10 +118,6 @@ def _fetch_tmdb_list_api(list_id: str, api_key: str) -> List[Dict[str, Any]]:
                         if processed_item:
                             media_items.append(processed_item)
                     
-                    # Small delay to be respectful to the API
-                    import time
-                    time.sleep(0.1)
-                    
                 except Exception as e:
                     logging.warning(f"Failed to fetch page {page}: {str(e)}")
                     continue
@@ -193,21 +196,21 @@ def _fetch_tmdb_list_scraping(list_id: str) -> List[Dict[str, Any]]:
             sb.open(url)
             
             # Initial wait for page load
-            sb.sleep(5)
+            cancellable_sleep(5)
             
             # Add some human-like scrolling behavior to avoid bot detection
             try:
                 sb.execute_script("window.scrollTo(0, 300);")
-                sb.sleep(1)
+                cancellable_sleep(1)
                 sb.execute_script("window.scrollTo(0, 600);")
-                sb.sleep(1)
+                cancellable_sleep(1)
                 sb.execute_script("window.scrollTo(0, 900);")
-                sb.sleep(1)
+                cancellable_sleep(1)
             except Exception as e:
                 logging.warning(f"Could not perform scrolling: {str(e)}")
             
             # Wait for any potential captcha/anti-bot verification to load
-            sb.sleep(3)
+            cancellable_sleep(3)
             
             # Process the list
             media_items.extend(_process_tmdb_list(sb, url))
@@ -251,7 +254,7 @@ def _process_tmdb_list(sb, url) -> List[Dict[str, Any]]:
                 raise ValueError(f"Could not find list content on page: {str(e2)}")
         
         # Additional wait to ensure everything is loaded
-        sb.sleep(3)
+        cancellable_sleep(3)
     
     except Exception as e:
         logging.error(f"Failed to load TMDB list page: {str(e)}")
@@ -327,22 +330,22 @@ def _process_tmdb_list(sb, url) -> List[Dict[str, Any]]:
             # Multiple scroll patterns to trigger different types of lazy loading
             # Pattern 1: Scroll to bottom
             sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             
             # Pattern 2: Scroll up and down to trigger intersection observers
             sb.execute_script("window.scrollTo(0, document.body.scrollHeight - 1500);")
-            sb.sleep(1)
+            cancellable_sleep(1)
             sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             
             # Pattern 3: Gradual scroll to trigger progressive loading
             for scroll_pos in [500, 1000, 1500, 2000, 2500, 3000]:
                 sb.execute_script(f"window.scrollTo(0, {scroll_pos});")
-                sb.sleep(0.5)
+                cancellable_sleep(0.5)
             
             # Pattern 4: Final scroll to bottom
             sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            sb.sleep(2)
+            cancellable_sleep(2)
             
             # Check if scrolling loaded new items
             new_items = sb.find_elements("css selector", "div[class*='border-[1px]'][class*='rounded-md']")
@@ -368,15 +371,15 @@ def _process_tmdb_list(sb, url) -> List[Dict[str, Any]]:
                 try:
                     # Scroll to the button
                     sb.execute_script("arguments[0].scrollIntoView(true);", button)
-                    sb.sleep(1)
+                    cancellable_sleep(1)
                     
                     # Click the button
                     button.click()
-                    sb.sleep(3)  # Wait for new content
+                    cancellable_sleep(3)  # Wait for new content
                     
                     # Scroll to bottom again to trigger any additional loading
                     sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    sb.sleep(2)
+                    cancellable_sleep(2)
                     
                     # Check final item count
                     final_items = sb.find_elements("css selector", "div[class*='border-[1px]'][class*='rounded-md']")
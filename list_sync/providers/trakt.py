@@ -10,7 +10,8 @@ from typing import List, Dict, Any, Optional
 import requests
 from dotenv import load_dotenv
 
-from . import register_provider, check_and_raise_if_cancelled, SyncCancelledException
+from ..utils import http_client
+from . import register_provider, cancellable_sleep, check_and_raise_if_cancelled, SyncCancelledException
 
 # Load environment variables
 if os.path.exists('.env'):
@@ -328,7 +329,7 @@ def fetch_trakt_list(list_id: str) -> List[Dict[str, Any]]:
         logging.info(f"Fetching from API endpoint: {url}")
         
         # Make API request
-        response = requests.get(url, headers=get_trakt_headers(), timeout=30)
+        response = http_client.get(url, headers=get_trakt_headers(), timeout=30)
         response.raise_for_status()
         
         items = response.json()
@@ -432,7 +433,7 @@ def fetch_trakt_special_list(url_or_shortcut: str) -> List[Dict[str, Any]]:
             
             logging.info(f"Fetching page {page} with limit {page_limit}...")
             
-            response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+            response = http_client.get(url, headers=get_trakt_headers(), params=params, timeout=30)
             response.raise_for_status()
             
             items = response.json()
@@ -607,7 +608,6 @@ def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict
     Returns:
         Optional[Dict[str, Any]]: Media info with IDs or None if not found
     """
-    import time
     import random
     
     for attempt in range(max_retries + 1):
@@ -616,20 +616,13 @@ def search_trakt_by_imdb_id(imdb_id: str, max_retries: int = 3) -> Optional[Dict
                 # Exponential backoff with jitter
                 delay = (2 ** attempt) + random.uniform(0, 1)
                 logging.warning(f"🔄 Retry attempt {attempt}/{max_retries} for IMDB ID {imdb_id} after {delay:.1f}s delay")
-                time.sleep(delay)
+                if cancellable_sleep(delay):
+                    return None
             
             logging.info(f"🔍 Trakt API: Searching by IMDB ID: {imdb_id}")
             url = f"{TRAKT_BASE_URL}/search/imdb/{imdb_id}"
             
-            response = requests.get(url, headers=get_trakt_headers(), timeout=30)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 10))
-                logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                # Retry once
-                response = requests.get(url, headers=get_trakt_headers(), timeout=30)
+            response = http_client.get(url, headers=get_trakt_headers(), timeout=30)
             
             response.raise_for_status()
             results = response.json()
@@ -721,8 +714,6 @@ def get_trakt_metadata(tmdb_id: Optional[int] = None, imdb_id: Optional[str] = N
     Returns:
         Optional[Dict[str, Any]]: Metadata including poster_url, rating, overview, genres
     """
-    import time
-    
     url = None  # Initialize url variable for error logging
     try:
         # Map media_type to Trakt API endpoint
@@ -739,13 +730,7 @@ def get_trakt_metadata(tmdb_id: Optional[int] = None, imdb_id: Optional[str] = N
             # Use the search/tmdb endpoint which properly handles TMDB IDs
             logging.debug(f"Fetching Trakt metadata via TMDB ID: {tmdb_id} (using search)")
             search_url = f"{TRAKT_BASE_URL}/search/tmdb/{tmdb_id}?type={trakt_type[:-1]}"  # Remove 's' from movies/shows
-            search_response = requests.get(search_url, headers=get_trakt_headers(), timeout=30)
-            
-            if search_response.status_code == 429:
-                retry_after = int(search_response.headers.get('Retry-After', 10))
-                logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                search_response = requests.get(search_url, headers=get_trakt_headers(), timeout=30)
+            search_response = http_client.get(search_url, headers=get_trakt_headers(), timeout=30)
             
             if search_response.status_code != 200:
                 logging.debug(f"TMDB ID {tmdb_id} not found in Trakt search")
@@ -774,14 +759,7 @@ def get_trakt_metadata(tmdb_id: Optional[int] = None, imdb_id: Optional[str] = N
             logging.warning("No TMDB or IMDB ID provided for metadata fetch")
             return None
         
-        response = requests.get(url, headers=get_trakt_headers(), timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_trakt_headers(), timeout=30)
+        response = http_client.get(url, headers=get_trakt_headers(), timeout=30)
         
         # Handle not found
         if response.status_code == 404:
@@ -864,16 +842,7 @@ def search_trakt_by_title(title: str, year: Optional[int], media_type: str) -> O
         url = f"{TRAKT_BASE_URL}/search/{trakt_type}"
         params = {"query": title}
         
-        response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logging.warning(f"⚠️  Trakt API rate limit hit. Waiting {retry_after} seconds...")
-            import time
-            time.sleep(retry_after)
-            # Retry once
-            response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+        response = http_client.get(url, headers=get_trakt_headers(), params=params, timeout=30)
         
         response.raise_for_status()
         results = response.json()
@@ -5,15 +5,21 @@ TVDB (The TV Database) list provider for ListSync.
 import logging
 import re
 import requests
-import time
 from typing import List, Dict, Any, Optional
 
 from seleniumbase import SB
 
-from . import register_provider
+from ..utils import http_client
+from . import register_provider, cancellable_sleep
 
 
-@register_provider("tvdb")
+def _scrapes_without_api_key() -> bool:
+    """TVDB lists are scraped with a browser when no TVDB API key is configured."""
+    from ..config import get_tvdb_api_key
+    return not get_tvdb_api_key()
+
+
+@register_provider("tvdb", uses_browser=_scrapes_without_api_key)
 def fetch_tvdb_list(list_id: str) -> List[Dict[str, Any]]:
     """
     Fetch TVDB list using API if available, otherwise fallback to web scraping
@@ -57,7 +63,7 @@ def _get_tvdb_token(api_key: str) -> Optional[str]:
             "apikey": api_key
         }
         
-        response = requests.post(auth_url, json=auth_data, timeout=30)
+        response = http_client.post(auth_url, json=auth_data, timeout=30, idempotent=True)
         response.raise_for_status()
         
         data = response.json()
@@ -137,7 +143,7 @@ def _fetch_tvdb_user_favorites(user_id: str, headers: Dict[str, str]) -> List[Di
         
         logging.info(f"Fetching TVDB user favorites from: {favorites_url}")
         
-        response = requests.get(favorites_url, headers=headers, timeout=30)
+        response = http_client.get(favorites_url, headers=headers, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -157,9 +163,6 @@ def _fetch_tvdb_user_favorites(user_id: str, headers: Dict[str, str]) -> List[Di
                         if processed_item:
                             media_items.append(processed_item)
                 
-                # Small delay to be respectful to the API
-                time.sleep(0.1)
-                
             except Exception as e:
                 logging.warning(f"Failed to process favorite {favorite}: {str(e)}")
                 continue
@@ -188,7 +191,7 @@ def _get_tvdb_series_details(series_id: str, headers: Dict[str, str]) -> Optiona
     try:
         series_url = f"https://api4.thetvdb.com/v4/series/{series_id}"
         
-        response = requests.get(series_url, headers=headers, timeout=30)
+        response = http_client.get(series_url, headers=headers, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -266,21 +269,21 @@ def _fetch_tvdb_list_scraping(list_id: str) -> List[Dict[str, Any]]:
             sb.open(url)
             
             # Initial wait for page load
-            sb.sleep(5)
+            cancellable_sleep(5)
             
             # Add some human-like scrolling behavior
             try:
                 sb.execute_script("window.scrollTo(0, 300);")
-                sb.sleep(1)
+                cancellable_sleep(1)
                 sb.execute_script("window.scrollTo(0, 600);")
-                sb.sleep(1)
+                cancellable_sleep(1)
                 sb.execute_script("window.scrollTo(0, 900);")
-                sb.sleep(1)
+                cancellable_sleep(1)
             except Exception as e:
                 logging.warning(f"Could not perform scrolling: {str(e)}")
             
             # Wait for any potential captcha/anti-bot verification
-            sb.sleep(3)
+            cancellable_sleep(3)
             
             # Process the list
             media_items.extend(_process_tvdb_list(sb, url))
@@ -320,7 +323,7 @@ def _process_tvdb_list(sb, url) -> List[Dict[str, Any]]:
             return media_items
         
         # Additional wait to ensure everything is loaded
-        sb.sleep(3)
+        cancellable_sleep(3)
         
         # Find all list items (each item is in a div.row)
         items = sb.find_elements("css selector", 'div.row')
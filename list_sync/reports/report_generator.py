@@ -360,8 +360,7 @@ def _generate_html(sync_results, list_breakdown: List[Dict], max_items_per_categ
     """
     
     # Calculate overview stats FROM DATABASE for accuracy
-    import sqlite3
-    from ..database import DB_FILE
+    from ..database import get_connection
     
     total_items = 1
     in_library = 0
@@ -372,7 +371,7 @@ def _generate_html(sync_results, list_breakdown: List[Dict], max_items_per_categ
     errors = 0
     
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM synced_items')
             total_items = cursor.fetchone()[0] or 1
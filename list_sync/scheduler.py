@@ -0,0 +1,115 @@
+"""
+Per-list sync scheduling for automated mode.
+
+Every configured list is due its own interval after it was last synced: the list's
+sync_interval_hours if set, else a per-type default from LISTSYNC_LIST_INTERVALS, else the
+global sync interval. The scheduler keeps the lists in a time-ordered queue so the automated
+loop can sleep until the next one is due and then sync only the due lists, highest
+sync_priority first.
+
+Tuning (environment variables):
+    LISTSYNC_LIST_INTERVALS   Per-list-type intervals in hours, e.g. "trakt_special=1,letterboxd=168"
+"""
+
+import heapq
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .database import load_list_ids
+
+# Lists due within this many seconds of the first due list are synced in the same run
+SCHEDULE_GRACE_SECONDS = 300
+
+
+def _type_interval(list_type: str) -> Optional[float]:
+    """Return the interval configured for a list type in LISTSYNC_LIST_INTERVALS, if any."""
+    overrides = os.getenv('LISTSYNC_LIST_INTERVALS', '')
+    for entry in overrides.split(','):
+        name, _, value = entry.partition('=')
+        if name.strip().lower() == list_type.lower():
+            try:
+                return float(value)
+            except ValueError:
+                logging.warning(f"Ignoring invalid LISTSYNC_LIST_INTERVALS entry: {entry.strip()}")
+    return None
+
+
+def _parse_last_synced(value: Optional[str]) -> float:
+    """Convert a lists.last_synced timestamp (UTC, from CURRENT_TIMESTAMP) to epoch seconds."""
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return 0.0
+
+
+class ListScheduler:
+    """Time-ordered queue of the configured lists, keyed by when each list is next due."""
+
+    def __init__(self, default_interval_hours: float):
+        self.default_interval_hours = default_interval_hours
+        self._queue: List[Tuple[float, int, int, Dict[str, Any]]] = []
+        # Lists that were synced (see mark_dispatched), so one that keeps failing is not retried in a tight loop
+        self._dispatched_at: Dict[Tuple[str, str], float] = {}
+
+    def interval_hours(self, list_info: Dict[str, Any]) -> float:
+        """Hours between syncs of a list."""
+        for interval in (list_info.get('sync_interval_hours'), _type_interval(list_info['type'])):
+            if interval is not None and interval > 0:
+                return float(interval)
+        return max(float(self.default_interval_hours), 0.0)
+
+    def refresh(self, default_interval_hours: Optional[float] = None):
+        """Rebuild the queue from the database, picking up list, interval and last_synced changes."""
+        if default_interval_hours is not None:
+            self.default_interval_hours = default_interval_hours
+
+        queue = []
+        for position, list_info in enumerate(load_list_ids()):
+            key = (list_info['type'], list_info['id'])
+            last_run = max(_parse_last_synced(list_info.get('last_synced')), self._dispatched_at.get(key, 0.0))
+            due_at = last_run + self.interval_hours(list_info) * 3600
+            queue.append((due_at, -int(list_info.get('sync_priority') or 0), position, list_info))
+        heapq.heapify(queue)
+        self._queue = queue
+
+    def seconds_until_due(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next list is due (0 if one is overdue), or None if no lists are configured."""
+        if not self._queue:
+            return None
+        now = time.time() if now is None else now
+        return max(self._queue[0][0] - now, 0.0)
+
+    def pop_due(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Take the lists that are due, plus those due within SCHEDULE_GRACE_SECONDS.
+
+        The lists are not marked as synced: the next refresh() queues them again unless
+        mark_dispatched() is called once they have run.
+
+        Returns:
+            List[Dict[str, Any]]: Due lists (as returned by load_list_ids), highest priority first
+        """
+        now = time.time() if now is None else now
+        due = []
+        while self._queue and self._queue[0][0] <= now + SCHEDULE_GRACE_SECONDS:
+            due.append(heapq.heappop(self._queue))
+
+        # Priority first, then the most overdue, then configured order
+        due.sort(key=lambda entry: (entry[1], entry[0], entry[2]))
+        return [list_info for _, _, _, list_info in due]
+
+    def mark_dispatched(self, lists: List[Dict[str, Any]], now: Optional[float] = None):
+        """
+        Record that lists were synced, so they are not due again for a full interval.
+
+        Called once a sync of the lists has actually run, whether or not it succeeded, so a list
+        that keeps failing waits its interval even if its last_synced does not move.
+        """
+        now = time.time() if now is None else now
+        for list_info in lists:
+            self._dispatched_at[(list_info['type'], list_info['id'])] = now
@@ -29,6 +29,7 @@ class SyncResults:
         self.total_items = 0
         self.synced_lists = []  # Track which lists were synced
         self.cancelled = False  # Track if sync was cancelled
+        self.failed_shards = []  # Sharded syncs: shards whose worker process failed
         self.results = {
             "requested": 0,
             "already_requested": 0,
@@ -93,8 +94,21 @@ class SyncResults:
             for item_line in all_failed_items:
                 summary += f"{item_line}\n"
         
+        summary += _failed_shards_section(self.failed_shards)
         return summary
 
+
+def _failed_shards_section(failed_shards: List[Dict]) -> str:
+    """Summary lines for shards whose items were left unprocessed (not counted in Total Items)."""
+    if not failed_shards:
+        return ""
+    section = f"\nFailed Shards ({len(failed_shards)})\n"
+    section += "─────────────\n"
+    for shard in failed_shards:
+        section += (f"• Shard {shard['shard']}/{shard['shard_count']}: {shard['items']} items unprocessed "
+                    f"(Error: {shard['error']})\n")
+    return section
+
 def display_ascii_art():
     """Display the ASCII art splash screen."""
     ascii_art = r"""
@@ -238,6 +252,8 @@ def display_summary(sync_results: SyncResults):
         for item_line in all_failed_items:
             summary += f"{item_line}\n"
 
+    summary += _failed_shards_section(sync_results.failed_shards)
+
     print(color_gradient(summary, "#9400D3", "#00FF00") + Style.RESET_ALL)
 
 def display_welcome_message():
@@ -7,7 +7,6 @@ import readline
 import logging
 import os
 from colorama import Style
-from seleniumbase import SB
 
 
 def custom_input(prompt):
@@ -143,6 +142,9 @@ def init_selenium_driver():
     """
     logging.info("Initializing Selenium driver...")
     try:
+        # Imported here so the URL and formatting helpers work without the browser dependencies
+        from seleniumbase import SB
+        
         chrome_options = [
             "--no-sandbox",
             "--headless=new",
@@ -0,0 +1,226 @@
+"""
+Shared HTTP transport for outbound API calls.
+
+Every upstream host (Overseerr, Trakt, TMDB, TVDB, SIMKL, AniList, ...) gets one pooled
+requests.Session so connections and TLS sessions are reused across calls, and all calls
+go through the same retry policy for rate limits and transient failures. Calls to
+services with known limits also draw from the shared token buckets in rate_limiter.
+
+Tuning (environment variables):
+    LISTSYNC_HTTP_POOL_SIZE       Connections kept alive per host (default 16)
+    LISTSYNC_HTTP_MAX_RETRIES     Retries for 429/5xx and connection errors (default 3)
+    LISTSYNC_HTTP_BACKOFF_BASE    Base delay in seconds for jittered backoff (default 1)
+    LISTSYNC_HTTP_MAX_WAIT        Longest single wait in seconds, incl. Retry-After (default 60)
+    LISTSYNC_HTTP_TIMEOUT         Default timeout in seconds when a call passes none (default 30)
+    LISTSYNC_HTTP_TIMEOUTS        Per-host timeout overrides, e.g. "api.trakt.tv=15,api.themoviedb.org=10"
+"""
+
+import email.utils
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import rate_limiter
+
+# Statuses worth retrying: rate limiting and transient gateway/server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Methods that are safe to repeat after the server may have acted on them
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)) or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)) or default)
+    except ValueError:
+        return default
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _host_timeout(url: str) -> Optional[float]:
+    """Return the timeout configured for the URL's host in LISTSYNC_HTTP_TIMEOUTS, if any."""
+    overrides = os.getenv('LISTSYNC_HTTP_TIMEOUTS', '')
+    if not overrides:
+        return None
+    host = (urlsplit(url).hostname or '').lower()
+    for entry in overrides.split(','):
+        name, _, value = entry.partition('=')
+        if name.strip().lower() == host:
+            try:
+                return float(value)
+            except ValueError:
+                logging.warning(f"Ignoring invalid LISTSYNC_HTTP_TIMEOUTS entry: {entry.strip()}")
+    return None
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Get the pooled session for the host of the given URL, creating it on first use.
+
+    Args:
+        url (str): Any URL on the target host
+
+    Returns:
+        requests.Session: Session shared by every caller talking to that host
+    """
+    key = _host_key(url)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            pool_size = max(1, _env_int('LISTSYNC_HTTP_POOL_SIZE', 16))
+            # Retries are handled in request() so Retry-After and logging stay in one place
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[key] = session
+            logging.debug(f"Opened pooled HTTP session for {key} (pool size {pool_size})")
+    return session
+
+
+def close_sessions():
+    """Close every pooled session. New sessions are created on the next request."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _backoff_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """Delay before retry number `attempt` (1-based): Retry-After if given, else full-jitter backoff."""
+    max_wait = _env_float('LISTSYNC_HTTP_MAX_WAIT', 60)
+    retry_after = _retry_after_seconds(response) if response is not None else None
+    if retry_after is not None:
+        # A little jitter keeps concurrent workers from retrying in lockstep
+        return min(retry_after + random.uniform(0, 1), max_wait)
+    base = _env_float('LISTSYNC_HTTP_BACKOFF_BASE', 1)
+    return random.uniform(0, min(base * (2 ** attempt), max_wait))
+
+
+def request(method: str, url: str, max_retries: Optional[int] = None, idempotent: Optional[bool] = None,
+            **kwargs) -> requests.Response:
+    """
+    Send a request through the pooled session for the URL's host.
+
+    429 and 5xx responses and connection errors are retried with jittered exponential
+    backoff, honouring Retry-After. Non-idempotent requests (POST, PATCH) are only retried
+    on 429, since the server did not act on them. When retries run out the last response is
+    returned (or the last exception raised), so callers keep their own status handling.
+
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+        max_retries (int, optional): Override LISTSYNC_HTTP_MAX_RETRIES for this call
+        idempotent (bool, optional): Treat the request as safe to repeat (e.g. GraphQL queries
+            sent via POST). Defaults to True for GET/HEAD/OPTIONS/PUT/DELETE.
+        **kwargs: Passed through to requests.Session.request
+
+    Returns:
+        requests.Response: The final response
+    """
+    method = method.upper()
+    if max_retries is None:
+        max_retries = max(0, _env_int('LISTSYNC_HTTP_MAX_RETRIES', 3))
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+
+    host_timeout = _host_timeout(url)
+    if host_timeout is not None:
+        kwargs['timeout'] = host_timeout
+    elif kwargs.get('timeout') is None:
+        kwargs['timeout'] = _env_float('LISTSYNC_HTTP_TIMEOUT', 30)
+
+    session = get_session(url)
+    attempt = 0
+    while True:
+        rate_limiter.acquire(url)
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # A connect failure never reached the server, so it is safe to repeat for any method
+            retryable = idempotent or isinstance(e, requests.exceptions.ConnectTimeout)
+            if not retryable or attempt >= max_retries:
+                raise
+            attempt += 1
+            delay = _backoff_delay(attempt)
+            logging.warning(f"⚠️  {method} {_host_key(url)} failed ({type(e).__name__}), "
+                            f"retry {attempt}/{max_retries} in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        status = response.status_code
+        retry_after = _retry_after_seconds(response) if status in RETRY_STATUSES else None
+        if retry_after is not None:
+            retry_after = min(retry_after, _env_float('LISTSYNC_HTTP_MAX_WAIT', 60))
+        limited = rate_limiter.observe(url, response, retry_after)
+        retryable = status == 429 or (idempotent and status in RETRY_STATUSES)
+        if not retryable or attempt >= max_retries:
+            return response
+
+        attempt += 1
+        if status == 429 and limited:
+            # The host's bucket is now paused for Retry-After, so the next acquire() does the waiting
+            logging.warning(f"⚠️  Rate limited by {_host_key(url)}, retry {attempt}/{max_retries}")
+            response.close()
+            continue
+
+        delay = _backoff_delay(attempt, response)
+        if status == 429:
+            logging.warning(f"⚠️  Rate limited by {_host_key(url)}, retry {attempt}/{max_retries} in {delay:.1f}s")
+        else:
+            logging.warning(f"⚠️  {method} {_host_key(url)} returned {status}, "
+                            f"retry {attempt}/{max_retries} in {delay:.1f}s")
+        response.close()
+        time.sleep(delay)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request through the shared transport (see request())."""
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Send a POST request through the shared transport (see request())."""
+    return request('POST', url, **kwargs)
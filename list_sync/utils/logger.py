@@ -3,7 +3,9 @@ Logging utilities for the ListSync application.
 """
 
 import logging
+import logging.handlers
 import os
+import threading
 
 # Define paths for data directory
 # Use /data in Docker (volume-mounted), ./data for local development
@@ -71,4 +73,117 @@ def setup_logging():
     urllib3_logger.setLevel(logging.INFO)
     urllib3_logger.propagate = False
     
-    return added_logger 
\ No newline at end of file
+    return added_logger 
+
+def setup_forwarded_logging(log_queue):
+    """
+    Set up logging in a worker process that hands every record to its parent process.
+
+    The parent writes the records through its own handlers (see LogRecordForwarder), so worker
+    processes never open list_sync.log or added.log themselves and can't interleave writes to them.
+
+    Args:
+        log_queue: multiprocessing queue the parent's LogRecordForwarder reads
+
+    Returns:
+        logging.Logger: Logger for added items
+    """
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+
+    added_logger = logging.getLogger("added_items")
+    added_logger.setLevel(logging.INFO)
+    for handler in added_logger.handlers[:]:
+        added_logger.removeHandler(handler)
+    added_logger.addHandler(queue_handler)
+    added_logger.propagate = False
+
+    # Same third-party logger settings as setup_logging
+    logging.getLogger('selenium').setLevel(logging.INFO)
+    logging.getLogger('selenium').propagate = False
+    logging.getLogger('urllib3').setLevel(logging.INFO)
+    logging.getLogger('urllib3').propagate = False
+
+    return added_logger
+
+
+class LogRecordForwarder(logging.handlers.QueueListener):
+    """
+    Parent-side end of setup_forwarded_logging.
+
+    Each record read from the queue is handled by the parent's logger of the same name, so it
+    ends up in the same file (list_sync.log or added.log) it would have been written to by the
+    parent itself. Call start() before starting the workers and stop() once they have exited;
+    stop() writes any records still queued.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+
+    def handle(self, record):
+        logging.getLogger(record.name).handle(record)
+
+
+class ItemLogBuffer(logging.Handler):
+    """
+    Root-logger handler that holds back records emitted by worker threads.
+
+    While installed, any thread that has called begin() has its records collected
+    instead of written, so the caller can replay each item's records as one
+    contiguous block once the item is finished. Records from other threads pass
+    straight through to the original handlers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._targets = []
+        self._local = threading.local()
+
+    def install(self):
+        """Replace the root logger's handlers with this buffer."""
+        root_logger = logging.getLogger()
+        self._targets = root_logger.handlers[:]
+        for handler in self._targets:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(self)
+
+    def uninstall(self):
+        """Restore the root logger's original handlers."""
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self)
+        for handler in self._targets:
+            root_logger.addHandler(handler)
+        self._targets = []
+
+    def begin(self):
+        """Start collecting records emitted by the current thread."""
+        self._local.records = []
+
+    def end(self) -> list:
+        """Stop collecting for the current thread and return the collected records."""
+        records = getattr(self._local, 'records', None) or []
+        self._local.records = None
+        return records
+
+    def replay(self, records: list):
+        """Write previously collected records to the original handlers, in order."""
+        for record in records:
+            for handler in self._targets:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def handle(self, record):
+        records = getattr(self._local, 'records', None)
+        if records is not None:
+            records.append(record)
+        else:
+            self.replay([record])
+        return True
+
+    def emit(self, record):
+        self.handle(record)
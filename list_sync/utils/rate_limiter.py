@@ -0,0 +1,381 @@
+"""
+Adaptive token-bucket rate limiter shared by every thread and process talking to a service.
+
+Each upstream host with a known limit gets a token bucket. Bucket state lives in a small
+SQLite file (WAL mode) next to the main database so the API server, its sync subprocess and
+the core sync all draw from the same budget; it is kept out of list_sync.db so the limiter
+never waits on the sync's write transactions.
+
+A process does not go to the store for every request: it reserves up to LEASE_SECONDS worth
+of tokens at a time and serves its threads from that lease, returning what it did not use
+when it renews. A 429, a pause or a newly learned limit is written to the store at once.
+
+Buckets adapt to what the service reports:
+    - Retry-After (or X-Ratelimit-Remaining: 0 with a reset time) pauses the bucket
+    - X-Ratelimit-Limit with a period (Trakt's X-Ratelimit JSON) sets the sustained rate
+    - a 429 halves the rate, which then climbs back towards the ceiling on success
+
+Tuning (environment variables):
+    LISTSYNC_RATE_LIMITER   Set to 'false' to disable client-side limiting (default 'true')
+    LISTSYNC_RATE_LIMITS    Per-host requests/second overrides, e.g. "api.trakt.tv=2,api4.thetvdb.com=5".
+                            A rate of 0 disables limiting for that host.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .logger import DATA_DIR
+
+RATE_LIMIT_DB_FILE = os.path.join(DATA_DIR, "rate_limits.db")
+
+# Sustained requests/second and burst size per host. Hosts not listed (e.g. the local
+# Overseerr instance) are not limited client-side; the transport still honours their 429s.
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    'api.trakt.tv': (1000 / 300, 10),   # 1000 GET calls per 5 minutes
+    'api.themoviedb.org': (40, 40),     # TMDB's soft limit is ~50/s
+    'api4.thetvdb.com': (10, 10),
+    'api.simkl.com': (10, 10),
+    'graphql.anilist.co': (90 / 60, 5),  # 90 requests per minute
+}
+
+# Slowest a bucket is allowed to back off to, in requests/second
+MIN_RATE = 0.05
+
+# Fraction of the ceiling a bucket regains after each successful response while backed off
+RECOVERY_STEP = 0.05
+
+# Longest a process serves requests from its reserved tokens before it syncs with the store again
+LEASE_SECONDS = 1.0
+
+# Each thread keeps its connection to the store open
+_local = threading.local()
+
+# Guards the leases and pending recoveries; held while a lease is renewed, never while sleeping
+_lock = threading.Lock()
+
+# host -> tokens this process reserved in the store, refilled like a bucket, with the
+# number of requests it may still serve ('remaining') and when it must renew ('expires_at')
+_leases: Dict[str, Dict[str, float]] = {}
+
+# host -> successful responses while backed off, applied to the stored rate on the next sync
+_pending_recovery: Dict[str, int] = {}
+
+# host -> (rate, max_rate) as last read from the store, so successes only count while recovering
+_last_seen: Dict[str, Tuple[float, float]] = {}
+
+
+def _forget_parent_state():
+    # A forked child reserves its own tokens over its own connection; the parent's lock may be held
+    global _local, _lock
+    _local = threading.local()
+    _lock = threading.Lock()
+    _leases.clear()
+    _pending_recovery.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_parent_state)
+
+
+def _enabled() -> bool:
+    return os.getenv('LISTSYNC_RATE_LIMITER', 'true').lower() == 'true'
+
+
+def _configured_limit(host: str) -> Optional[Tuple[float, float]]:
+    """Return (rate, burst) for a host, or None if it is not limited."""
+    overrides = os.getenv('LISTSYNC_RATE_LIMITS', '')
+    for entry in overrides.split(','):
+        name, _, value = entry.partition('=')
+        if name.strip().lower() != host:
+            continue
+        try:
+            rate = float(value)
+        except ValueError:
+            logging.warning(f"Ignoring invalid LISTSYNC_RATE_LIMITS entry: {entry.strip()}")
+            break
+        if rate <= 0:
+            return None
+        burst = DEFAULT_LIMITS.get(host, (rate, max(1.0, rate)))[1]
+        return rate, burst
+    return DEFAULT_LIMITS.get(host)
+
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's autocommit connection to the bucket store, opening it on first use."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and _local.path == RATE_LIMIT_DB_FILE:
+        return conn
+    conn = sqlite3.connect(RATE_LIMIT_DB_FILE, timeout=10, isolation_level=None)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                host TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                capacity REAL NOT NULL,
+                rate REAL NOT NULL,
+                max_rate REAL NOT NULL,
+                configured_rate REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                blocked_until REAL NOT NULL DEFAULT 0
+            )
+        ''')
+    except sqlite3.Error:
+        conn.close()
+        raise
+    _local.conn, _local.path = conn, RATE_LIMIT_DB_FILE
+    return conn
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """This thread's store connection inside a write transaction, committed if the block succeeds."""
+    conn = _connect()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+        conn.execute('COMMIT')
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+
+
+def _refill(bucket: Dict[str, float], now: float):
+    # Tokens only accrue while the bucket is not paused
+    refill_from = max(bucket['updated_at'], min(bucket['blocked_until'], now))
+    if now > refill_from:
+        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - refill_from) * bucket['rate'])
+    bucket['updated_at'] = now
+
+
+def _load_bucket(conn: sqlite3.Connection, host: str, limit: Tuple[float, float], now: float) -> Dict[str, float]:
+    """Read a bucket inside the caller's transaction, creating it full if missing, and refill it."""
+    rate, burst = limit
+    row = conn.execute(
+        'SELECT tokens, capacity, rate, max_rate, configured_rate, updated_at, blocked_until '
+        'FROM rate_limit_buckets WHERE host = ?',
+        (host,),
+    ).fetchone()
+    if row is None or row[4] != rate:
+        # New host, or the configured limit changed since the bucket was learned
+        bucket = {'tokens': burst, 'capacity': burst, 'rate': rate, 'max_rate': rate, 'configured_rate': rate,
+                  'updated_at': now, 'blocked_until': 0.0}
+        conn.execute(
+            'INSERT OR REPLACE INTO rate_limit_buckets '
+            '(host, tokens, capacity, rate, max_rate, configured_rate, updated_at, blocked_until) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, 0)',
+            (host, burst, burst, rate, rate, rate, now),
+        )
+        return bucket
+
+    bucket = dict(zip(('tokens', 'capacity', 'rate', 'max_rate', 'configured_rate', 'updated_at', 'blocked_until'),
+                      row))
+    _refill(bucket, now)
+    return bucket
+
+
+def _store_bucket(conn: sqlite3.Connection, host: str, bucket: Dict[str, float]):
+    conn.execute(
+        'UPDATE rate_limit_buckets SET tokens = ?, capacity = ?, rate = ?, max_rate = ?, updated_at = ?, '
+        'blocked_until = ? WHERE host = ?',
+        (bucket['tokens'], bucket['capacity'], bucket['rate'], bucket['max_rate'], bucket['updated_at'],
+         bucket['blocked_until'], host),
+    )
+    _last_seen[host] = (bucket['rate'], bucket['max_rate'])
+
+
+def _release_lease(host: str, bucket: Dict[str, float]):
+    """Fold this process's lease and pending recovery back into the bucket read from the store."""
+    lease = _leases.pop(host, None)
+    if lease is not None and lease['configured_rate'] == bucket['configured_rate']:
+        # Tokens reserved but not used go back to the other processes
+        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + lease['remaining'])
+    successes = _pending_recovery.pop(host, 0)
+    if successes:
+        bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + successes * bucket['max_rate'] * RECOVERY_STEP)
+
+
+def _renew_lease(host: str, limit: Tuple[float, float], now: float) -> Dict[str, float]:
+    """Sync with the store and reserve the tokens this process may use for the next LEASE_SECONDS."""
+    with _transaction() as conn:
+        bucket = _load_bucket(conn, host, limit, now)
+        _release_lease(host, bucket)
+        # The lease starts from the bucket as it was, so its tokens come due at the store's pace
+        lease = dict(bucket)
+        lease['remaining'] = float(max(1, int(min(bucket['capacity'], bucket['rate'] * LEASE_SECONDS))))
+        lease['expires_at'] = now + LEASE_SECONDS
+        bucket['tokens'] -= lease['remaining']
+        _store_bucket(conn, host, bucket)
+    _leases[host] = lease
+    return lease
+
+
+def acquire(url: str) -> float:
+    """
+    Take a token for the URL's host, sleeping until one is available.
+
+    Tokens are reserved up front (the bucket may go negative), so concurrent callers queue
+    behind each other instead of polling. They come from this process's lease, which is
+    renewed from the store once it runs out or expires.
+
+    Args:
+        url (str): URL about to be requested
+
+    Returns:
+        float: Seconds spent waiting
+    """
+    host = (urlsplit(url).hostname or '').lower()
+    limit = _configured_limit(host) if _enabled() else None
+    if limit is None:
+        return 0.0
+
+    try:
+        with _lock:
+            now = time.time()
+            lease = _leases.get(host)
+            if (lease is None or lease['remaining'] < 1 or now >= lease['expires_at']
+                    or lease['configured_rate'] != limit[0]):
+                lease = _renew_lease(host, limit, now)
+            _refill(lease, now)
+            lease['tokens'] -= 1
+            lease['remaining'] -= 1
+            wait = max(0.0, lease['blocked_until'] - now)
+            if lease['tokens'] < 0:
+                wait += -lease['tokens'] / max(lease['rate'], MIN_RATE)
+    except sqlite3.Error as e:
+        # Never block outbound calls on the limiter's own storage
+        logging.debug(f"Rate limiter unavailable for {host}: {e}")
+        return 0.0
+
+    if wait > 0:
+        if wait >= 1:
+            logging.info(f"⏳ Rate limiter: waiting {wait:.1f}s for {host}")
+        time.sleep(wait)
+    return wait
+
+
+def _header(headers, *names: str) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _parse_reset(value: str, now: float) -> Optional[float]:
+    """Interpret a reset header as epoch seconds, seconds from now, or an ISO timestamp."""
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
+    return number if number > 1e9 else now + number
+
+
+def _reported_limits(headers, now: float) -> Dict[str, float]:
+    """Extract limit, period, remaining and reset_at from whichever rate-limit headers are present."""
+    reported: Dict[str, float] = {}
+
+    # Trakt: X-Ratelimit: {"limit": 1000, "period": 300, "remaining": 999, "until": "..."}
+    trakt = headers.get('X-Ratelimit')
+    if trakt:
+        try:
+            data = json.loads(trakt)
+            for key in ('limit', 'period', 'remaining'):
+                if data.get(key) is not None:
+                    reported[key] = float(data[key])
+            if data.get('until'):
+                reset_at = _parse_reset(str(data['until']), now)
+                if reset_at:
+                    reported['reset_at'] = reset_at
+        except (ValueError, TypeError, AttributeError):
+            pass
+
+    limit = _header(headers, 'X-Ratelimit-Limit', 'X-RateLimit-Limit')
+    remaining = _header(headers, 'X-Ratelimit-Remaining', 'X-RateLimit-Remaining')
+    reset = _header(headers, 'X-Ratelimit-Reset', 'X-RateLimit-Reset')
+    try:
+        if limit is not None:
+            reported.setdefault('limit', float(limit))
+        if remaining is not None:
+            reported.setdefault('remaining', float(remaining))
+    except ValueError:
+        pass
+    if reset is not None and 'reset_at' not in reported:
+        reset_at = _parse_reset(reset, now)
+        if reset_at:
+            reported['reset_at'] = reset_at
+    return reported
+
+
+def observe(url: str, response, retry_after: Optional[float] = None) -> bool:
+    """
+    Adjust the host's bucket from a response.
+
+    Args:
+        url (str): URL that was requested
+        response: The requests.Response received
+        retry_after (float, optional): Parsed Retry-After in seconds, if the response had one
+
+    Returns:
+        bool: True if the host is rate limited here, so the next acquire() already waits
+            out any pause and the caller should not sleep on its own
+    """
+    host = (urlsplit(url).hostname or '').lower()
+    limit = _configured_limit(host) if _enabled() else None
+    if limit is None:
+        return False
+
+    now = time.time()
+    status = response.status_code
+    reported = _reported_limits(response.headers, now)
+    exhausted = reported.get('remaining') == 0 and reported.get('reset_at', 0) > now
+    learned_rate = None
+    if reported.get('limit') and reported.get('period'):
+        learned_rate = max(MIN_RATE, reported['limit'] / reported['period'])
+
+    if status != 429 and not exhausted:
+        rate, max_rate = _last_seen.get(host, (None, None))
+        if learned_rate is None or learned_rate == max_rate:
+            if status < 400 and rate is not None and rate < max_rate:
+                with _lock:
+                    _pending_recovery[host] = _pending_recovery.get(host, 0) + 1
+            return True
+
+    try:
+        with _lock, _transaction() as conn:
+            bucket = _load_bucket(conn, host, limit, now)
+            # Requests after this take tokens under the new rate or pause
+            _release_lease(host, bucket)
+            if learned_rate is not None:
+                bucket['max_rate'] = learned_rate
+                bucket['capacity'] = max(1.0, min(bucket['capacity'], reported['limit']))
+            if status == 429:
+                bucket['rate'] = max(MIN_RATE, bucket['rate'] / 2)
+                bucket['tokens'] = min(bucket['tokens'], 0.0)
+                if retry_after is not None:
+                    bucket['blocked_until'] = max(bucket['blocked_until'], now + retry_after)
+                logging.warning(f"⚠️  Rate limiter: {host} returned 429, slowing to {bucket['rate']:.2f} req/s")
+            elif status < 400:
+                bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + bucket['max_rate'] * RECOVERY_STEP)
+            if exhausted:
+                bucket['blocked_until'] = max(bucket['blocked_until'], reported['reset_at'])
+                bucket['tokens'] = min(bucket['tokens'], 0.0)
+            bucket['rate'] = min(bucket['rate'], bucket['max_rate'])
+            _store_bucket(conn, host, bucket)
+    except sqlite3.Error as e:
+        logging.debug(f"Rate limiter unavailable for {host}: {e}")
+        return False
+    return True
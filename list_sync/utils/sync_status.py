@@ -4,6 +4,9 @@ In-memory sync status tracking for real-time sync state monitoring.
 
 import threading
 import datetime
+import logging
+import mmap
+import time
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, asdict
 import json
@@ -121,6 +124,7 @@ class SyncStatusTracker:
         """Request cancellation of the current sync"""
         with self._state_lock:
             self._state.cancellation_requested = True
+        _cancel_event.set()
     
     def is_cancellation_requested(self) -> bool:
         """Check if cancellation has been requested"""
@@ -131,6 +135,7 @@ class SyncStatusTracker:
         """Clear the cancellation request flag"""
         with self._state_lock:
             self._state.cancellation_requested = False
+        _cancel_event.clear()
 
 
 # Global instance for easy access
@@ -175,9 +180,11 @@ def set_cancel_request(session_id: str):
     data = _read_cancel_requests()
     data[session_id] = {"cancel_requested": True}
     _write_cancel_requests(data)
+    _set_cancel_flag(session_id)
 
 
 def clear_cancel_request(session_id: str):
+    _clear_cancel_flag(session_id)
     data = _read_cancel_requests()
     if session_id in data:
         data.pop(session_id, None)
@@ -190,6 +197,142 @@ def is_cancel_requested_persisted(session_id: str) -> bool:
     return bool(entry and entry.get("cancel_requested"))
 
 
+# ---------------------------------------------
+# Shared-memory cancellation flag
+# ---------------------------------------------
+#
+# Sync loops check for cancellation before every item and providers between page loads, so
+# the check must not touch the filesystem. The API and the sync process share a small file
+# mapped into both: byte 0 is set when a cancel is requested and the following bytes hold the
+# session ID it applies to. Reading the flag is a plain memory read; cancel_requests.json
+# remains the durable record for callers that need it.
+
+_CANCEL_FLAG_FILE = os.path.join(os.path.dirname(_CANCEL_FILE), "cancel_flag.bin")
+_CANCEL_FLAG_SIZE = 128
+# How often waits started through wait_for_cancellation re-check the flag set by another process
+_CANCEL_POLL_SECONDS = 0.2
+
+_cancel_map = None
+_cancel_map_lock = threading.Lock()
+# Wakes in-process waits immediately when this process requests cancellation
+_cancel_event = threading.Event()
+# Session of the sync running in this process, for checks that don't know it (e.g. providers)
+_active_session_id: Optional[str] = None
+
+
+def _cancel_flag_map() -> Optional[mmap.mmap]:
+    """Map the cancel flag file on first use; returns None if it cannot be mapped."""
+    global _cancel_map
+    if _cancel_map is None:
+        with _cancel_map_lock:
+            if _cancel_map is None:
+                try:
+                    _ensure_cancel_file_dir()
+                    fd = os.open(_CANCEL_FLAG_FILE, os.O_RDWR | os.O_CREAT, 0o666)
+                    try:
+                        if os.fstat(fd).st_size < _CANCEL_FLAG_SIZE:
+                            os.ftruncate(fd, _CANCEL_FLAG_SIZE)
+                        _cancel_map = mmap.mmap(fd, _CANCEL_FLAG_SIZE)
+                    finally:
+                        os.close(fd)
+                except (OSError, ValueError) as e:
+                    logging.warning(f"Cancel flag unavailable, falling back to {_CANCEL_FILE}: {e}")
+                    _cancel_map = False
+    return _cancel_map or None
+
+
+def _session_bytes(session_id: str) -> bytes:
+    return session_id.encode("utf-8")[:_CANCEL_FLAG_SIZE - 2]
+
+
+def _flag_matches(flag: mmap.mmap, session_id: str) -> bool:
+    """Whether the flag is raised for session_id (read without any system call)."""
+    if not flag[0]:
+        return False
+    sid = _session_bytes(session_id)
+    return flag[1:1 + len(sid)] == sid and flag[1 + len(sid)] == 0
+
+
+def _set_cancel_flag(session_id: str):
+    flag = _cancel_flag_map()
+    if flag is not None:
+        # Write the session before raising the flag so readers never see a half-written ID
+        sid = _session_bytes(session_id)
+        flag[1:_CANCEL_FLAG_SIZE] = sid + bytes(_CANCEL_FLAG_SIZE - 1 - len(sid))
+        flag[0] = 1
+    if session_id == _active_session_id:
+        _cancel_event.set()
+
+
+def _clear_cancel_flag(session_id: str):
+    flag = _cancel_flag_map()
+    if flag is not None and _flag_matches(flag, session_id):
+        flag[0] = 0
+    if session_id == _active_session_id and not get_sync_tracker().is_cancellation_requested():
+        _cancel_event.clear()
+
+
+def set_active_sync_session(session_id: Optional[str]):
+    """
+    Register the sync session running in this process (None when it ends).
+
+    Cancellation checks that don't pass a session ID, such as those inside providers,
+    apply to this session.
+    """
+    global _active_session_id
+    _active_session_id = session_id
+    flag = _cancel_flag_map()
+    if session_id and flag is not None and _flag_matches(flag, session_id):
+        _cancel_event.set()
+    else:
+        _cancel_event.clear()
+
+
+def is_cancellation_pending(session_id: Optional[str] = None) -> bool:
+    """
+    Check whether the running sync should stop, without touching the filesystem.
+
+    Args:
+        session_id (Optional[str]): Session to check. Defaults to the active sync session.
+
+    Returns:
+        bool: True if cancellation was requested in this process or by another one
+    """
+    if _cancel_event.is_set() or get_sync_tracker().is_cancellation_requested():
+        return True
+    sid = session_id or _active_session_id
+    if not sid:
+        return False
+    flag = _cancel_flag_map()
+    if flag is None:
+        return is_cancel_requested_persisted(sid)
+    return _flag_matches(flag, sid)
+
+
+def wait_for_cancellation(timeout: float, session_id: Optional[str] = None) -> bool:
+    """
+    Sleep for up to timeout seconds, waking early if the sync is cancelled.
+
+    Cancellation from this process wakes the wait immediately; cancellation from another
+    process is noticed within _CANCEL_POLL_SECONDS.
+
+    Args:
+        timeout (float): Maximum seconds to wait
+        session_id (Optional[str]): Session to watch. Defaults to the active sync session.
+
+    Returns:
+        bool: True if cancellation was requested, False if the full timeout elapsed
+    """
+    deadline = time.monotonic() + max(timeout, 0)
+    while True:
+        if is_cancellation_pending(session_id):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        _cancel_event.wait(min(remaining, _CANCEL_POLL_SECONDS))
+
+
 # ---------------------------------------------
 # Pause scheduling until a given timestamp
 # ---------------------------------------------
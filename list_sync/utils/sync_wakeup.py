@@ -0,0 +1,73 @@
+"""
+Wake the core sync process as soon as a sync job is queued.
+
+The core process listens on a Unix datagram socket in the data directory; the API server
+sends a one-byte datagram after queueing a job. Jobs live in the sync_jobs table, so a lost
+wake-up only delays a job until the core's next poll (LISTSYNC_JOB_POLL_SECONDS), and
+platforms without Unix datagram sockets fall back to polling alone.
+"""
+
+import logging
+import os
+import socket
+import threading
+from typing import Optional
+
+from .logger import DATA_DIR
+
+WAKEUP_SOCKET = os.path.join(DATA_DIR, "sync_wakeup.sock")
+
+
+def start_wakeup_listener(wake_event: threading.Event) -> Optional[threading.Thread]:
+    """
+    Set wake_event whenever a wake-up arrives.
+
+    Args:
+        wake_event (threading.Event): Event the automated sync loop waits on
+
+    Returns:
+        threading.Thread: The listener thread, or None if the socket could not be opened
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        if os.path.exists(WAKEUP_SOCKET):
+            os.remove(WAKEUP_SOCKET)
+        sock.bind(WAKEUP_SOCKET)
+    except OSError as e:
+        logging.warning(f"Sync wake-up socket unavailable, falling back to polling for sync jobs: {e}")
+        return None
+
+    def listen():
+        while True:
+            try:
+                sock.recv(64)
+            except OSError as e:
+                logging.warning(f"Sync wake-up listener stopped: {e}")
+                return
+            wake_event.set()
+
+    thread = threading.Thread(target=listen, daemon=True, name="listsync-wakeup")
+    thread.start()
+    logging.info(f"Listening for sync job wake-ups on {WAKEUP_SOCKET}")
+    return thread
+
+
+def notify_core() -> bool:
+    """
+    Wake the core process so it picks up newly queued jobs.
+
+    Returns:
+        bool: True if the wake-up was delivered
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(WAKEUP_SOCKET):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b'1', WAKEUP_SOCKET)
+        return True
+    except OSError as e:
+        # No listener (core not running) or the socket buffer is full of pending wake-ups
+        logging.debug(f"Could not wake the core sync process: {e}")
+        return False
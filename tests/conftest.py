@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the ListSync test suite.
+
+Every test that touches the database gets a fresh SQLite file in its own temporary directory.
+"""
+
+import os
+import tempfile
+
+# Logs and other data files go to a throwaway directory, never ./data
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="listsync-tests-"))
+
+import pytest  # noqa: E402
+
+from list_sync import database  # noqa: E402
+
+
+@pytest.fixture()
+def db_file(tmp_path, monkeypatch):
+    """Point the database module at an empty database file."""
+    path = str(tmp_path / "list_sync.db")
+    monkeypatch.setattr(database, "DB_FILE", path)
+    return path
+
+
+@pytest.fixture()
+def db(db_file):
+    """An initialized database; returns the database module."""
+    database.init_database()
+    return database
@@ -0,0 +1,91 @@
+"""Tests for the shared memory-mapped cancellation flag."""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from list_sync.utils import sync_status
+
+
+@pytest.fixture()
+def flag(tmp_path, monkeypatch):
+    """Point the cancel files at a temporary directory with no map open yet; returns the flag file path."""
+    path = tmp_path / "cancel_flag.bin"
+    monkeypatch.setattr(sync_status, "_CANCEL_FILE", str(tmp_path / "cancel_requests.json"))
+    monkeypatch.setattr(sync_status, "_CANCEL_FLAG_FILE", str(path))
+    monkeypatch.setattr(sync_status, "_cancel_map", None)
+    monkeypatch.setattr(sync_status, "_cancel_event", threading.Event())
+    monkeypatch.setattr(sync_status, "_active_session_id", None)
+    monkeypatch.setattr(sync_status.get_sync_tracker(), "is_cancellation_requested", lambda: False)
+    return path
+
+
+def test_cancel_applies_to_its_own_session(flag):
+    sync_status.set_cancel_request("sync-1")
+
+    assert sync_status.is_cancellation_pending("sync-1")
+    assert not sync_status.is_cancellation_pending("sync-10")
+    assert not sync_status.is_cancellation_pending()
+    assert sync_status.is_cancel_requested_persisted("sync-1")
+
+    sync_status.clear_cancel_request("sync-1")
+    assert not sync_status.is_cancellation_pending("sync-1")
+    assert not sync_status.is_cancel_requested_persisted("sync-1")
+
+
+def test_checks_without_a_session_use_the_active_sync(flag):
+    sync_status.set_active_sync_session("sync-1")
+    assert not sync_status.is_cancellation_pending()
+
+    sync_status.set_cancel_request("sync-1")
+    assert sync_status.is_cancellation_pending()
+
+    sync_status.set_active_sync_session(None)
+    assert not sync_status.is_cancellation_pending()
+
+
+def test_cancel_from_another_process_is_seen(flag):
+    child = (
+        "from list_sync.utils import sync_status\n"
+        f"sync_status._CANCEL_FILE = {str(flag.with_name('cancel_requests.json'))!r}\n"
+        f"sync_status._CANCEL_FLAG_FILE = {str(flag)!r}\n"
+        "sync_status.set_cancel_request('sync-1')\n"
+    )
+    sync_status.set_active_sync_session("sync-1")
+    assert not sync_status.is_cancellation_pending()
+
+    subprocess.run([sys.executable, "-c", child], check=True, timeout=60)
+
+    # Nothing was signalled in this process: the check reads the shared mapping
+    assert not sync_status._cancel_event.is_set()
+    assert sync_status.is_cancellation_pending()
+
+
+def test_waits_wake_up_when_the_sync_is_cancelled(flag):
+    sync_status.set_active_sync_session("sync-1")
+    timer = threading.Timer(0.05, sync_status.set_cancel_request, args=("sync-1",))
+    timer.start()
+    started = time.monotonic()
+
+    assert sync_status.wait_for_cancellation(30)
+    assert time.monotonic() - started < 5
+    timer.join()
+
+
+def test_waits_run_out_when_nothing_is_cancelled(flag):
+    sync_status.set_active_sync_session("sync-1")
+    sync_status.set_cancel_request("sync-2")
+
+    assert not sync_status.wait_for_cancellation(0.05)
+
+
+def test_unmappable_flag_falls_back_to_the_request_file(flag, monkeypatch):
+    monkeypatch.setattr(sync_status, "_CANCEL_FLAG_FILE", str(flag.parent))
+
+    sync_status.set_cancel_request("sync-1")
+
+    assert sync_status._cancel_flag_map() is None
+    assert sync_status.is_cancellation_pending("sync-1")
@@ -0,0 +1,130 @@
+"""Tests for the bounded worker-pool mode of sync_media_to_overseerr (LISTSYNC_MAX_WORKERS)."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from list_sync import main
+
+STATUSES = ["requested", "already_available", "already_requested", "not_found", "skipped"]
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture()
+def worker(monkeypatch):
+    """Replace item processing with a fake that finishes later items first; returns its call stats."""
+    stats = {"active": 0, "peak": 0, "started": [], "cancel_after": None, "fail": set(), "delay": 0.002}
+    lock = threading.Lock()
+
+    def process_media_item(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        number = item["number"]
+        with lock:
+            stats["active"] += 1
+            stats["peak"] = max(stats["peak"], stats["active"])
+            stats["started"].append(number)
+        try:
+            logging.info("work %s begins", number)
+            time.sleep(stats["delay"] * (number % 4))
+            logging.info("work %s ends", number)
+            if number in stats["fail"]:
+                raise RuntimeError("item failed")
+            return {"title": item["title"], "status": STATUSES[number % len(STATUSES)], "year": 2000 + number,
+                    "media_type": "movie"}
+        finally:
+            with lock:
+                stats["active"] -= 1
+
+    def check_cancellation_requested(session_id=None):
+        return stats["cancel_after"] is not None and len(stats["started"]) >= stats["cancel_after"]
+
+    monkeypatch.setattr(main, "process_media_item", process_media_item)
+    monkeypatch.setattr(main, "check_cancellation_requested", check_cancellation_requested)
+    monkeypatch.setattr(main, "handle_cancellation", lambda tracker, session_id=None: None)
+    monkeypatch.setattr(main, "_prepare_overseerr_client", lambda client, dry_run: None)
+    monkeypatch.setenv("LISTSYNC_SHARD_PROCESSES", "1")
+    return stats
+
+
+@pytest.fixture()
+def root_messages():
+    """Messages written by the root logger's handlers."""
+    handler = _Collect()
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(handler)
+    yield handler.messages
+    root_logger.removeHandler(handler)
+    root_logger.setLevel(previous_level)
+
+
+def _items(count):
+    return [{"title": f"Movie {number}", "number": number} for number in range(1, count + 1)]
+
+
+def _sync(monkeypatch, items, **env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return main.sync_media_to_overseerr(items, overseerr_client=None)
+
+
+@pytest.mark.usefixtures("db")
+def test_worker_pool_matches_sequential_results(monkeypatch, worker):
+    items = _items(30)
+    worker["fail"] = {7}
+
+    sequential = _sync(monkeypatch, items, LISTSYNC_SEQUENTIAL_MODE="true")
+    concurrent = _sync(monkeypatch, items, LISTSYNC_SEQUENTIAL_MODE="false", LISTSYNC_MAX_WORKERS="4")
+
+    assert concurrent.results == sequential.results
+    assert concurrent.results["error"] == 1
+    assert concurrent.total_items == 30
+    assert concurrent.media_type_counts["movie"] == sum(concurrent.results.values()) - 1
+    assert not concurrent.cancelled
+
+
+@pytest.mark.usefixtures("db")
+def test_worker_pool_is_bounded(monkeypatch, worker):
+    worker["delay"] = 0.01
+
+    _sync(monkeypatch, _items(40), LISTSYNC_MAX_WORKERS="3")
+
+    assert 1 < worker["peak"] <= 3
+    assert sorted(worker["started"]) == list(range(1, 41))
+
+
+@pytest.mark.usefixtures("db")
+def test_item_logs_are_replayed_in_item_order(monkeypatch, worker, root_messages):
+    _sync(monkeypatch, _items(20), LISTSYNC_MAX_WORKERS="4")
+
+    work = [message for message in root_messages if message.startswith("work ")]
+    expected = []
+    for number in range(1, 21):
+        expected += [f"work {number} begins", f"work {number} ends"]
+    assert work == expected
+    # Each item's block is contiguous: its header, its own records, then its completion line
+    header = root_messages.index("🎬 PROCESSING ITEM 5/20")
+    assert root_messages[header + 2:header + 4] == ["work 5 begins", "work 5 ends"]
+    assert root_messages[header + 5].startswith("✅ COMPLETED ITEM 5/20")
+
+
+@pytest.mark.usefixtures("db")
+def test_cancellation_stops_new_items(monkeypatch, worker):
+    worker["cancel_after"] = 5
+
+    results = _sync(monkeypatch, _items(50), LISTSYNC_MAX_WORKERS="2")
+
+    assert results.cancelled
+    # Items already in flight finish; nothing new starts once the cancellation is seen
+    assert len(worker["started"]) <= 5 + 2 * 2
+    assert sum(results.results.values()) == len(worker["started"])
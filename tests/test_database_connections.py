@@ -0,0 +1,109 @@
+"""Tests for the pooled per-thread database connections."""
+
+import threading
+
+import pytest
+
+from list_sync import database
+
+
+def _count(table="lists"):
+    with database.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _add_list(conn, list_id):
+    conn.execute("INSERT INTO lists (list_type, list_id) VALUES ('imdb', ?)", (list_id,))
+
+
+@pytest.mark.usefixtures("db")
+def test_connection_is_pooled_per_thread_in_wal_mode():
+    first = database.get_connection()
+    second = database.get_connection()
+    assert first._conn is second._conn
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(database.get_connection()._conn))
+    thread.start()
+    thread.join()
+    assert other[0] is not first._conn
+
+
+@pytest.mark.usefixtures("db")
+def test_row_factory_applies_to_its_checkout_only():
+    with database.get_connection() as outer:
+        outer.row_factory = database.sqlite3.Row
+        with database.get_connection() as inner:
+            assert isinstance(inner.execute("SELECT 1 AS one").fetchone(), tuple)
+        assert outer.execute("SELECT 1 AS one").fetchone()["one"] == 1
+
+
+@pytest.mark.usefixtures("db")
+def test_inner_exception_keeps_outer_transaction():
+    with database.get_connection() as outer:
+        _add_list(outer, "outer")
+        with pytest.raises(RuntimeError), database.get_connection() as inner:
+            _add_list(inner, "inner")
+            raise RuntimeError("inner failure")
+        assert outer.in_transaction
+        assert [row[0] for row in outer.execute("SELECT list_id FROM lists")] == ["outer"]
+
+    assert _count() == 1
+
+
+@pytest.mark.usefixtures("db")
+def test_inner_commit_and_close_leave_outer_transaction_to_the_outer_checkout():
+    outer = database.get_connection()
+    _add_list(outer, "outer")
+
+    inner = database.get_connection()
+    _add_list(inner, "inner")
+    inner.commit()
+    _add_list(inner, "discarded")
+    inner.close()
+
+    # Nothing is committed until the outer checkout commits, and the inner close() only undid its own work
+    assert outer.in_transaction
+    assert sorted(row[0] for row in outer.execute("SELECT list_id FROM lists")) == ["inner", "outer"]
+    outer.rollback()
+    outer.close()
+    assert _count() == 0
+
+
+@pytest.mark.usefixtures("db")
+def test_helper_commit_inside_outer_transaction_is_part_of_it():
+    with database.get_connection() as outer:
+        _add_list(outer, "outer")
+        database.configure_sync_interval(6)
+        assert outer.in_transaction
+        outer.rollback()
+
+    # The helper's commit did not commit the outer checkout's changes, so both were rolled back
+    assert _count() == 0
+    assert _count("sync_interval") == 0
+
+
+@pytest.mark.usefixtures("db")
+def test_checkout_without_transaction_commits_on_its_own():
+    reader = database.get_connection()
+    reader.execute("SELECT COUNT(*) FROM lists").fetchone()
+
+    with database.get_connection() as writer:
+        _add_list(writer, "written")
+
+    assert not reader.in_transaction
+    reader.close()
+    assert _count() == 1
+
+
+@pytest.mark.usefixtures("db")
+def test_dropped_checkout_is_released():
+    def leak():
+        conn = database.get_connection()
+        conn.execute("SELECT 1").fetchone()
+
+    leak()
+    with database.get_connection() as conn:
+        assert conn._entry.checkouts == 1
+        assert conn._savepoint is None
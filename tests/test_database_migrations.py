@@ -0,0 +1,266 @@
+"""Tests for the user_version schema migrations, run against databases from before them."""
+
+import logging
+import sqlite3
+import sys
+
+import pytest
+
+from list_sync import database
+
+# The tables a database had before schema migrations were tracked, with the long-gone simkl_id column
+BASELINE_SCHEMA = """
+    CREATE TABLE lists (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        list_type TEXT NOT NULL,
+        list_id TEXT NOT NULL,
+        list_url TEXT,
+        UNIQUE(list_type, list_id)
+    );
+    CREATE TABLE synced_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        media_type TEXT NOT NULL,
+        imdb_id TEXT,
+        overseerr_id INTEGER,
+        status TEXT,
+        last_synced TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        simkl_id TEXT,
+        year INTEGER,
+        tmdb_id TEXT
+    );
+    CREATE TABLE item_lists (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_id INTEGER NOT NULL,
+        list_type TEXT NOT NULL,
+        list_id TEXT NOT NULL,
+        synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(item_id, list_type, list_id)
+    );
+    CREATE TABLE list_changes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_id INTEGER NOT NULL,
+        list_type TEXT NOT NULL,
+        list_id TEXT NOT NULL,
+        change_type TEXT NOT NULL,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        title TEXT,
+        year INTEGER,
+        tmdb_id TEXT
+    );
+"""
+
+
+def _create_baseline(path, items=(), links=(), lists=()):
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany("INSERT INTO lists (list_type, list_id) VALUES (?, ?)", lists)
+    conn.executemany(
+        "INSERT INTO synced_items (id, title, media_type, imdb_id, overseerr_id, status, tmdb_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", items)
+    conn.executemany("INSERT INTO item_lists (item_id, list_type, list_id) VALUES (?, ?, ?)", links)
+    conn.commit()
+    conn.close()
+
+
+def _query(path, sql, params=()):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def _index_names(path):
+    return {name for (name,) in _query(path, "SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def test_fresh_database_is_at_current_schema_version(db_file):
+    database.init_database()
+
+    assert _query(db_file, "PRAGMA user_version")[0][0] == database.SCHEMA_VERSION
+    assert "idx_synced_items_unique_media_type_overseerr_id" in _index_names(db_file)
+    assert _query(db_file, "SELECT COUNT(*) FROM deduplicated_items") == [(0,)]
+
+
+def test_upgrade_from_baseline_database(db_file):
+    _create_baseline(db_file, items=[
+        (1, "Heat", "movie", "tt0113277", 949, "requested", "949"),
+        (2, "Heat", "movie", "tt0113277", None, "not_found", None),
+    ], links=[(1, "imdb", "ls1"), (2, "imdb", "ls2")])
+
+    database.init_database()
+
+    assert _query(db_file, "PRAGMA user_version")[0][0] == database.SCHEMA_VERSION
+    columns = {row[1] for row in _query(db_file, "PRAGMA table_info(synced_items)")}
+    assert "simkl_id" not in columns
+    assert {"next_check_at", "source_list_type"} <= columns
+    assert {"idx_synced_items_imdb_id", "idx_synced_items_unique_imdb_id",
+            "idx_synced_items_unique_media_type_tmdb_id"} <= _index_names(db_file)
+    # The duplicate was folded into the lowest ID, links included
+    assert _query(db_file, "SELECT id FROM synced_items") == [(1,)]
+    assert _query(db_file, "SELECT item_id, list_id FROM item_lists ORDER BY list_id") == [(1, "ls1"), (1, "ls2")]
+    assert _query(db_file, "SELECT item_id, status FROM deduplicated_items") == [(1, "requested")]
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture()
+def warnings():
+    """Warnings logged through the root logger."""
+    handler = _Collect()
+    handler.setLevel(logging.WARNING)
+    logging.getLogger().addHandler(handler)
+    yield handler.messages
+    logging.getLogger().removeHandler(handler)
+
+
+def test_migration_keeps_what_the_merged_rows_held(db_file, warnings):
+    _create_baseline(db_file, items=[
+        (1, "Heat", "movie", "tt0113277", None, "not_found", None),
+        (2, "Heat", "movie", "tt0113277", 949, "requested", "949"),
+    ], links=[(1, "imdb", "a"), (2, "imdb", "a"), (2, "trakt", "b")])
+    conn = sqlite3.connect(db_file)
+    conn.execute("INSERT INTO list_changes (item_id, list_type, list_id, change_type) "
+                 "VALUES (2, 'trakt', 'b', 'added')")
+    conn.commit()
+    conn.close()
+
+    database.init_database()
+
+    # The kept row took over the IDs it lacked; links and history moved to it
+    assert _query(db_file, "SELECT id, imdb_id, overseerr_id, tmdb_id FROM synced_items") == [
+        (1, "tt0113277", 949, "949")]
+    assert _query(db_file, "SELECT item_id, list_id FROM item_lists ORDER BY list_id") == [(1, "a"), (1, "b")]
+    assert _query(db_file, "SELECT item_id, list_id, change_type FROM list_changes") == [(1, "b", "added")]
+    assert _query(db_file, "SELECT id, merged_into, overseerr_id, status FROM merged_synced_items") == [
+        (2, 1, 949, "requested")]
+    assert "⚠️ Merged synced items [2] into 1: they share imdb_id tt0113277" in warnings
+
+
+def test_migration_takes_over_tmdb_ids_only_within_a_media_type(db_file):
+    _create_baseline(db_file, items=[
+        (1, "Dune", "movie", "tt1160419", None, "not_found", None),
+        (2, "Dune", "tv", "tt1160419", 438631, "requested", "438631"),
+    ])
+
+    database.init_database()
+
+    assert _query(db_file, "SELECT id, media_type, overseerr_id, tmdb_id FROM synced_items") == [
+        (1, "movie", None, None)]
+    assert _query(db_file, "SELECT id, merged_into, media_type FROM merged_synced_items") == [(2, 1, "tv")]
+
+
+def test_movie_and_show_sharing_a_tmdb_id_survive_the_migration(db_file):
+    _create_baseline(db_file, items=[
+        (1, "Dune", "movie", "tt1160419", 438631, "requested", "438631"),
+        (2, "Some Show", "tv", None, 438631, "requested", "438631"),
+        (3, "Dune", "movie", None, 438631, "already_requested", "438631"),
+    ], links=[(1, "trakt", "a"), (2, "trakt", "b"), (3, "trakt", "c")])
+
+    database.init_database()
+
+    assert _query(db_file, "SELECT id, media_type FROM synced_items ORDER BY id") == [(1, "movie"), (2, "tv")]
+    assert _query(db_file, "SELECT item_id, list_id FROM item_lists ORDER BY list_id") == [
+        (1, "a"), (2, "b"), (1, "c")]
+
+
+def test_untyped_identity_indexes_are_replaced(db_file):
+    database.init_database()
+    conn = sqlite3.connect(db_file)
+    for column in database._TYPED_IDENTITIES:
+        conn.execute(f"DROP INDEX {database._unique_identity_index(column)}")
+        conn.execute(f"CREATE UNIQUE INDEX idx_synced_items_unique_{column} ON synced_items({column}) "
+                     f"WHERE {database._IDENTITY_CONDITIONS[column]}")
+    conn.execute("PRAGMA user_version = 4")
+    conn.commit()
+    conn.close()
+
+    database.run_migrations()
+
+    names = _index_names(db_file)
+    assert "idx_synced_items_unique_overseerr_id" not in names
+    assert "idx_synced_items_unique_tmdb_id" not in names
+    assert "idx_synced_items_unique_media_type_overseerr_id" in names
+    database.save_sync_result("Dune", "movie", None, 438631, "requested", tmdb_id="438631")
+    database.save_sync_result("Some Show", "tv", None, 438631, "requested", tmdb_id="438631")
+    assert _query(db_file, "SELECT COUNT(*) FROM synced_items") == [(2,)]
+
+
+@pytest.mark.parametrize("write_behind", ["true", "false"])
+def test_save_sync_result_matches_tmdb_ids_within_a_media_type(db, monkeypatch, write_behind):
+    monkeypatch.setenv("LISTSYNC_WRITE_BEHIND", write_behind)
+    with db.buffered_sync_results():
+        db.save_sync_result("Dune", "movie", None, 438631, "requested", tmdb_id="438631",
+                            list_type="trakt", list_id="a")
+        db.save_sync_result("Some Show", "tv", None, 438631, "requested", tmdb_id="438631",
+                            list_type="trakt", list_id="b")
+        db.save_sync_result("Dune", "movie", "tt1160419", 438631, "available", tmdb_id="438631",
+                            list_type="trakt", list_id="c")
+
+    rows = _query(db.DB_FILE, "SELECT id, title, media_type, imdb_id, status FROM synced_items ORDER BY id")
+    assert rows == [(1, "Dune", "movie", "tt1160419", "available"), (2, "Some Show", "tv", None, "requested")]
+    assert _query(db.DB_FILE, "SELECT item_id, list_id FROM item_lists ORDER BY list_id") == [
+        (1, "a"), (2, "b"), (1, "c")]
+
+
+def test_item_changing_media_type_merges_into_the_item_holding_its_tmdb_id(db):
+    db.save_sync_result("Dune", "movie", "tt1160419", 438631, "requested", tmdb_id="438631")
+    db.save_sync_result("Dune", "tv", None, 438631, "already_requested", tmdb_id="438631")
+    # Matched by IMDb ID and re-typed; its TMDB IDs now name the TV item, which it absorbs
+    db.save_sync_result("Dune", "tv", "tt1160419", None, "skipped")
+
+    assert _query(db.DB_FILE, "SELECT id, media_type, imdb_id, overseerr_id FROM synced_items") == [
+        (1, "tv", "tt1160419", 438631)]
+
+
+def test_save_sync_result_merges_items_that_turn_out_to_be_the_same(db):
+    db.save_sync_result("Heat", "movie", "tt0113277", None, "not_found", list_type="imdb", list_id="a")
+    db.save_sync_result("Heat", "movie", None, 949, "requested", tmdb_id="949", list_type="trakt", list_id="b")
+    db.save_sync_result("Heat", "movie", "tt0113277", 949, "requested", tmdb_id="949", list_type="imdb", list_id="a")
+
+    # Matched by overseerr_id first; the row holding the IMDb ID is merged into it
+    assert _query(db.DB_FILE, "SELECT id, imdb_id, overseerr_id FROM synced_items") == [(2, "tt0113277", 949)]
+    assert _query(db.DB_FILE, "SELECT item_id, list_id FROM item_lists ORDER BY list_id") == [(2, "a"), (2, "b")]
+    assert _query(db.DB_FILE, "SELECT id, merged_into, imdb_id, status FROM merged_synced_items") == [
+        (1, 2, "tt0113277", "not_found")]
+
+
+@pytest.fixture()
+def _without_seleniumbase(monkeypatch):
+    """Make the optional browser dependency unimportable, as in an API-only install."""
+    monkeypatch.setitem(sys.modules, "seleniumbase", None)
+    monkeypatch.delitem(sys.modules, "list_sync.utils.helpers", raising=False)
+
+
+@pytest.mark.usefixtures("_without_seleniumbase")
+def test_upgrade_without_browser_dependencies_backfills_list_urls(db_file):
+    _create_baseline(db_file, lists=[("imdb", "ls012345678")])
+
+    database.init_database()
+
+    assert _query(db_file, "PRAGMA user_version")[0][0] == database.SCHEMA_VERSION
+    assert _query(db_file, "SELECT list_url FROM lists") == [("https://www.imdb.com/list/ls012345678",)]
+
+
+@pytest.mark.parametrize("baseline", [True, False], ids=["upgraded", "fresh"])
+def test_migrations_complete_when_list_urls_cannot_be_built(db_file, monkeypatch, baseline):
+    if baseline:
+        _create_baseline(db_file, items=[(1, "Heat", "movie", "tt0113277", 949, "requested", "949")],
+                         lists=[("imdb", "ls012345678")])
+    monkeypatch.setitem(sys.modules, "list_sync.utils.helpers", None)
+
+    database.init_database()
+
+    assert _query(db_file, "PRAGMA user_version")[0][0] == database.SCHEMA_VERSION
+    assert "simkl_id" not in {row[1] for row in _query(db_file, "PRAGMA table_info(synced_items)")}
+    assert _query(db_file, "SELECT COUNT(*) FROM deduplicated_items") == [(1 if baseline else 0,)]
+    if baseline:
+        assert _query(db_file, "SELECT list_url FROM lists") == [(None,)]
@@ -0,0 +1,127 @@
+"""The trigger-maintained deduplicated_items table against the dashboard's original de-duplication."""
+
+import random
+
+import pytest
+
+STATUSES = ["requested", "already_requested", "already_available", "available", "not_found", "error", "skipped",
+            "unknown"]
+TIMES = ["2025-01-01 10:00:00", "2025-01-02 10:00:00", "2025-01-03 10:00:00"]
+
+ITEM_COLUMNS = ("id, title, media_type, year, imdb_id, overseerr_id, status, last_synced, source_list_type, "
+                "source_list_id")
+
+
+def python_dedup(rows):
+    """The API server's de-duplication before it moved into the database, kept as the reference."""
+    status_priority = {
+        "requested": 100,
+        "already_requested": 90,
+        "already_available": 80,
+        "available": 70,
+        "not_found": 20,
+        "error": 10,
+        "skipped": 5,
+    }
+    unique_items = {}
+    for item in rows:
+        _, title, media_type, _, _, overseerr_id, status, last_synced, _, _ = item
+        key = f"{title}_{media_type}".lower().strip()
+        if key not in unique_items:
+            unique_items[key] = item
+            continue
+        existing = unique_items[key]
+        current_priority = status_priority.get(status, 0)
+        existing_priority = status_priority.get(existing[6], 0)
+        # Prefer the higher status, then the row matched in Overseerr, then the more recent one
+        tie = current_priority == existing_priority
+        if current_priority > existing_priority or (tie and overseerr_id and not existing[5]) or (
+                tie and bool(overseerr_id) == bool(existing[5]) and last_synced > existing[7]):
+            unique_items[key] = item
+    return unique_items.values()
+
+
+def _random_rows(rng, count, first_id=1):
+    for item_id in range(first_id, first_id + count):
+        title = rng.choice(["Heat", "heat", " Heat ", "Alien", "ALIEN", "Up"])
+        overseerr_id = rng.choice([None, 0, 1000 + item_id])
+        yield (item_id, title, rng.choice(["movie", "tv"]), rng.choice(STATUSES), overseerr_id, rng.choice(TIMES),
+               rng.choice(["trakt", "letterboxd"]), rng.choice(["a", "b"]))
+
+
+def _insert(conn, rows):
+    conn.executemany(
+        "INSERT INTO synced_items (id, title, media_type, status, overseerr_id, last_synced, source_list_type, "
+        "source_list_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def _assert_parity(db):
+    with db.get_connection() as conn:
+        rows = conn.execute(f"SELECT {ITEM_COLUMNS} FROM synced_items ORDER BY id").fetchall()
+    expected = sorted(python_dedup(rows))
+
+    assert sorted(db.get_deduplicated_items()) == expected
+    assert db.count_deduplicated_items() == len(expected)
+    counts = {}
+    for row in expected:
+        counts[row[6]] = counts.get(row[6], 0) + 1
+    assert db.get_deduplicated_status_counts() == counts
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_triggers_match_python_dedup(db, seed):
+    rng = random.Random(seed)
+    with db.get_connection() as conn:
+        _insert(conn, _random_rows(rng, 60))
+        conn.commit()
+    _assert_parity(db)
+
+    with db.get_connection() as conn:
+        for item_id in rng.sample(range(1, 61), 20):
+            conn.execute("UPDATE synced_items SET status = ?, last_synced = ? WHERE id = ?",
+                         (rng.choice(STATUSES), rng.choice(TIMES), item_id))
+        conn.executemany("DELETE FROM synced_items WHERE id = ?", [(i,) for i in rng.sample(range(1, 61), 10)])
+        conn.execute("UPDATE synced_items SET title = 'Up', media_type = 'movie' WHERE id IN (SELECT id FROM "
+                     "synced_items ORDER BY id LIMIT 3)")
+        conn.commit()
+    _assert_parity(db)
+
+
+def test_migration_fills_table_from_existing_rows(db):
+    rng = random.Random(42)
+    with db.get_connection() as conn:
+        conn.execute("DROP TRIGGER synced_items_dedup_insert")
+        _insert(conn, _random_rows(rng, 40))
+        conn.execute("DROP TABLE deduplicated_items")
+        db._add_deduplicated_items(conn.cursor())
+        conn.commit()
+    _assert_parity(db)
+
+
+def test_list_filter_and_paging(db):
+    with db.get_connection() as conn:
+        _insert(conn, [
+            (1, "Heat", "movie", "requested", 1, TIMES[0], "trakt", "a"),
+            (2, "Heat", "movie", "skipped", None, TIMES[2], "trakt", "b"),
+            (3, "Alien", "movie", "not_found", None, TIMES[1], "trakt", "b"),
+            (4, "Up", "movie", "available", 2, None, "letterboxd", "a"),
+        ])
+        conn.commit()
+
+    assert [row[0] for row in db.get_deduplicated_items()] == [3, 1, 4]
+    assert [row[0] for row in db.get_deduplicated_items(limit=2, offset=1)] == [1, 4]
+    assert [row[0] for row in db.get_deduplicated_items(list_type="trakt", list_ids=["b"])] == [3]
+    assert db.count_deduplicated_items("trakt", ["a", "b"]) == 2
+
+
+def test_reads_without_deduplicated_items_table(db):
+    with db.get_connection() as conn:
+        _insert(conn, _random_rows(random.Random(7), 40))
+        expected = conn.execute("SELECT * FROM deduplicated_items").fetchall()
+        conn.execute("DROP TABLE deduplicated_items")
+        conn.commit()
+
+    _assert_parity(db)
+    filtered = db.get_deduplicated_items(list_type="trakt", list_ids=["a"])
+    assert db.count_deduplicated_items("trakt", ["a"]) == len(filtered)
+    assert len(db.get_deduplicated_items(limit=5)) == min(5, len(expected))
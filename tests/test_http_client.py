@@ -0,0 +1,121 @@
+"""Tests for the shared pooled HTTP transport and its retry policy."""
+
+import io
+
+import pytest
+import requests
+
+from list_sync.utils import http_client
+
+URL = "http://overseerr.test/api/v1/status"
+
+
+def _response(status_code, **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO()
+    response.headers.update(headers)
+    return response
+
+
+class _Session:
+    """Stands in for a pooled session: hands out scripted responses (or raises scripted errors)."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(http_client.time, "sleep", delays.append)
+    monkeypatch.setenv("LISTSYNC_HTTP_BACKOFF_BASE", "1")
+    return delays
+
+
+@pytest.fixture()
+def session(monkeypatch):
+    def install(*outcomes):
+        fake = _Session(outcomes)
+        monkeypatch.setattr(http_client, "get_session", lambda url: fake)
+        return fake
+    return install
+
+
+def test_sessions_are_pooled_per_host():
+    try:
+        first = http_client.get_session("https://api.trakt.tv/users/me")
+        assert http_client.get_session("https://API.trakt.tv/lists/1") is first
+        assert http_client.get_session("https://api.themoviedb.org/3/movie/1") is not first
+    finally:
+        http_client.close_sessions()
+    assert http_client.get_session("https://api.trakt.tv/users/me") is not first
+    http_client.close_sessions()
+
+
+def test_server_errors_are_retried_with_backoff(session, sleeps):
+    fake = session(_response(503), _response(502), _response(200))
+
+    assert http_client.get(URL).status_code == 200
+    assert len(fake.calls) == 3
+    assert len(sleeps) == 2
+    assert all(0 <= delay <= 2 ** attempt for attempt, delay in enumerate(sleeps, 1))
+
+
+def test_retry_after_is_honoured(session, sleeps, monkeypatch):
+    monkeypatch.setattr(http_client.random, "uniform", lambda low, high: 0)
+    session(_response(429, **{"Retry-After": "7"}), _response(200))
+
+    assert http_client.get(URL).status_code == 200
+    assert sleeps == [7]
+
+
+def test_last_response_is_returned_when_retries_run_out(session, sleeps, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_HTTP_MAX_RETRIES", "2")
+    fake = session(*[_response(500)] * 3)
+
+    assert http_client.get(URL).status_code == 500
+    assert len(fake.calls) == 3
+
+
+def test_posts_are_only_retried_when_rate_limited(session, sleeps):
+    fake = session(_response(503))
+    assert http_client.post(URL).status_code == 503
+    assert len(fake.calls) == 1
+
+    fake = session(_response(429), _response(201))
+    assert http_client.post(URL).status_code == 201
+    assert len(fake.calls) == 2
+
+
+def test_connection_errors_are_retried_for_idempotent_requests(session, sleeps):
+    session(requests.ConnectionError("reset"), _response(200))
+    assert http_client.get(URL).status_code == 200
+
+    session(requests.ConnectionError("reset"))
+    with pytest.raises(requests.ConnectionError):
+        http_client.post(URL)
+
+    session(requests.ConnectTimeout("connect timeout"), _response(200))
+    assert http_client.post(URL).status_code == 200
+
+
+def test_timeouts_default_and_per_host_overrides(session, sleeps, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_HTTP_TIMEOUT", "12")
+    fake = session(_response(200), _response(200), _response(200))
+
+    http_client.get(URL)
+    http_client.get(URL, timeout=5)
+    monkeypatch.setenv("LISTSYNC_HTTP_TIMEOUTS", "api.trakt.tv=15, overseerr.test=3")
+    http_client.get(URL, timeout=5)
+
+    assert [kwargs["timeout"] for _, kwargs in fake.calls] == [12, 5, 3]
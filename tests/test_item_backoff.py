@@ -0,0 +1,93 @@
+"""Tests for the exponential failure backoff of items that keep failing."""
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+HEAT = {"imdb_id": "tt0113277", "title": "Heat", "year": 1995, "media_type": "movie"}
+
+
+def _skips_until_retry(db, **ids):
+    """Syncs that skip the item before it is searched again."""
+    skipped = 0
+    while (db.check_item_backoff(**ids) or {}).get("skip"):
+        skipped += 1
+    return skipped
+
+
+def test_failures_skip_exponentially_more_syncs(db):
+    skips = []
+    for _ in range(4):
+        skips.append(db.record_item_failure("not_found", **HEAT))
+        assert _skips_until_retry(db, **HEAT) == skips[-1]
+
+    assert skips == [1, 2, 4, 8]
+
+
+def test_skips_are_capped(db, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_BACKOFF_MAX_SKIP", "3")
+
+    skips = [db.record_item_failure("error", **HEAT) for _ in range(5)]
+
+    assert skips == [1, 2, 3, 3, 3]
+
+
+def test_items_are_keyed_by_their_list_ids(db):
+    db.record_item_failure("not_found", tmdb_id=949, media_type="movie", title="Heat")
+
+    assert db.check_item_backoff(tmdb_id="949", media_type="movie")["skip"]
+    assert db.check_item_backoff(tmdb_id=949, media_type="tv") is None
+    assert db.check_item_backoff(title="Heat", media_type="movie") is None
+
+
+def test_clear_and_reset(db):
+    db.record_item_failure("not_found", **HEAT)
+    db.record_item_failure("error", imdb_id="tt0078748")
+
+    assert db.reset_item_backoff(status="error") == 1
+    assert not db.check_item_backoff(imdb_id="tt0078748")["skip"]
+    assert db.clear_item_backoff(**HEAT)
+    assert db.check_item_backoff(**HEAT) is None
+    assert not db.clear_item_backoff(**HEAT)
+
+
+@pytest.fixture()
+def matcher(monkeypatch):
+    """Replace matching and requesting; returns the statuses to hand out, in order, and the call log."""
+    state = {"statuses": [], "calls": 0}
+
+    def match(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        state["calls"] += 1
+        return {"title": item["title"], "status": state["statuses"].pop(0), "year": item["year"],
+                "media_type": item["media_type"]}
+
+    monkeypatch.setattr(main, "_match_and_request_media_item", match)
+    return state
+
+
+def _sync_heat():
+    item = MediaItem.from_dict(HEAT)
+    item.set_source_list("imdb", "ls1")
+    return main.process_media_item(item, overseerr_client=None, dry_run=False)
+
+
+def test_sync_skips_backed_off_items_until_they_are_due(db, matcher):
+    matcher["statuses"] = ["not_found", "not_found", "requested"]
+
+    assert _sync_heat()["status"] == "not_found"
+    skipped = _sync_heat()
+    assert (skipped["status"], skipped["backoff_status"]) == ("skipped", "not_found")
+    assert matcher["calls"] == 1
+    # The skipped item keeps its list link, with its last failure status
+    with db.get_connection() as conn:
+        assert conn.execute(
+            "SELECT s.status, il.list_id FROM synced_items s JOIN item_lists il ON il.item_id = s.id "
+            "WHERE s.imdb_id = ?", (HEAT["imdb_id"],)).fetchall() == [("not_found", "ls1")]
+
+    assert _sync_heat()["status"] == "not_found"
+    assert [_sync_heat()["status"] for _ in range(2)] == ["skipped", "skipped"]
+    assert _sync_heat()["status"] == "requested"
+    assert matcher["calls"] == 3
+    # Success clears the history
+    assert db.check_item_backoff(**HEAT) is None
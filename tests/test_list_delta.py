@@ -0,0 +1,87 @@
+"""Tests for delta syncing a list against the items it linked to at its previous sync."""
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+LIST = {"type": "trakt", "id": "favorites"}
+HEAT = {"imdb_id": "tt0113277", "tmdb_id": 949, "title": "Heat", "year": 1995, "media_type": "movie"}
+ALIEN = {"imdb_id": "tt0078748", "tmdb_id": 348, "title": "Alien", "year": 1979, "media_type": "movie"}
+UP = {"title": "Up", "year": 2009, "media_type": "movie"}
+JAWS = {"imdb_id": "tt0073195", "title": "Jaws", "year": 1975, "media_type": "movie"}
+
+
+def _link(db, item, status="already_available"):
+    db.save_sync_result(item["title"], item["media_type"], item.get("imdb_id"), item.get("tmdb_id"), status,
+                        item["year"], item.get("tmdb_id") and str(item["tmdb_id"]), LIST["type"], LIST["id"])
+
+
+def _item_id(db, title):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT id FROM synced_items WHERE title = ?", (title,)).fetchone()[0]
+
+
+def _fetched(*items):
+    return [MediaItem.from_dict(item) for item in items]
+
+
+def test_only_added_and_due_items_are_processed(db):
+    for item in (HEAT, ALIEN, JAWS):
+        _link(db, item)
+    db.reset_revalidation_schedule()
+    _link(db, HEAT)
+    synced_list = dict(LIST)
+
+    # Heat is scheduled, Alien is due, Up is new and Jaws left the list
+    to_process = main._apply_list_delta(_fetched(HEAT, ALIEN, UP), synced_list)
+
+    assert [item["title"] for item in to_process] == ["Alien", "Up"]
+    assert synced_list["delta"] == {"added": 1, "due": 1, "unchanged": 1, "removed": 1}
+    assert synced_list["removed_item_ids"] == [_item_id(db, "Jaws")]
+
+
+def test_items_are_matched_by_tmdb_id_then_title(db):
+    _link(db, HEAT)
+    _link(db, UP)
+    synced_list = dict(LIST)
+
+    # The list dropped Heat's IMDb ID and Up is matched by title, year and media type
+    to_process = main._apply_list_delta(
+        _fetched({**HEAT, "imdb_id": None}, {**UP, "title": "up"}, {**UP, "year": 2010}), synced_list)
+
+    assert [(item["title"], item["year"]) for item in to_process] == [("Up", 2010)]
+    assert synced_list["delta"]["unchanged"] == 2
+    # TMDB IDs only match within a media type
+    to_process = main._apply_list_delta(_fetched({**HEAT, "imdb_id": None, "media_type": "tv"}), dict(LIST))
+    assert len(to_process) == 1
+
+
+def test_unchanged_items_have_their_links_refreshed(db):
+    _link(db, HEAT)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE item_lists SET synced_at = datetime('now', '-7 days')")
+        conn.commit()
+
+    main._apply_list_delta(_fetched(HEAT), dict(LIST))
+
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT synced_at > datetime('now', '-1 minute') FROM item_lists").fetchone()[0]
+
+
+def test_first_sync_processes_everything(db):
+    synced_list = dict(LIST)
+
+    assert len(main._apply_list_delta(_fetched(HEAT, ALIEN), synced_list)) == 2
+    assert synced_list["delta"] == {"added": 2, "due": 0, "unchanged": 0, "removed": 0}
+
+
+def test_snapshot_errors_fall_back_to_a_full_sync(db, monkeypatch):
+    _link(db, HEAT)
+
+    def broken(list_type, list_id):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(main, "get_list_snapshot", broken)
+    synced_list = dict(LIST)
+
+    assert len(main._apply_list_delta(_fetched(HEAT, ALIEN), synced_list)) == 2
+    assert "delta" not in synced_list
@@ -0,0 +1,101 @@
+"""Tests for fetching lists concurrently with separate API and browser limits."""
+
+import threading
+import time
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+
+@pytest.fixture()
+def providers(db, monkeypatch):
+    """Fake providers; letterboxd lists count as browser-driven. Returns the state they record into."""
+    state = {"items": {}, "delay": {}, "fail": set(), "active": {}, "peak": {}, "fetched": [], "cancel_after": None}
+    lock = threading.Lock()
+
+    def get_provider(list_type):
+        def provider(list_id):
+            with lock:
+                state["fetched"].append(list_id)
+                state["active"][list_type] = state["active"].get(list_type, 0) + 1
+                state["peak"][list_type] = max(state["peak"].get(list_type, 0), state["active"][list_type])
+            try:
+                time.sleep(state["delay"].get(list_id, 0.02))
+                if list_id in state["fail"]:
+                    raise RuntimeError("list is private")
+                return [MediaItem.from_dict(item) for item in state["items"].get(list_id, [])]
+            finally:
+                with lock:
+                    state["active"][list_type] -= 1
+        return provider
+
+    def check_cancellation_requested(session_id=None):
+        return state["cancel_after"] is not None and len(state["fetched"]) >= state["cancel_after"]
+
+    monkeypatch.setattr(main, "get_provider", get_provider)
+    monkeypatch.setattr(main, "provider_uses_browser", lambda list_type: list_type == "letterboxd")
+    monkeypatch.setattr(main, "check_cancellation_requested", check_cancellation_requested)
+    return state
+
+
+def _lists(list_type, count, prefix=""):
+    return [{"type": list_type, "id": f"{prefix}{number}"} for number in range(1, count + 1)]
+
+
+def test_lists_are_combined_in_configured_order(providers):
+    heat = {"title": "Heat", "year": 1995, "media_type": "movie", "imdb_id": "tt0113277"}
+    providers["items"] = {"slow": [heat], "fast": [heat, {"title": "Up", "year": 2009, "media_type": "movie"}]}
+    providers["delay"] = {"slow": 0.1, "fast": 0}
+
+    items, synced_lists = main.fetch_media_from_lists([{"type": "trakt", "id": "slow"},
+                                                       {"type": "trakt", "id": "fast"}])
+
+    assert [synced_list["id"] for synced_list in synced_lists] == ["slow", "fast"]
+    assert [item["title"] for item in items] == ["Heat", "Up"]
+    # The canonical copy comes from the first configured list, whichever finished first
+    assert [ref.id for ref in items[0]["_source_lists"]] == ["slow", "fast"]
+
+
+def test_api_lists_are_fetched_concurrently_up_to_the_limit(providers, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_FETCH_WORKERS", "3")
+    providers["delay"] = {str(number): 0.05 for number in range(1, 10)}
+
+    _, synced_lists = main.fetch_media_from_lists(_lists("trakt", 9))
+
+    assert len(synced_lists) == 9
+    assert 1 < providers["peak"]["trakt"] <= 3
+
+
+def test_browser_lists_share_their_own_pool(providers, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_BROWSER_FETCH_WORKERS", "1")
+    providers["delay"] = {**{f"b{number}": 0.05 for number in range(1, 4)},
+                          **{f"a{number}": 0.05 for number in range(1, 4)}}
+
+    _, synced_lists = main.fetch_media_from_lists(_lists("letterboxd", 3, "b") + _lists("trakt", 3, "a"))
+
+    assert len(synced_lists) == 6
+    assert providers["peak"]["letterboxd"] == 1
+    assert providers["peak"]["trakt"] > 1
+
+
+def test_failed_list_does_not_stop_the_others(providers):
+    providers["items"] = {"2": [{"title": "Up", "year": 2009, "media_type": "movie"}]}
+    providers["fail"] = {"1"}
+
+    items, synced_lists = main.fetch_media_from_lists(_lists("trakt", 2))
+
+    assert [item["title"] for item in items] == ["Up"]
+    assert synced_lists[0]["error"] == "list is private"
+    assert "error" not in synced_lists[1]
+
+
+def test_cancellation_stops_starting_lists(providers, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_FETCH_WORKERS", "1")
+    providers["cancel_after"] = 2
+
+    _, synced_lists = main.fetch_media_from_lists(_lists("trakt", 6))
+
+    assert providers["fetched"] == ["1", "2"]
+    assert len(synced_lists) <= 2
@@ -0,0 +1,84 @@
+"""Tests for skipping lists whose content has not changed since their last completed sync."""
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+HEAT = {"imdb_id": "tt0113277", "tmdb_id": 949, "title": "Heat", "year": 1995, "media_type": "movie"}
+ALIEN = {"imdb_id": "tt0078748", "tmdb_id": 348, "title": "Alien", "year": 1979, "media_type": "movie"}
+LIST = {"type": "imdb", "id": "ls1"}
+
+
+def test_fingerprint_follows_content_and_order(db):
+    fingerprint = db.compute_list_fingerprint([HEAT, ALIEN])
+
+    assert db.compute_list_fingerprint([MediaItem.from_dict(HEAT), MediaItem.from_dict(ALIEN)]) == fingerprint
+    assert db.compute_list_fingerprint([ALIEN, HEAT]) != fingerprint
+    assert db.compute_list_fingerprint([{**HEAT, "year": 1996}, ALIEN]) != fingerprint
+    assert db.compute_list_fingerprint([HEAT]) != fingerprint
+
+
+@pytest.fixture()
+def synced_list(db):
+    """The list after a completed sync: both items already available and the fingerprint saved."""
+    db.save_list_id(LIST["id"], LIST["type"])
+    for item in (HEAT, ALIEN):
+        db.save_sync_result(item["title"], "movie", item["imdb_id"], item["tmdb_id"], "already_available",
+                            item["year"], str(item["tmdb_id"]), LIST["type"], LIST["id"])
+    fingerprint = db.compute_list_fingerprint([HEAT, ALIEN])
+    main._save_list_fingerprints([{**LIST, "fingerprint": fingerprint}])
+    return {**LIST, "fingerprint": fingerprint}
+
+
+def test_unchanged_list_is_skipped(synced_list):
+    assert main._is_list_unchanged(synced_list)
+
+
+def test_changed_or_failed_lists_are_not_skipped(db, synced_list):
+    assert not main._is_list_unchanged({**synced_list, "fingerprint": db.compute_list_fingerprint([HEAT])})
+    assert not main._is_list_unchanged({**synced_list, "error": "list is private"})
+    assert not main._is_list_unchanged({"type": "trakt", "id": "never-synced", "fingerprint": "abc"})
+
+
+def test_list_with_due_items_is_not_skipped(db, synced_list, monkeypatch):
+    db.reset_revalidation_schedule()
+    assert not main._is_list_unchanged(synced_list)
+
+    # Failures are re-evaluated once they are older than LISTSYNC_RECHECK_OTHER_HOURS
+    db.save_sync_result("Up", "movie", "tt1049413", None, "not_found", 2009, None, LIST["type"], LIST["id"])
+    db.save_sync_result("Heat", "movie", HEAT["imdb_id"], 949, "already_available", 1995, "949")
+    db.save_sync_result("Alien", "movie", ALIEN["imdb_id"], 348, "already_available", 1979, "348")
+    assert main._is_list_unchanged(synced_list)
+    monkeypatch.setenv("LISTSYNC_RECHECK_OTHER_HOURS", "0")
+    assert not main._is_list_unchanged(synced_list)
+
+
+def test_only_fully_synced_lists_save_their_fingerprint(db):
+    db.save_list_id("ls2", "imdb")
+    db.save_list_id("ls3", "imdb")
+
+    main._save_list_fingerprints([
+        {"type": "imdb", "id": "ls2", "fingerprint": "new", "unchanged": True},
+        {"type": "imdb", "id": "ls3", "fingerprint": "new", "error": "timed out"},
+    ])
+
+    assert db.get_list_fingerprint("imdb", "ls2") is None
+    assert db.get_list_fingerprint("imdb", "ls3") is None
+
+
+def test_fetch_drops_the_items_of_unchanged_lists(synced_list, monkeypatch):
+    lists = {"ls1": [HEAT, ALIEN], "ls2": [HEAT]}
+    monkeypatch.setattr(main, "get_provider",
+                        lambda list_type: lambda list_id: [MediaItem.from_dict(item) for item in lists[list_id]])
+    monkeypatch.setattr(main, "provider_uses_browser", lambda list_type: False)
+    monkeypatch.setattr(main, "check_cancellation_requested", lambda session_id=None: False)
+
+    fetched = {synced["id"]: (items, synced) for _, items, synced in
+               main.iter_fetched_lists([LIST, {"type": "imdb", "id": "ls2"}], skip_unchanged=True)}
+
+    items, synced = fetched["ls1"]
+    assert (items, synced["unchanged"], synced["item_count"]) == ([], True, 2)
+    items, synced = fetched["ls2"]
+    assert [item["title"] for item in items] == ["Heat"]
+    assert "unchanged" not in synced
@@ -0,0 +1,90 @@
+"""Tests for recording items that left a list, on delta and full fetches alike."""
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+LIST = {"type": "imdb", "id": "ls1"}
+
+
+def _item(title, imdb_id):
+    return MediaItem(title=title, year=2000, media_type="movie", imdb_id=imdb_id)
+
+
+@pytest.fixture()
+def linked_list(db):
+    """Three items linked to the list by an earlier sync; returns their IDs by title."""
+    ids = {}
+    for number, title in enumerate(("Alpha", "Beta", "Gamma"), start=1):
+        ids[title] = db.save_sync_result(title, "movie", f"tt000000{number}", number, "requested", 2000,
+                                         list_type=LIST["type"], list_id=LIST["id"])
+    return ids
+
+
+@pytest.fixture()
+def fetched(monkeypatch):
+    """Make every list fetch return these items."""
+    items = []
+
+    def fetch_list_items(list_info):
+        fetched_items = [MediaItem.from_dict(item.to_dict()) for item in items]
+        for item in fetched_items:
+            item.set_source_list(list_info["type"], list_info["id"])
+        return fetched_items, {"type": list_info["type"], "id": list_info["id"], "item_count": len(items)}
+
+    monkeypatch.setattr(main, "fetch_list_items", fetch_list_items)
+    monkeypatch.setattr(main, "check_cancellation_requested", lambda session_id=None: False)
+    return items
+
+
+def _changes(db):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT item_id, change_type FROM list_changes WHERE change_type = 'removed'").fetchall()
+
+
+def _linked_ids(db):
+    with db.get_connection() as conn:
+        return sorted(row[0] for row in conn.execute("SELECT item_id FROM item_lists"))
+
+
+@pytest.mark.parametrize("delta", [False, True], ids=["full", "delta"])
+def test_items_that_left_a_list_are_unlinked_and_recorded(db, linked_list, fetched, delta):
+    fetched.extend([_item("Alpha", "tt0000001"), _item("Gamma", "tt0000003"), _item("Delta", "tt0000004")])
+
+    _, synced_lists = main.fetch_media_from_lists([LIST], delta=delta)
+    assert synced_lists[0]["removed_item_ids"] == [linked_list["Beta"]]
+    assert _changes(db) == []
+
+    main._record_list_removals(synced_lists)
+
+    assert _changes(db) == [(linked_list["Beta"], "removed")]
+    assert _linked_ids(db) == [linked_list["Alpha"], linked_list["Gamma"]]
+
+
+def test_items_are_matched_by_title_when_ids_are_missing(db, linked_list, fetched):
+    fetched.extend([MediaItem(title="alpha", year=2000, media_type="movie"), _item("Beta", "tt0000002")])
+
+    _, synced_lists = main.fetch_media_from_lists([LIST])
+
+    assert synced_lists[0]["removed_item_ids"] == [linked_list["Gamma"]]
+
+
+def test_failed_fetch_records_no_removals(db, linked_list, monkeypatch):
+    failed = {**LIST, "item_count": 0, "error": "boom"}
+    monkeypatch.setattr(main, "fetch_list_items", lambda list_info: ([], dict(failed)))
+    monkeypatch.setattr(main, "check_cancellation_requested", lambda session_id=None: False)
+
+    _, synced_lists = main.fetch_media_from_lists([LIST])
+    main._record_list_removals(synced_lists)
+
+    assert "removed_item_ids" not in synced_lists[0]
+    assert _linked_ids(db) == sorted(linked_list.values())
+
+
+def test_detect_list_removals_keeps_current_items(db, linked_list):
+    removed = db.detect_list_removals(LIST["type"], LIST["id"], {linked_list["Alpha"]})
+
+    assert removed == 2
+    assert _linked_ids(db) == [linked_list["Alpha"]]
+    assert sorted(_changes(db)) == [(linked_list["Beta"], "removed"), (linked_list["Gamma"], "removed")]
@@ -0,0 +1,143 @@
+"""Tests for the per-list automated sync schedule."""
+
+import pytest
+
+from list_sync import config, main
+from list_sync.scheduler import SCHEDULE_GRACE_SECONDS, ListScheduler, _parse_last_synced
+
+LAST_SYNCED = "2026-01-01 00:00:00"
+HOUR = 3600
+
+
+@pytest.fixture()
+def lists(db):
+    """Three lists, all last synced at LAST_SYNCED; returns a helper to set one list's schedule."""
+    for list_type, list_id in (("trakt", "weekly"), ("imdb", "ls1"), ("trakt_special", "trending")):
+        db.save_list_id(list_id, list_type)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE lists SET last_synced = ?", (LAST_SYNCED,))
+        conn.commit()
+    return db.set_list_schedule
+
+
+def _due_ids(scheduler, hours_after_sync):
+    now = _parse_last_synced(LAST_SYNCED) + hours_after_sync * HOUR
+    return [list_info["id"] for list_info in scheduler.pop_due(now)]
+
+
+def test_lists_share_the_global_interval_by_default(lists):
+    scheduler = ListScheduler(6)
+    scheduler.refresh()
+
+    assert _due_ids(scheduler, 5) == []
+    assert scheduler.seconds_until_due(_parse_last_synced(LAST_SYNCED) + 5 * HOUR) == HOUR
+    assert _due_ids(scheduler, 6) == ["weekly", "ls1", "trending"]
+    assert scheduler.seconds_until_due() is None
+
+
+def test_per_list_and_per_type_intervals(lists, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_LIST_INTERVALS", "trakt_special=1, imdb=12")
+    lists("trakt", "weekly", interval_hours=168)
+    scheduler = ListScheduler(6)
+    scheduler.refresh()
+
+    assert _due_ids(scheduler, 1) == ["trending"]
+    assert _due_ids(scheduler, 11) == []
+    assert _due_ids(scheduler, 12) == ["ls1"]
+    assert _due_ids(scheduler, 100) == []
+    assert _due_ids(scheduler, 168) == ["weekly"]
+
+
+def test_due_lists_are_ordered_by_priority(lists):
+    lists("trakt_special", "trending", priority=5)
+    lists("imdb", "ls1", interval_hours=6)
+    lists("trakt", "weekly", interval_hours=6 + SCHEDULE_GRACE_SECONDS / HOUR + 0.1)
+    scheduler = ListScheduler(6.05)
+    scheduler.refresh()
+
+    # ls1 is due first and trending is due within the grace period, so it comes along (ahead of it)
+    assert _due_ids(scheduler, 6) == ["trending", "ls1"]
+    assert scheduler.seconds_until_due(_parse_last_synced(LAST_SYNCED) + 6 * HOUR) > SCHEDULE_GRACE_SECONDS
+
+
+def test_dispatched_lists_wait_a_full_interval(lists):
+    scheduler = ListScheduler(6)
+    scheduler.refresh()
+    due = scheduler.pop_due(_parse_last_synced(LAST_SYNCED) + 6 * HOUR)
+    scheduler.mark_dispatched(due, _parse_last_synced(LAST_SYNCED) + 6 * HOUR)
+
+    # The lists' last_synced did not move (e.g. the sync failed), they are still not retried at once
+    scheduler.refresh()
+    assert _due_ids(scheduler, 7) == []
+    assert _due_ids(scheduler, 12) == ["weekly", "ls1", "trending"]
+
+
+def test_lists_that_did_not_run_stay_due(lists):
+    scheduler = ListScheduler(6)
+    scheduler.refresh()
+    assert _due_ids(scheduler, 6) == ["weekly", "ls1", "trending"]
+
+    scheduler.refresh()
+    assert _due_ids(scheduler, 7) == ["weekly", "ls1", "trending"]
+
+
+def test_never_synced_lists_are_due_immediately(db):
+    db.save_list_id("ls9", "imdb")
+    scheduler = ListScheduler(24)
+    scheduler.refresh()
+
+    assert scheduler.seconds_until_due() == 0
+    assert [list_info["id"] for list_info in scheduler.pop_due()] == ["ls9"]
+
+
+class _StopLoop(BaseException):
+    """Ends automated_sync's loop, which only catches Exception."""
+
+
+@pytest.mark.parametrize("early_return", ["queued_job", "cancellation"])
+def test_automated_sync_reschedules_lists_only_once_they_ran(db, monkeypatch, early_return):
+    db.save_list_id("ls1", "imdb")
+    state = {"iterations": 0, "synced": [], "early_returns": 1, "wake_event": None}
+
+    def load_sync_interval():
+        # Called at the top of every loop iteration; lets the waits return at once
+        state["iterations"] += 1
+        if state["iterations"] > 3:
+            raise _StopLoop
+        state["wake_event"].set()
+        return 24
+
+    def start_wakeup_listener(wake_event):
+        state["wake_event"] = wake_event
+
+    def early(returned, otherwise):
+        # The first scheduled sync returns early, as if a job arrived or a cancellation was pending
+        if state["synced"] and state["early_returns"]:
+            state["early_returns"] -= 1
+            return returned
+        return otherwise
+
+    def run_sync(client, lists=None, **kwargs):
+        state["synced"].append(lists and [list_info["id"] for list_info in lists])
+
+    monkeypatch.setattr(main.signal, "signal", lambda signum, handler: None)
+    monkeypatch.setattr(main, "start_wakeup_listener", start_wakeup_listener)
+    monkeypatch.setattr(main, "recover_sync_jobs", lambda: None)
+    monkeypatch.setattr(main, "has_queued_sync_jobs", lambda: False)
+    monkeypatch.setattr(main, "load_sync_interval", load_sync_interval)
+    monkeypatch.setattr(main, "run_sync", run_sync)
+    monkeypatch.setattr(config, "load_env_config", lambda: ("http://overseerr.test", "key", "1", 24, False, False))
+    if early_return == "queued_job":
+        monkeypatch.setattr(main, "run_queued_sync_jobs", lambda is_4k, automated_mode: early(returned=1, otherwise=0))
+        monkeypatch.setattr(main, "check_cancellation_requested", lambda session_id=None: False)
+    else:
+        monkeypatch.setattr(main, "run_queued_sync_jobs", lambda is_4k, automated_mode: 0)
+        monkeypatch.setattr(main, "check_cancellation_requested",
+                            lambda session_id=None: early(returned=True, otherwise=False))
+
+    with pytest.raises(_StopLoop):
+        main.automated_sync(None, 24)
+
+    # The startup sync, then ls1 (never synced, so due) once the early return has passed, and not again
+    assert state["early_returns"] == 0
+    assert state["synced"] == [None, ["ls1"]]
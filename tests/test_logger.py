@@ -0,0 +1,82 @@
+"""Tests for the logging helpers."""
+
+import logging
+import multiprocessing
+
+import pytest
+
+from list_sync.utils.logger import ItemLogBuffer, LogRecordForwarder, setup_forwarded_logging
+
+
+def _log_from_worker(log_queue):
+    """Worker-process target: log through the forwarded setup."""
+    added_logger = setup_forwarded_logging(log_queue)
+    logging.getLogger("list_sync.main").info("worker line")
+    try:
+        int("boom")
+    except ValueError:
+        logging.exception("worker failure")
+    added_logger.info("Added: Heat")
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture()
+def collected(monkeypatch):
+    """Records reaching the root logger's and the added_items logger's handlers, as set up by setup_logging."""
+    root_handler, added_handler = _Collect(), _Collect()
+    root_logger, added_logger = logging.getLogger(), logging.getLogger("added_items")
+    monkeypatch.setattr(root_logger, "level", logging.DEBUG)
+    monkeypatch.setattr(added_logger, "propagate", False)
+    root_logger.addHandler(root_handler)
+    added_logger.addHandler(added_handler)
+    yield root_handler.records, added_handler.records
+    root_logger.removeHandler(root_handler)
+    added_logger.removeHandler(added_handler)
+
+
+def test_worker_records_are_written_by_the_parent(collected):
+    root_records, added_records = collected
+    context = multiprocessing.get_context("spawn")
+    log_queue = context.Queue()
+    forwarder = LogRecordForwarder(log_queue)
+    forwarder.start()
+    worker = context.Process(target=_log_from_worker, args=(log_queue,))
+    worker.start()
+    worker.join(timeout=60)
+    forwarder.stop()
+
+    assert worker.exitcode == 0
+    assert [(record.name, record.getMessage().splitlines()[0]) for record in root_records] == [
+        ("list_sync.main", "worker line"), ("root", "worker failure")]
+    assert all(record.process == worker.pid for record in root_records)
+    # The worker formats the traceback into the message before sending it
+    assert "ValueError: invalid literal" in root_records[1].getMessage()
+    # added.log lines stay on their own logger
+    assert [record.getMessage() for record in added_records] == ["Added: Heat"]
+
+
+def test_item_log_buffer_holds_records_until_replayed():
+    root_logger = logging.getLogger()
+    collect = _Collect()
+    root_logger.addHandler(collect)
+    buffer = ItemLogBuffer()
+    buffer.install()
+    try:
+        buffer.begin()
+        logging.warning("first")
+        records = buffer.end()
+        logging.warning("passed through")
+        buffer.replay(records)
+    finally:
+        buffer.uninstall()
+        root_logger.removeHandler(collect)
+
+    assert [record.getMessage() for record in collect.records] == ["passed through", "first"]
@@ -0,0 +1,70 @@
+"""Tests for cross-list de-duplication of fetched items."""
+
+from list_sync.main import MediaDeduplicator
+from list_sync.media_item import MediaItem
+
+
+def _item(list_id, title, media_type="movie", year=2000, **ids):
+    item = MediaItem(title=title, year=year, media_type=media_type, **ids)
+    item.set_source_list("trakt", list_id)
+    return item
+
+
+def _dedup(*items):
+    deduplicator = MediaDeduplicator()
+    added = [deduplicator.add(item) for item in items]
+    return deduplicator, added
+
+
+def _lists(item):
+    return [ref.id for ref in item["_source_lists"]]
+
+
+def test_same_imdb_id_across_lists_is_one_item():
+    deduplicator, added = _dedup(_item("a", "Heat", imdb_id="tt0113277"),
+                                 _item("b", "Heat (1995)", imdb_id="tt0113277"))
+
+    assert added == [True, False]
+    [item] = deduplicator.unique_items()
+    assert _lists(item) == ["a", "b"]
+    assert deduplicator.duplicate_count == 1
+
+
+def test_movie_and_show_with_the_same_tmdb_id_stay_separate():
+    deduplicator, added = _dedup(_item("a", "Dune", tmdb_id="438631"),
+                                 _item("b", "Some Show", media_type="tv", tmdb_id="438631"))
+
+    assert added == [True, True]
+    assert [item["media_type"] for item in deduplicator.unique_items()] == ["movie", "tv"]
+
+
+def test_movie_and_show_with_the_same_title_stay_separate():
+    deduplicator, _ = _dedup(_item("a", "Fargo", year=None), _item("b", "Fargo", media_type="tv", year=None))
+
+    assert len(deduplicator.unique_items()) == 2
+
+
+def test_item_carrying_both_ids_bridges_two_entries():
+    deduplicator, added = _dedup(
+        _item("a", "Heat", imdb_id="tt0113277"),
+        _item("b", "Heat", year=1995, tmdb_id="949"),
+        _item("c", "Heat", year=1995, imdb_id="tt0113277", tmdb_id="949"),
+    )
+
+    assert added == [True, True, False]
+    [item] = deduplicator.unique_items()
+    assert _lists(item) == ["a", "b", "c"]
+    assert deduplicator.duplicate_count == 2
+
+
+def test_title_match_never_joins_conflicting_ids():
+    deduplicator, _ = _dedup(_item("a", "Solaris", imdb_id="tt0069293"), _item("b", "Solaris", imdb_id="tt0307479"))
+
+    assert len(deduplicator.unique_items()) == 2
+
+
+def test_normalized_title_and_year_match_items_without_ids():
+    deduplicator, added = _dedup(_item("a", "Amélie!"), _item("b", "amélie"), _item("a", "Amélie"))
+
+    assert added == [True, False, False]
+    assert _lists(deduplicator.unique_items()[0]) == ["a", "b"]
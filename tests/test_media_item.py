@@ -0,0 +1,119 @@
+"""MediaItem's dict interface: presence, lookups, ID types and round-trips."""
+
+import pickle
+
+import pytest
+
+from list_sync.media_item import ListRef, MediaItem
+
+
+def test_unassigned_fields_are_not_present():
+    item = MediaItem.from_dict({"title": "Heat", "tmdb_id": 949})
+
+    assert list(item.keys()) == ["title", "tmdb_id"]
+    assert "title" in item
+    assert "imdb_id" not in item
+    assert "year" not in item
+    assert item.get("imdb_id") is None
+    assert item.get("year", "unknown") == "unknown"
+    assert item.imdb_id is None
+    with pytest.raises(KeyError):
+        item["tvdb_id"]
+
+
+def test_assigned_none_is_present():
+    item = MediaItem(title="Heat", year=None)
+
+    assert "year" in item
+    assert item["year"] is None
+    assert item.get("year", 1995) is None
+    assert item.to_dict() == {"title": "Heat", "year": None}
+
+
+def test_assignment_marks_a_field_present():
+    item = MediaItem()
+    assert list(item.keys()) == []
+
+    item["media_type"] = "movie"
+    item.imdb_id = "tt0113277"
+
+    assert list(item.keys()) == ["media_type", "imdb_id"]
+    assert item["imdb_id"] == "tt0113277"
+
+
+@pytest.mark.parametrize(("key", "value"), [
+    ("year", "1995"),
+    ("year", 1995),
+    ("tmdb_id", "949"),
+    ("tmdb_id", 949),
+    ("tvdb_id", "81189"),
+    ("tvdb_id", 81189),
+    ("tmdb_id", "0949"),
+    ("imdb_id", "tt0113277"),
+    ("imdb_id", "tt12345678"),
+    ("imdb_id", "tt00113277"),
+    ("imdb_id", "nm0000158"),
+])
+def test_values_keep_their_type(key, value):
+    item = MediaItem.from_dict({key: value})
+
+    assert item[key] == value
+    assert type(item[key]) is type(value)
+    assert getattr(item, key) == value
+
+
+def test_reassigning_switches_the_id_type():
+    item = MediaItem(tmdb_id="949")
+    item["tmdb_id"] = 949
+    assert item["tmdb_id"] == 949
+
+    item["tmdb_id"] = "949"
+    assert item["tmdb_id"] == "949"
+
+
+def test_extra_and_source_keys():
+    item = MediaItem.from_dict({"title": "Heat", "poster": "/heat.jpg"})
+    assert "_source_list_type" not in item
+
+    item.set_source_list("trakt", "user/list", 2)
+
+    assert item.get("poster") == "/heat.jpg"
+    assert item["_source_list_type"] == "trakt"
+    assert item["_source_list_user_id"] == "2"
+    assert list(item.keys()) == ["title", "_source_list_type", "_source_list_id", "_source_list_user_id", "poster"]
+
+
+def test_dict_round_trip():
+    data = {
+        "title": "Heat",
+        "year": "1995",
+        "media_type": "movie",
+        "imdb_id": "tt0113277",
+        "tmdb_id": 949,
+        "rating": 8.3,
+        "_source_lists": [{"type": "trakt", "id": "user/list", "user_id": "1"}],
+    }
+
+    item = MediaItem.from_dict(data)
+
+    assert item.to_dict() == data
+    assert MediaItem.from_dict(item.to_dict()).to_dict() == data
+
+
+def test_source_lists_serialize_as_dicts():
+    item = MediaItem(title="Heat")
+    item["_source_lists"] = [ListRef("trakt", "user/list")]
+
+    assert item.to_dict()["_source_lists"] == [{"type": "trakt", "id": "user/list", "user_id": "1"}]
+
+
+def test_pickle_round_trip():
+    item = MediaItem.from_dict({"title": "Heat", "tmdb_id": "949", "imdb_id": "tt0113277"})
+    item.set_source_list("trakt", "user/list")
+
+    copy = pickle.loads(pickle.dumps(item))  # noqa: S301 - our own data
+
+    assert copy.to_dict() == item.to_dict()
+    assert list(copy.keys()) == list(item.keys())
+    assert copy["tmdb_id"] == "949"
+    assert copy.source_list is item.source_list
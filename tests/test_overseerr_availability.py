@@ -0,0 +1,136 @@
+"""Tests for the Overseerr availability index that replaces per-item status requests."""
+
+import pytest
+import requests
+
+from list_sync import main
+from list_sync.api import overseerr
+from list_sync.api.overseerr import OverseerrClient
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+@pytest.fixture()
+def server(monkeypatch):
+    """Fake Overseerr listings and media details; returns the state they are served from and the URL log."""
+    state = {"media": [], "requests": [], "details": {}, "fail_listing": False, "urls": []}
+
+    def get(url, headers=None, timeout=None, **kwargs):
+        state["urls"].append(url)
+        path = url.split("overseerr.test", 1)[1]
+        if path.startswith(("/api/v1/media?", "/api/v1/request?")):
+            if state["fail_listing"]:
+                return _Response({}, 500)
+            results = state["media"] if path.startswith("/api/v1/media?") else state["requests"]
+            take = int(path.split("take=")[1].split("&")[0])
+            skip = int(path.split("skip=")[1])
+            pages = max(1, -(-len(results) // take))
+            return _Response({"results": results[skip:skip + take],
+                              "pageInfo": {"page": skip // take + 1, "pages": pages}})
+        media_type, tmdb_id = path.split("/")[3:5]
+        details = state["details"].get((media_type, tmdb_id))
+        return _Response(details, 200) if details is not None else _Response({}, 404)
+
+    monkeypatch.setattr(overseerr.http_client, "get", get)
+    return state
+
+
+@pytest.fixture()
+def client():
+    return OverseerrClient("http://overseerr.test", "key")
+
+
+def _detail_requests(server):
+    return [url for url in server["urls"] if "?" not in url]
+
+
+def test_index_answers_statuses_without_per_item_requests(server, client, monkeypatch):
+    monkeypatch.setattr(OverseerrClient, "AVAILABILITY_PAGE_SIZE", 2)
+    server["media"] = [
+        {"tmdbId": 949, "mediaType": "movie", "status": 5, "status4k": 1},
+        {"tmdbId": 348, "mediaType": "movie", "status": 3, "status4k": 5},
+        {"tmdbId": 1396, "mediaType": "tv", "status": 4, "status4k": 1},
+    ]
+
+    assert client.prefetch_availability_index()
+
+    assert client.get_media_status(949, "movie") == (True, False, 1)
+    assert client.get_media_status("348", "movie") == (False, True, 1)
+    assert client.get_media_status(348, "movie", is_4k=True) == (True, False, 1)
+    assert client.get_media_status(1396, "tv") == (True, False, 1)
+    assert client.indexed_status("949", "movie") == 5
+    assert client.indexed_status(949, "tv") is None
+    assert _detail_requests(server) == []
+    # Two pages of media, one (empty) page of requests
+    assert len(server["urls"]) == 3
+
+
+def test_open_requests_count_as_requested(server, client):
+    server["media"] = [{"tmdbId": 949, "mediaType": "movie", "status": 0, "status4k": 1}]
+    server["requests"] = [
+        {"status": 2, "is4k": False, "media": {"tmdbId": 949, "mediaType": "movie"}},
+        {"status": 1, "is4k": True, "media": {"tmdbId": 603, "mediaType": "movie"}},
+        # Declined and completed requests are ignored
+        {"status": 3, "is4k": False, "media": {"tmdbId": 680, "mediaType": "movie"}},
+    ]
+
+    client.prefetch_availability_index()
+
+    assert client.indexed_status(949, "movie") == 2
+    assert client.indexed_status(603, "movie", is_4k=True) == 2
+    assert client.indexed_status(680, "movie") is None
+
+
+def test_misses_and_unrequested_shows_fall_back_to_details(server, client):
+    server["media"] = [{"tmdbId": 1396, "mediaType": "tv", "status": 0, "status4k": 1}]
+    server["details"] = {
+        ("tv", "1396"): {"mediaInfo": {"status": 0}, "numberOfSeasons": 5},
+        ("movie", "949"): {"mediaInfo": {"status": 5}},
+    }
+    client.prefetch_availability_index()
+
+    # An unknown TV show needs its season count, so it is still looked up
+    assert client.get_media_status(1396, "tv") == (False, False, 5)
+    assert client.get_media_status(949, "movie") == (True, False, 1)
+    assert len(_detail_requests(server)) == 2
+
+
+def test_listing_failure_falls_back_to_per_item_lookups(server, client):
+    server["fail_listing"] = True
+    server["details"] = {("movie", "949"): {"mediaInfo": {"status": 5}}}
+
+    assert not client.prefetch_availability_index()
+
+    assert client.indexed_status(949, "movie") is None
+    assert client.get_media_status(949, "movie") == (True, False, 1)
+    assert len(_detail_requests(server)) == 1
+
+
+def test_reset_drops_the_index(server, client):
+    server["media"] = [{"tmdbId": 949, "mediaType": "movie", "status": 5, "status4k": 1}]
+    client.prefetch_availability_index()
+
+    client.reset_sync_caches()
+
+    assert client.indexed_status(949, "movie") is None
+
+
+@pytest.mark.parametrize(("setting", "listed"), [("true", True), ("false", False)])
+def test_sync_loads_the_index_unless_disabled(server, client, monkeypatch, setting, listed):
+    monkeypatch.setenv("LISTSYNC_AVAILABILITY_INDEX", setting)
+
+    main._prepare_overseerr_client(client, dry_run=False)
+
+    assert any("/api/v1/media?" in url for url in server["urls"]) == listed
+    assert (client._availability_index is not None) == listed
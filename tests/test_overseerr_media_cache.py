@@ -0,0 +1,121 @@
+"""Tests for the shared, per-sync Overseerr media-detail request."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from list_sync.api import overseerr
+from list_sync.api.overseerr import OverseerrClient
+
+HEAT = {"title": "Heat", "releaseDate": "1995-12-15", "mediaInfo": {"status": 5}}
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+@pytest.fixture()
+def server(monkeypatch):
+    """Fake media-detail endpoint; returns the responses it serves by path and the request log."""
+    state = {"responses": {"/api/v1/movie/949": _Response(HEAT)}, "urls": [], "delay": 0, "error": None}
+    lock = threading.Lock()
+
+    def get(url, headers=None, timeout=None, **kwargs):
+        with lock:
+            state["urls"].append(url)
+        time.sleep(state["delay"])
+        if state["error"] is not None:
+            raise state["error"]
+        return state["responses"].get(url.split("overseerr.test", 1)[1], _Response({}, 404))
+
+    monkeypatch.setattr(overseerr.http_client, "get", get)
+    return state
+
+
+@pytest.fixture()
+def client():
+    return OverseerrClient("http://overseerr.test", "key")
+
+
+def test_lookup_and_status_share_one_request(server, client):
+    client.enable_media_cache()
+
+    assert client.get_media_by_tmdb_id(949, "movie")["title"] == "Heat"
+    assert client.get_media_status(949, "movie") == (True, False, 1)
+    assert len(server["urls"]) == 1
+
+
+def test_not_found_is_cached_but_errors_are_not(server, client):
+    server["responses"]["/api/v1/movie/680"] = _Response({}, 503)
+    client.enable_media_cache()
+
+    assert client.get_media_by_tmdb_id(1, "movie") is None
+    assert client.get_media_by_tmdb_id(1, "movie") is None
+    assert client.get_media_by_tmdb_id(680, "movie") is None
+    assert client.get_media_by_tmdb_id(680, "movie") is None
+    assert len(server["urls"]) == 3
+
+
+def test_nothing_is_cached_outside_a_sync(server, client):
+    client.get_media_status(949, "movie")
+    client.get_media_status(949, "movie")
+    client.enable_media_cache()
+    client.get_media_status(949, "movie")
+    client.reset_sync_caches()
+    client.get_media_status(949, "movie")
+
+    assert len(server["urls"]) == 4
+
+
+def _call_concurrently(count, function):
+    results, errors = [], []
+    barrier = threading.Barrier(count)
+
+    def call():
+        barrier.wait()
+        try:
+            results.append(function())
+        except requests.RequestException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_callers_share_the_in_flight_request(server, client):
+    server["delay"] = 0.1
+
+    results, errors = _call_concurrently(8, lambda: client.get_media_status(949, "movie"))
+
+    assert errors == []
+    assert results == [(True, False, 1)] * 8
+    assert len(server["urls"]) == 1
+
+
+def test_in_flight_errors_reach_every_caller(server, client):
+    server["delay"] = 0.1
+    server["error"] = requests.ConnectionError("connection reset")
+
+    results, errors = _call_concurrently(4, lambda: client._get_media_details("movie", 949))
+
+    assert results == []
+    assert [str(error) for error in errors] == ["connection reset"] * 4
+    assert len(server["urls"]) == 1
+    # The failed request is not remembered
+    server["error"] = None
+    assert client._get_media_details("movie", 949).status_code == 200
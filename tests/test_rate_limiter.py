@@ -0,0 +1,176 @@
+"""Tests for the adaptive token-bucket rate limiter."""
+
+import io
+import json
+import sqlite3
+import threading
+
+import pytest
+import requests
+
+from list_sync.utils import rate_limiter
+
+URL = "https://api.example.test/lists"
+
+
+class _Clock:
+    """Fake time: sleeping advances it."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _response(status_code, **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO()
+    response.headers.update(headers)
+    return response
+
+
+@pytest.fixture()
+def clock(tmp_path, monkeypatch):
+    """A fresh bucket store on a fake clock; api.example.test allows 2 requests/second, burst 2."""
+    fake = _Clock()
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_DB_FILE", str(tmp_path / "rate_limits.db"))
+    monkeypatch.setattr(rate_limiter, "_leases", {})
+    monkeypatch.setattr(rate_limiter, "_pending_recovery", {})
+    monkeypatch.setattr(rate_limiter, "_last_seen", {})
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    monkeypatch.setenv("LISTSYNC_RATE_LIMITS", "api.example.test=2")
+    return fake
+
+
+def _bucket(host="api.example.test"):
+    conn = sqlite3.connect(rate_limiter.RATE_LIMIT_DB_FILE)
+    try:
+        row = conn.execute("SELECT tokens, rate, max_rate, blocked_until FROM rate_limit_buckets WHERE host = ?",
+                           (host,)).fetchone()
+    finally:
+        conn.close()
+    return dict(zip(("tokens", "rate", "max_rate", "blocked_until"), row))
+
+
+def test_burst_then_sustained_rate(clock):
+    waits = [rate_limiter.acquire(URL) for _ in range(4)]
+
+    assert waits == [0, 0, pytest.approx(0.5), pytest.approx(0.5)]
+    clock.now += 10
+    assert rate_limiter.acquire(URL) == 0
+
+
+def test_unlimited_hosts_and_disabled_limiter_never_wait(clock, monkeypatch):
+    assert all(rate_limiter.acquire("http://overseerr.local/api/v1/status") == 0 for _ in range(10))
+
+    monkeypatch.setenv("LISTSYNC_RATE_LIMITER", "false")
+    assert all(rate_limiter.acquire(URL) == 0 for _ in range(10))
+
+    monkeypatch.setenv("LISTSYNC_RATE_LIMITER", "true")
+    monkeypatch.setenv("LISTSYNC_RATE_LIMITS", "api.example.test=0")
+    assert all(rate_limiter.acquire(URL) == 0 for _ in range(10))
+    assert clock.slept == []
+
+
+def test_429_slows_down_and_pauses_for_retry_after(clock):
+    rate_limiter.acquire(URL)
+
+    assert rate_limiter.observe(URL, _response(429), retry_after=30)
+
+    assert _bucket()["rate"] == 1
+    assert rate_limiter.acquire(URL) == pytest.approx(31)
+
+
+def test_rate_recovers_on_success(clock):
+    rate_limiter.acquire(URL)
+    rate_limiter.observe(URL, _response(429))
+
+    for _ in range(10):
+        rate_limiter.observe(URL, _response(200))
+    # Successes reach the store when the process next syncs with it
+    assert _bucket()["rate"] == 1
+    rate_limiter.acquire(URL)
+
+    assert _bucket()["rate"] == pytest.approx(2)
+
+
+def test_limits_are_learned_from_trakt_headers(clock):
+    trakt = json.dumps({"limit": 1000, "period": 500, "remaining": 0, "until": clock.now + 60})
+
+    rate_limiter.observe(URL, _response(200, **{"X-Ratelimit": trakt}))
+
+    bucket = _bucket()
+    assert (bucket["max_rate"], bucket["rate"]) == (2, 2)
+    assert bucket["blocked_until"] == clock.now + 60
+
+
+def test_buckets_are_shared_through_the_store(clock, monkeypatch):
+    rate_limiter.acquire(URL)
+    rate_limiter.acquire(URL)
+    # Another process: no in-memory state, same store
+    monkeypatch.setattr(rate_limiter, "_local", threading.local())
+    monkeypatch.setattr(rate_limiter, "_leases", {})
+    monkeypatch.setattr(rate_limiter, "_last_seen", {})
+
+    assert rate_limiter.acquire(URL) == pytest.approx(0.5)
+
+
+def test_storage_errors_never_block_requests(clock, tmp_path, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_DB_FILE", str(tmp_path / "missing" / "rate_limits.db"))
+
+    assert rate_limiter.acquire(URL) == 0
+    assert not rate_limiter.observe(URL, _response(429), retry_after=5)
+
+
+def test_requests_are_served_from_a_lease_over_one_connection(clock, monkeypatch):
+    connects, transactions = [], []
+    connect, transaction = sqlite3.connect, rate_limiter._transaction
+
+    def counting_connect(*args, **kwargs):
+        connects.append(args)
+        return connect(*args, **kwargs)
+
+    def counting_transaction():
+        transactions.append(clock.now)
+        return transaction()
+
+    monkeypatch.setattr(rate_limiter, "_local", threading.local())
+    monkeypatch.setattr(rate_limiter.sqlite3, "connect", counting_connect)
+    monkeypatch.setattr(rate_limiter, "_transaction", counting_transaction)
+
+    waits = [rate_limiter.acquire(URL) for _ in range(20)]
+
+    assert len(connects) == 1
+    # The 2 tokens a second are reserved a second's worth at a time
+    assert len(transactions) == 10
+    assert sum(waits) == pytest.approx(9)
+    assert _query_journal_mode() == "wal"
+
+
+def test_unused_lease_tokens_go_back_to_the_store(clock):
+    start = clock.now
+    for _ in range(3):
+        rate_limiter.acquire(URL)
+    # The second lease reserved 2 tokens past the burst; one of them was used
+    assert _bucket()["tokens"] == -2
+
+    clock.now = start + rate_limiter.LEASE_SECONDS
+    rate_limiter.acquire(URL)
+
+    # Refilled by 2, given back the unused token, then reserved the next 2
+    assert _bucket()["tokens"] == -1
+
+
+def _query_journal_mode():
+    conn = sqlite3.connect(rate_limiter.RATE_LIMIT_DB_FILE)
+    try:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        conn.close()
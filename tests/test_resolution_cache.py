@@ -0,0 +1,86 @@
+"""Tests for the persistent IMDb/title -> TMDB resolution cache."""
+
+import pytest
+
+from list_sync import main
+
+
+@pytest.fixture()
+def cache(db):
+    db.reset_resolution_cache_stats()
+    return db
+
+
+def _age_entries(db, days):
+    with db.get_connection() as conn:
+        conn.execute("UPDATE id_resolution_cache SET resolved_at = datetime('now', ?)", (f"-{days} days",))
+        conn.commit()
+
+
+def test_imdb_lookups_ignore_case_and_whitespace(cache):
+    cache.save_resolution(949, imdb_id="tt0113277", resolved_media_type="movie")
+
+    assert cache.get_cached_resolution(imdb_id=" TT0113277 ") == {
+        "tmdb_id": 949, "imdb_id": "tt0113277", "media_type": "movie"}
+    assert cache.get_cached_resolution(imdb_id="tt0000001") is None
+
+
+def test_title_lookups_are_normalized_and_keyed_by_year_and_type(cache):
+    cache.save_resolution(634649, title="Spider-Man: No Way Home", year=2021, media_type="movie")
+
+    hit = cache.get_cached_resolution(title="spider man  no way home", year=2021, media_type="movie")
+    assert hit["tmdb_id"] == 634649
+    assert cache.get_cached_resolution(title="Spider-Man: No Way Home", year=2022, media_type="movie") is None
+    assert cache.get_cached_resolution(title="Spider-Man: No Way Home", year=2021, media_type="tv") is None
+
+
+def test_entries_expire_after_the_ttl(cache, monkeypatch):
+    cache.save_resolution(949, imdb_id="tt0113277")
+    _age_entries(cache, 40)
+
+    assert cache.get_cached_resolution(imdb_id="tt0113277") is None
+    monkeypatch.setenv("LISTSYNC_RESOLUTION_CACHE_TTL_DAYS", "60")
+    assert cache.get_cached_resolution(imdb_id="tt0113277")["tmdb_id"] == 949
+
+
+def test_hits_and_misses_are_counted(cache):
+    cache.save_resolution(949, imdb_id="tt0113277")
+    cache.get_cached_resolution(imdb_id="tt0113277")
+    cache.get_cached_resolution(imdb_id="tt0113277")
+    cache.get_cached_resolution(imdb_id="tt0000001")
+
+    stats = cache.get_resolution_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["lifetime_hits"]) == (2, 1, 1, 2)
+
+    cache.reset_resolution_cache_stats()
+    assert cache.get_resolution_cache_stats()["hits"] == 0
+
+
+def test_resolve_calls_trakt_only_on_a_miss(cache):
+    calls = []
+
+    def lookup():
+        calls.append(1)
+        return {"tmdb_id": 949, "imdb_id": "tt0113277", "media_type": "movie"}
+
+    first = main._resolve_with_cache(lookup, imdb_id="tt0113277")
+    second = main._resolve_with_cache(lookup, imdb_id="tt0113277")
+
+    assert len(calls) == 1
+    assert first["tmdb_id"] == second["tmdb_id"] == 949
+
+
+@pytest.mark.parametrize("result", [None, {"tmdb_id": None}])
+def test_unresolved_lookups_are_not_cached(cache, result):
+    assert main._resolve_with_cache(lambda: result, title="Unknown", year=1999, media_type="movie") == result
+    assert cache.get_resolution_cache_stats()["entries"] == 0
+
+
+def test_cache_errors_fall_back_to_trakt(cache, monkeypatch):
+    def broken(**kwargs):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(main, "get_cached_resolution", broken)
+    monkeypatch.setattr(main, "save_resolution", broken)
+
+    assert main._resolve_with_cache(lambda: {"tmdb_id": 949}, imdb_id="tt0113277") == {"tmdb_id": 949}
@@ -0,0 +1,102 @@
+"""Tests for the per-status revalidation schedule that lets items skip status checks."""
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+HEAT = {"imdb_id": "tt0113277", "tmdb_id": "949", "title": "Heat", "year": 1995, "media_type": "movie"}
+
+
+def _save(db, status, overseerr_id=949, **overrides):
+    item = {**HEAT, **overrides}
+    db.save_sync_result(item["title"], item["media_type"], item["imdb_id"], overseerr_id, status, item["year"],
+                        item["tmdb_id"], "imdb", "ls1")
+
+
+def _hours_until_check(db, imdb_id="tt0113277"):
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT (julianday(next_check_at) - julianday('now')) * 24 FROM synced_items WHERE imdb_id = ?",
+            (imdb_id,)).fetchone()
+    return row[0]
+
+
+@pytest.mark.parametrize(("status", "hours"), [("already_available", 720), ("requested", 24),
+                                               ("already_requested", 24)])
+def test_statuses_are_trusted_for_their_window_with_jitter(db, status, hours):
+    _save(db, status)
+
+    assert hours * 0.9 - 0.01 <= _hours_until_check(db) <= hours * 1.1
+    assert db.get_scheduled_status(imdb_id="tt0113277")["status"] == status
+
+
+@pytest.mark.parametrize("status", ["not_found", "error", "request_failed"])
+def test_other_statuses_are_checked_on_every_sync(db, status):
+    _save(db, status, overseerr_id=None)
+
+    assert _hours_until_check(db) is None
+    assert db.get_scheduled_status(imdb_id="tt0113277") is None
+
+
+def test_windows_are_configurable(db, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_RECHECK_AVAILABLE_HOURS", "10")
+    _save(db, "already_available")
+    assert 9 - 0.01 <= _hours_until_check(db) <= 11
+
+    monkeypatch.setenv("LISTSYNC_RECHECK_REQUESTED_HOURS", "0")
+    _save(db, "requested", imdb_id="tt0078748", tmdb_id="348", title="Alien", overseerr_id=348)
+    assert db.get_scheduled_status(imdb_id="tt0078748") is None
+
+
+def test_items_are_found_by_their_list_ids(db):
+    _save(db, "already_available")
+
+    assert db.get_scheduled_status(tmdb_id=949, media_type="movie")["overseerr_id"] == 949
+    assert db.get_scheduled_status(tmdb_id=949, media_type="tv") is None
+    assert db.get_scheduled_status(title="heat", year=1995, media_type="movie")["status"] == "already_available"
+    assert db.get_scheduled_status(title="Heat", year=1986, media_type="movie") is None
+    assert db.get_scheduled_status() is None
+
+
+def test_due_and_reset_items_are_checked_again(db):
+    _save(db, "already_available")
+    _save(db, "requested", imdb_id="tt0078748", tmdb_id="348", title="Alien", overseerr_id=348)
+
+    assert db.reset_revalidation_schedule(status="requested") == 1
+    assert db.get_scheduled_status(imdb_id="tt0078748") is None
+    assert [row["status"] for row in db.get_revalidation_summary()] == ["already_available"]
+
+    with db.get_connection() as conn:
+        conn.execute("UPDATE synced_items SET next_check_at = datetime('now', '-1 minute')")
+        conn.commit()
+    assert db.get_scheduled_status(imdb_id="tt0113277") is None
+
+
+def test_sync_reuses_scheduled_statuses_without_matching(db, monkeypatch):
+    calls = []
+
+    def match(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        calls.append(item["title"])
+        _save(db, "already_available")
+        return {"title": item["title"], "status": "already_available", "year": item["year"],
+                "media_type": item["media_type"]}
+
+    monkeypatch.setattr(main, "_match_and_request_media_item", match)
+
+    def sync():
+        item = MediaItem.from_dict(HEAT)
+        item.set_source_list("trakt", "watchlist")
+        return main.process_media_item(item, overseerr_client=None, dry_run=False)
+
+    assert sync()["status"] == "already_available"
+    hours = _hours_until_check(db)
+    result = sync()
+
+    assert calls == ["Heat"]
+    assert (result["status"], result["overseerr_id"], result["scheduled"]) == ("already_available", 949, True)
+    # Relinking keeps the schedule and records the new list
+    assert _hours_until_check(db) == pytest.approx(hours, abs=0.01)
+    with db.get_connection() as conn:
+        lists = {row[0] for row in conn.execute("SELECT list_id FROM item_lists")}
+    assert lists == {"ls1", "watchlist"}
@@ -0,0 +1,142 @@
+"""Tests for splitting a sync across shard processes and merging what the shards report."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from list_sync import main
+from list_sync.ui.display import SyncResults
+
+
+class _InlinePool(ThreadPoolExecutor):
+    """Runs the shards on threads, so monkeypatched shard functions are used."""
+
+    def __init__(self, max_workers, mp_context=None, initializer=None, initargs=()):
+        super().__init__(max_workers, initializer=initializer, initargs=initargs)
+
+
+class _Client:
+    overseerr_url = "http://overseerr"
+    api_key = "key"
+    requester_user_id = "1"
+    index = None
+
+    def __init__(self, *settings):
+        pass
+
+    def enable_media_cache(self):
+        pass
+
+    def prefetch_availability_index(self):
+        return False
+
+    def get_availability_index(self):
+        return self.index
+
+    def set_availability_index(self, index):
+        self.index = index
+
+
+def _items(count):
+    return [{"title": f"Movie {i}", "media_type": "movie", "tmdb_id": str(i)} for i in range(count)]
+
+
+def _shard_sizes(items, shard_count):
+    sizes = [0] * shard_count
+    for item in items:
+        sizes[main._shard_index(item, shard_count)] += 1
+    return sizes
+
+
+@pytest.fixture()
+def run_shard(monkeypatch):
+    """Replace the shard worker; returns the dict of shard number -> exception to raise."""
+    failures = {}
+
+    def run_sync_shard(shard, shard_count, media_items, client_settings, is_4k, dry_run, session_id, progress):
+        if shard in failures:
+            raise failures[shard]
+        results = SyncResults()
+        results.total_items = len(media_items)
+        results.results["requested"] = len(media_items)
+        results.media_type_counts["movie"] = len(media_items)
+        return results
+
+    monkeypatch.setattr(main, "ProcessPoolExecutor", _InlinePool)
+    monkeypatch.setattr(main, "setup_forwarded_logging", lambda log_queue: None)
+    monkeypatch.setattr(main, "_run_sync_shard", run_sync_shard)
+    monkeypatch.setattr(main, "_sync_progress", None)
+    return failures
+
+
+def _sync(items, shard_count):
+    sync_results = SyncResults()
+    sync_results.total_items = len(items)
+    return main._sync_media_sharded(items, _Client(), sync_results, shard_count, is_4k=False, dry_run=False,
+                                    session_id=None)
+
+
+def test_shard_partition_is_stable_and_complete():
+    items = _items(50)
+    sizes = _shard_sizes(items, 3)
+
+    assert sum(sizes) == 50
+    assert all(sizes)
+    assert sizes == _shard_sizes(list(reversed(items)), 3)
+
+
+def test_shard_results_are_merged(run_shard):
+    items = _items(40)
+
+    results = _sync(items, 3)
+
+    assert results.total_items == 40
+    assert results.results["requested"] == 40
+    assert results.media_type_counts["movie"] == 40
+    assert results.failed_shards == []
+
+
+def test_failed_shard_is_reported_separately(run_shard):
+    items = _items(40)
+    sizes = _shard_sizes(items, 2)
+    run_shard[1] = RuntimeError("worker died")
+
+    results = _sync(items, 2)
+
+    assert results.results["error"] == 0
+    assert results.error_items == []
+    assert results.results["requested"] == sizes[0]
+    assert results.total_items == sizes[0]
+    assert results.failed_shards == [{"shard": 2, "shard_count": 2, "items": sizes[1], "error": "worker died"}]
+    assert f"Shard 2/2: {sizes[1]} items unprocessed" in str(results)
+
+
+@pytest.mark.usefixtures("db")
+def test_availability_index_is_loaded_once_for_all_shards(monkeypatch):
+    prefetches, indexes_used = [], []
+
+    class Client(_Client):
+        def prefetch_availability_index(self):
+            prefetches.append(self)
+            self.index = {(1, "movie"): (5, None)}
+            return True
+
+    def process_media_item(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        indexes_used.append(overseerr_client.get_availability_index())
+        return {"title": item["title"], "status": "requested", "year": 2000, "media_type": "movie"}
+
+    monkeypatch.setattr(main, "ProcessPoolExecutor", _InlinePool)
+    monkeypatch.setattr(main, "setup_forwarded_logging", lambda log_queue: None)
+    monkeypatch.setattr(main, "setup_sync_signal_handlers", lambda: None)
+    monkeypatch.setattr(main, "OverseerrClient", Client)
+    monkeypatch.setattr(main, "process_media_item", process_media_item)
+    monkeypatch.setattr(main, "_sync_progress", None)
+    monkeypatch.setenv("LISTSYNC_AVAILABILITY_INDEX", "true")
+    monkeypatch.setenv("LISTSYNC_SHARD_PROCESSES", "3")
+
+    results = main.sync_media_to_overseerr(_items(30), Client())
+
+    # Listed by the parent only; every shard item was checked against that index
+    assert len(prefetches) == 1
+    assert indexes_used == [{(1, "movie"): (5, None)}] * 30
+    assert results.results["requested"] == 30
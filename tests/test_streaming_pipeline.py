@@ -0,0 +1,129 @@
+"""Tests for the streaming fetch/dedup/sync pipeline (LISTSYNC_PIPELINE_MODE)."""
+
+import logging
+import re
+import threading
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+SLOW = {"type": "trakt", "id": "slow"}
+FAST = {"type": "trakt", "id": "fast"}
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _media(title, imdb_id):
+    return MediaItem(title=title, year=2000, media_type="movie", imdb_id=imdb_id)
+
+
+@pytest.fixture()
+def pipeline(db, monkeypatch):
+    """Fake providers and item processing; returns the shared state the fakes record into."""
+    state = {
+        "lists": {},
+        "processed": [],
+        "first_processed": threading.Event(),
+        "waits_for_processing": set(),
+        "streamed": {},
+        "cancel_after": None,
+    }
+    lock = threading.Lock()
+
+    def get_provider(list_type):
+        def provider(list_id):
+            if list_id in state["waits_for_processing"]:
+                # A pipeline dispatches the fast list's items while this list is still being fetched
+                state["streamed"][list_id] = state["first_processed"].wait(timeout=10)
+            return [MediaItem.from_dict(item.to_dict()) for item in state["lists"][list_id]]
+        return provider
+
+    def process_media_item(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        with lock:
+            state["processed"].append(item["title"])
+        logging.info("work %s begins", item["title"])
+        logging.info("work %s ends", item["title"])
+        state["first_processed"].set()
+        return {"title": item["title"], "status": "requested", "year": item.get("year"), "media_type": "movie",
+                "imdb_id": item.get("imdb_id")}
+
+    def check_cancellation_requested(session_id=None):
+        return state["cancel_after"] is not None and len(state["processed"]) >= state["cancel_after"]
+
+    monkeypatch.setattr(main, "get_provider", get_provider)
+    monkeypatch.setattr(main, "provider_uses_browser", lambda list_type: False)
+    monkeypatch.setattr(main, "process_media_item", process_media_item)
+    monkeypatch.setattr(main, "check_cancellation_requested", check_cancellation_requested)
+    monkeypatch.setattr(main, "handle_cancellation", lambda tracker, session_id=None: None)
+    monkeypatch.setattr(main, "_prepare_overseerr_client", lambda client, dry_run: None)
+    monkeypatch.setattr(main, "_PIPELINE_POLL_INTERVAL", 0.01)
+    monkeypatch.setenv("LISTSYNC_MAX_WORKERS", "4")
+    return state
+
+
+def _linked_lists(db, title):
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT il.list_id FROM item_lists il JOIN synced_items s ON s.id = il.item_id WHERE s.title = ?",
+            (title,)).fetchall()
+    return {row[0] for row in rows}
+
+
+def test_items_are_synced_while_slow_lists_are_fetched(db, pipeline):
+    pipeline["lists"] = {
+        "slow": [_media("Heat", "tt0113277"), _media("Alien", "tt0078748")],
+        "fast": [_media("Heat", "tt0113277"), _media("Up", "tt1049413")],
+    }
+    pipeline["waits_for_processing"] = {"slow"}
+
+    results, synced_lists = main.stream_media_to_overseerr([SLOW, FAST], overseerr_client=None)
+
+    assert pipeline["streamed"] == {"slow": True}
+    assert sorted(pipeline["processed"]) == ["Alien", "Heat", "Up"]
+    assert results.total_items == 3
+    assert results.results["requested"] == 3
+    # Lists are reported in configured order, not completion order
+    assert [synced_list["id"] for synced_list in synced_lists] == ["slow", "fast"]
+    # Heat was dispatched from the fast list; its later copy from the slow list is linked afterwards
+    assert _linked_lists(db, "Heat") == {"slow"}
+
+
+def test_item_logs_are_replayed_in_dispatch_order(pipeline):
+    pipeline["lists"] = {"fast": [_media(f"Movie {number}", f"tt{number:07d}") for number in range(1, 31)]}
+    handler = _Collect()
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(handler)
+    try:
+        main.stream_media_to_overseerr([FAST], overseerr_client=None)
+    finally:
+        root_logger.removeHandler(handler)
+        root_logger.setLevel(previous_level)
+
+    headers = [message for message in handler.messages if message.startswith("🎬 PROCESSING ITEM")]
+    assert [int(re.search(r"ITEM (\d+)/", header).group(1)) for header in headers] == list(range(1, 31))
+    work = [message for message in handler.messages if message.startswith("work ")]
+    # Every item's records form one block, in the order the items were dispatched (list order),
+    # whatever order the workers ran them in
+    assert work[0::2] == [f"work Movie {number} begins" for number in range(1, 31)]
+    assert work[1::2] == [f"work Movie {number} ends" for number in range(1, 31)]
+
+
+def test_cancellation_stops_the_pipeline(pipeline):
+    pipeline["lists"] = {"fast": [_media(f"Movie {number}", f"tt{number:07d}") for number in range(1, 201)]}
+    pipeline["cancel_after"] = 3
+
+    results, _ = main.stream_media_to_overseerr([FAST], overseerr_client=None)
+
+    assert results.cancelled
+    assert len(pipeline["processed"]) < 200
@@ -0,0 +1,136 @@
+"""Tests for the durable sync job queue and the core's wake-up socket."""
+
+import socket
+import threading
+
+import pytest
+
+from list_sync import config, main
+from list_sync.utils import sync_wakeup
+
+
+def _states(db):
+    return [(job["id"], job["state"]) for job in db.get_sync_jobs()]
+
+
+def test_triggers_for_an_active_target_coalesce(db):
+    first = db.enqueue_sync_job("single", "imdb", "ls1", requested_by="web_ui")
+    again = db.enqueue_sync_job("single", "imdb", "ls1")
+    other = db.enqueue_sync_job("single", "imdb", "ls2")
+    full = db.enqueue_sync_job("full")
+
+    assert (first["coalesced"], again["coalesced"], other["coalesced"], full["coalesced"]) == (
+        False, True, False, False)
+    assert again["id"] == first["id"]
+    assert db.enqueue_sync_job("full")["id"] == full["id"]
+
+
+def test_jobs_are_claimed_oldest_first(db):
+    first = db.enqueue_sync_job("full")
+    second = db.enqueue_sync_job("single", "imdb", "ls1")
+
+    claimed = db.claim_next_sync_job()
+
+    assert (claimed["id"], claimed["state"], claimed["attempts"]) == (first["id"], "running", 1)
+    # A running job still absorbs triggers for its target
+    assert db.enqueue_sync_job("full")["coalesced"]
+    assert db.claim_next_sync_job()["id"] == second["id"]
+    assert db.claim_next_sync_job() is None
+    assert not db.has_queued_sync_jobs()
+
+
+def test_finished_jobs_make_room_for_new_triggers(db):
+    job = db.enqueue_sync_job("full")
+    db.claim_next_sync_job()
+    db.finish_sync_job(job["id"], "failed", "Overseerr is down")
+
+    retry = db.enqueue_sync_job("full")
+
+    assert not retry["coalesced"]
+    assert _states(db) == [(retry["id"], "queued"), (job["id"], "failed")]
+
+
+def test_jobs_of_dead_workers_are_requeued_until_they_run_out_of_attempts(db, monkeypatch):
+    monkeypatch.setattr(db, "_pid_alive", lambda pid: False)
+    job = db.enqueue_sync_job("full")
+    for attempt in range(1, db.SYNC_JOB_MAX_ATTEMPTS + 1):
+        assert db.claim_next_sync_job()["attempts"] == attempt
+        with db.get_connection() as conn:
+            conn.execute("UPDATE sync_jobs SET worker_pid = -1")
+            conn.commit()
+        db.recover_sync_jobs()
+
+    assert _states(db) == [(job["id"], "failed")]
+
+
+def test_jobs_of_live_workers_are_left_alone(db, monkeypatch):
+    monkeypatch.setattr(db, "_pid_alive", lambda pid: True)
+    job = db.enqueue_sync_job("full")
+    db.claim_next_sync_job()
+    with db.get_connection() as conn:
+        conn.execute("UPDATE sync_jobs SET worker_pid = -1")
+        conn.commit()
+
+    assert db.recover_sync_jobs() == 0
+    assert _states(db) == [(job["id"], "running")]
+
+
+def test_old_finished_jobs_are_dropped(db):
+    job = db.enqueue_sync_job("full")
+    db.finish_sync_job(job["id"])
+    with db.get_connection() as conn:
+        conn.execute("UPDATE sync_jobs SET updated_at = datetime('now', '-8 days')")
+        conn.commit()
+
+    db.recover_sync_jobs()
+
+    assert db.get_sync_jobs() == []
+
+
+@pytest.fixture()
+def runner(db, monkeypatch):
+    """Replace the syncs a job runs; returns the calls they received."""
+    calls = []
+
+    def sync_single_list(list_type, list_id, *args):
+        calls.append(f"{list_type}:{list_id}")
+        if list_id == "broken":
+            return {"success": False, "error": "list is private"}
+        return {"success": True}
+
+    def run_sync(client, **kwargs):
+        calls.append("full")
+        # A trigger that arrives mid-sync is picked up in the same pass
+        db.enqueue_sync_job("single", "imdb", "late")
+
+    monkeypatch.setattr(config, "load_env_config",
+                        lambda: ("http://overseerr.test", "key", "1", 24, False, False))
+    monkeypatch.setattr(main, "sync_single_list", sync_single_list)
+    monkeypatch.setattr(main, "run_sync", run_sync)
+    monkeypatch.setattr(main, "check_cancellation_requested", lambda session_id=None: False)
+    return calls
+
+
+def test_queued_jobs_run_in_order_and_record_their_outcome(db, runner):
+    db.enqueue_sync_job("full")
+    db.enqueue_sync_job("single", "imdb", "broken")
+
+    assert main.run_queued_sync_jobs() == 3
+
+    assert runner == ["full", "imdb:broken", "imdb:late"]
+    jobs = {job["list_id"]: job for job in db.get_sync_jobs()}
+    assert jobs[None]["state"] == jobs["late"]["state"] == "completed"
+    assert (jobs["broken"]["state"], jobs["broken"]["last_error"]) == ("failed", "list is private")
+
+
+def test_wakeups_reach_the_listener(tmp_path, monkeypatch):
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix datagram sockets are not available")
+    monkeypatch.setattr(sync_wakeup, "WAKEUP_SOCKET", str(tmp_path / "wakeup.sock"))
+    assert not sync_wakeup.notify_core()
+
+    woken = threading.Event()
+    assert sync_wakeup.start_wakeup_listener(woken) is not None
+
+    assert sync_wakeup.notify_core()
+    assert woken.wait(timeout=5)
@@ -0,0 +1,172 @@
+"""Tests for writing sync results behind the sync in batched transactions."""
+
+import pytest
+
+from list_sync import main
+
+# Arguments for save_sync_result, including items matched again by IMDb or TMDB ID
+RESULTS = [
+    ("Heat", "movie", "tt0113277", None, "not_found", 1995, None, "imdb", "ls1"),
+    ("Heat", "movie", "tt0113277", 949, "requested", 1995, "949", "trakt", "favorites"),
+    ("Heat", "movie", "tt0113277", 949, "already_requested", 1995, "949", "imdb", "ls1"),
+    ("Alien", "movie", None, None, "error", 1979, "348", "imdb", "ls1"),
+    ("Alien", "movie", "tt0078748", 348, "already_available", 1979, "348", "imdb", "ls2"),
+    ("Dark", "tv", None, None, "not_found", 2017, "348", "trakt", "favorites"),
+    ("Up", "movie", None, None, "blocked", 2009, None, None, None),
+]
+
+
+def _save_all(db):
+    return [db.save_sync_result(*result) for result in RESULTS]
+
+
+def _dump(db):
+    with db.get_connection() as conn:
+        return {
+            "items": conn.execute(
+                "SELECT id, title, media_type, year, imdb_id, tmdb_id, overseerr_id, status, next_check_at IS NULL "
+                "FROM synced_items ORDER BY id").fetchall(),
+            "links": conn.execute(
+                "SELECT item_id, list_type, list_id FROM item_lists ORDER BY item_id, list_type, list_id").fetchall(),
+            "changes": conn.execute(
+                "SELECT item_id, list_type, list_id, change_type, title, year, tmdb_id FROM list_changes "
+                "ORDER BY id").fetchall(),
+        }
+
+
+def test_batched_writes_match_writing_one_by_one(db, tmp_path, monkeypatch):
+    _save_all(db)
+    expected = _dump(db)
+
+    monkeypatch.setattr(db, "DB_FILE", str(tmp_path / "buffered.db"))
+    db.init_database()
+    with db.buffered_sync_results():
+        assert _save_all(db) == [None] * len(RESULTS)
+
+    assert _dump(db) == expected
+    assert len(expected["items"]) == 4
+
+
+@pytest.mark.parametrize(("saved", "batch"), [
+    # Heat loses its IMDb ID, then a record with that ID is a new item
+    ([("Heat", "movie", "tt0113277", None, "requested", 1995, "949", "imdb", "ls1")],
+     [("Heat", "movie", None, None, "requested", 1995, "949", "imdb", "ls1"),
+      ("Heat", "movie", "tt0113277", None, "not_found", 1995, None, "trakt", "favorites")]),
+    # A skipped record moves Alien to tv, where its kept overseerr_id belongs to Dark (known by its TMDB ID)
+    ([("Dark", "tv", None, 348, "skipped", 2017, "70523", "trakt", "favorites"),
+      ("Alien", "movie", "tt0078748", 348, "requested", 1979, "348", "imdb", "ls1")],
+     [("Alien", "tv", "tt0078748", None, "skipped", 1979, None, "imdb", "ls1"),
+      ("Dark", "tv", None, None, "requested", 2017, "70523", "trakt", "favorites")]),
+])
+def test_batches_match_identities_as_saved(db, tmp_path, monkeypatch, saved, batch):
+    for result in saved + batch:
+        db.save_sync_result(*result)
+    expected = _dump(db)
+
+    monkeypatch.setattr(db, "DB_FILE", str(tmp_path / "buffered.db"))
+    db.init_database()
+    for result in saved:
+        db.save_sync_result(*result)
+    with db.get_connection() as conn:
+        db._write_sync_results(conn.cursor(), [db._SyncResult(*result, keep_schedule=False) for result in batch])
+        conn.commit()
+
+    assert _dump(db) == expected
+
+
+def test_queued_writes_land_when_the_block_exits(db):
+    with db.buffered_sync_results():
+        _save_all(db)
+        db.add_item_to_sync(1, None, "Heat", "movie", "requested", item_key="imdb:tt0113277")
+
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM synced_items").fetchone()[0] == 4
+        assert conn.execute("SELECT item_key FROM sync_items").fetchall() == [("imdb:tt0113277",)]
+
+
+def test_queued_writes_land_when_the_block_fails(db):
+    with pytest.raises(RuntimeError, match="sync crashed"), db.buffered_sync_results():
+        _save_all(db)
+        raise RuntimeError("sync crashed")
+
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM synced_items").fetchone()[0] == 4
+
+
+def test_writes_are_batched(db, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_WRITE_BATCH_SIZE", "3")
+    monkeypatch.setenv("LISTSYNC_WRITE_FLUSH_SECONDS", "60")
+    batches = []
+    write = db._SyncResultWriter._write
+
+    def recording_write(writer, batch):
+        batches.append(len(batch))
+        write(writer, batch)
+
+    monkeypatch.setattr(db._SyncResultWriter, "_write", recording_write)
+
+    with db.buffered_sync_results():
+        _save_all(db)
+
+    assert batches == [3, 3, 1]
+
+
+def test_failed_batches_are_retried_record_by_record(db, monkeypatch):
+    write_sync_results = db._write_sync_results
+
+    def fail_on_batches(cursor, records):
+        if len(records) > 1:
+            raise RuntimeError("database is locked")
+        return write_sync_results(cursor, records)
+
+    monkeypatch.setattr(db, "_write_sync_results", fail_on_batches)
+    with db.buffered_sync_results():
+        _save_all(db)
+
+    monkeypatch.setattr(db, "_write_sync_results", write_sync_results)
+    assert len(_dump(db)["items"]) == 4
+
+
+def test_nested_blocks_flush_on_exit_and_share_the_writer(db):
+    with db.buffered_sync_results():
+        writer = db._result_writer
+        with db.buffered_sync_results():
+            db.save_sync_result(*RESULTS[1])
+            assert db._result_writer is writer
+        assert len(_dump(db)["items"]) == 1
+        db.save_sync_result(*RESULTS[4])
+    assert db._result_writer is None
+    assert len(_dump(db)["items"]) == 2
+
+
+def test_write_behind_can_be_turned_off(db, monkeypatch):
+    monkeypatch.setenv("LISTSYNC_WRITE_BEHIND", "false")
+
+    with db.buffered_sync_results():
+        assert db.save_sync_result(*RESULTS[1]) == 1
+
+
+@pytest.mark.parametrize("outcome", ["cancelled", "failed"])
+def test_sync_writes_its_results_whatever_the_outcome(db, monkeypatch, outcome):
+    processed = []
+
+    def process_media_item(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        processed.append(item["title"])
+        db.save_sync_result(item["title"], "movie", None, None, "not_found", 2000, None, "imdb", "ls1")
+        if outcome == "failed" and len(processed) == 3:
+            raise RuntimeError("item failed")
+        return {"title": item["title"], "status": "not_found", "year": 2000, "media_type": "movie"}
+
+    monkeypatch.setattr(main, "process_media_item", process_media_item)
+    monkeypatch.setattr(main, "check_cancellation_requested",
+                        lambda session_id=None: outcome == "cancelled" and len(processed) >= 3)
+    monkeypatch.setattr(main, "handle_cancellation", lambda tracker, session_id=None: None)
+    monkeypatch.setattr(main, "_prepare_overseerr_client", lambda client, dry_run: None)
+    monkeypatch.setenv("LISTSYNC_SEQUENTIAL_MODE", "true")
+    monkeypatch.setenv("LISTSYNC_WRITE_FLUSH_SECONDS", "60")
+
+    results = main.sync_media_to_overseerr([{"title": f"Movie {number}"} for number in range(1, 6)],
+                                           overseerr_client=None)
+
+    assert results.cancelled == (outcome == "cancelled")
+    assert len(_dump(db)["items"]) == len(processed)
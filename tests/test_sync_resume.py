@@ -0,0 +1,120 @@
+"""Tests for resuming an interrupted sync from its session's progress cursor."""
+
+import pytest
+
+from list_sync import main
+from list_sync.media_item import MediaItem
+
+HEAT = {"imdb_id": "tt0113277", "title": "Heat", "year": 1995, "media_type": "movie"}
+ALIEN = {"imdb_id": "tt0078748", "title": "Alien", "year": 1979, "media_type": "movie"}
+
+
+def _session(db, name, items=(), status=None, sync_type="full", list_id=None, pid=None):
+    """A sync session that processed the given items and then ended with status (None = still running)."""
+    sync_id = db.start_sync_in_db(name, sync_type, "imdb" if list_id else None, list_id, pid=pid)
+    for item in items:
+        db.add_item_to_sync(sync_id, None, item["title"], item["media_type"], "requested", "imdb", "ls1",
+                            item["year"], item["imdb_id"], item_key=db.sync_item_key(**item))
+    if status:
+        db.end_sync_in_db(name, status)
+    return sync_id
+
+
+def _resume(db, name="next", sync_type="full", list_id=None):
+    sync_id = _session(db, name, sync_type=sync_type, list_id=list_id)
+    return db.resume_interrupted_sync(sync_id, sync_type, "imdb" if list_id else None, list_id)
+
+
+@pytest.mark.parametrize("status", ["cancelled", "failed"])
+def test_interrupted_sessions_are_resumed(db, status):
+    _session(db, "first", [HEAT, ALIEN], status)
+
+    resumed = _resume(db)
+
+    assert resumed["session_id"] == "first"
+    assert set(resumed["items"]) == {db.sync_item_key(**HEAT), db.sync_item_key(**ALIEN)}
+    # The progress is carried over, so a second interruption still remembers it
+    assert set(_resume(db, "third")["items"]) == set(resumed["items"])
+
+
+def test_completed_and_empty_sessions_are_not_resumed(db):
+    _session(db, "done", [HEAT], "completed")
+    assert _resume(db) is None
+
+    _session(db, "empty", [], "cancelled")
+    assert _resume(db, "after-empty") is None
+
+
+def test_sessions_left_running_by_a_dead_process_are_resumed(db, monkeypatch):
+    _session(db, "alive", [HEAT], pid=4242)
+    monkeypatch.setattr(db, "_pid_alive", lambda pid: True)
+    assert _resume(db, "while-alive") is None
+
+    _session(db, "crashed", [HEAT], pid=4242)
+    monkeypatch.setattr(db, "_pid_alive", lambda pid: False)
+    assert _resume(db)["session_id"] == "crashed"
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT status FROM sync_history WHERE session_id = 'crashed'").fetchone()[0] == \
+            "interrupted"
+
+
+@pytest.mark.parametrize(("max_age", "resumed"), [(None, False), ("72", True)])
+def test_old_sessions_are_not_resumed(db, monkeypatch, max_age, resumed):
+    _session(db, "first", [HEAT], "cancelled")
+    with db.get_connection() as conn:
+        conn.execute("UPDATE sync_history SET start_time = datetime('now', '-2 days')")
+        conn.commit()
+    if max_age:
+        monkeypatch.setenv("LISTSYNC_RESUME_MAX_AGE_HOURS", max_age)
+
+    assert (_resume(db) is not None) == resumed
+
+
+def test_single_list_syncs_resume_the_same_list(db):
+    _session(db, "ls1-sync", [HEAT], "cancelled", sync_type="single", list_id="ls1")
+
+    assert _resume(db, "ls2-sync", sync_type="single", list_id="ls2") is None
+    assert _resume(db, "full-sync") is None
+    assert _resume(db, "ls1-again", sync_type="single", list_id="ls1")["session_id"] == "ls1-sync"
+
+
+def test_finished_sessions_are_pruned(db):
+    first = _session(db, "first", [HEAT], "completed")
+    second = _session(db, "second", [HEAT, ALIEN], "completed")
+
+    assert db.prune_sync_items(second) == 1
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sync_items WHERE sync_id = ?", (first,)).fetchone()[0] == 0
+
+
+def test_resumed_items_skip_their_work(db, monkeypatch):
+    calls = []
+
+    def match(item, overseerr_client, dry_run, is_4k=False, list_type=None, list_id=None):
+        calls.append(item["title"])
+        return {"title": item["title"], "status": "requested", "year": item["year"], "media_type": "movie"}
+
+    monkeypatch.setattr(main, "_match_and_request_media_item", match)
+    monkeypatch.setattr(main, "_sync_progress", None)
+    _session(db, "first", [HEAT], "cancelled")
+    sync_id = _session(db, "next")
+
+    main._start_sync_progress(sync_id, "full", dry_run=False)
+    results = [main.process_media_item(MediaItem.from_dict(item), None, dry_run=False) for item in (HEAT, ALIEN)]
+
+    assert calls == ["Alien"]
+    assert (results[0]["status"], results[0]["resumed"]) == ("requested", True)
+    # Both items are now in this session's progress cursor
+    with db.get_connection() as conn:
+        assert sorted(row[0] for row in conn.execute(
+            "SELECT title FROM sync_items WHERE sync_id = ?", (sync_id,))) == ["Alien", "Heat"]
+
+
+def test_resume_can_be_turned_off(db, monkeypatch):
+    monkeypatch.setattr(main, "_sync_progress", None)
+    monkeypatch.setenv("LISTSYNC_RESUME", "false")
+    _session(db, "first", [HEAT], "cancelled")
+
+    main._start_sync_progress(_session(db, "next"), "full", dry_run=False)
+
+    assert main._sync_progress["items"] == {}
@@ -0,0 +1,154 @@
+"""Tests for requesting only the missing seasons of TV shows."""
+
+import pytest
+import requests
+
+from list_sync import main
+from list_sync.api import overseerr
+from list_sync.api.overseerr import OverseerrClient
+
+BREAKING_BAD = {
+    "name": "Breaking Bad",
+    "numberOfSeasons": 5,
+    "seasons": [{"seasonNumber": number} for number in range(6)],
+    "mediaInfo": {
+        "status": 4,
+        "status4k": 1,
+        "seasons": [
+            {"seasonNumber": 1, "status": 5, "status4k": 1},
+            {"seasonNumber": 2, "status": 4, "status4k": 1},
+            {"seasonNumber": 3, "status": 3, "status4k": 1},
+        ],
+        "requests": [
+            {"status": 2, "is4k": False, "seasons": [{"seasonNumber": 4}]},
+            # Declined, and a 4K request that does not count for HD
+            {"status": 3, "is4k": False, "seasons": [{"seasonNumber": 5}]},
+            {"status": 1, "is4k": True, "seasons": [{"seasonNumber": 1}, {"seasonNumber": 2}]},
+        ],
+    },
+}
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+@pytest.fixture()
+def posted(monkeypatch):
+    """Serve Breaking Bad's details; returns the request payloads posted to Overseerr."""
+    shows = {"/api/v1/tv/1396": BREAKING_BAD}
+    payloads = []
+
+    def get(url, headers=None, timeout=None, **kwargs):
+        path = url.split("overseerr.test", 1)[1]
+        return _Response(shows[path]) if path in shows else _Response({}, 404)
+
+    def post(url, headers=None, json=None, **kwargs):
+        payloads.append(json)
+        return _Response({}, 201)
+
+    monkeypatch.setattr(overseerr.http_client, "get", get)
+    monkeypatch.setattr(overseerr.http_client, "post", post)
+    return payloads
+
+
+@pytest.fixture()
+def client(posted):
+    return OverseerrClient("http://overseerr.test", "key")
+
+
+def test_season_state_from_media_info_and_open_requests(client):
+    state = client.get_tv_season_state(1396)
+
+    assert state == {"media_status": 4, "seasons": [1, 2, 3, 4, 5], "available": [1, 2], "requested": [3, 4],
+                     "missing": [5]}
+    state_4k = client.get_tv_season_state(1396, is_4k=True)
+    assert (state_4k["available"], state_4k["requested"], state_4k["missing"]) == ([], [1, 2], [3, 4, 5])
+    assert client.get_tv_season_state(1) is None
+
+
+def test_season_state_is_cached_per_show_and_quality(db, monkeypatch):
+    db.save_tv_season_state(1396, is_4k=False, state={"media_status": 4, "seasons": [1, 2, 3], "available": [1],
+                                          "requested": [2]})
+
+    cached = db.get_tv_season_state(1396)
+    assert (cached["missing"], cached["media_status"]) == ([3], 4)
+    assert db.get_tv_season_state(1396, is_4k=True) is None
+
+    with db.get_connection() as conn:
+        conn.execute("UPDATE tv_season_state SET checked_at = datetime('now', '-2 days')")
+        conn.commit()
+    assert db.get_tv_season_state(1396) is None
+    monkeypatch.setenv("LISTSYNC_SEASON_CACHE_HOURS", "72")
+    assert db.get_tv_season_state(1396) is not None
+
+
+class _Client:
+    """Stands in for OverseerrClient: a fixed availability index status and season state."""
+
+    def __init__(self, indexed_status=None, state=None):
+        self.indexed = indexed_status
+        self.state = state
+        self.lookups = 0
+
+    def indexed_status(self, media_id, media_type, is_4k=False):
+        return self.indexed
+
+    def get_tv_season_state(self, tv_id, is_4k=False):
+        self.lookups += 1
+        return self.state
+
+
+STATE = {"media_status": 4, "seasons": [1, 2, 3], "available": [1], "requested": [], "missing": [2, 3]}
+
+
+def test_plan_reads_and_caches_the_season_state(db):
+    fake = _Client(indexed_status=4, state=STATE)
+
+    assert main._plan_tv_seasons(fake, 1396, is_4k=False)["missing"] == [2, 3]
+    assert main._plan_tv_seasons(fake, 1396, is_4k=False)["missing"] == [2, 3]
+    assert fake.lookups == 1
+    assert db.get_tv_season_state(1396)["missing"] == [2, 3]
+
+
+def test_plan_rereads_when_the_indexed_status_changed(db):
+    db.save_tv_season_state(1396, is_4k=False, state=STATE)
+    fake = _Client(indexed_status=2, state={**STATE, "media_status": 2, "requested": [2, 3], "missing": []})
+
+    assert main._plan_tv_seasons(fake, 1396, is_4k=False)["requested"] == [2, 3]
+    assert fake.lookups == 1
+
+
+@pytest.mark.parametrize(("indexed_status", "state", "setting"), [
+    (5, STATE, "true"),  # Fully available: nothing to plan
+    (None, None, "true"),  # Season details unavailable
+    (None, {**STATE, "seasons": []}, "true"),  # No season list
+    (4, STATE, "false"),  # Season-aware requests turned off
+])
+def test_plan_falls_back_to_the_show_status(db, monkeypatch, indexed_status, state, setting):
+    monkeypatch.setenv("LISTSYNC_SEASON_AWARE", setting)
+
+    assert main._plan_tv_seasons(_Client(indexed_status, state), 1396, is_4k=False) is None
+
+
+def test_partially_available_shows_get_their_missing_seasons_requested(db, client, posted):
+    item = {"title": "Breaking Bad", "year": 2008, "media_type": "tv", "tmdb_id": 1396}
+
+    result = main._match_and_request_media_item(item, client, dry_run=False, list_type="trakt", list_id="shows")
+
+    assert result["status"] == "requested"
+    assert [(payload["mediaId"], payload["seasons"]) for payload in posted] == [(1396, [5])]
+    # The request is reflected in the cached state, so the next sync sees the show as requested
+    assert db.get_tv_season_state(1396)["requested"] == [3, 4, 5]
+    assert main._match_and_request_media_item(item, client, dry_run=False, list_type="trakt",
+                                              list_id="shows")["status"] == "already_requested"
+    assert len(posted) == 1